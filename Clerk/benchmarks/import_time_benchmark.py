@@ -0,0 +1,97 @@
+"""
+Import-time profile of the Clerk API entry point.
+
+Imports main in a fresh interpreter with -X importtime, reports the slowest
+top-level imports and fails if a subsystem that should load lazily (spaCy,
+sklearn, the PDF stack, pydantic-ai agents, the document injector) is
+imported at startup. Run it in the same environment as the API, since
+importing main reads settings from the environment.
+
+Usage:
+    python benchmarks/import_time_benchmark.py [--runs 3] [--top 15] [--budget 0]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Loaded on first use or by the background warm-up, never by "import main"
+LAZY_MODULES = [
+    "spacy",
+    "sklearn",
+    "pdfplumber",
+    "fitz",
+    "pymupdf",
+    "pydantic_ai",
+    "src.ai_agents.motion_drafter",
+    "src.ai_agents.fact_extractor",
+    "src.document_injector_unified",
+]
+
+
+def profile_import(module):
+    """Import module in a fresh interpreter; returns {module: (self_us, cumulative_us, depth)}"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"import {module} failed:\n{result.stderr[-2000:]}")
+
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        timings.setdefault(name.strip(), (int(self_us), int(cumulative_us), depth))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument(
+        "--budget", type=float, default=0, help="Fail above this many seconds"
+    )
+    args = parser.parse_args()
+
+    # Keep the fastest run; the others mostly measure a cold disk cache
+    runs = [profile_import(args.module) for _ in range(args.runs)]
+    timings = min(runs, key=lambda t: t[args.module][1])
+    total = timings[args.module][1] / 1e6
+
+    direct = sorted(
+        (
+            (name, cumulative)
+            for name, (_, cumulative, depth) in timings.items()
+            if depth == 1
+        ),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+    print(f"import {args.module}: {total:.2f}s (best of {args.runs})")
+    print(f"{'module':<52}{'cumulative':>12}")
+    for name, cumulative in direct[: args.top]:
+        print(f"{name:<52}{cumulative / 1e6:>10.3f} s")
+
+    eager = [name for name in LAZY_MODULES if name in timings]
+    failed = False
+    if eager:
+        print(f"\nimported eagerly: {', '.join(eager)}")
+        failed = True
+    if args.budget and total > args.budget:
+        print(f"\nimport time {total:.2f}s exceeds budget {args.budget:.2f}s")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Hit-path latency of the CachingManager L1 memory cache.
+
+Compares InMemoryCache against the previous implementation, which kept
+LRU order in a list and paid list.remove on every hit. Keys are read in
+random order, so hits land anywhere in the access order.
+
+Usage:
+    python benchmarks/l1_cache_benchmark.py [--entries 10000] [--lookups 20000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.database.caching_manager import CacheEntry, InMemoryCache  # noqa: E402
+
+
+class ListLRUCache:
+    """The previous InMemoryCache hit and insert paths"""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.cache = {}
+        self.access_order = []
+
+    def get(self, key):
+        if key in self.cache:
+            entry = self.cache[key]
+            if not entry.is_expired:
+                entry.last_accessed = datetime.now()
+                entry.access_count += 1
+                if key in self.access_order:
+                    self.access_order.remove(key)
+                self.access_order.append(key)
+                return entry
+        return None
+
+    def put(self, key, entry):
+        self.cache[key] = entry
+        self.access_order.append(key)
+        return True
+
+
+def fill(cache, keys):
+    now = datetime.now()
+    for key in keys:
+        cache.put(
+            key,
+            CacheEntry(
+                key=key,
+                value=key,
+                created_at=now,
+                last_accessed=now,
+                ttl_seconds=3600,
+                size_bytes=200,
+            ),
+        )
+
+
+def per_hit_us(cache, lookups):
+    started = time.perf_counter()
+    for key in lookups:
+        cache.get(key)
+    return (time.perf_counter() - started) / len(lookups) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=10_000)
+    parser.add_argument("--lookups", type=int, default=20_000)
+    args = parser.parse_args()
+
+    keys = [
+        f"legal_docs.case_{i % 20}:search:{i:08x}:results" for i in range(args.entries)
+    ]
+    rng = random.Random(7)
+    lookups = [rng.choice(keys) for _ in range(args.lookups)]
+
+    rows = []
+    for label, cache in (
+        ("list LRU (previous)", ListLRUCache(args.entries)),
+        (
+            "OrderedDict LRU",
+            InMemoryCache(args.entries, max_bytes=args.entries * 200),
+        ),
+        (
+            "with namespace quotas",
+            InMemoryCache(
+                args.entries,
+                max_bytes=args.entries * 200,
+                namespace_quota_bytes=args.entries * 20,
+            ),
+        ),
+    ):
+        fill(cache, keys)
+        rows.append((label, per_hit_us(cache, lookups)))
+
+    print(f"{'cache':<24}{'per hit':>12}   ({args.entries} entries)")
+    for label, us in rows:
+        print(f"{label:<24}{us:>9.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Microbenchmark for the shared legal entity scanner.
+
+Compares scanning ingestion chunks the old way, with every consumer running
+its own patterns, against the shared scanner, where each chunk is scanned once
+and trigger literals skip patterns that cannot match.
+
+Usage:
+    python benchmarks/legal_entity_scanner_benchmark.py [--chunks 2000]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.legal_entity_scanner import (  # noqa: E402
+    LEGAL_ENTITY_PATTERNS,
+    LegalEntityScanner,
+)
+
+NARRATIVE = [
+    "The driver testified that he had been on duty for fourteen hours.",
+    "Witnesses described heavy rain and reduced visibility on the highway.",
+    "The officer's report did not mention any skid marks at the scene.",
+    "The tractor was traveling northbound in the right lane before impact.",
+    "Emergency responders arrived and transported the plaintiff to the hospital.",
+    "The company had no written policy on driver fatigue at the time.",
+]
+
+CITATIONS = [
+    "See Smith Dep. 45:3-12 (describing the approach to the intersection).",
+    "Plaintiff's Exhibit 12 shows the maintenance history of the tractor.",
+    "The carrier violated 49 C.F.R. § 395.8 by failing to keep logs.",
+    "Under Fla. Stat. § 768.81, fault is apportioned among the parties.",
+    "Palsgraf v. Long Island, 248 N.E. 99 (1928) remains instructive.",
+    "Medical expenses totaled $184,250.00 through March 3, 2023.",
+    "The collision occurred at approximately 6:45 p.m. on 03/15/2022.",
+    "Defendant produced documents Bates stamped SMITH000123 through SMITH000410.",
+    "Pursuant to Fed. R. Civ. P. 26, the parties exchanged disclosures.",
+]
+
+# Consumers that scan each chunk during ingestion, with how often they do
+CONSUMERS = {
+    "sparse": 2,  # keyword and citation vectors both extract entities
+    "citation": 1,
+    "fact": 1,
+    "deposition": 1,
+    "exhibit": 1,
+    "motion": 1,
+}
+
+
+def make_chunks(count: int, citation_share: float, sentences_per_chunk: int = 12):
+    """Build chunks in which citation_share of the sentences cite something"""
+    rng = random.Random(7)
+    return [
+        " ".join(
+            rng.choice(CITATIONS if rng.random() < citation_share else NARRATIVE)
+            for _ in range(sentences_per_chunk)
+        )
+        for _ in range(count)
+    ]
+
+
+def legacy_scan(chunks):
+    """Every consumer compiles and runs its own patterns"""
+    found = 0
+    for chunk in chunks:
+        for group, repeats in CONSUMERS.items():
+            patterns = [
+                re.compile(p.pattern, p.flags)
+                for p in LEGAL_ENTITY_PATTERNS
+                if p.kind.startswith(f"{group}.")
+            ]
+            for _ in range(repeats):
+                for pattern in patterns:
+                    found += len(list(pattern.finditer(chunk)))
+    return found
+
+
+def scanner_scan(chunks, scanner):
+    """Every consumer reads from the shared scanner"""
+    kinds = {group: list(scanner.patterns_for(group)) for group in CONSUMERS}
+    found = 0
+    for chunk in chunks:
+        for group, repeats in CONSUMERS.items():
+            for _ in range(repeats):
+                for name in kinds[group]:
+                    found += len(scanner.finditer(chunk, f"{group}.{name}"))
+    return found
+
+
+def run(chunks, scanner, repeat):
+    legacy_times, scanner_times = [], []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        legacy_found = legacy_scan(chunks)
+        legacy_times.append(time.perf_counter() - started)
+
+        scanner.clear_cache()
+        started = time.perf_counter()
+        scanner_found = scanner_scan(chunks, scanner)
+        scanner_times.append(time.perf_counter() - started)
+
+    assert legacy_found == scanner_found, (legacy_found, scanner_found)
+    return (
+        min(legacy_times) / len(chunks) * 1e6,
+        min(scanner_times) / len(chunks) * 1e6,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--chunks", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    scanner = LegalEntityScanner(LEGAL_ENTITY_PATTERNS)
+
+    print(f"{'chunks':<24}{'per-consumer':>14}{'shared':>12}{'speedup':>10}")
+    for label, share in (("narrative (5% cited)", 0.05), ("citation-dense", 0.5)):
+        chunks = make_chunks(args.chunks, share)
+        legacy, shared = run(chunks, scanner, args.repeat)
+        print(
+            f"{label:<24}{legacy:>11.1f} us{shared:>9.1f} us"
+            f"{legacy / shared:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
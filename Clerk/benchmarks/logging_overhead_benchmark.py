@@ -0,0 +1,114 @@
+"""
+Caller-side logging cost of one /hybrid-search request.
+
+Compares the previous setup, where the request thread formatted and wrote
+every record to the console and the JSON RotatingFileHandler, against the
+queued setup from setup_logging. The request logs the same lines as the
+search path: auth header dumps and per-result [RAG_DEBUG] lines at INFO and
+f-string debug lines before, versus one summary record and lazy debug
+lines after.
+
+Usage:
+    python benchmarks/logging_overhead_benchmark.py [--requests 2000]
+"""
+
+import argparse
+import contextlib
+import io
+import logging
+import logging.handlers
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.logger import (  # noqa: E402
+    LOG_FORMAT,
+    LegalAIFormatter,
+    LogSummary,
+    setup_logging,
+    stop_logging,
+)
+
+RESULTS = [(0.91 - i / 50, 800 + i) for i in range(3)]
+
+
+def direct_logger(log_dir: Path) -> logging.Logger:
+    """The previous setup: handlers run on the calling thread"""
+    logger = logging.getLogger("bench_direct")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    console = logging.StreamHandler(io.StringIO())
+    console.setFormatter(logging.Formatter(LOG_FORMAT))
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_dir / "bench_direct.log", maxBytes=10 * 1024 * 1024, backupCount=1
+    )
+    file_handler.setFormatter(LegalAIFormatter())
+    logger.addHandler(console)
+    logger.addHandler(file_handler)
+    return logger
+
+
+def request_before(logger, path="/hybrid-search", db="smith_v_jones"):
+    logger.info(f"Auth middleware processing: {path}")
+    logger.info(f"AUTH_ENABLED: {False}")
+    logger.info(f"Is Development: {True}")
+    logger.info(f"Headers: Authorization={'Bearer dev-token'}")
+    logger.info(f"[RAG_DEBUG] Attempting search on database: '{db}' (type: case)")
+    logger.debug(f"Semantic search returned {20} results")
+    logger.debug(f"Keyword search returned {20} results")
+    logger.debug(f"Citation search returned {12} results")
+    logger.info(f"[RAG_DEBUG] Search returned {len(RESULTS)} raw results from '{db}'")
+    for j, (score, length) in enumerate(RESULTS):
+        logger.info(
+            f"[RAG_DEBUG] Result {j + 1}: score={score:.4f}, content_length={length}"
+        )
+        logger.info(f"[RAG_RESEARCH] Added result (score: {score:.3f}) from {db}")
+
+
+def request_after(logger, path="/hybrid-search", db="smith_v_jones"):
+    logger.debug("Auth middleware processing: %s", path)
+    logger.debug("[RAG_DEBUG] Attempting search on database: '%s'", db)
+    logger.debug("Semantic search returned %d results", 20)
+    logger.debug("Keyword search returned %d results", 20)
+    logger.debug("Citation search returned %d results", 12)
+    summary = LogSummary(logger, "[RAG_RESEARCH] Searches complete", queries=1)
+    summary.count("searches")
+    summary.count("results.case", len(RESULTS))
+    summary.set(top_score=RESULTS[0][0])
+    summary.emit()
+
+
+def per_request_us(func, logger, requests):
+    started = time.perf_counter()
+    for _ in range(requests):
+        func(logger)
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_dir = Path(tmp)
+        before = per_request_us(request_before, direct_logger(log_dir), args.requests)
+
+        # The console handler binds sys.stderr when it is created
+        with contextlib.redirect_stderr(io.StringIO()):
+            queued = setup_logging("bench_queued", "INFO", log_dir=log_dir)
+        queued.propagate = False
+        after = per_request_us(request_after, queued, args.requests)
+        stop_logging()
+
+    print(f"{'setup':<34}{'per request':>14}")
+    print(f"{'sync handlers, per-item lines':<34}{before:>11.1f} us")
+    print(f"{'queued, summary record':<34}{after:>11.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Overhead of the hot-path latency timers.
+
+Measures the cost of one timed block (histogram lookup, two perf_counter
+reads and one record) and relates it to a search request, which passes
+through roughly a dozen timed stages and takes tens of milliseconds.
+
+Usage:
+    python benchmarks/metrics_overhead_benchmark.py [--iterations 200000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.metrics import MetricsRegistry  # noqa: E402
+
+
+def per_call_ns(func, iterations):
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) / iterations * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200_000)
+    parser.add_argument("--timers-per-request", type=int, default=12)
+    parser.add_argument("--request-ms", type=float, default=50)
+    args = parser.parse_args()
+
+    registry = MetricsRegistry()
+
+    def bare():
+        pass
+
+    def context_manager():
+        with registry.timer("llm_call_seconds", model="gpt-4.1-mini"):
+            pass
+
+    @registry.timer("sparse_encoding_seconds")
+    def decorated():
+        pass
+
+    baseline = per_call_ns(bare, args.iterations)
+    rows = [
+        ("context manager", per_call_ns(context_manager, args.iterations)),
+        ("decorator", per_call_ns(decorated, args.iterations)),
+    ]
+
+    request_ns = args.request_ms * 1e6
+    print(f"{'timer':<18}{'per call':>12}{'per request':>14}")
+    for label, ns in rows:
+        overhead = (ns - baseline) * args.timers_per_request
+        print(f"{label:<18}{ns - baseline:>9.0f} ns{overhead / request_ns:>13.4%}")
+
+
+if __name__ == "__main__":
+    main()
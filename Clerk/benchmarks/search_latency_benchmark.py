@@ -0,0 +1,141 @@
+"""
+Load test for search latency under concurrent requests.
+
+Fires batches of concurrent searches through the old request path, where the
+handler calls the sync embedding and Qdrant clients inside the event loop,
+and through the async path used by the /search endpoints now. The OpenAI and
+Qdrant round trips are simulated with fixed delays, so the numbers show how
+latency scales with concurrency rather than real service times.
+
+With blocking calls every request waits for all requests ahead of it, so p99
+grows linearly with concurrency; on the async path it stays near one round
+trip.
+
+Usage:
+    python benchmarks/search_latency_benchmark.py [--embed-ms 40] [--qdrant-ms 15]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.vector_storage.qdrant_store import QdrantVectorStore  # noqa: E402
+
+COLLECTION = "bench_case"
+EMBEDDING = [0.1] * 8
+POINTS = [
+    SimpleNamespace(
+        id=i,
+        score=1.0 - i / 100,
+        payload={"content": f"chunk {i}", "case_name": COLLECTION},
+    )
+    for i in range(10)
+]
+COLLECTION_INFO = SimpleNamespace(
+    config=SimpleNamespace(params=SimpleNamespace(vectors={"semantic": None}))
+)
+
+
+class SimulatedServices:
+    """Sync and async stand-ins for the embedding API and Qdrant"""
+
+    def __init__(self, embed_seconds: float, qdrant_seconds: float):
+        self.embed_seconds = embed_seconds
+        self.qdrant_seconds = qdrant_seconds
+
+    # Embedding generator
+    def generate_embedding(self, text):
+        time.sleep(self.embed_seconds)
+        return EMBEDDING, 1
+
+    async def generate_embedding_async(self, text):
+        await asyncio.sleep(self.embed_seconds)
+        return EMBEDDING, 1
+
+    # Sync Qdrant client
+    def get_collection(self, collection_name):
+        time.sleep(self.qdrant_seconds)
+        return COLLECTION_INFO
+
+    def search(self, **kwargs):
+        time.sleep(self.qdrant_seconds)
+        return POINTS
+
+
+class SimulatedAsyncQdrant:
+    def __init__(self, qdrant_seconds: float):
+        self.qdrant_seconds = qdrant_seconds
+
+    async def get_collection(self, collection_name):
+        await asyncio.sleep(self.qdrant_seconds)
+        return COLLECTION_INFO
+
+    async def query_points(self, **kwargs):
+        await asyncio.sleep(self.qdrant_seconds)
+        return SimpleNamespace(points=POINTS)
+
+
+async def blocking_search(store, embedder, query):
+    """The old /search handler body"""
+    query_embedding, _ = embedder.generate_embedding(query)
+    return store.search_documents(COLLECTION, query_embedding, 10)
+
+
+async def async_search(store, embedder, query):
+    """The /search handler body after the change"""
+    query_embedding, _ = await embedder.generate_embedding_async(query)
+    return await store.search_documents_async(COLLECTION, query_embedding, 10)
+
+
+async def measure(handler, store, embedder, concurrency):
+    """Submit concurrency requests at once and return their latencies in ms"""
+    submitted = time.perf_counter()
+
+    async def request(i):
+        await handler(store, embedder, f"query {i}")
+        return (time.perf_counter() - submitted) * 1000
+
+    return sorted(await asyncio.gather(*(request(i) for i in range(concurrency))))
+
+
+def percentile(latencies, pct):
+    index = min(len(latencies) - 1, round(pct / 100 * (len(latencies) - 1)))
+    return latencies[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--embed-ms", type=float, default=40)
+    parser.add_argument("--qdrant-ms", type=float, default=15)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 64])
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    services = SimulatedServices(args.embed_ms / 1000, args.qdrant_ms / 1000)
+    store = QdrantVectorStore()
+    store.client = services
+    store.async_client = SimulatedAsyncQdrant(args.qdrant_ms / 1000)
+
+    print(
+        f"{'concurrency':<13}{'blocking p50':>14}{'blocking p99':>14}"
+        f"{'async p50':>12}{'async p99':>12}"
+    )
+    for concurrency in args.concurrency:
+        blocking = asyncio.run(measure(blocking_search, store, services, concurrency))
+        non_blocking = asyncio.run(measure(async_search, store, services, concurrency))
+        print(
+            f"{concurrency:<13}"
+            f"{percentile(blocking, 50):>11.0f} ms{percentile(blocking, 99):>11.0f} ms"
+            f"{percentile(non_blocking, 50):>9.0f} ms"
+            f"{percentile(non_blocking, 99):>9.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -107,11 +107,27 @@ class CacheSettings(BaseSettings):
     redis_url: Optional[str] = Field(None, env="REDIS_URL")
     cache_ttl: int = Field(3600, env="CACHE_TTL")  # seconds
     enable_cache: bool = Field(True, env="ENABLE_CACHE")
+    spill_dir: Optional[str] = Field(None, env="CACHE_SPILL_DIR")
+    spill_max_mb: int = Field(1024, env="CACHE_SPILL_MAX_MB")
 
     class Config:
         env_prefix = "CACHE_"
 
 
+class ClientPoolSettings(BaseSettings):
+    """Connection pools of the shared service clients"""
+
+    max_connections: int = Field(100, env="CLIENT_POOL_MAX_CONNECTIONS")
+    max_keepalive_connections: int = Field(
+        20, env="CLIENT_POOL_MAX_KEEPALIVE_CONNECTIONS"
+    )
+    keepalive_expiry: float = Field(30.0, env="CLIENT_POOL_KEEPALIVE_EXPIRY")
+    health_check_timeout: float = Field(5.0, env="CLIENT_POOL_HEALTH_CHECK_TIMEOUT")
+
+    class Config:
+        env_prefix = "CLIENT_POOL_"
+
+
 class SecuritySettings(BaseSettings):
     """Security configuration"""
 
@@ -299,6 +315,7 @@ class Settings(BaseSettings):
     box: BoxConfig = Field(default_factory=BoxConfig)
     database: DatabaseSettings = Field(default_factory=DatabaseSettings)
     cache: CacheSettings = Field(default_factory=CacheSettings)
+    client_pool: ClientPoolSettings = Field(default_factory=ClientPoolSettings)
     security: SecuritySettings = Field(
         default_factory=lambda: SecuritySettings(
             secret_key=os.getenv("SECRET_KEY", "dev-secret-key")
@@ -337,6 +354,8 @@ class Settings(BaseSettings):
     debug: bool = Field(False, env="DEBUG")
     api_v1_prefix: str = Field("/api/v1", env="API_V1_PREFIX")
     cors_origins: str = Field("http://localhost:3000", env="CORS_ORIGINS")
+    # Preload spaCy, the document injector and client pools after startup
+    warm_start: bool = Field(True, env="WARM_START")
 
     # Shared collections configuration
     shared_collections: str = Field(
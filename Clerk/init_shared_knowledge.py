@@ -86,19 +86,23 @@ async def initialize_florida_statutes():
         },
     ]
 
-    # Load each statute
-    for statute in statutes:
-        await loader.load_statute(
-            statute_number=statute["number"],
-            title=statute["title"],
-            content=statute["content"],
-            chapter="Chapter 768 - Negligence"
-            if statute["number"].startswith("768")
-            else "Chapter 316 - Traffic"
-            if statute["number"].startswith("316")
-            else "Chapter 627 - Insurance",
-            effective_date=datetime(2024, 1, 1),
-        )
+    # Load all statutes in one batch; unchanged statutes are skipped
+    await loader.load_statutes(
+        [
+            {
+                "statute_number": statute["number"],
+                "title": statute["title"],
+                "content": statute["content"],
+                "chapter": "Chapter 768 - Negligence"
+                if statute["number"].startswith("768")
+                else "Chapter 316 - Traffic"
+                if statute["number"].startswith("316")
+                else "Chapter 627 - Insurance",
+                "effective_date": datetime(2024, 1, 1),
+            }
+            for statute in statutes
+        ]
+    )
 
     logger.info("Florida statutes initialized successfully")
 
@@ -174,15 +178,10 @@ GUIDANCE: A driver who informs a motor carrier that he or she needs immediate re
         },
     ]
 
-    # Load each regulation
-    for reg in regulations:
-        await loader.load_regulation(
-            part=reg["part"],
-            section=reg["section"],
-            title=reg["title"],
-            content=reg["content"],
-            effective_date=datetime(2024, 1, 1),
-        )
+    # Load all regulations in one batch; unchanged regulations are skipped
+    await loader.load_regulations(
+        [{**reg, "effective_date": datetime(2024, 1, 1)} for reg in regulations]
+    )
 
     logger.info("FMCSR regulations initialized successfully")
 
@@ -25,23 +25,22 @@ from fastapi import (
     Form,
 )
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, FileResponse, PlainTextResponse
 from pydantic import BaseModel, Field
 
-from src.document_injector_unified import UnifiedDocumentInjector
 from src.vector_storage.qdrant_store import QdrantVectorStore
 from src.vector_storage.embeddings import EmbeddingGenerator
-from src.ai_agents.legal_document_agent import legal_document_agent
-from src.ai_agents.motion_drafter import motion_drafter, DocumentLength
-from src.ai_agents.outline_cache_manager import outline_cache
+from src.vector_storage.sparse_encoder import get_sparse_encoder
+from src.utils.client_registry import get_client_registry
 from src.utils.logger import setup_logging
+from src.utils.metrics import metrics
+from src.utils.thread_pool import run_blocking, shutdown_blocking_executor
 from src.utils.env_validator import (
     validate_all as validate_environment,
     EnvironmentError,
 )
 from config.settings import settings
 from src.models.unified_document_models import DiscoveryProcessingRequest
-from src.document_processing.websocket_document_processor import get_websocket_processor
 
 # MVP Mode conditional imports
 if os.getenv("MVP_MODE", "false").lower() == "true":
@@ -50,6 +49,8 @@ else:
     from src.middleware.case_context import get_case_context
 
 from src.database.connection import init_db, close_db
+from src.database.caching_manager import get_materialized_view_manager
+from src.database.storage_tiering import get_storage_tiering_manager
 
 # Import new routers
 from src.api.auth_endpoints import router as auth_router
@@ -62,15 +63,68 @@ logger = setup_logging("clerk_api", "INFO")
 # Global instances
 document_injector = None
 vector_store = None
+view_refresh_task = None
+tiering_task = None
+warm_up_task = None
 embedding_generator = None
+_document_injector_lock = asyncio.Lock()
 _openai_health_cache = {"status": None, "last_check": None}
 HEALTH_CACHE_DURATION = 3600
 
 
+async def get_document_injector():
+    """
+    Document injector, built on first use.
+
+    Importing and building it pulls in the whole processing stack (PDF
+    libraries, fact extraction, Box authentication), so startup leaves it to
+    the warm-up task or the first request that needs it.
+
+    Returns:
+        The shared UnifiedDocumentInjector, or None if it could not be built
+    """
+    global document_injector
+    async with _document_injector_lock:
+        if document_injector is None:
+            try:
+                from src.document_injector_unified import UnifiedDocumentInjector
+
+                document_injector = await run_blocking(
+                    UnifiedDocumentInjector, enable_cost_tracking=True
+                )
+            except Exception as e:
+                logger.error(f"Failed to initialize document injector: {str(e)}")
+    return document_injector
+
+
+async def warm_up():
+    """Preload heavy subsystems after startup so first requests stay fast"""
+    started = datetime.now()
+    try:
+        injector = await get_document_injector()
+        if injector and not await run_blocking(injector.box_client.check_connection):
+            logger.warning(
+                "Box API connection failed - document processing will be limited"
+            )
+
+        # spaCy model behind hybrid search
+        await run_blocking(get_sparse_encoder)
+
+        # Open pooled connections to every service client created so far
+        await get_client_registry().health_check()
+
+        logger.info(
+            f"Warm-up finished in {(datetime.now() - started).total_seconds():.1f}s"
+        )
+    except Exception as e:
+        logger.warning(f"Warm-up failed, subsystems will load on first use: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events"""
-    global document_injector, vector_store, embedding_generator
+    global vector_store, embedding_generator
+    global view_refresh_task, tiering_task, warm_up_task
 
     # Startup
     logger.info("Starting Clerk API service...")
@@ -109,17 +163,23 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to initialize database: {str(e)}")
         # Continue - the app might work with existing database
 
-    # Initialize components
+    # Initialize components; heavy subsystems load on first use or in warm-up
     try:
-        document_injector = UnifiedDocumentInjector(enable_cost_tracking=True)
         vector_store = QdrantVectorStore()  # Default instance for legacy endpoints
         embedding_generator = EmbeddingGenerator()
 
-        # Test connections
-        if not document_injector.box_client.check_connection():
-            logger.warning(
-                "Box API connection failed - document processing will be limited"
-            )
+        # Keep materialized case statistics fresh in the background
+        view_refresh_task = asyncio.create_task(
+            get_materialized_view_manager(vector_store).run_background_refresh()
+        )
+
+        # Move idle cases to cheaper storage; searches promote them back
+        tiering_task = asyncio.create_task(
+            get_storage_tiering_manager(vector_store).run_background_tiering()
+        )
+
+        if settings.warm_start:
+            warm_up_task = asyncio.create_task(warm_up())
 
         logger.info("Clerk API service started successfully")
 
@@ -131,8 +191,14 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down Clerk API service...")
-    if vector_store:
-        vector_store.close()
+    if view_refresh_task:
+        view_refresh_task.cancel()
+    if tiering_task:
+        tiering_task.cancel()
+    if warm_up_task:
+        warm_up_task.cancel()
+    await get_client_registry().aclose()
+    shutdown_blocking_executor(wait=False)
 
     # Close database connections
     await close_db()
@@ -303,6 +369,35 @@ async def debug_settings():
     }
 
 
+# Prometheus metrics endpoint
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint():
+    """Hot-path stage latency histograms in Prometheus text format"""
+    return PlainTextResponse(
+        metrics.render_prometheus(), media_type="text/plain; version=0.0.4"
+    )
+
+
+# Storage tiering report
+@app.get("/storage-tiers")
+async def storage_tiers():
+    """Storage tier and RAM saved per case"""
+    try:
+        return await run_blocking(get_storage_tiering_manager().get_memory_report)
+    except Exception as e:
+        logger.error(f"Error building storage tier report: {str(e)}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to build storage tier report: {str(e)}"
+        )
+
+
+# Pooled client health
+@app.get("/health/clients")
+async def client_health():
+    """Probe the shared service clients and report latency per client"""
+    return await get_client_registry().health_check()
+
+
 # Health check endpoint
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
@@ -397,12 +492,13 @@ async def process_folder(
     request: ProcessFolderRequest, background_tasks: BackgroundTasks
 ):
     """Process documents from a Box folder"""
-    if not document_injector:
+    injector = await get_document_injector()
+    if not injector:
         raise HTTPException(status_code=503, detail="Document processing not available")
 
     # Run processing in background
     background_tasks.add_task(
-        document_injector.process_case_folder, request.folder_id, request.max_documents
+        injector.process_case_folder, request.folder_id, request.max_documents
     )
 
     return ProcessingStatus(
@@ -425,7 +521,8 @@ async def process_discovery(
     All documents in the specified folder are treated as verified discovery materials.
     Fact extraction is forced regardless of document type.
     """
-    if not document_injector:
+    injector = await get_document_injector()
+    if not injector:
         raise HTTPException(status_code=503, detail="Document processing not available")
 
     # Prepare discovery metadata
@@ -441,7 +538,7 @@ async def process_discovery(
 
     # Run processing in background
     background_tasks.add_task(
-        document_injector.process_discovery_folder,
+        injector.process_discovery_folder,
         request.folder_id,
         request.case_name,
         discovery_metadata,
@@ -473,6 +570,10 @@ async def process_discovery_websocket(
     """
     try:
         # Get the WebSocket-enabled processor
+        from src.document_processing.websocket_document_processor import (
+            get_websocket_processor,
+        )
+
         ws_processor = get_websocket_processor()
 
         # Start processing in the background
@@ -527,17 +628,22 @@ async def search_documents(
         if not case_name:
             raise HTTPException(status_code=400, detail="Case context required")
 
-        # Generate embedding for query
-        query_embedding, _ = embedding_generator.generate_embedding(request.query)
-
-        # Perform search
-        if request.use_hybrid and hasattr(document_injector, "search_case"):
-            results = document_injector.search_case(
-                case_name, request.query, request.limit, request.use_hybrid
+        # Perform search without blocking the event loop
+        injector = await get_document_injector() if request.use_hybrid else None
+        if request.use_hybrid and hasattr(injector, "search_case"):
+            results = await run_blocking(
+                injector.search_case,
+                case_name,
+                request.query,
+                request.limit,
+                request.use_hybrid,
             )
         else:
-            results = vector_store.search_documents(
-                request.case_name, query_embedding, request.limit
+            query_embedding, _ = await embedding_generator.generate_embedding_async(
+                request.query
+            )
+            results = await vector_store.search_documents_async(
+                case_name, query_embedding, request.limit
             )
 
         # Format results
@@ -554,7 +660,7 @@ async def search_documents(
 
         return {
             "query": request.query,
-            "case_name": request.case_name,
+            "case_name": case_name,
             "results": formatted_results,
             "count": len(formatted_results),
         }
@@ -570,7 +676,8 @@ async def search_unified_documents(request: SearchRequest):
     """Search for documents using the unified document management system"""
     try:
         # Use the unified search from document injector
-        results = document_injector.search_documents(
+        injector = await get_document_injector()
+        results = await injector.search_documents_async(
             case_name=request.case_name,
             query=request.query,
             document_types=request.document_types
@@ -596,8 +703,8 @@ async def search_unified_documents(request: SearchRequest):
 async def list_cases_legacy():
     """List all available cases (legacy endpoint for compatibility)"""
     try:
-        # Fall back to vector store listing
-        cases_data = vector_store.list_cases()
+        # Fall back to vector store listing; names only, so skip per-case details
+        cases_data = vector_store.list_cases(include_details=False)
         case_names = [
             case.get("collection_name", case.get("original_name", ""))
             for case in cases_data
@@ -618,16 +725,14 @@ async def hybrid_search_endpoint(request: HybridSearchRequest):
     Now includes detailed ranking history for each result.
     """
     try:
-        # Initialize vector store (database_name is used as collection name in hybrid search)
-        case_vector_store = QdrantVectorStore()
-
         # Generate query embedding - properly unpack the tuple
-        query_embedding, token_count = embedding_generator.generate_embedding(
-            request.query
+        query_embedding, token_count = (
+            await embedding_generator.generate_embedding_async(request.query)
         )
 
-        # Perform hybrid search with RRF and reranking
-        results = await case_vector_store.hybrid_search(
+        # Perform hybrid search with RRF and reranking on the shared store
+        # (database_name is used as collection name in hybrid search)
+        results = await vector_store.hybrid_search(
             collection_name=request.database_name,  # Use database_name as collection name
             query=request.query,
             query_embedding=query_embedding,  # Now passing just the embedding vector
@@ -771,6 +876,8 @@ def calculate_ranking_statistics(results: List[Dict]) -> Dict[str, Any]:
 @app.post("/ai/query")
 async def ai_query(case_name: str, query: str, user_id: str = "api_user"):
     """Query documents using AI agent"""
+    from src.ai_agents.legal_document_agent import legal_document_agent
+
     try:
         response = await legal_document_agent.query_documents(
             user_query=query, user_id=user_id
@@ -813,7 +920,9 @@ async def upload_file_to_box(
     Returns:
         UploadResponse with file details
     """
-    if not document_injector or not document_injector.box_client:
+    try:
+        box_client = await run_blocking(get_client_registry().box_client)
+    except Exception:
         raise HTTPException(status_code=503, detail="Box service not available")
 
     try:
@@ -822,7 +931,7 @@ async def upload_file_to_box(
         file_stream = io.BytesIO(file_content)
 
         # Upload to Box
-        uploaded_file = document_injector.box_client.upload_file(
+        uploaded_file = box_client.upload_file(
             file_stream=file_stream,
             file_name=file.filename,
             parent_folder_id=folder_id,
@@ -832,7 +941,7 @@ async def upload_file_to_box(
         # Get the web link for the file
         web_link = None
         try:
-            file_info = document_injector.box_client.client.file(uploaded_file.id).get()
+            file_info = box_client.client.file(uploaded_file.id).get()
             if hasattr(file_info, "shared_link") and file_info.shared_link:
                 web_link = file_info.shared_link.get("url")
         except:
@@ -931,7 +1040,8 @@ async def generate_and_upload_outline(
                         filename = f"legal_outline_{timestamp}.docx"
 
                         file_stream = io.BytesIO(docx_bytes)
-                        uploaded_file = document_injector.box_client.upload_file(
+                        box_client = get_client_registry().box_client()
+                        uploaded_file = box_client.upload_file(
                             file_stream=file_stream,
                             file_name=filename,
                             parent_folder_id=folder_id,
@@ -985,6 +1095,8 @@ async def draft_motion(request: MotionDraftingRequest):
     """
     Draft a complete legal motion from an outline
     """
+    from src.ai_agents.motion_drafter import DocumentLength, motion_drafter
+
     try:
         logger.info(f"Starting motion draft for database: {request.database_name}")
 
@@ -1082,7 +1194,8 @@ async def draft_motion(request: MotionDraftingRequest):
                 if request.upload_to_box and request.box_folder_id:
                     try:
                         with open(docx_path, "rb") as f:
-                            uploaded_file = document_injector.box_client.upload_file(
+                            box_client = get_client_registry().box_client()
+                            uploaded_file = box_client.upload_file(
                                 file_stream=f,
                                 file_name=f"{motion_draft.title}_{draft_id}.docx",
                                 parent_folder_id=request.box_folder_id,
@@ -1138,11 +1251,81 @@ async def draft_motion(request: MotionDraftingRequest):
         raise HTTPException(status_code=500, detail=f"Motion drafting failed: {str(e)}")
 
 
+def _finalize_motion_draft(
+    motion_draft,
+    request: MotionDraftingRequest,
+    draft_id: str,
+    outline_id: Optional[str],
+) -> MotionDraftingResponse:
+    """Export, optionally upload and store a drafted motion"""
+    from src.ai_agents.motion_drafter import motion_drafter
+
+    response = MotionDraftingResponse(
+        status="success",
+        message=f"Motion drafted successfully: {motion_draft.total_page_estimate} pages",
+        draft_id=draft_id,
+        title=motion_draft.title,
+        total_pages=motion_draft.total_page_estimate,
+        total_words=motion_draft.total_word_count,
+        quality_score=motion_draft.coherence_score,
+        review_notes=motion_draft.review_notes,
+        quality_metrics=motion_draft.quality_metrics,
+        outline_id=outline_id,  # Include for reference
+    )
+
+    docx_path = None
+    if request.export_format in ["docx", "both"]:
+        with tempfile.NamedTemporaryFile(suffix=".docx", delete=False) as tmp_file:
+            docx_path = tmp_file.name
+            motion_drafter.export_to_docx(motion_draft, docx_path)
+
+            if request.upload_to_box and request.box_folder_id:
+                try:
+                    with open(docx_path, "rb") as f:
+                        box_client = get_client_registry().box_client()
+                        uploaded_file = box_client.upload_file(
+                            file_stream=f,
+                            file_name=f"{motion_draft.title}_{draft_id}.docx",
+                            parent_folder_id=request.box_folder_id,
+                            description=f"AI-drafted motion created on {motion_draft.creation_timestamp}",
+                        )
+
+                    response.box_file_id = uploaded_file.id
+                    response.box_web_link = (
+                        f"https://app.box.com/file/{uploaded_file.id}"
+                    )
+                    logger.info(f"Motion uploaded to Box: {uploaded_file.id}")
+                except Exception as e:
+                    logger.error(f"Failed to upload to Box: {str(e)}")
+                    response.review_notes.append(f"Box upload failed: {str(e)}")
+
+            response.export_links["docx"] = f"/download-draft/{draft_id}/docx"
+
+    if request.export_format in ["json", "both"]:
+        response.export_links["json"] = f"/download-draft/{draft_id}/json"
+
+    # Store draft data
+    if not hasattr(app, "draft_storage"):
+        app.draft_storage = {}
+
+    app.draft_storage[draft_id] = {
+        "motion_draft": motion_draft,
+        "docx_path": docx_path,
+        "created_at": datetime.utcnow(),
+        "outline_id": outline_id,
+    }
+
+    return response
+
+
 @app.post("/draft-motion-cached", response_model=MotionDraftingResponse)
 async def draft_motion_cached(request: MotionDraftingRequest):
     """
     Draft a motion using intelligent outline caching
     """
+    from src.ai_agents.motion_drafter import DocumentLength, motion_drafter
+    from src.ai_agents.outline_cache_manager import outline_cache
+
     start_time = datetime.utcnow()
 
     try:
@@ -1197,62 +1380,7 @@ async def draft_motion_cached(request: MotionDraftingRequest):
             f"{request.database_name}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
         )
 
-        # Prepare response
-        response = MotionDraftingResponse(
-            status="success",
-            message=f"Motion drafted successfully: {motion_draft.total_page_estimate} pages",
-            draft_id=draft_id,
-            title=motion_draft.title,
-            total_pages=motion_draft.total_page_estimate,
-            total_words=motion_draft.total_word_count,
-            quality_score=motion_draft.coherence_score,
-            review_notes=motion_draft.review_notes,
-            quality_metrics=motion_draft.quality_metrics,
-            outline_id=outline_id,  # Include for reference
-        )
-
-        # Handle export formats (same as before)
-        if request.export_format in ["docx", "both"]:
-            with tempfile.NamedTemporaryFile(suffix=".docx", delete=False) as tmp_file:
-                docx_path = tmp_file.name
-                motion_drafter.export_to_docx(motion_draft, docx_path)
-
-                if request.upload_to_box and request.box_folder_id:
-                    try:
-                        with open(docx_path, "rb") as f:
-                            uploaded_file = document_injector.box_client.upload_file(
-                                file_stream=f,
-                                file_name=f"{motion_draft.title}_{draft_id}.docx",
-                                parent_folder_id=request.box_folder_id,
-                                description=f"AI-drafted motion created on {motion_draft.creation_timestamp}",
-                            )
-
-                        response.box_file_id = uploaded_file.id
-                        response.box_web_link = (
-                            f"https://app.box.com/file/{uploaded_file.id}"
-                        )
-                        logger.info(f"Motion uploaded to Box: {uploaded_file.id}")
-                    except Exception as e:
-                        logger.error(f"Failed to upload to Box: {str(e)}")
-                        response.review_notes.append(f"Box upload failed: {str(e)}")
-
-                response.export_links["docx"] = f"/download-draft/{draft_id}/docx"
-
-        if request.export_format in ["json", "both"]:
-            response.export_links["json"] = f"/download-draft/{draft_id}/json"
-
-        # Store draft data
-        if not hasattr(app, "draft_storage"):
-            app.draft_storage = {}
-
-        app.draft_storage[draft_id] = {
-            "motion_draft": motion_draft,
-            "docx_path": docx_path
-            if request.export_format in ["docx", "both"]
-            else None,
-            "created_at": datetime.utcnow(),
-            "outline_id": outline_id,
-        }
+        response = _finalize_motion_draft(motion_draft, request, draft_id, outline_id)
 
         # Calculate duration
         duration = datetime.utcnow() - start_time
@@ -1269,12 +1397,115 @@ async def draft_motion_cached(request: MotionDraftingRequest):
         raise HTTPException(status_code=500, detail=f"Motion drafting failed: {str(e)}")
 
 
+async def _run_streaming_motion_draft(
+    stream,
+    request: MotionDraftingRequest,
+    outline_data: Dict[str, Any],
+    outline_id: str,
+):
+    """Background task that drafts a motion while streaming it over WebSocket"""
+    from src.ai_agents.motion_drafter import DocumentLength, motion_drafter
+
+    start_time = datetime.utcnow()
+
+    try:
+        try:
+            target_length_enum = DocumentLength[request.target_length]
+        except KeyError:
+            target_length_enum = DocumentLength.MEDIUM
+
+        motion_draft = await motion_drafter.draft_motion_with_cache(
+            outline=outline_data,
+            database_name=request.database_name,
+            target_length=target_length_enum,
+            motion_title=request.motion_title,
+            opposing_motion_text=request.opposing_motion_text,
+            outline_id=outline_id,
+            stream_callback=stream.handle_event,
+        )
+
+        draft_id = (
+            f"{request.database_name}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
+        )
+        response = _finalize_motion_draft(motion_draft, request, draft_id, outline_id)
+        response.processing_time_seconds = (
+            datetime.utcnow() - start_time
+        ).total_seconds()
+
+        await stream.completed(
+            {
+                **response.model_dump(mode="json"),
+                "sections": [
+                    motion_drafter.serialize_section(section)
+                    for section in motion_draft.sections
+                ],
+            }
+        )
+        logger.info(
+            f"Streaming motion {stream.motion_id} completed in {datetime.utcnow() - start_time}"
+        )
+
+    except Exception as e:
+        logger.error(
+            f"Error drafting streaming motion {stream.motion_id}: {str(e)}",
+            exc_info=True,
+        )
+        await stream.failed(f"Motion drafting failed: {str(e)}")
+
+
+@app.post("/draft-motion-stream", response_model=Dict[str, Any])
+async def draft_motion_stream(
+    request: MotionDraftingRequest, background_tasks: BackgroundTasks
+):
+    """
+    Draft a motion with real-time section streaming over WebSocket
+
+    Returns immediately with a motion_id. Emit ``subscribe_motion`` with that ID
+    on /ws/socket.io to receive ``motion:section_started``,
+    ``motion:section_delta`` (LLM tokens with character offsets),
+    ``motion:section_snapshot`` and finally ``motion:completed``, which carries
+    the same result as /draft-motion-cached.
+    """
+    from src.ai_agents.outline_cache_manager import outline_cache
+    from src.websocket import create_motion_stream
+
+    outline_data = request.outline
+    if isinstance(outline_data, list) and len(outline_data) > 0:
+        outline_data = outline_data[0]
+
+    try:
+        outline_id = await outline_cache.cache_outline(
+            outline_data, request.database_name
+        )
+    except Exception as e:
+        logger.error(f"Failed to cache outline for streaming draft: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    motion_id = str(uuid.uuid4())
+    stream = create_motion_stream(motion_id)
+
+    background_tasks.add_task(
+        _run_streaming_motion_draft, stream, request, outline_data, outline_id
+    )
+
+    return {
+        "motion_id": motion_id,
+        "outline_id": outline_id,
+        "status": "started",
+        "message": f"Streaming motion draft started for {request.database_name}",
+        "websocket_url": "/ws/socket.io",
+    }
+
+
 # Add endpoint to use already cached outline
 @app.post("/draft-motion-from-cache", response_model=MotionDraftingResponse)
 async def draft_motion_from_cache(request: CachedMotionDraftingRequest):
     """
     Draft a motion from an already cached outline
     """
+    from src.ai_agents.motion_drafter import DocumentLength, motion_drafter
+    from src.ai_agents.outline_cache_manager import outline_cache
+
     try:
         logger.info(f"Drafting from cached outline: {request.outline_id}")
 
@@ -1331,6 +1562,8 @@ async def draft_motion_from_cache(request: CachedMotionDraftingRequest):
 @app.get("/outline-cache/status")
 async def get_outline_cache_status():
     """Get status of the outline cache"""
+    from src.ai_agents.outline_cache_manager import outline_cache
+
     try:
         stats = await outline_cache.get_cache_stats()
         return {"status": "ok", "cache_stats": stats}
@@ -1343,6 +1576,8 @@ async def get_outline_cache_status():
 @app.get("/outline-cache/{outline_id}")
 async def get_cached_outline_info(outline_id: str):
     """Get information about a cached outline"""
+    from src.ai_agents.outline_cache_manager import outline_cache
+
     try:
         metadata = await outline_cache.get_outline_metadata(outline_id)
         if not metadata:
@@ -1449,11 +1684,13 @@ async def root():
         "version": "1.0.0",
         "endpoints": [
             "/health",
+            "/metrics",
             "/process/folder",
             "/search",
             "/cases",
             "/ai/query",
             "/draft-motion",
+            "/draft-motion-stream",
             "/websocket/status",
             "/docs",
         ],
@@ -2,8 +2,16 @@
 Clerk Legal AI System - Document Processing Components
 """
 
-from .document_injector_unified import UnifiedDocumentInjector, UnifiedProcessingResult
+from src.utils.lazy_imports import lazy_exports
 
 __all__ = ["UnifiedDocumentInjector", "UnifiedProcessingResult"]
 
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "UnifiedDocumentInjector": ".document_injector_unified",
+        "UnifiedProcessingResult": ".document_injector_unified",
+    },
+)
+
 __version__ = "0.1.0"
@@ -2,17 +2,7 @@
 AI Agents package for Clerk Legal AI System
 """
 
-from .motion_drafter import EnhancedMotionDraftingAgent as MotionDrafter
-from .case_researcher import CaseResearcher
-from .legal_document_agent import LegalDocumentAgent
-from .fact_extractor import FactExtractor
-from .evidence_mapper import EvidenceMapper
-from .enhanced_rag_agent import EnhancedRAGResearchAgent
-from .evidence_discovery_agent import (
-    EvidenceDiscoveryAgent,
-    ExhibitSuggestion,
-    ArgumentEvidence,
-)
+from src.utils.lazy_imports import lazy_exports
 
 __all__ = [
     "MotionDrafter",
@@ -25,3 +15,18 @@ __all__ = [
     "ExhibitSuggestion",
     "ArgumentEvidence",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "MotionDrafter": ".motion_drafter:EnhancedMotionDraftingAgent",
+        "CaseResearcher": ".case_researcher",
+        "LegalDocumentAgent": ".legal_document_agent",
+        "FactExtractor": ".fact_extractor",
+        "EvidenceMapper": ".evidence_mapper",
+        "EnhancedRAGResearchAgent": ".enhanced_rag_agent",
+        "EvidenceDiscoveryAgent": ".evidence_discovery_agent",
+        "ExhibitSuggestion": ".evidence_discovery_agent",
+        "ArgumentEvidence": ".evidence_discovery_agent",
+    },
+)
@@ -9,6 +9,9 @@ from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+from src.document_processing.transcript_index import LINE_MASK, TranscriptIndex
+from src.utils.legal_entity_scanner import get_legal_entity_scanner
+
 logger = logging.getLogger("clerk_api")
 
 
@@ -47,80 +50,20 @@ class CitationFormatter:
 
     def __init__(self):
         """Initialize citation formatter with regex patterns"""
+        self.scanner = get_legal_entity_scanner()
         self.patterns = self._compile_patterns()
 
     def _compile_patterns(self) -> Dict[str, re.Pattern]:
-        """Compile regex patterns for different citation types"""
-        return {
-            # Deposition patterns
-            "deposition_full": re.compile(
-                r"(?:Deposition\s+of|Dep\.\s+of|Depo\.\s+of)\s+([^,]+?)\s+"
-                r"(?:at|p\.|pp\.)\s*(\d+(?:[-]\d+)?)"
-                r"(?:\s*:\s*(\d+(?:[-]\d+)?))?",
-                re.IGNORECASE,
-            ),
-            "deposition_page_line": re.compile(r"(\d+:\d+(?:[-]\d+)?)", re.IGNORECASE),
-            # Exhibit patterns
-            "exhibit": re.compile(
-                r"(?:Exhibit|Ex\.|Exh\.)\s*([A-Z0-9]+(?:[-][A-Z0-9]+)?)", re.IGNORECASE
-            ),
-            "exhibit_with_desc": re.compile(
-                r"(?:Exhibit|Ex\.|Exh\.)\s*([A-Z0-9]+)(?:\s*[-]\s*([^,\.\)]+))?",
-                re.IGNORECASE,
-            ),
-            # Document patterns
-            "document_log": re.compile(
-                r"(?:Maintenance\s+Log|Driver\s+Log|Safety\s+Report|Inspection\s+Report)"
-                r"\s*(?:No\.|Nos\.|#)?\s*(\d+(?:[-]\d+)?)",
-                re.IGNORECASE,
-            ),
-            # Expert report patterns
-            "expert_report": re.compile(
-                r"(?:Expert\s+Report\s+of|Report\s+of)\s+(?:Dr\.|Mr\.|Ms\.)\s*([^,]+?)"
-                r"(?:\s+at\s+(\d+(?:[-]\d+)?))?",
-                re.IGNORECASE,
-            ),
-            # Internal communication patterns
-            "email": re.compile(
-                r"(?:Email|E-mail)\s+(?:from|by)\s+([^,]+?)\s+"
-                r"(?:dated|on)\s+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})",
-                re.IGNORECASE,
-            ),
-            # Date patterns
-            "date": re.compile(
-                r"(?:January|February|March|April|May|June|July|August|September|October|November|December)"
-                r"\s+\d{1,2},?\s+\d{4}|"
-                r"\d{1,2}[/-]\d{1,2}[/-]\d{2,4}",
-                re.IGNORECASE,
-            ),
-            # Case law patterns
-            "case_law": re.compile(
-                r"([A-Z][a-zA-Z]+(?:\s+[a-zA-Z]+)*)\s+v\.\s+"
-                r"([A-Z][a-zA-Z]+(?:\s+[a-zA-Z]+)*),?\s*"
-                r"(\d+\s+(?:So\.|F\.|U\.S\.|S\.\s*Ct\.)\s*(?:\d+d)?\s+\d+)"
-                r"(?:\s*\(([^)]+)\))?"
-            ),
-            # Statute patterns
-            "statute": re.compile(
-                r"(\d+)\s+(U\.S\.C\.|Fla\.\s*Stat\.)\s*(?:§|section)*\s*(\d+[\w\-\.]*)",
-                re.IGNORECASE,
-            ),
-            # Regulation patterns
-            "regulation": re.compile(
-                r"(\d+)\s+C\.F\.R\.\s*(?:§|section)*\s*(\d+\.\d+)", re.IGNORECASE
-            ),
-            # FMCSR patterns
-            "fmcsr": re.compile(
-                r"FMCSR\s+(\d+\.\d+(?:\([a-z]\)(?:\(\d+\))?)?)", re.IGNORECASE
-            ),
-        }
+        """Return the regex patterns for different citation types"""
+        # Compiled once in the shared scanner, see LEGAL_ENTITY_PATTERNS
+        return self.scanner.patterns_for("citation")
 
     def extract_citations_from_text(self, text: str) -> List[Citation]:
         """Extract all citations from a text block"""
         citations = []
 
         # Extract depositions
-        for match in self.patterns["deposition_full"].finditer(text):
+        for match in self.scanner.finditer(text, "citation.deposition_full"):
             deponent = match.group(1).strip()
             pages = match.group(2)
             lines = match.group(3) if match.group(3) else None
@@ -142,7 +85,7 @@ class CitationFormatter:
             )
 
         # Extract exhibits
-        for match in self.patterns["exhibit_with_desc"].finditer(text):
+        for match in self.scanner.finditer(text, "citation.exhibit_with_desc"):
             exhibit_num = match.group(1)
             description = match.group(2).strip() if match.group(2) else None
 
@@ -162,7 +105,7 @@ class CitationFormatter:
             )
 
         # Extract case law
-        for match in self.patterns["case_law"].finditer(text):
+        for match in self.scanner.finditer(text, "citation.case_law"):
             plaintiff = match.group(1)
             defendant = match.group(2)
             reporter = match.group(3)
@@ -185,7 +128,7 @@ class CitationFormatter:
             )
 
         # Extract FMCSR violations
-        for match in self.patterns["fmcsr"].finditer(text):
+        for match in self.scanner.finditer(text, "citation.fmcsr"):
             section = match.group(1)
             formatted = f"49 C.F.R. � {section}"
 
@@ -266,6 +209,39 @@ class CitationFormatter:
             page_reference=str(page) if "page" in locals() else None,
         )
 
+    def quote_deposition_citation(
+        self, citation: Citation, transcript_index: TranscriptIndex
+    ) -> Optional[str]:
+        """
+        Return the transcript text a deposition citation points to.
+
+        Page ranges without line references cover whole pages.
+
+        Returns:
+            Quoted testimony, or None if the cited lines are not in the transcript
+        """
+        if citation.citation_type != CitationType.DEPOSITION:
+            return None
+        if not citation.page_reference:
+            return None
+
+        pages = citation.page_reference.split("-")
+        if citation.line_reference:
+            lines = citation.line_reference.split("-")
+            line_start, line_end = int(lines[0]), int(lines[-1])
+        else:
+            line_start, line_end = 0, LINE_MASK
+
+        return transcript_index.lookup(
+            int(pages[0]), line_start, int(pages[-1]), line_end
+        )
+
+    def verify_deposition_citation(
+        self, citation: Citation, transcript_index: TranscriptIndex
+    ) -> bool:
+        """Check that a deposition citation points at existing testimony"""
+        return self.quote_deposition_citation(citation, transcript_index) is not None
+
     def _format_expert_citation(
         self, content: str, metadata: Dict[str, Any]
     ) -> Optional[Citation]:
@@ -0,0 +1,114 @@
+"""
+Per-draft vector index over retrieved case context
+Selects the facts and firm examples for each motion section by cosine similarity
+"""
+
+import logging
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger("clerk_api")
+
+
+def _item_content(item: Any) -> str:
+    """Get the text of a context item (search result object or dict)"""
+    if hasattr(item, "content"):
+        return item.content or ""
+    if isinstance(item, dict):
+        return item.get("content", "") or ""
+    return str(item)
+
+
+class DraftContextIndex:
+    """In-memory cosine similarity index built once per motion draft
+
+    Each named collection (e.g. "case_facts", "firm_knowledge") is stored as a
+    row-normalized float32 matrix of embeddings, so a section lookup is a
+    single matrix-vector product followed by a partial sort.
+    """
+
+    def __init__(self, embedding_generator, max_text_chars: int = 2000):
+        """
+        Initialize the index
+
+        Args:
+            embedding_generator: EmbeddingGenerator used for batch and query embeddings
+            max_text_chars: Characters of each item sent to the embedding model
+        """
+        self.embedding_generator = embedding_generator
+        self.max_text_chars = max_text_chars
+
+        self._items: Dict[str, List[Any]] = {}
+        self._matrices: Dict[str, np.ndarray] = {}
+        self._query_cache: Dict[str, np.ndarray] = {}
+
+    async def build(self, collections: Dict[str, List[Any]]) -> int:
+        """Embed every collection with one batched embedding request
+
+        Args:
+            collections: Collection name -> context items
+
+        Returns:
+            Number of items indexed
+        """
+        texts: List[str] = []
+        spans: Dict[str, Tuple[int, List[Any]]] = {}
+
+        for name, items in collections.items():
+            kept = [item for item in items or [] if _item_content(item).strip()]
+            spans[name] = (len(texts), kept)
+            texts.extend(_item_content(item)[: self.max_text_chars] for item in kept)
+
+        if not texts:
+            return 0
+
+        (
+            embeddings,
+            _,
+        ) = await self.embedding_generator.generate_embeddings_batch_async(texts)
+        matrix = self._normalize(np.asarray(embeddings, dtype=np.float32))
+
+        for name, (start, kept) in spans.items():
+            self._items[name] = kept
+            self._matrices[name] = matrix[start : start + len(kept)]
+
+        return len(texts)
+
+    @staticmethod
+    def _normalize(matrix: np.ndarray) -> np.ndarray:
+        """Scale rows to unit length so dot products are cosine similarities"""
+        norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    async def embed_query(self, text: str) -> Optional[np.ndarray]:
+        """Embed a section query, reusing earlier results for identical text"""
+        if not text.strip():
+            return None
+
+        key = text[: self.max_text_chars]
+        if key not in self._query_cache:
+            embedding, _ = await self.embedding_generator.generate_embedding_async(key)
+            self._query_cache[key] = self._normalize(
+                np.asarray(embedding, dtype=np.float32)
+            )
+
+        return self._query_cache[key]
+
+    def top_k(self, name: str, query_vector: Optional[np.ndarray], k: int) -> List[Any]:
+        """Return the k items of a collection most similar to the query"""
+        matrix = self._matrices.get(name)
+        if matrix is None or len(matrix) == 0 or query_vector is None or k <= 0:
+            return []
+
+        scores = matrix @ query_vector
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        return [self._items[name][i] for i in top]
+
+    def size(self, name: str) -> int:
+        """Number of indexed items in a collection"""
+        return len(self._items.get(name, []))
@@ -3,7 +3,9 @@ Enhanced RAG Research Agent with Case Isolation and Shared Knowledge Integration
 Searches case-specific evidence and shared legal knowledge while maintaining strict boundaries
 """
 
+import asyncio
 import logging
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field
 from enum import Enum
@@ -104,6 +106,42 @@ class EnhancedResearchResponse(BaseModel):
     case_isolation_verified: bool = True
 
 
+class CaseComponents:
+    """Case-scoped search components, created on first use and reused
+
+    Constructing these loads spaCy and checks Qdrant collections, so each is
+    built once per case in a worker thread and shared by later searches.
+    """
+
+    def __init__(self, case_name: str):
+        self.case_name = case_name
+        self._instances: Dict[str, Any] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    @staticmethod
+    def _factory(source_type: str):
+        return {
+            "fact": FactExtractor,
+            "deposition": DepositionParser,
+            "exhibit": ExhibitIndexer,
+        }[source_type]
+
+    async def get(self, source_type: str):
+        """Get the component for a source type, creating it if needed"""
+        instance = self._instances.get(source_type)
+        if instance is not None:
+            return instance
+
+        lock = self._locks.setdefault(source_type, asyncio.Lock())
+        async with lock:
+            if source_type not in self._instances:
+                loop = asyncio.get_running_loop()
+                self._instances[source_type] = await loop.run_in_executor(
+                    None, self._factory(source_type), self.case_name
+                )
+        return self._instances[source_type]
+
+
 class EnhancedRAGResearchAgent:
     """
     Enhanced RAG agent with case isolation and shared knowledge integration
@@ -125,6 +163,10 @@ class EnhancedRAGResearchAgent:
         self._florida_statutes_loader = None
         self._fmcsr_loader = None
 
+        # Case-scoped search components, reused across requests
+        self._case_components: "OrderedDict[str, CaseComponents]" = OrderedDict()
+        self.max_pooled_cases = 32
+
         logger.info("EnhancedRAGResearchAgent initialized")
     
     @property
@@ -277,88 +319,158 @@ Create concise, well-attributed summaries that support legal arguments.""",
             logger.error(f"Query optimization failed: {e}")
             return [question]  # Fallback to original question
 
+    def _get_case_components(self, case_name: str) -> "CaseComponents":
+        """Get the pooled search components for a case, most recent first"""
+        components = self._case_components.get(case_name)
+        if components is None:
+            components = CaseComponents(case_name)
+            self._case_components[case_name] = components
+
+            # Drop the least recently used case once the pool is full
+            if len(self._case_components) > self.max_pooled_cases:
+                evicted, _ = self._case_components.popitem(last=False)
+                logger.debug(f"Released pooled search components for {evicted}")
+        else:
+            self._case_components.move_to_end(case_name)
+
+        return components
+
     async def _search_case_databases(
         self, case_name: str, queries: List[str], request: EnhancedResearchRequest
     ) -> List[EnhancedResearchResult]:
-        """Search case-specific databases"""
+        """Search case-specific databases
+
+        Every (query, source type) search runs concurrently, and each query is
+        embedded once in a single batch shared by all source types.
+        """
         results = []
 
-        # Initialize case-specific extractors
-        fact_extractor = FactExtractor(case_name)
-        deposition_parser = DepositionParser(case_name)
-        exhibit_indexer = ExhibitIndexer(case_name)
+        source_types = [
+            source_type
+            for source_type, enabled in (
+                ("fact", request.include_facts),
+                ("deposition", request.include_depositions),
+                ("exhibit", request.include_exhibits),
+            )
+            if enabled
+        ]
+        if not queries or not source_types:
+            return results
+
+        components = self._get_case_components(case_name)
+        (
+            embeddings,
+            _,
+        ) = await self.embedding_generator.generate_embeddings_batch_async(queries)
+
+        searches = [
+            (query, embedding, source_type)
+            for query, embedding in zip(queries, embeddings)
+            for source_type in source_types
+        ]
+        outcomes = await asyncio.gather(
+            *(
+                self._search_case_source(
+                    components,
+                    source_type,
+                    query,
+                    embedding,
+                    request.max_results_per_type,
+                )
+                for query, embedding, source_type in searches
+            ),
+            return_exceptions=True,
+        )
 
-        for query in queries:
-            # Search facts
-            if request.include_facts:
-                facts = await fact_extractor.search_facts(
-                    query, limit=request.max_results_per_type
+        # Collect in query order, then source type order
+        for (query, _, source_type), outcome in zip(searches, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(
+                    f"{source_type.capitalize()} search failed for '{query}': {outcome}"
                 )
-                for fact in facts:
-                    results.append(
-                        EnhancedResearchResult(
-                            content=fact.content,
-                            source_type="fact",
-                            source_identifier=fact.id,
-                            source_collection=f"{case_name}_facts",
-                            case_name=case_name,
-                            score=fact.confidence_score,
-                            metadata={
-                                "category": fact.category,
-                                "source_document": fact.source_document,
-                                "extraction_date": fact.extraction_timestamp.isoformat(),
-                            },
-                            suggested_citation=f"Case Fact from {fact.source_document}",
-                        )
-                    )
+                continue
+            results.extend(outcome)
 
-            # Search depositions
-            if request.include_depositions:
-                depositions = await deposition_parser.search_testimony(
-                    query, limit=request.max_results_per_type
+        return results
+
+    async def _search_case_source(
+        self,
+        components: "CaseComponents",
+        source_type: str,
+        query: str,
+        query_embedding: List[float],
+        limit: int,
+    ) -> List[EnhancedResearchResult]:
+        """Run one case-scoped search and convert its hits to research results"""
+        case_name = components.case_name
+
+        if source_type == "fact":
+            fact_extractor = await components.get("fact")
+            facts = await fact_extractor.search_facts(
+                query, limit=limit, query_embedding=query_embedding
+            )
+            return [
+                EnhancedResearchResult(
+                    content=fact.content,
+                    source_type="fact",
+                    source_identifier=fact.id,
+                    source_collection=f"{case_name}_facts",
+                    case_name=case_name,
+                    score=fact.confidence_score,
+                    metadata={
+                        "category": fact.category,
+                        "source_document": fact.source_document,
+                        "extraction_date": fact.extraction_timestamp.isoformat(),
+                    },
+                    suggested_citation=f"Case Fact from {fact.source_document}",
                 )
-                for depo in depositions:
-                    results.append(
-                        EnhancedResearchResult(
-                            content=depo.testimony_excerpt,
-                            source_type="deposition",
-                            source_identifier=depo.id,
-                            source_collection=f"{case_name}_depositions",
-                            case_name=case_name,
-                            score=0.8,  # Default score
-                            metadata={
-                                "deponent": depo.deponent_name,
-                                "page": depo.page_start,
-                                "line": depo.line_start,
-                            },
-                            suggested_citation=depo.citation_format,
-                        )
-                    )
+                for fact in facts
+            ]
 
-            # Search exhibits
-            if request.include_exhibits:
-                exhibits = await exhibit_indexer.search_exhibits(
-                    query, limit=request.max_results_per_type
+        if source_type == "deposition":
+            deposition_parser = await components.get("deposition")
+            depositions = await deposition_parser.search_testimony(
+                query, limit=limit, query_embedding=query_embedding
+            )
+            return [
+                EnhancedResearchResult(
+                    content=depo.testimony_excerpt,
+                    source_type="deposition",
+                    source_identifier=depo.id,
+                    source_collection=f"{case_name}_depositions",
+                    case_name=case_name,
+                    score=0.8,  # Default score
+                    metadata={
+                        "deponent": depo.deponent_name,
+                        "page": depo.page_start,
+                        "line": depo.line_start,
+                    },
+                    suggested_citation=depo.citation_format,
                 )
-                for exhibit in exhibits:
-                    results.append(
-                        EnhancedResearchResult(
-                            content=exhibit.description,
-                            source_type="exhibit",
-                            source_identifier=exhibit.id,
-                            source_collection=f"{case_name}_exhibits",
-                            case_name=case_name,
-                            score=exhibit.relevance_score,
-                            metadata={
-                                "exhibit_number": exhibit.exhibit_number,
-                                "document_type": exhibit.document_type,
-                                "pages": exhibit.page_references,
-                            },
-                            suggested_citation=exhibit.exhibit_number,
-                        )
-                    )
+                for depo in depositions
+            ]
 
-        return results
+        exhibit_indexer = await components.get("exhibit")
+        exhibits = await exhibit_indexer.search_exhibits(
+            query, limit=limit, query_embedding=query_embedding
+        )
+        return [
+            EnhancedResearchResult(
+                content=exhibit.description,
+                source_type="exhibit",
+                source_identifier=exhibit.id,
+                source_collection=f"{case_name}_exhibits",
+                case_name=case_name,
+                score=exhibit.relevance_score,
+                metadata={
+                    "exhibit_number": exhibit.exhibit_number,
+                    "document_type": exhibit.document_type,
+                    "pages": exhibit.page_references,
+                },
+                suggested_citation=exhibit.exhibit_number,
+            )
+            for exhibit in exhibits
+        ]
 
     async def _search_shared_knowledge(
         self, queries: List[str], request: EnhancedResearchRequest
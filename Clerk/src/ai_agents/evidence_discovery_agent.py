@@ -14,6 +14,7 @@ from src.models.source_document_models import DocumentType
 from src.document_processing.source_document_indexer import SourceDocumentIndexer
 from src.vector_storage.qdrant_store import QdrantVectorStore
 from src.vector_storage.embeddings import EmbeddingGenerator
+from src.utils.metrics import metrics
 from config.settings import settings
 
 logger = logging.getLogger("clerk_api")
@@ -112,15 +113,19 @@ Format as JSON array with objects containing:
 """
 
         try:
-            response = self.openai_client.chat.completions.create(
-                model=settings.ai.default_model,
-                messages=[
-                    {"role": "system", "content": "You are a legal evidence analyst."},
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.3,
-                response_format={"type": "json_object"},
-            )
+            with metrics.timer("llm_call_seconds", model=settings.ai.default_model):
+                response = self.openai_client.chat.completions.create(
+                    model=settings.ai.default_model,
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": "You are a legal evidence analyst.",
+                        },
+                        {"role": "user", "content": prompt},
+                    ],
+                    temperature=0.3,
+                    response_format={"type": "json_object"},
+                )
 
             result = json.loads(response.choices[0].message.content)
             return result.get("evidence_needs", [])
@@ -180,15 +185,16 @@ If it doesn't support the argument, respond with "NOT RELEVANT".
 """
 
         try:
-            response = self.openai_client.chat.completions.create(
-                model=settings.ai.default_model,
-                messages=[
-                    {"role": "system", "content": "You are a legal analyst."},
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.3,
-                max_tokens=200,
-            )
+            with metrics.timer("llm_call_seconds", model=settings.ai.default_model):
+                response = self.openai_client.chat.completions.create(
+                    model=settings.ai.default_model,
+                    messages=[
+                        {"role": "system", "content": "You are a legal analyst."},
+                        {"role": "user", "content": prompt},
+                    ],
+                    temperature=0.3,
+                    max_tokens=200,
+                )
 
             purpose = response.choices[0].message.content.strip()
 
@@ -228,15 +234,16 @@ Focus on the logical flow and how they build upon each other.
 """
 
         try:
-            response = self.openai_client.chat.completions.create(
-                model=settings.ai.default_model,
-                messages=[
-                    {"role": "system", "content": "You are a legal strategist."},
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.3,
-                max_tokens=200,
-            )
+            with metrics.timer("llm_call_seconds", model=settings.ai.default_model):
+                response = self.openai_client.chat.completions.create(
+                    model=settings.ai.default_model,
+                    messages=[
+                        {"role": "system", "content": "You are a legal strategist."},
+                        {"role": "user", "content": prompt},
+                    ],
+                    temperature=0.3,
+                    max_tokens=200,
+                )
 
             return response.choices[0].message.content.strip()
 
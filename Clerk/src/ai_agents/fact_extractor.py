@@ -5,11 +5,13 @@ while maintaining strict case separation.
 """
 
 import re
+import asyncio
 import logging
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import json
 import uuid
+from functools import partial
 
 from pydantic_ai import Agent
 from pydantic_ai.models.openai import OpenAIModel
@@ -26,6 +28,12 @@ from src.models.fact_models import (
 )
 from src.vector_storage.qdrant_store import QdrantVectorStore
 from src.vector_storage.embeddings import EmbeddingGenerator
+from src.database.caching_manager import get_materialized_view_manager
+from src.services.fact_deduplicator import FactDeduplicator
+from src.utils.client_registry import get_client_registry
+from src.utils.fact_date_index import record_fact_upserts
+from src.utils.legal_entity_scanner import get_legal_entity_scanner
+from src.utils.metrics import metrics
 from config.settings import settings
 
 logger = logging.getLogger("clerk_api")
@@ -37,11 +45,31 @@ class FactExtractor:
     Uses NLP and pattern matching for entity and date extraction.
     """
 
-    def __init__(self, case_name: str):
-        """Initialize fact extractor for a specific case"""
+    def __init__(
+        self,
+        case_name: str,
+        max_concurrent_llm_calls: int = 8,
+        vector_store: Optional[QdrantVectorStore] = None,
+        embedding_generator: Optional[EmbeddingGenerator] = None,
+        openai_client: Optional[openai.OpenAI] = None,
+        async_openai_client: Optional[openai.AsyncOpenAI] = None,
+    ):
+        """Initialize fact extractor for a specific case
+
+        Args:
+            case_name: Case whose collections this extractor reads and writes
+            max_concurrent_llm_calls: Limit on in-flight LLM requests per extractor
+            vector_store: Vector store to use, defaults to one on the shared clients
+            embedding_generator: Embedding generator, defaults to one on the shared clients
+            openai_client: Sync OpenAI client, defaults to the registry's pooled client
+            async_openai_client: Async OpenAI client, defaults to the registry's pooled client
+        """
         self.case_name = self._validate_case_name(case_name)
-        self.vector_store = QdrantVectorStore()
-        self.embedding_generator = EmbeddingGenerator()
+        self.vector_store = vector_store or QdrantVectorStore()
+        self.embedding_generator = embedding_generator or EmbeddingGenerator()
+        self.deduplicator = FactDeduplicator(
+            self.vector_store, self.embedding_generator
+        )
 
         # Initialize NLP model for entity recognition
         try:
@@ -50,14 +78,20 @@ class FactExtractor:
             logger.warning("spaCy model not found. Running without NER support.")
             self.nlp = None
 
-        # Initialize OpenAI client
-        self.openai_client = openai.OpenAI(api_key=settings.openai.api_key)
+        # Shared pooled OpenAI clients
+        registry = get_client_registry()
+        self.openai_client = openai_client or registry.openai_client()
+        self.async_openai_client = async_openai_client or registry.async_openai_client()
+
+        # Bound concurrent chunk extraction and categorization requests
+        self._llm_semaphore = asyncio.Semaphore(max_concurrent_llm_calls)
 
         # Initialize LLM for fact categorization (pydantic_ai)
         self.llm_model = OpenAIModel(settings.ai.default_model)
         self.fact_categorizer = self._create_fact_categorizer()
 
         # Compile regex patterns
+        self.scanner = get_legal_entity_scanner()
         self.patterns = self._compile_patterns()
 
         # Case-specific collections
@@ -102,19 +136,12 @@ class FactExtractor:
                 re.I,
             ),
             "date_iso": re.compile(r"\b(\d{4})-(\d{2})-(\d{2})\b"),
-            # Deposition citation patterns
-            "deposition": re.compile(
-                r"(\w+)\s+Dep\.\s*(?:at\s*)?(\d+):(\d+)(?:-(\d+))?(?::(\d+))?"
-            ),
             "deposition_long": re.compile(
                 r"Deposition\s+of\s+([^,]+),\s*(?:taken\s+on\s+)?([^,]+),\s*(?:at\s*)?(?:pp?\.\s*)?(\d+)(?:-(\d+))?"
             ),
-            # Legal citation patterns
-            "case_citation": re.compile(
-                r"(\d+)\s+(\w+\.?\s*\d*[dst]?)\s+(\d+)(?:\s*\(([^)]+)\))?"
-            ),
-            "statute": re.compile(r"(?:Fla\.\s*Stat\.|F\.S\.)\s*§?\s*([\d.]+)"),
-            "cfr": re.compile(r"(\d+)\s+C\.F\.R\.\s*§?\s*([\d.]+)"),
+            # Deposition and legal citation patterns, shared with the other
+            # citation consumers through the entity scanner
+            **self.scanner.patterns_for("fact"),
             # Money patterns
             "money": re.compile(r"\$[\d,]+(?:\.\d{2})?|\b\d+\s*dollars?\b", re.I),
             # Vehicle patterns
@@ -163,26 +190,37 @@ class FactExtractor:
         # Split document into chunks for processing
         chunks = self._split_into_chunks(document_content)
 
-        for i, chunk in enumerate(chunks):
-            # Extract different types of information
-            facts = await self._extract_facts_from_chunk(chunk, document_id, i)
-            dates = self._extract_dates(chunk)
-            entities = self._extract_entities(chunk) if self.nlp else {}
-            citations = self._extract_citations(chunk)
-
-            # Create fact objects
-            for fact_text in facts:
-                # Extract entities specific to this fact
-                fact_entities = self._extract_entities(fact_text) if self.nlp else {}
-                # Extract dates specific to this fact
-                fact_dates = self._extract_dates(fact_text)
-                # Extract citations specific to this fact
-                fact_citations = self._extract_citations(fact_text)
-
-                fact = await self._create_fact(
+        # Extract fact statements from all chunks concurrently
+        chunk_facts = await asyncio.gather(
+            *(
+                self._extract_facts_from_chunk(chunk, document_id, i)
+                for i, chunk in enumerate(chunks)
+            )
+        )
+        fact_sources = [
+            (fact_text, i) for i, facts in enumerate(chunk_facts) for fact_text in facts
+        ]
+
+        # Extract entities, dates and citations for every fact in one pass,
+        # off the event loop since spaCy and dateparser are CPU-bound
+        loop = asyncio.get_running_loop()
+        annotations = await loop.run_in_executor(
+            None, self._annotate_facts, [fact_text for fact_text, _ in fact_sources]
+        )
+
+        # Categorize and create fact objects concurrently
+        facts = await asyncio.gather(
+            *(
+                self._create_fact(
                     fact_text, document_id, i, fact_dates, fact_entities, fact_citations
                 )
-                collection.add_fact(fact)
+                for (fact_text, i), (fact_entities, fact_dates, fact_citations) in zip(
+                    fact_sources, annotations
+                )
+            )
+        )
+        for fact in facts:
+            collection.add_fact(fact)
 
         collection.extraction_end_time = datetime.now()
         collection.total_documents_processed = 1
@@ -231,19 +269,21 @@ class FactExtractor:
         Facts (one per line):"""
 
         try:
-            # Use OpenAI client directly
-            response = self.openai_client.chat.completions.create(
-                model=settings.ai.default_model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a legal fact extractor. Extract key factual statements from legal text.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.3,
-                max_tokens=500,
-            )
+            # Use the async OpenAI client so other requests keep running
+            async with self._llm_semaphore:
+                with metrics.timer("llm_call_seconds", model=settings.ai.default_model):
+                    response = await self.async_openai_client.chat.completions.create(
+                        model=settings.ai.default_model,
+                        messages=[
+                            {
+                                "role": "system",
+                                "content": "You are a legal fact extractor. Extract key factual statements from legal text.",
+                            },
+                            {"role": "user", "content": prompt},
+                        ],
+                        temperature=0.3,
+                        max_tokens=500,
+                    )
 
             facts_text = response.choices[0].message.content
             facts = [f.strip() for f in facts_text.split("\n") if f.strip()]
@@ -306,12 +346,38 @@ class FactExtractor:
 
         return dates
 
-    def _extract_entities(self, text: str) -> Dict[EntityType, List[str]]:
-        """Extract named entities using spaCy"""
+    def _annotate_facts(
+        self, fact_texts: List[str]
+    ) -> List[Tuple[Dict[EntityType, List[str]], List[DateReference], List[str]]]:
+        """Extract entities, dates and citations for many facts
+
+        spaCy parses all texts in batches with nlp.pipe instead of one call
+        per fact.
+
+        Returns:
+            (entities, dates, citations) for each fact, in input order
+        """
+        if self.nlp and fact_texts:
+            docs = self.nlp.pipe(fact_texts, batch_size=64)
+        else:
+            docs = [None] * len(fact_texts)
+
+        return [
+            (
+                self._extract_entities(fact_text, doc) if self.nlp else {},
+                self._extract_dates(fact_text),
+                self._extract_citations(fact_text),
+            )
+            for fact_text, doc in zip(fact_texts, docs)
+        ]
+
+    def _extract_entities(self, text: str, doc=None) -> Dict[EntityType, List[str]]:
+        """Extract named entities using spaCy, reusing a parsed doc if given"""
         if not self.nlp:
             return {}
 
-        doc = self.nlp(text)
+        if doc is None:
+            doc = self.nlp(text)
         entities = {entity_type: [] for entity_type in EntityType}
 
         # Map spaCy labels to our entity types
@@ -407,22 +473,22 @@ class FactExtractor:
         citations = []
 
         # Deposition citations
-        for match in self.patterns["deposition"].finditer(text):
+        for match in self.scanner.finditer(text, "fact.deposition"):
             citation = match.group(0)
             citations.append(citation)
 
         # Case citations
-        for match in self.patterns["case_citation"].finditer(text):
+        for match in self.scanner.finditer(text, "fact.case_citation"):
             citation = match.group(0)
             citations.append(citation)
 
         # Statute citations
-        for match in self.patterns["statute"].finditer(text):
+        for match in self.scanner.finditer(text, "fact.statute"):
             citation = match.group(0)
             citations.append(citation)
 
         # CFR citations
-        for match in self.patterns["cfr"].finditer(text):
+        for match in self.scanner.finditer(text, "fact.cfr"):
             citation = match.group(0)
             citations.append(citation)
 
@@ -443,7 +509,8 @@ class FactExtractor:
 
         # Categorize the fact
         try:
-            category_response = await self.fact_categorizer.run(fact_text)
+            async with self._llm_semaphore:
+                category_response = await self.fact_categorizer.run(fact_text)
             category = FactCategory(category_response.data.lower())
         except:
             category = FactCategory.SUBSTANTIVE  # Default
@@ -484,11 +551,26 @@ class FactExtractor:
         """Store facts in case-specific vector database"""
         points = []
 
-        for fact in collection.facts:
-            # Generate embedding for fact content
-            embedding, _ = await self.embedding_generator.generate_embedding_async(
-                fact.content
+        # Drop facts repeated across chunks or already stored for the case;
+        # the deduplicator embeds all facts in one batched request
+        dedup = await self.deduplicator.find_duplicates(
+            [fact.content for fact in collection.facts],
+            self.facts_collection,
+            ids=[fact.id for fact in collection.facts],
+        )
+        if len(dedup.unique_indices) < len(collection.facts):
+            logger.info(
+                f"Skipping {len(collection.facts) - len(dedup.unique_indices)} "
+                f"duplicate facts for {self.case_name}"
             )
+            facts = [collection.facts[i] for i in dedup.unique_indices]
+            collection.facts = []
+            collection.fact_count_by_category = {}
+            for fact in facts:
+                collection.add_fact(fact)
+        embeddings = [dedup.embeddings[i] for i in dedup.unique_indices]
+
+        for fact, embedding in zip(collection.facts, embeddings):
 
             # Prepare metadata
             metadata = {
@@ -527,10 +609,21 @@ class FactExtractor:
 
         # Store in case-specific collection
         if points:
-            self.vector_store.client.upsert(
-                collection_name=self.facts_collection, points=points
-            )
+            loop = asyncio.get_running_loop()
+            with metrics.timer("qdrant_upsert_seconds", target="facts"):
+                await loop.run_in_executor(
+                    None,
+                    partial(
+                        self.vector_store.client.upsert,
+                        collection_name=self.facts_collection,
+                        points=points,
+                    ),
+                )
             logger.info(f"Stored {len(points)} facts in {self.facts_collection}")
+            record_fact_upserts(self.case_name, collection.facts)
+            get_materialized_view_manager().record_fact_count_change(
+                self.case_name, len(points)
+            )
 
     async def search_facts(
         self,
@@ -538,12 +631,19 @@ class FactExtractor:
         category_filter: Optional[List[FactCategory]] = None,
         date_range: Optional[Tuple[datetime, datetime]] = None,
         limit: int = 20,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[CaseFact]:
-        """Search facts within this case only"""
+        """Search facts within this case only
+
+        A precomputed query_embedding can be passed to share one embedding
+        across several searches for the same query.
+        """
         # Generate query embedding
-        query_embedding, _ = await self.embedding_generator.generate_embedding_async(
-            query
-        )
+        if query_embedding is None:
+            (
+                query_embedding,
+                _,
+            ) = await self.embedding_generator.generate_embedding_async(query)
 
         # Build filter
         must_conditions = [{"key": "case_name", "match": {"value": self.case_name}}]
@@ -570,20 +670,23 @@ class FactExtractor:
         # Search case-specific collection
         if settings.legal.enable_hybrid_search:
             # For hybrid collections, specify the vector name
-            results = self.vector_store.client.search(
-                collection_name=self.facts_collection,
-                query_vector=("semantic", query_embedding),  # Named vector search
-                query_filter={"must": must_conditions},
-                limit=limit,
-            )
+            query_vector = ("semantic", query_embedding)  # Named vector search
         else:
             # For standard collections, use unnamed vector
-            results = self.vector_store.client.search(
+            query_vector = query_embedding
+
+        # Run the blocking Qdrant call off the event loop
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(
+            None,
+            partial(
+                self.vector_store.client.search,
                 collection_name=self.facts_collection,
-                query_vector=query_embedding,
+                query_vector=query_vector,
                 query_filter={"must": must_conditions},
                 limit=limit,
-            )
+            ),
+        )
 
         # Convert results back to CaseFact objects
         facts = []
@@ -108,8 +108,8 @@ async def search_case_documents(
         )
 
         # Generate embedding for the query
-        query_embedding, token_count = ctx.deps.embedding_generator.generate_embedding(
-            query
+        query_embedding, token_count = (
+            await ctx.deps.embedding_generator.generate_embedding_async(query)
         )
 
         # Use hybrid search with reranking
@@ -8,63 +8,59 @@ import json
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 import asyncio
-from dataclasses import dataclass, field
-import pickle
 from functools import wraps
 
+from src.utils.cache import CacheEntry, SharedCache, SpillStore, create_spill_store
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
-@dataclass
-class CacheEntry:
-    """Single cache entry with metadata"""
-
-    key: str
-    value: Any
-    created_at: datetime
-    accessed_at: datetime
-    access_count: int = 0
-    size_bytes: int = 0
-    ttl_seconds: int = 3600
-    tags: List[str] = field(default_factory=list)
-
-    def is_expired(self) -> bool:
-        """Check if cache entry has expired"""
-        return (datetime.utcnow() - self.created_at).total_seconds() > self.ttl_seconds
-
-    def touch(self):
-        """Update access time and count"""
-        self.accessed_at = datetime.utcnow()
-        self.access_count += 1
-
-
 class MotionDraftingCache:
     """Specialized cache for motion drafting operations"""
 
-    def __init__(self, max_size_mb: int = 500, default_ttl: int = 3600):
+    def __init__(
+        self,
+        max_size_mb: int = 500,
+        default_ttl: int = 3600,
+        spill_store: Optional[SpillStore] = None,
+    ):
         """
         Initialize cache manager
 
         Args:
-            max_size_mb: Maximum cache size in megabytes
+            max_size_mb: Maximum in-memory cache size in megabytes
             default_ttl: Default time-to-live in seconds
+            spill_store: Optional disk or Redis tier shared between workers
         """
-        self.cache: Dict[str, CacheEntry] = {}
         self.max_size_bytes = max_size_mb * 1024 * 1024
-        self.current_size_bytes = 0
         self.default_ttl = default_ttl
+        # Drafting results are mostly reread by the worker that produced them,
+        # so only entries evicted from memory are pickled and spilled
+        self.cache = SharedCache(
+            self.max_size_bytes,
+            default_ttl=default_ttl,
+            spill_store=spill_store,
+            write_through=False,
+        )
 
-        # Cache statistics
-        self.hits = 0
-        self.misses = 0
-        self.evictions = 0
+        logger.info(f"Initialized motion cache with {max_size_mb}MB limit")
 
-        # Lock for thread safety
-        self._lock = asyncio.Lock()
+    @property
+    def current_size_bytes(self) -> int:
+        return self.cache.current_size_bytes
 
-        logger.info(f"Initialized motion cache with {max_size_mb}MB limit")
+    @property
+    def hits(self) -> int:
+        return self.cache.hits
+
+    @property
+    def misses(self) -> int:
+        return self.cache.misses
+
+    @property
+    def evictions(self) -> int:
+        return self.cache.evictions
 
     def _generate_key(self, operation: str, **kwargs) -> str:
         """Generate cache key from operation and parameters"""
@@ -75,38 +71,17 @@ class MotionDraftingCache:
         # Use SHA256 for consistent, fixed-length keys
         return hashlib.sha256(key_data.encode()).hexdigest()
 
-    def _estimate_size(self, value: Any) -> int:
-        """Estimate size of value in bytes"""
-        try:
-            return len(pickle.dumps(value))
-        except:
-            # Fallback for non-pickleable objects
-            return len(str(value).encode())
-
     async def get(self, operation: str, **kwargs) -> Optional[Any]:
         """Get value from cache"""
-        async with self._lock:
-            key = self._generate_key(operation, **kwargs)
-
-            if key in self.cache:
-                entry = self.cache[key]
-
-                # Check expiration
-                if entry.is_expired():
-                    self._remove_entry(key)
-                    self.misses += 1
-                    return None
-
-                # Update access info
-                entry.touch()
-                self.hits += 1
-
-                logger.debug(f"Cache hit for {operation}")
-                return entry.value
+        key = self._generate_key(operation, **kwargs)
+        entry = await self.cache.get_entry(key)
 
-            self.misses += 1
+        if entry is None:
             return None
 
+        logger.debug(f"Cache hit for {operation}")
+        return entry.value
+
     async def set(
         self,
         operation: str,
@@ -116,89 +91,24 @@ class MotionDraftingCache:
         **kwargs,
     ):
         """Set value in cache"""
-        async with self._lock:
-            key = self._generate_key(operation, **kwargs)
-            size = self._estimate_size(value)
-
-            # Check if we need to evict entries
-            while self.current_size_bytes + size > self.max_size_bytes:
-                if not self._evict_lru():
-                    logger.warning("Cannot evict more entries, cache might be full")
-                    break
-
-            # Create cache entry
-            entry = CacheEntry(
-                key=key,
-                value=value,
-                created_at=datetime.utcnow(),
-                accessed_at=datetime.utcnow(),
-                size_bytes=size,
-                ttl_seconds=ttl or self.default_ttl,
-                tags=tags or [],
-            )
-
-            # Store entry
-            self.cache[key] = entry
-            self.current_size_bytes += size
-
-            logger.debug(f"Cached {operation} ({size} bytes)")
-
-    def _remove_entry(self, key: str):
-        """Remove entry from cache"""
-        if key in self.cache:
-            entry = self.cache[key]
-            self.current_size_bytes -= entry.size_bytes
-            del self.cache[key]
+        key = self._generate_key(operation, **kwargs)
+        entry = await self.cache.set(key, value, ttl=ttl, tags=tags)
 
-    def _evict_lru(self) -> bool:
-        """Evict least recently used entry"""
-        if not self.cache:
-            return False
-
-        # Find LRU entry
-        lru_key = min(self.cache.keys(), key=lambda k: self.cache[k].accessed_at)
-
-        self._remove_entry(lru_key)
-        self.evictions += 1
-
-        logger.debug(f"Evicted LRU entry: {lru_key[:8]}...")
-        return True
+        logger.debug(f"Cached {operation} ({entry.size_bytes} bytes)")
 
     async def invalidate_by_tags(self, tags: List[str]):
         """Invalidate all entries with specified tags"""
-        async with self._lock:
-            keys_to_remove = []
-
-            for key, entry in self.cache.items():
-                if any(tag in entry.tags for tag in tags):
-                    keys_to_remove.append(key)
-
-            for key in keys_to_remove:
-                self._remove_entry(key)
-
-            logger.info(f"Invalidated {len(keys_to_remove)} entries with tags {tags}")
+        removed = await self.cache.invalidate_by_tags(tags)
+        logger.info(f"Invalidated {removed} entries with tags {tags}")
 
     async def clear(self):
         """Clear entire cache"""
-        async with self._lock:
-            self.cache.clear()
-            self.current_size_bytes = 0
-            logger.info("Cache cleared")
+        await self.cache.clear()
+        logger.info("Cache cleared")
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
-        total_requests = self.hits + self.misses
-        hit_rate = self.hits / total_requests if total_requests > 0 else 0
-
-        return {
-            "hits": self.hits,
-            "misses": self.misses,
-            "evictions": self.evictions,
-            "hit_rate": hit_rate,
-            "entries": len(self.cache),
-            "size_bytes": self.current_size_bytes,
-            "size_mb": self.current_size_bytes / (1024 * 1024),
-        }
+        return self.cache.get_stats()
 
 
 class ContextCache:
@@ -281,7 +191,9 @@ class ContextCache:
 
 
 # Global cache instances
-motion_cache = MotionDraftingCache(max_size_mb=500, default_ttl=3600)
+motion_cache = MotionDraftingCache(
+    max_size_mb=500, default_ttl=3600, spill_store=create_spill_store("motion")
+)
 context_cache = ContextCache()
 
 
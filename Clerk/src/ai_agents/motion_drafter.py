@@ -5,7 +5,7 @@ Implements section-by-section legal motion generation with improved database acc
 
 import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Awaitable
 from datetime import datetime
 from dataclasses import dataclass, field
 from enum import Enum
@@ -14,19 +14,29 @@ import re
 from pydantic_ai import Agent
 from pydantic_ai.models.openai import OpenAIModel
 from openai import AsyncOpenAI
-import tiktoken
 
 from src.vector_storage.qdrant_store import QdrantVectorStore
 from src.vector_storage.embeddings import EmbeddingGenerator
 from src.ai_agents.outline_cache_manager import outline_cache
 from src.ai_agents.rag_research_agent import rag_research_agent, ResearchRequest
 from src.ai_agents.legal_formatter import legal_formatter
+from src.ai_agents.draft_context_index import DraftContextIndex
+from src.ai_agents.prompt_assembler import (
+    PromptAssembler,
+    PromptBlock,
+    get_tokenizer,
+)
 from src.utils.timeout_monitor import TimeoutMonitor
+from src.utils.legal_entity_scanner import get_legal_entity_scanner
+from src.utils.metrics import metrics
 from config.settings import settings
 
 # Use the same logger as the main API to ensure messages are visible
 logger = logging.getLogger("clerk_api")
 
+# Receives (event_name, payload) while a motion is drafted in streaming mode
+StreamCallback = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
 
 class SectionType(Enum):
     """Types of sections in a legal motion"""
@@ -128,15 +138,20 @@ class EnhancedMotionDraftingAgent:
         # Initialize AI agents with enhanced prompts
         self.section_writer = self._create_enhanced_section_writer()
 
-        # Initialize tokenizer
-        self.tokenizer = tiktoken.encoding_for_model("gpt-4")
+        # Initialize tokenizer (shared, loaded once per process)
+        self.tokenizer = get_tokenizer("gpt-4")
 
         # Enhanced configuration
         self.words_per_page = 250
         self.max_expansion_cycles = 5
         self.min_confidence_threshold = 0.75
+        self.scanner = get_legal_entity_scanner()
         self.citation_patterns = self._compile_citation_patterns()
 
+        # Prompt token budgets (tokens of input per LLM call)
+        self.section_prompt_token_budget = 3000
+        self.expansion_prompt_token_budget = 6000
+
         # Track document-wide context
         self.document_context = {
             "themes": [],
@@ -236,26 +251,10 @@ Remember: Judges want SPECIFIC EVIDENCE, not general allegations.""",
             raise
 
     def _compile_citation_patterns(self) -> List[re.Pattern]:
-        """Compile regex patterns for citation extraction"""
-        patterns = [
-            # Federal cases
-            re.compile(r"\d+\s+U\.S\.\s+\d+(?:\s+\(\d{4}\))?"),
-            re.compile(r"\d+\s+F\.\d+d\s+\d+(?:\s+\([^)]+\d{4}\))?"),
-            re.compile(r"\d+\s+F\.\s*Supp\.\s*\d+d?\s+\d+(?:\s+\([^)]+\d{4}\))?"),
-            re.compile(r"\d+\s+S\.\s*Ct\.\s+\d+(?:\s+\(\d{4}\))?"),
-            # State cases
-            re.compile(r"\d+\s+[A-Z][a-z]+\.(?:\s+\d+d)?\s+\d+(?:\s+\([^)]+\d{4}\))?"),
-            # Case names
-            re.compile(r"[A-Z][a-zA-Z]+\s+v\.\s+[A-Z][a-zA-Z]+(?:,\s+\d+)?"),
-            # Statutes
-            re.compile(r"\d+\s+U\.S\.C\.\s+§+\s*\d+[\w\-\.]*"),
-            re.compile(r"[A-Z][a-z]+\.\s+Stat\.\s+(?:Ann\.\s+)?§+\s*\d+[\w\-\.]*"),
-            # Regulations
-            re.compile(r"\d+\s+C\.F\.R\.\s+§*\s*\d+\.\d+"),
-            # Rules
-            re.compile(r"Fed\.\s*R\.\s*(?:Civ|Crim|Evid|App)\.\s*P\.\s*\d+[a-z]*"),
-        ]
-        return patterns
+        """Return the regex patterns for citation extraction"""
+        # Federal and state cases, case names, statutes, regulations and rules
+        # live in the shared entity scanner
+        return list(self.scanner.patterns_for("motion").values())
 
     def _determine_section_type(self, title: str) -> SectionType:
         """Determine section type from title with proper legal motion structure"""
@@ -940,9 +939,15 @@ Remember: Judges want SPECIFIC EVIDENCE, not general allegations.""",
         motion_title: Optional[str] = None,
         opposing_motion_text: Optional[str] = None,
         outline_id: Optional[str] = None,  # If already cached
+        stream_callback: Optional[StreamCallback] = None,
     ) -> MotionDraft:
         """
         Enhanced motion drafting with fixed database access and firm knowledge
+
+        When stream_callback is given, section LLM output is forwarded as it is
+        generated ("section_started", "section_delta" and "section_snapshot"
+        events). The drafting pipeline itself is unchanged, so the returned
+        MotionDraft is identical to the non-streaming result.
         """
         start_time = datetime.utcnow()
         logger.info(
@@ -1057,6 +1062,11 @@ Remember: Judges want SPECIFIC EVIDENCE, not general allegations.""",
                     f"[MOTION_DRAFTER] Basic search also failed: {search_error}"
                 )
 
+        # Index retrieved facts and firm examples once for per-section selection;
+        # kept local because the drafter is shared by concurrent drafts
+        context_index = await self._build_context_index(case_context)
+        timeout_monitor.log_progress("Case context indexed")
+
         # Process sections individually
         drafted_sections = []
         total_words = 0
@@ -1120,6 +1130,12 @@ Remember: Judges want SPECIFIC EVIDENCE, not general allegations.""",
                     drafted_sections, case_context
                 )
 
+                await self._emit_stream_event(
+                    stream_callback,
+                    "section_started",
+                    {"index": i, "heading": section_info["heading"], "revision": 0},
+                )
+
                 # Draft the section with longer timeout
                 drafted_section = await asyncio.wait_for(
                     self._draft_section_efficiently(
@@ -1127,20 +1143,37 @@ Remember: Judges want SPECIFIC EVIDENCE, not general allegations.""",
                         section_data,  # Pass full section data separately
                         case_context,
                         cumulative_context,
+                        on_delta=self._make_delta_forwarder(stream_callback, i, 0),
+                        context_index=context_index,
+                        timeout_monitor=timeout_monitor,
                     ),
                     timeout=60.0,  # 60 seconds per section
                 )
 
                 # Expand if needed
                 if drafted_section.word_count < outline_section.target_length * 0.9:
+                    # Expansion rewrites the whole section, so streaming clients
+                    # start a new revision of it from offset 0
+                    await self._emit_stream_event(
+                        stream_callback,
+                        "section_started",
+                        {"index": i, "heading": section_info["heading"], "revision": 1},
+                    )
                     drafted_section = await self._expand_section_efficiently(
                         drafted_section,
                         section_data,
                         outline_section.target_length,
                         case_context,
+                        on_delta=self._make_delta_forwarder(stream_callback, i, 1),
+                        timeout_monitor=timeout_monitor,
                     )
 
                 drafted_sections.append(drafted_section)
+                await self._emit_stream_event(
+                    stream_callback,
+                    "section_snapshot",
+                    {"index": i, "section": self.serialize_section(drafted_section)},
+                )
                 total_words += drafted_section.word_count
 
                 # Update document context incrementally
@@ -1158,6 +1191,11 @@ Remember: Judges want SPECIFIC EVIDENCE, not general allegations.""",
                     outline_section, "Section timed out"
                 )
                 drafted_sections.append(drafted_section)
+                await self._emit_stream_event(
+                    stream_callback,
+                    "section_snapshot",
+                    {"index": i, "section": self.serialize_section(drafted_section)},
+                )
             except Exception as e:
                 logger.error(
                     f"[MOTION_DRAFTER] Error drafting section {i + 1}: {str(e)}",
@@ -1171,6 +1209,11 @@ Remember: Judges want SPECIFIC EVIDENCE, not general allegations.""",
                     outline_section, str(e)
                 )
                 drafted_sections.append(drafted_section)
+                await self._emit_stream_event(
+                    stream_callback,
+                    "section_snapshot",
+                    {"index": i, "section": self.serialize_section(drafted_section)},
+                )
 
         # Post-process sections to ensure proper structure
         logger.info("[MOTION_DRAFTER] Post-processing sections for proper structure")
@@ -1287,12 +1330,149 @@ Remember: Judges want SPECIFIC EVIDENCE, not general allegations.""",
             revision_notes=[f"Section failed to draft: {error_msg}"],
         )
 
+    async def _build_context_index(
+        self, case_context: Dict[str, Any]
+    ) -> Optional[DraftContextIndex]:
+        """Embed retrieved case facts and firm examples for similarity selection"""
+        index = DraftContextIndex(self.embedding_generator)
+        try:
+            indexed = await index.build(
+                {
+                    "case_facts": case_context.get("case_facts", []),
+                    "firm_knowledge": case_context.get("firm_knowledge", []),
+                }
+            )
+            logger.info(f"[MOTION_DRAFTER] Indexed {indexed} context items")
+            return index
+        except Exception as e:
+            logger.warning(
+                f"[MOTION_DRAFTER] Context indexing failed, using retrieval order: {e}"
+            )
+            return None
+
+    async def _embed_section_query(
+        self,
+        outline_section: OutlineSection,
+        index: Optional[DraftContextIndex],
+    ) -> Optional[Any]:
+        """Embed a section's title and content points for context selection"""
+        if index is None:
+            return None
+
+        query = "\n".join([outline_section.title, *outline_section.content_points])
+        try:
+            return await index.embed_query(query)
+        except Exception as e:
+            logger.debug(f"Error embedding section query: {e}")
+            return None
+
+    def _assemble_prompt(
+        self,
+        assembler: PromptAssembler,
+        label: str,
+        build: Callable[[Dict[str, str]], str],
+        blocks: List[PromptBlock],
+        timeout_monitor: Optional[TimeoutMonitor] = None,
+    ) -> str:
+        """Fit prompt blocks into the assembler's budget and render the prompt"""
+        template_tokens = assembler.count_tokens(build({b.name: "" for b in blocks}))
+        parts, usage = assembler.fit(blocks, reserved_tokens=template_tokens)
+        prompt = build(parts)
+        self._record_prompt_budget(
+            label, assembler, prompt, usage.blocks, timeout_monitor
+        )
+        return prompt
+
+    def _record_prompt_budget(
+        self,
+        label: str,
+        assembler: PromptAssembler,
+        prompt: str,
+        blocks: Optional[Dict[str, Dict[str, int]]] = None,
+        timeout_monitor: Optional[TimeoutMonitor] = None,
+    ):
+        """Log a prompt's token budget utilization to the draft's timeout monitor"""
+        prompt_tokens = assembler.count_tokens(prompt)
+        usage = {
+            "budget": assembler.token_budget,
+            "prompt_tokens": prompt_tokens,
+            "utilization": round(prompt_tokens / assembler.token_budget, 3),
+            "blocks": blocks or {},
+        }
+        if timeout_monitor is not None:
+            timeout_monitor.log_prompt_budget(label, usage)
+
+    async def _emit_stream_event(
+        self,
+        stream_callback: Optional[StreamCallback],
+        event: str,
+        payload: Dict[str, Any],
+    ):
+        """Forward a streaming event without letting client failures abort the draft"""
+        if stream_callback is None:
+            return
+        try:
+            await stream_callback(event, payload)
+        except Exception as e:
+            logger.warning(f"[MOTION_DRAFTER] Failed to emit stream event {event}: {e}")
+
+    def _make_delta_forwarder(
+        self, stream_callback: Optional[StreamCallback], index: int, revision: int
+    ) -> Optional[Callable[[str], Awaitable[None]]]:
+        """Build a token delta callback for one revision of a section"""
+        if stream_callback is None:
+            return None
+
+        async def on_delta(delta: str):
+            await self._emit_stream_event(
+                stream_callback,
+                "section_delta",
+                {"index": index, "revision": revision, "delta": delta},
+            )
+
+        return on_delta
+
+    async def _run_section_writer(
+        self,
+        prompt: str,
+        on_delta: Optional[Callable[[str], Awaitable[None]]] = None,
+    ) -> str:
+        """Run the section writer, streaming text deltas to on_delta when given"""
+        with metrics.timer("llm_call_seconds", model=self.primary_model.model_name):
+            if on_delta is None:
+                result = await self.section_writer.run(prompt)
+                return str(result.data) if hasattr(result, "data") else str(result)
+
+            chunks = []
+            async with self.section_writer.run_stream(prompt) as result:
+                async for delta in result.stream_text(delta=True):
+                    chunks.append(delta)
+                    await on_delta(delta)
+            return "".join(chunks)
+
+    def serialize_section(self, section: DraftedSection) -> Dict[str, Any]:
+        """Convert a drafted section to a JSON-serializable dict"""
+        return {
+            "id": section.outline_section.id,
+            "title": section.outline_section.title,
+            "type": section.outline_section.section_type.value,
+            "content": section.content,
+            "word_count": section.word_count,
+            "citations_used": section.citations_used,
+            "confidence_score": section.confidence_score,
+            "needs_revision": section.needs_revision,
+            "revision_notes": section.revision_notes,
+        }
+
     async def _draft_section_efficiently(
         self,
         outline_section: OutlineSection,
         full_section_data: Dict[str, Any],
         case_context: Dict[str, Any],
         cumulative_context: Dict[str, Any],
+        on_delta: Optional[Callable[[str], Awaitable[None]]] = None,
+        context_index: Optional[DraftContextIndex] = None,
+        timeout_monitor: Optional[TimeoutMonitor] = None,
     ) -> DraftedSection:
         """Draft a section efficiently with case facts and firm knowledge"""
 
@@ -1300,14 +1480,23 @@ Remember: Judges want SPECIFIC EVIDENCE, not general allegations.""",
             # Extract the most important content from full section data
             essential_content = self._extract_essential_content(full_section_data)
 
-            # Build relevant case facts for this section
+            # Select the case facts and firm examples closest to this section
+            section_vector = await self._embed_section_query(
+                outline_section, context_index
+            )
             relevant_facts = self._extract_relevant_facts(
-                outline_section, case_context.get("case_facts", []), limit=5
+                outline_section,
+                case_context.get("case_facts", []),
+                limit=8,
+                section_vector=section_vector,
+                index=context_index,
             )
-
-            # Find relevant firm knowledge examples
             relevant_examples = self._extract_relevant_firm_examples(
-                outline_section, case_context.get("firm_knowledge", []), limit=2
+                outline_section,
+                case_context.get("firm_knowledge", []),
+                limit=2,
+                section_vector=section_vector,
+                index=context_index,
             )
 
             # Create section-specific prompts based on type
@@ -1332,9 +1521,11 @@ Remember: Judges want SPECIFIC EVIDENCE, not general allegations.""",
                 # Import citation formatter
                 from src.ai_agents.citation_formatter import citation_formatter
 
+                assembler = PromptAssembler(self.section_prompt_token_budget)
+
                 # Format evidence with proper citations
                 formatted_evidence = []
-                for fact in case_context.get("case_facts", [])[:10]:
+                for fact in relevant_facts:
                     try:
                         # Handle both object and dict formats
                         if hasattr(fact, "content"):
@@ -1346,43 +1537,103 @@ Remember: Judges want SPECIFIC EVIDENCE, not general allegations.""",
                             content = fact.get("content", "")
                             metadata = fact.get("metadata", {})
 
+                        # Trim the excerpt but never the citation that follows it
+                        excerpt = assembler.truncate(content, 80)
                         citation = citation_formatter.format_search_result_as_citation(
                             {"content": content, "metadata": metadata}
                         )
                         if citation:
                             formatted_evidence.append(
-                                f"{content[:200]}... ({citation.formatted_citation})"
+                                f"{excerpt} ({citation.formatted_citation})"
                             )
                         else:
-                            formatted_evidence.append(f"{content[:200]}...")
+                            formatted_evidence.append(excerpt)
                     except Exception as e:
                         logger.debug(f"Error formatting evidence: {e}")
                         continue
 
+                blocks = [
+                    PromptBlock(
+                        "key_points",
+                        essential_content["key_points"][:7],
+                        priority=0,
+                        item_max_tokens=80,
+                    ),
+                    PromptBlock(
+                        "evidence",
+                        formatted_evidence,
+                        priority=1,
+                        item_format="{n}. {item}",
+                    ),
+                    PromptBlock(
+                        "authorities",
+                        essential_content["authorities"][:7],
+                        priority=2,
+                        item_max_tokens=60,
+                    ),
+                    PromptBlock(
+                        "previous_arguments",
+                        [
+                            cumulative_context.get(
+                                "summary", "This is the first argument section."
+                            )
+                        ],
+                        priority=3,
+                        item_format="{item}",
+                        max_tokens=150,
+                    ),
+                    PromptBlock(
+                        "expert_evidence",
+                        self._format_expert_evidence(
+                            case_context.get("expert_reports", [])[:3]
+                        ).split("\n"),
+                        priority=4,
+                        item_format="{item}",
+                    ),
+                    PromptBlock(
+                        "regulatory_evidence",
+                        self._format_regulatory_evidence(
+                            case_context.get("regulatory_evidence", [])[:3]
+                        ).split("\n"),
+                        priority=5,
+                        item_format="{item}",
+                    ),
+                    PromptBlock(
+                        "firm_examples",
+                        self._format_firm_examples(relevant_examples).split("\n"),
+                        priority=6,
+                        item_format="{item}",
+                    ),
+                ]
+
                 # Full argument prompt with formatted evidence
-                drafting_prompt = f"""Draft this ARGUMENT section of the legal motion:
+                def build_argument_prompt(parts: Dict[str, str]) -> str:
+                    return f"""Draft this ARGUMENT section of the legal motion:
 
 Section: {outline_section.title}
 Type: MEMORANDUM OF LAW - {outline_section.section_type.value}
 Target Length: {outline_section.target_length} words (MINIMUM - this is a substantive section)
 
 Key Arguments to Develop:
-{chr(10).join(f"- {point}" for point in essential_content["key_points"][:7])}
+{parts["key_points"]}
 
 Required Legal Authorities:
-{chr(10).join(f"- {auth}" for auth in essential_content["authorities"][:7])}
+{parts["authorities"]}
 
 SPECIFIC EVIDENCE TO INCORPORATE (USE THESE EXACT CITATIONS):
-{chr(10).join(f"{i + 1}. {evidence}" for i, evidence in enumerate(formatted_evidence[:8]))}
+{parts["evidence"]}
 
 Expert Testimony Available:
-{self._format_expert_evidence(case_context.get("expert_reports", [])[:3])}
+{parts["expert_evidence"]}
 
 Regulatory Violations:
-{self._format_regulatory_evidence(case_context.get("regulatory_evidence", [])[:3])}
+{parts["regulatory_evidence"]}
+
+Firm Examples (style reference only):
+{parts["firm_examples"]}
 
 Previous Arguments Made:
-{cumulative_context.get("summary", "This is the first argument section.")}
+{parts["previous_arguments"]}
 
 CRITICAL REQUIREMENTS:
 1. EVERY factual assertion MUST have a specific citation
@@ -1398,16 +1649,52 @@ EVIDENCE INTEGRATION EXAMPLE:
 "The evidence establishes that PFG knew of the safety risks but chose profits over safety. MR. DACOSTA testified that his supervisor instructed him to disable the telematics monitoring system to avoid speed alerts. (DACOSTA Dep. 45:12-23). This is corroborated by an email from the Fleet Manager stating 'disable those annoying alerts - they're slowing down deliveries.' (Email from Jones dated 8/15/2021, Ex. 17). Moreover, the maintenance logs reveal that brake issues were reported three times but never repaired. (Maintenance Log Nos. 52-63, Ex. 22)."
 
 Remember: Use SPECIFIC EVIDENCE with EXACT CITATIONS throughout."""
+
+                drafting_prompt = self._assemble_prompt(
+                    assembler,
+                    outline_section.title,
+                    build_argument_prompt,
+                    blocks,
+                    timeout_monitor,
+                )
             else:
                 # Default prompt for other sections
-                drafting_prompt = f"""Draft this section of the legal motion:
+                assembler = PromptAssembler(self.section_prompt_token_budget)
+                blocks = [
+                    PromptBlock(
+                        "key_points",
+                        essential_content["key_points"][:5],
+                        priority=0,
+                        item_max_tokens=80,
+                    ),
+                    PromptBlock(
+                        "facts",
+                        [
+                            assembler.truncate(
+                                getattr(fact, "content", "")
+                                if not isinstance(fact, dict)
+                                else fact.get("content", ""),
+                                80,
+                            )
+                            for fact in relevant_facts[:5]
+                        ],
+                        priority=1,
+                        empty_text="- No specific case facts retrieved",
+                    ),
+                ]
+
+                def build_default_prompt(parts: Dict[str, str]) -> str:
+                    return f"""Draft this section of the legal motion:
 
 Section: {outline_section.title}
 Type: {outline_section.section_type.value}
 Target Length: {outline_section.target_length} words
 
 Key Points:
-{chr(10).join(f"- {point}" for point in essential_content["key_points"][:5])}
+{parts["key_points"]}
+
+Relevant Case Facts:
+{parts["facts"]}
 
 Requirements:
 1. Use appropriate legal formatting
@@ -1415,14 +1702,33 @@ Requirements:
 3. Include relevant facts and authorities
 4. Maintain professional tone"""
 
+                drafting_prompt = self._assemble_prompt(
+                    assembler,
+                    outline_section.title,
+                    build_default_prompt,
+                    blocks,
+                    timeout_monitor,
+                )
+
+            if outline_section.section_type in [
+                SectionType.INTRODUCTION,
+                SectionType.CONCLUSION,
+                SectionType.PRAYER_FOR_RELIEF,
+            ]:
+                # Short fixed-form prompts: measured, not assembled
+                self._record_prompt_budget(
+                    outline_section.title,
+                    PromptAssembler(self.section_prompt_token_budget),
+                    drafting_prompt,
+                    timeout_monitor=timeout_monitor,
+                )
+
             # Generate content
-            result = await asyncio.wait_for(
-                self.section_writer.run(drafting_prompt),
+            content = await asyncio.wait_for(
+                self._run_section_writer(drafting_prompt, on_delta),
                 timeout=45,  # 45 second timeout per section
             )
 
-            content = str(result.data) if hasattr(result, "data") else str(result)
-
             # Create drafted section
             word_count = len(content.split())
             return DraftedSection(
@@ -1445,70 +1751,52 @@ Requirements:
             raise
 
     def _extract_relevant_facts(
-        self, outline_section: OutlineSection, case_facts: List[Any], limit: int = 5
-    ) -> List[str]:
-        """Extract facts relevant to the current section"""
-        relevant_facts = []
-
-        try:
-            # Keywords to match based on section type
-            if outline_section.section_type == SectionType.STATEMENT_OF_FACTS:
-                # For facts section, get chronological facts
-                for fact in case_facts[: limit * 2]:
-                    if hasattr(fact, "content"):
-                        relevant_facts.append(fact.content[:200])
-            else:
-                # For other sections, match based on content
-                section_keywords = []
-                for point in outline_section.content_points:
-                    # Extract keywords from content points
-                    words = point.lower().split()
-                    section_keywords.extend([w for w in words if len(w) > 4][:3])
-
-                # Find facts matching keywords
-                for fact in case_facts:
-                    if hasattr(fact, "content"):
-                        fact_lower = fact.content.lower()
-                        if any(kw in fact_lower for kw in section_keywords):
-                            relevant_facts.append(fact.content[:200])
-                            if len(relevant_facts) >= limit:
-                                break
-
-        except Exception as e:
-            logger.debug(f"Error extracting relevant facts: {e}")
-
-        return relevant_facts[:limit]
+        self,
+        outline_section: OutlineSection,
+        case_facts: List[Any],
+        limit: int = 5,
+        section_vector: Optional[Any] = None,
+        index: Optional[DraftContextIndex] = None,
+    ) -> List[Any]:
+        """Select the case facts most similar to the current section"""
+        if index is not None and section_vector is not None:
+            selected = index.top_k("case_facts", section_vector, limit)
+            if selected:
+                return selected
+
+        # Without embeddings, keep retrieval order (already ranked by score)
+        return list(case_facts[:limit])
 
     def _extract_relevant_firm_examples(
         self,
         outline_section: OutlineSection,
         firm_knowledge: List[Dict[str, Any]],
         limit: int = 2,
+        section_vector: Optional[Any] = None,
+        index: Optional[DraftContextIndex] = None,
     ) -> List[Dict[str, Any]]:
-        """Extract firm knowledge examples relevant to current section"""
-        relevant_examples = []
+        """Select the firm knowledge examples most similar to the current section"""
+        if index is not None and section_vector is not None:
+            selected = index.top_k("firm_knowledge", section_vector, limit)
+            if selected:
+                return selected
 
-        try:
-            # Match based on section type and authorities
-            for example in firm_knowledge:
-                # Check if motion type matches
-                if outline_section.section_type == SectionType.ARGUMENT:
-                    if "argument" in example.get("motion_type", "").lower():
-                        relevant_examples.append(example)
-
-                # Check if any authorities match
-                for auth in outline_section.legal_authorities:
-                    if auth.lower() in example.get("content", "").lower():
-                        if example not in relevant_examples:
-                            relevant_examples.append(example)
-
-                if len(relevant_examples) >= limit:
-                    break
+        return list(firm_knowledge[:limit])
 
-        except Exception as e:
-            logger.debug(f"Error extracting firm examples: {e}")
+    def _format_firm_examples(self, examples: List[Dict[str, Any]]) -> str:
+        """Format firm knowledge examples for inclusion in prompts"""
+        formatted = []
 
-        return relevant_examples[:limit]
+        for example in examples:
+            content = (
+                example.get("content", "")
+                if isinstance(example, dict)
+                else getattr(example, "content", "")
+            )
+            if content:
+                formatted.append(f"- {content[:300]}...")
+
+        return "\n".join(formatted) if formatted else "- No firm examples available"
 
     def _format_expert_evidence(self, expert_reports: List[Any]) -> str:
         """Format expert evidence for inclusion in prompts"""
@@ -2033,6 +2321,8 @@ Write the WHEREFORE section now:"""
         full_section_data: Dict[str, Any],
         target_length: int,
         case_context: Dict[str, Any],
+        on_delta: Optional[Callable[[str], Awaitable[None]]] = None,
+        timeout_monitor: Optional[TimeoutMonitor] = None,
     ) -> DraftedSection:
         """Expand section efficiently without overwhelming context"""
 
@@ -2071,13 +2361,30 @@ Write the WHEREFORE section now:"""
                 drafted_section.content, full_section_data
             )
 
-            expansion_prompt = f"""Expand this legal section by adding {expansion_needed} words.
+            assembler = PromptAssembler(self.expansion_prompt_token_budget)
+            blocks = [
+                PromptBlock(
+                    "current_section",
+                    [drafted_section.content],
+                    priority=0,
+                    item_format="{item}",
+                ),
+                PromptBlock(
+                    "unused_content",
+                    unused_content[:5],
+                    priority=1,
+                    item_max_tokens=60,
+                ),
+            ]
+
+            def build_expansion_prompt(parts: Dict[str, str]) -> str:
+                return f"""Expand this legal section by adding {expansion_needed} words.
 
 Current Section ({current_length} words):
-{drafted_section.content[:2000]}... [truncated]
+{parts["current_section"]}
 
 Unused Content Points:
-{chr(10).join(f"- {point}" for point in unused_content[:5])}
+{parts["unused_content"]}
 
 REQUIREMENTS:
 1. Add {expansion_needed} words of substantive content
@@ -2088,12 +2395,16 @@ REQUIREMENTS:
 
 Provide the COMPLETE expanded section."""
 
-            result = await asyncio.wait_for(
-                self.section_writer.run(expansion_prompt), timeout=30
+            expansion_prompt = self._assemble_prompt(
+                assembler,
+                f"{drafted_section.outline_section.title} (expansion)",
+                build_expansion_prompt,
+                blocks,
+                timeout_monitor,
             )
 
-            expanded_content = (
-                str(result.data) if hasattr(result, "data") else str(result)
+            expanded_content = await asyncio.wait_for(
+                self._run_section_writer(expansion_prompt, on_delta), timeout=30
             )
 
             # Update section
@@ -2780,9 +3091,8 @@ Provide the COMPLETE expanded section."""
         """Extract all citations from text using compiled patterns"""
         citations = []
 
-        for pattern in self.citation_patterns:
-            matches = pattern.findall(text)
-            citations.extend(matches)
+        for span in self.scanner.scan(text, ["motion"]):
+            citations.append(span.text)
 
         # Clean and deduplicate
         citations = list(set(citation.strip() for citation in citations))
@@ -7,10 +7,11 @@ import json
 import hashlib
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
-import asyncio
 from dataclasses import dataclass
 import logging
 
+from src.utils.cache import SharedCache, SpillStore, create_spill_store
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,18 +32,38 @@ class CachedOutline:
 class OutlineCacheManager:
     """Manages caching of large legal outlines"""
 
-    def __init__(self, ttl_hours: int = 24):
-        self._cache: Dict[str, CachedOutline] = {}
+    def __init__(
+        self,
+        ttl_hours: int = 24,
+        max_size_mb: int = 256,
+        spill_store: Optional[SpillStore] = None,
+    ):
+        """
+        Initialize the outline cache
+
+        Args:
+            ttl_hours: Hours an outline stays cached
+            max_size_mb: Maximum in-memory cache size in megabytes
+            spill_store: Optional disk or Redis tier shared between workers
+        """
         self._ttl = timedelta(hours=ttl_hours)
-        self._lock = asyncio.Lock()
+        self._cache = SharedCache(
+            max_size_mb * 1024 * 1024,
+            default_ttl=int(self._ttl.total_seconds()),
+            spill_store=spill_store,
+        )
         logger.info(f"OutlineCacheManager initialized with {ttl_hours}h TTL")
 
-    def _generate_outline_id(self, outline: Dict[str, Any], database_name: str) -> str:
-        """Generate unique ID for outline based on content"""
+    def _generate_outline_id(self, outline_json: str, database_name: str) -> str:
+        """Generate unique ID for outline based on its serialized content"""
         # Create a hash of the outline content and database name
-        content = json.dumps(outline, sort_keys=True) + database_name
+        content = outline_json + database_name
         return hashlib.sha256(content.encode()).hexdigest()[:16]
 
+    async def _get_cached(self, outline_id: str) -> Optional[CachedOutline]:
+        """Look up a live cached outline in memory or the shared spill store"""
+        return await self._cache.get(outline_id)
+
     def _build_section_index(self, outline: Dict[str, Any]) -> Dict[str, int]:
         """Build an index mapping section IDs to their positions"""
         index = {}
@@ -62,60 +83,52 @@ class OutlineCacheManager:
 
     async def cache_outline(self, outline: Dict[str, Any], database_name: str) -> str:
         """Cache an outline and return its ID"""
-        async with self._lock:
-            outline_id = self._generate_outline_id(outline, database_name)
-
-            # Calculate outline size
-            outline_str = json.dumps(outline)
-            total_size = len(outline_str)
-
-            # Extract sections
-            sections = outline.get("sections", [])
-            section_count = len(sections)
-
-            # Build section index
-            section_index = self._build_section_index(outline)
-
-            # Create cached outline
-            cached = CachedOutline(
-                outline_id=outline_id,
-                outline_data=outline,
-                database_name=database_name,
-                created_at=datetime.utcnow(),
-                expires_at=datetime.utcnow() + self._ttl,
-                section_count=section_count,
-                total_size=total_size,
-                section_index=section_index,
-            )
+        # Serialize once for both the content hash and the size
+        outline_str = json.dumps(outline, sort_keys=True)
+        outline_id = self._generate_outline_id(outline_str, database_name)
+        total_size = len(outline_str)
 
-            self._cache[outline_id] = cached
+        # Extract sections
+        sections = outline.get("sections", [])
+        section_count = len(sections)
+
+        # Build section index
+        section_index = self._build_section_index(outline)
+
+        # Create cached outline
+        cached = CachedOutline(
+            outline_id=outline_id,
+            outline_data=outline,
+            database_name=database_name,
+            created_at=datetime.utcnow(),
+            expires_at=datetime.utcnow() + self._ttl,
+            section_count=section_count,
+            total_size=total_size,
+            section_index=section_index,
+        )
 
-            logger.info(
-                f"Cached outline {outline_id} for {database_name}: "
-                f"{section_count} sections, {total_size} bytes"
-            )
+        await self._cache.set(outline_id, cached, size_bytes=total_size)
+
+        logger.info(
+            f"Cached outline {outline_id} for {database_name}: "
+            f"{section_count} sections, {total_size} bytes"
+        )
 
-            # Clean expired entries
-            await self._cleanup_expired()
+        # Clean expired entries
+        await self._cleanup_expired()
 
-            return outline_id
+        return outline_id
 
     async def get_outline(self, outline_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve full outline by ID"""
-        async with self._lock:
-            cached = self._cache.get(outline_id)
+        cached = await self._get_cached(outline_id)
 
-            if not cached:
-                logger.warning(f"Outline {outline_id} not found in cache")
-                return None
-
-            if datetime.utcnow() > cached.expires_at:
-                logger.warning(f"Outline {outline_id} has expired")
-                del self._cache[outline_id]
-                return None
+        if not cached:
+            logger.warning(f"Outline {outline_id} not found in cache")
+            return None
 
-            logger.info(f"Retrieved outline {outline_id} from cache")
-            return cached.outline_data
+        logger.info(f"Retrieved outline {outline_id} from cache")
+        return cached.outline_data
 
     async def get_section(
         self, outline_id: str, section_index: int
@@ -138,37 +151,35 @@ class OutlineCacheManager:
         self, outline_id: str, section_key: str
     ) -> Optional[Dict[str, Any]]:
         """Retrieve a section by its key (heading or type)"""
-        async with self._lock:
-            cached = self._cache.get(outline_id)
-            if not cached:
-                return None
-
-            # Check if key exists in index
-            section_index = cached.section_index.get(section_key)
-            if section_index is None:
-                logger.warning(
-                    f"Section key '{section_key}' not found in outline {outline_id}"
-                )
-                return None
+        cached = await self._get_cached(outline_id)
+        if not cached:
+            return None
+
+        # Check if key exists in index
+        section_index = cached.section_index.get(section_key)
+        if section_index is None:
+            logger.warning(
+                f"Section key '{section_key}' not found in outline {outline_id}"
+            )
+            return None
 
         return await self.get_section(outline_id, section_index)
 
     async def get_outline_metadata(self, outline_id: str) -> Optional[Dict[str, Any]]:
         """Get metadata about cached outline without loading full content"""
-        async with self._lock:
-            cached = self._cache.get(outline_id)
-            if not cached:
-                return None
-
-            return {
-                "outline_id": cached.outline_id,
-                "database_name": cached.database_name,
-                "created_at": cached.created_at.isoformat(),
-                "expires_at": cached.expires_at.isoformat(),
-                "section_count": cached.section_count,
-                "total_size": cached.total_size,
-                "section_keys": list(cached.section_index.keys()),
-            }
+        cached = await self._get_cached(outline_id)
+        if not cached:
+            return None
+
+        return {
+            "outline_id": cached.outline_id,
+            "database_name": cached.database_name,
+            "created_at": cached.created_at.isoformat(),
+            "expires_at": cached.expires_at.isoformat(),
+            "section_count": cached.section_count,
+            "total_size": cached.total_size,
+            "section_keys": list(cached.section_index.keys()),
+        }
 
     async def get_outline_structure(
         self, outline_id: str
@@ -214,42 +225,35 @@ class OutlineCacheManager:
         return chunks
 
     async def _cleanup_expired(self):
-        """Remove expired outlines from cache"""
-        current_time = datetime.utcnow()
-        expired_ids = [
-            oid
-            for oid, cached in self._cache.items()
-            if current_time > cached.expires_at
-        ]
-
-        for oid in expired_ids:
-            del self._cache[oid]
+        """Remove expired outlines from the in-memory cache"""
+        for oid in self._cache.purge_expired():
             logger.info(f"Removed expired outline {oid}")
 
     async def clear_cache(self):
         """Clear all cached outlines"""
-        async with self._lock:
-            count = len(self._cache)
-            self._cache.clear()
-            logger.info(f"Cleared {count} outlines from cache")
+        count = len(self._cache)
+        await self._cache.clear()
+        logger.info(f"Cleared {count} outlines from cache")
 
     async def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
-        async with self._lock:
-            total_size = sum(c.total_size for c in self._cache.values())
-
-            return {
-                "cached_outlines": len(self._cache),
-                "total_size_bytes": total_size,
-                "total_size_mb": round(total_size / (1024 * 1024), 2),
-                "oldest_outline": min(
-                    (c.created_at for c in self._cache.values()), default=None
-                ),
-                "newest_outline": max(
-                    (c.created_at for c in self._cache.values()), default=None
-                ),
-            }
+        outlines = [entry.value for entry in self._cache.entries()]
+        total_size = self._cache.current_size_bytes
+        cache_stats = self._cache.get_stats()
+
+        return {
+            "cached_outlines": len(outlines),
+            "total_size_bytes": total_size,
+            "total_size_mb": round(total_size / (1024 * 1024), 2),
+            "oldest_outline": min((c.created_at for c in outlines), default=None),
+            "newest_outline": max((c.created_at for c in outlines), default=None),
+            "evictions": cache_stats["evictions"],
+            "spill_hits": cache_stats["spill_hits"],
+            "spill_backend": cache_stats["spill_backend"],
+        }
 
 
 # Global instance
-outline_cache = OutlineCacheManager(ttl_hours=24)
+outline_cache = OutlineCacheManager(
+    ttl_hours=24, spill_store=create_spill_store("outlines")
+)
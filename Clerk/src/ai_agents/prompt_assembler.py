@@ -0,0 +1,146 @@
+"""
+Token-budget-aware prompt assembly for motion drafting
+Fits prioritized prompt content into a fixed per-section token budget
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+
+import tiktoken
+
+
+@lru_cache(maxsize=None)
+def get_tokenizer(model: str = "gpt-4") -> tiktoken.Encoding:
+    """Get a tokenizer, loading each encoding only once per process"""
+    return tiktoken.encoding_for_model(model)
+
+
+@dataclass
+class PromptBlock:
+    """A group of prompt items of one content type
+
+    Lower priority values are filled first. Items are added whole until the
+    block's share of the budget is used; the first item that does not fit is
+    truncated at a token boundary when enough room is left to be useful.
+    """
+
+    name: str
+    items: List[str]
+    priority: int
+    item_format: str = "- {item}"  # may also use {n} for 1-based numbering
+    item_max_tokens: Optional[int] = None
+    max_tokens: Optional[int] = None
+    empty_text: str = ""
+
+
+@dataclass
+class PromptBudgetUsage:
+    """How a prompt's token budget was spent"""
+
+    budget: int
+    reserved_tokens: int
+    blocks: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    prompt_tokens: int = 0
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of the budget used by the final prompt"""
+        return self.prompt_tokens / self.budget if self.budget else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dict"""
+        return {
+            "budget": self.budget,
+            "reserved_tokens": self.reserved_tokens,
+            "prompt_tokens": self.prompt_tokens,
+            "utilization": round(self.utilization, 3),
+            "blocks": self.blocks,
+        }
+
+
+class PromptAssembler:
+    """Allocates a token budget across prompt blocks by priority"""
+
+    def __init__(
+        self, token_budget: int, model: str = "gpt-4", min_partial_tokens: int = 24
+    ):
+        """
+        Initialize the assembler
+
+        Args:
+            token_budget: Maximum tokens for the assembled prompt
+            model: Model whose tokenizer is used for counting
+            min_partial_tokens: Smallest remainder worth filling with a truncated item
+        """
+        self.token_budget = token_budget
+        self.tokenizer = get_tokenizer(model)
+        self.min_partial_tokens = min_partial_tokens
+
+    def count_tokens(self, text: str) -> int:
+        """Count tokens in text"""
+        return len(self.tokenizer.encode(text, disallowed_special=()))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Cut text to at most max_tokens tokens"""
+        tokens = self.tokenizer.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        # Leave one token for the ellipsis
+        return self.tokenizer.decode(tokens[: max(max_tokens - 1, 0)]).rstrip() + "..."
+
+    def fit(
+        self, blocks: List[PromptBlock], reserved_tokens: int = 0
+    ) -> Tuple[Dict[str, str], PromptBudgetUsage]:
+        """Render blocks within the budget left after the fixed prompt text
+
+        Args:
+            blocks: Content blocks to render
+            reserved_tokens: Tokens already used by the fixed template text
+
+        Returns:
+            Tuple of (block name -> rendered text, budget usage)
+        """
+        usage = PromptBudgetUsage(
+            budget=self.token_budget, reserved_tokens=reserved_tokens
+        )
+        remaining = max(self.token_budget - reserved_tokens, 0)
+        rendered: Dict[str, str] = {}
+
+        for block in sorted(blocks, key=lambda b: b.priority):
+            allowance = remaining
+            if block.max_tokens is not None:
+                allowance = min(allowance, block.max_tokens)
+
+            lines: List[str] = []
+            spent = 0
+
+            for item in block.items:
+                if block.item_max_tokens is not None:
+                    item = self.truncate(item, block.item_max_tokens)
+
+                line = block.item_format.format(n=len(lines) + 1, item=item)
+                # +1 for the newline joining this line to the previous one
+                cost = self.count_tokens(line) + (1 if lines else 0)
+
+                if spent + cost <= allowance:
+                    lines.append(line)
+                    spent += cost
+                    continue
+
+                room = allowance - spent - (1 if lines else 0)
+                if room >= self.min_partial_tokens:
+                    line = self.truncate(line, room)
+                    lines.append(line)
+                    spent += self.count_tokens(line) + (1 if len(lines) > 1 else 0)
+                break
+
+            remaining -= spent
+            rendered[block.name] = "\n".join(lines) if lines else block.empty_text
+            usage.blocks[block.name] = {
+                "tokens": spent,
+                "items": len(lines),
+                "dropped": len(block.items) - len(lines),
+            }
+
+        return rendered, usage
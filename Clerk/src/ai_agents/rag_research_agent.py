@@ -16,10 +16,13 @@ from pydantic import BaseModel, Field
 
 from src.vector_storage.qdrant_store import QdrantVectorStore
 from src.vector_storage.embeddings import EmbeddingGenerator
+from src.utils.logger import LogSummary, get_hot_path_logger
 from config.settings import settings
 
 # Use the same logger as the main API
 logger = logging.getLogger("clerk_api")
+# Rate-limited logger for per-database messages inside the search loop
+hot_logger = get_hot_path_logger("clerk_api")
 
 
 class DatabaseType(Enum):
@@ -471,11 +474,17 @@ Make decisions quickly and confidently based on the question type.""",
     ) -> List[ResearchResult]:
         """Execute all research queries against appropriate databases"""
         search_results = []
+        summary = LogSummary(
+            logger, "[RAG_RESEARCH] Searches complete", queries=len(research_queries)
+        )
 
         for i, query in enumerate(research_queries):
             try:
-                logger.info(
-                    f"[RAG_RESEARCH] Executing query {i + 1}/{len(research_queries)}: {query.query_text[:50]}..."
+                logger.debug(
+                    "[RAG_RESEARCH] Executing query %d/%d: %.50s...",
+                    i + 1,
+                    len(research_queries),
+                    query.query_text,
                 )
 
                 # Generate embedding
@@ -492,9 +501,10 @@ Make decisions quickly and confidently based on the question type.""",
                 # Execute searches
                 for db_name, db_type in databases_to_search:
                     try:
-                        # DEBUG: Check if collection exists and has data
-                        logger.info(
-                            f"[RAG_DEBUG] Attempting search on database: '{db_name}' (type: {db_type.value})"
+                        logger.debug(
+                            "[RAG_DEBUG] Attempting search on database: '%s' (type: %s)",
+                            db_name,
+                            db_type.value,
                         )
 
                         # Check if collection exists
@@ -505,34 +515,38 @@ Make decisions quickly and confidently based on the question type.""",
                                 if hasattr(collections, "collections")
                                 else []
                             )
-                            logger.info(
-                                f"[RAG_DEBUG] Available collections: {collection_names}"
-                            )
 
                             if db_name not in collection_names:
-                                logger.warning(
-                                    f"[RAG_DEBUG] Collection '{db_name}' not found! Available: {collection_names}"
+                                hot_logger.warning(
+                                    "[RAG_DEBUG] Collection '%s' not found", db_name
                                 )
+                                summary.count("missing_collections")
                                 continue
 
                             # Check collection info
                             collection_info = self.vector_store.client.get_collection(
                                 db_name
                             )
-                            logger.info(
-                                f"[RAG_DEBUG] Collection '{db_name}' has {collection_info.points_count} points"
+                            logger.debug(
+                                "[RAG_DEBUG] Collection '%s' has %s points",
+                                db_name,
+                                collection_info.points_count,
                             )
 
                             if collection_info.points_count == 0:
-                                logger.warning(
-                                    f"[RAG_DEBUG] Collection '{db_name}' is empty!"
+                                hot_logger.warning(
+                                    "[RAG_DEBUG] Collection '%s' is empty!", db_name
                                 )
+                                summary.count("empty_collections")
                                 continue
 
                         except Exception as check_error:
                             logger.error(
-                                f"[RAG_DEBUG] Error checking collection '{db_name}': {check_error}"
+                                "[RAG_DEBUG] Error checking collection '%s': %s",
+                                db_name,
+                                check_error,
                             )
+                            summary.count("errors")
                             continue
 
                         results = await asyncio.wait_for(
@@ -546,17 +560,11 @@ Make decisions quickly and confidently based on the question type.""",
                             ),
                             timeout=8.0,
                         )
-
-                        logger.info(
-                            f"[RAG_DEBUG] Search returned {len(results)} raw results from '{db_name}'"
-                        )
+                        summary.count("searches")
+                        summary.count(f"results.{db_type.value}", len(results))
 
                         # Convert to ResearchResult objects
-                        for j, result in enumerate(results):
-                            logger.info(
-                                f"[RAG_DEBUG] Result {j + 1}: score={result.score:.4f}, content_length={len(result.content)}"
-                            )
-
+                        for result in results:
                             # No score filtering - hybrid search already ranks results
                             research_result = ResearchResult(
                                 content=result.content[:1000],  # Limit content length
@@ -573,26 +581,31 @@ Make decisions quickly and confidently based on the question type.""",
                                 },
                             )
                             search_results.append(research_result)
-                            logger.info(
-                                f"[RAG_RESEARCH] Added result (score: {result.score:.3f}) from {db_name}"
-                            )
 
                     except Exception as e:
                         logger.error(
-                            f"[RAG_RESEARCH] Error searching {db_name}: {str(e)}",
+                            "[RAG_RESEARCH] Error searching %s: %s",
+                            db_name,
+                            e,
                             exc_info=True,
                         )
+                        summary.count("errors")
                         continue
 
             except Exception as e:
                 logger.error(
-                    f"[RAG_RESEARCH] Error executing query '{query.query_text[:30]}': {str(e)}"
+                    "[RAG_RESEARCH] Error executing query '%.30s': %s",
+                    query.query_text,
+                    e,
                 )
+                summary.count("errors")
                 continue
 
-        logger.info(
-            f"[RAG_RESEARCH] Collected {len(search_results)} total search results"
+        summary.set(
+            results=len(search_results),
+            top_score=round(max((r.score for r in search_results), default=0.0), 4),
         )
+        summary.emit()
         return search_results
 
     def _get_databases_to_search(
@@ -30,13 +30,13 @@ from ..models.discovery_models import (
     FactSearchRequest,
     FactSearchResponse,
     FactBulkOperation,
+    FactBulkUpdateRequest,
 )
 from ..services.fact_manager import FactManager
 from ..document_processing.unified_document_manager import UnifiedDocumentManager
 from ..document_processing.enhanced_chunker import EnhancedChunker
 from ..vector_storage.embeddings import EmbeddingGenerator
 from ..models.unified_document_models import DocumentType, UnifiedDocument, DiscoveryProcessingRequest
-from ..ai_agents.fact_extractor import FactExtractor
 from ..websocket.socket_server import (
     sio,
     emit_discovery_started,
@@ -52,7 +52,6 @@ from ..websocket.socket_server import (
 import os
 import tempfile
 from datetime import datetime
-import pdfplumber
 
 if os.getenv("MVP_MODE", "false").lower() == "true":
     from ..utils.mock_auth import (
@@ -67,9 +66,9 @@ else:
         CaseContext,
     )
 
-from ..document_processing.box_client import BoxClient
 from ..document_processing.pdf_extractor import PDFExtractor
 from ..vector_storage.qdrant_store import QdrantVectorStore
+from ..utils.client_registry import get_client_registry
 from ..utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -288,6 +287,7 @@ async def _process_discovery_async(
     
     # Use the basic discovery processor directly - no normalized wrapper
     from src.document_processing.discovery_splitter import DiscoveryProductionProcessor
+    from src.ai_agents.fact_extractor import FactExtractor
     
     # Document manager for deduplication
     document_manager = UnifiedDocumentManager(case_name)
@@ -863,35 +863,32 @@ async def delete_fact(
 async def bulk_fact_operation(
     operation: FactBulkOperation,
     case_context: CaseContext = Depends(require_case_context("write")),
-) -> Dict[str, int]:
+) -> Dict[str, Any]:
     """Perform bulk operations on facts"""
-    fact_manager = FactManager()
-
-    if operation.operation == "mark_reviewed":
-        result = await fact_manager.bulk_update_facts(
-            case_name=case_context.case_name,
-            fact_ids=operation.fact_ids,
-            updates={"review_status": "reviewed"},
-        )
-        return {"updated": result}
+    if operation.operation not in ("mark_reviewed", "delete", "change_category") or (
+        operation.operation == "change_category" and not operation.category
+    ):
+        raise HTTPException(400, "Invalid bulk operation")
 
-    elif operation.operation == "delete":
-        result = await fact_manager.bulk_delete_facts(
-            case_name=case_context.case_name,
-            fact_ids=operation.fact_ids,
-        )
-        return {"deleted": result}
+    fact_manager = FactManager()
 
-    elif operation.operation == "change_category" and operation.category:
-        result = await fact_manager.bulk_update_facts(
-            case_name=case_context.case_name,
+    # Applied as chunked Qdrant batch updates, not one round trip per fact
+    results = await fact_manager.bulk_update_facts(
+        FactBulkUpdateRequest(
             fact_ids=operation.fact_ids,
-            updates={"category": operation.category},
-        )
-        return {"updated": result}
+            action=operation.operation,
+            category=operation.category,
+        ),
+        case_context,
+    )
 
-    else:
-        raise HTTPException(400, "Invalid bulk operation")
+    succeeded = sum(results.values())
+    count_key = "deleted" if operation.operation == "delete" else "updated"
+    return {
+        count_key: succeeded,
+        "failed": len(results) - succeeded,
+        "results": results,
+    }
 
 
 @router.get("/documents/{document_id}/pdf")
@@ -911,7 +908,7 @@ async def list_box_folders(
     case_context: CaseContext = Depends(require_case_context("read")),
 ) -> List[Dict[str, Any]]:
     """List Box folders for selection"""
-    box_client = BoxClient()
+    box_client = get_client_registry().box_client()
     folders = await box_client.list_folders(parent_id)
     return folders
 
@@ -922,7 +919,7 @@ async def list_box_files(
     case_context: CaseContext = Depends(require_case_context("read")),
 ) -> List[Dict[str, Any]]:
     """List files in a Box folder"""
-    box_client = BoxClient()
+    box_client = get_client_registry().box_client()
     files = await box_client.get_folder_files(folder_id)
     return [f for f in files if f["name"].endswith(".pdf")]
 
@@ -1092,6 +1089,8 @@ def extract_text_from_pages(pdf_path: str, start_page: int, end_page: int) -> st
     Returns:
         Extracted text from the specified page range
     """
+    import pdfplumber
+
     text = ""
     try:
         with pdfplumber.open(pdf_path) as pdf:
@@ -30,7 +30,7 @@ class TestDiscoveryEndpoints:
         """Mock all external dependencies"""
         with patch('src.api.discovery_endpoints.vector_store') as mock_vector_store, \
              patch('src.api.discovery_endpoints.sio') as mock_sio, \
-             patch('src.api.discovery_endpoints.FactExtractor') as mock_fact_extractor, \
+             patch('src.ai_agents.fact_extractor.FactExtractor') as mock_fact_extractor, \
              patch('src.api.discovery_endpoints.NormalizedDiscoveryProductionProcessor') as mock_discovery_processor, \
              patch('src.api.discovery_endpoints.UnifiedDocumentManager') as mock_doc_manager, \
              patch('src.api.discovery_endpoints.EnhancedChunker') as mock_chunker, \
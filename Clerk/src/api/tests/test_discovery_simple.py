@@ -15,7 +15,7 @@ class TestDiscoverySimple:
         """Test that discovery endpoint accepts requests and starts processing"""
         
         # Mock all external dependencies
-        with patch("src.api.discovery_endpoints.FactExtractor") as mock_fact_ext, \
+        with patch("src.ai_agents.fact_extractor.FactExtractor") as mock_fact_ext, \
              patch("src.api.discovery_endpoints.sio") as mock_sio, \
              patch("src.document_processing.discovery_splitter.DiscoveryProductionProcessor") as mock_splitter, \
              patch("src.document_processing.unified_document_manager.UnifiedDocumentManager") as mock_doc_mgr, \
@@ -4,5 +4,19 @@ Data loaders for shared legal knowledge bases
 
 from .florida_statutes_loader import FloridaStatutesLoader
 from .fmcsr_loader import FMCSRLoader
+from .bulk_loader import KnowledgeBulkLoader, KnowledgeRecord
+from .knowledge_index import (
+    KnowledgeIdentifierIndex,
+    get_knowledge_index,
+    normalize_citation,
+)
 
-__all__ = ["FloridaStatutesLoader", "FMCSRLoader"]
+__all__ = [
+    "FloridaStatutesLoader",
+    "FMCSRLoader",
+    "KnowledgeBulkLoader",
+    "KnowledgeRecord",
+    "KnowledgeIdentifierIndex",
+    "get_knowledge_index",
+    "normalize_citation",
+]
@@ -0,0 +1,168 @@
+"""
+Bulk Loader for Shared Legal Knowledge
+Embeds and upserts statute and regulation sections in batches with stable IDs
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Dict, List
+
+from src.data_loaders.knowledge_index import record_knowledge_payloads
+from src.models.fact_models import SharedKnowledgeEntry
+from src.vector_storage.bulk_upsert import upsert_in_chunks
+from src.vector_storage.point_ids import deterministic_point_id
+
+logger = logging.getLogger("clerk_api")
+
+
+def knowledge_entry_id(knowledge_type: str, identifier: str) -> str:
+    """Derive the point ID of a knowledge entry from its citation identifier"""
+    return deterministic_point_id(knowledge_type, identifier)
+
+
+@dataclass
+class KnowledgeRecord:
+    """A knowledge entry together with the payload it is stored with"""
+
+    entry: SharedKnowledgeEntry
+    payload: Dict[str, Any]
+
+    @property
+    def embedding_text(self) -> str:
+        entry = self.entry
+        return f"{entry.identifier} {entry.title}\n{entry.content[:500]}"
+
+    @property
+    def content_hash(self) -> str:
+        """Hash of everything stored except timestamps"""
+        stable = {
+            key: value
+            for key, value in self.payload.items()
+            if key not in ("last_updated", "content_hash")
+        }
+        digest = hashlib.sha256()
+        digest.update(json.dumps(stable, sort_keys=True, default=str).encode("utf-8"))
+        digest.update(self.entry.content.encode("utf-8"))
+        return digest.hexdigest()
+
+
+class KnowledgeBulkLoader:
+    """
+    Stores many knowledge entries with one embedding pass and chunked upserts.
+
+    In diff mode the stored content hash of every entry is read first and
+    entries whose hash is unchanged are skipped, so reloading a chapter or
+    part only re-embeds sections that actually changed.
+    """
+
+    def __init__(
+        self,
+        vector_store,
+        embedding_generator,
+        collection_name: str,
+        upsert_batch_size: int = 256,
+        lookup_batch_size: int = 500,
+    ):
+        self.vector_store = vector_store
+        self.embedding_generator = embedding_generator
+        self.collection_name = collection_name
+        self.upsert_batch_size = upsert_batch_size
+        self.lookup_batch_size = lookup_batch_size
+
+    async def store(
+        self, records: List[KnowledgeRecord], diff: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Embed and upsert knowledge records.
+
+        Args:
+            records: Entries and payloads to store
+            diff: Skip entries whose stored content hash is unchanged
+
+        Returns:
+            Load statistics
+        """
+        started = time.perf_counter()
+
+        # Later records win when a section appears twice
+        unique = list({record.entry.id: record for record in records}.values())
+        hashes = {record.entry.id: record.content_hash for record in unique}
+
+        stored_hashes = await self._stored_hashes(list(hashes)) if diff else {}
+        changed = [
+            record
+            for record in unique
+            if stored_hashes.get(record.entry.id) != hashes[record.entry.id]
+        ]
+
+        if changed:
+            embeddings, _ = (
+                await self.embedding_generator.generate_embeddings_batch_async(
+                    [record.embedding_text for record in changed]
+                )
+            )
+
+            points = [
+                {
+                    "id": record.entry.id,
+                    "vector": embedding,
+                    "payload": {
+                        **record.payload,
+                        "content_hash": hashes[record.entry.id],
+                    },
+                }
+                for record, embedding in zip(changed, embeddings)
+            ]
+            await upsert_in_chunks(
+                self.vector_store.client,
+                self.collection_name,
+                points,
+                self.upsert_batch_size,
+                target="knowledge",
+            )
+            record_knowledge_payloads(self.collection_name, points)
+
+        elapsed = time.perf_counter() - started
+        stats = {
+            "total": len(unique),
+            "embedded": len(changed),
+            "unchanged": len(unique) - len(changed),
+            "seconds": round(elapsed, 3),
+        }
+        logger.info(
+            f"Bulk loaded {stats['total']} entries into {self.collection_name}: "
+            f"{stats['embedded']} embedded, {stats['unchanged']} unchanged "
+            f"in {elapsed:.2f}s"
+        )
+        return stats
+
+    async def _stored_hashes(self, point_ids: List[str]) -> Dict[str, str]:
+        """Read the stored content hash of existing points"""
+        loop = asyncio.get_running_loop()
+        hashes = {}
+        for i in range(0, len(point_ids), self.lookup_batch_size):
+            try:
+                points = await loop.run_in_executor(
+                    None,
+                    partial(
+                        self.vector_store.client.retrieve,
+                        collection_name=self.collection_name,
+                        ids=point_ids[i : i + self.lookup_batch_size],
+                        with_payload=["content_hash"],
+                        with_vectors=False,
+                    ),
+                )
+            except Exception as e:
+                # Without stored hashes every entry is treated as changed
+                logger.warning(f"Failed to read stored hashes: {e}")
+                continue
+
+            for point in points:
+                if point.payload and point.payload.get("content_hash"):
+                    hashes[str(point.id)] = point.payload["content_hash"]
+        return hashes
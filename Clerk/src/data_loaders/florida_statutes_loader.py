@@ -5,12 +5,17 @@ Loads and indexes Florida statutory law for cross-case access
 
 import re
 import logging
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import json
-import uuid
 
 from src.models.fact_models import SharedKnowledgeEntry
+from src.data_loaders.bulk_loader import (
+    KnowledgeBulkLoader,
+    KnowledgeRecord,
+    knowledge_entry_id,
+)
+from src.data_loaders.knowledge_index import get_knowledge_index
 from src.vector_storage.qdrant_store import QdrantVectorStore
 from src.vector_storage.embeddings import EmbeddingGenerator
 from qdrant_client.models import VectorParams, Distance
@@ -35,6 +40,11 @@ class FloridaStatutesLoader:
         # Ensure collection exists
         self._ensure_collection_exists()
 
+        # Batched embedding and chunked upserts for whole chapters
+        self.bulk_loader = KnowledgeBulkLoader(
+            self.vector_store, self.embedding_generator, self.collection_name
+        )
+
         # Statute patterns
         self.statute_patterns = self._compile_statute_patterns()
 
@@ -165,31 +175,31 @@ class FloridaStatutesLoader:
         """Load a single Florida statute"""
         logger.info(f"Loading Florida Statute § {statute_number}: {title}")
 
-        # Generate unique ID using UUID
-        statute_id = str(uuid.uuid4())
+        record = self._build_statute_record(
+            statute_number, title, content, chapter, effective_date, source_url
+        )
 
-        # Extract topics
-        topics = self._extract_topics(title + " " + content)
+        # Store in vector database
+        await self.bulk_loader.store([record])
 
-        # Extract citations within the statute
-        citations = self._extract_cross_references(content)
+        return record.entry
 
-        # Create knowledge entry
-        entry = SharedKnowledgeEntry(
-            id=statute_id,
-            knowledge_type="florida_statute",
-            identifier=f"Fla. Stat. § {statute_number}",
-            title=title,
-            content=content,
-            effective_date=effective_date,
-            topics=topics,
-            citations=citations,
-        )
+    async def load_statutes(
+        self, statutes: List[Dict[str, Any]], diff: bool = True
+    ) -> List[SharedKnowledgeEntry]:
+        """
+        Load many statutes with batched embeddings and chunked upserts.
 
-        # Store in vector database
-        await self._store_statute(entry, chapter, source_url)
+        Args:
+            statutes: Dicts with load_statute keyword arguments
+            diff: Only re-embed statutes whose content changed
 
-        return entry
+        Returns:
+            Knowledge entries for every statute
+        """
+        records = [self._build_statute_record(**statute) for statute in statutes]
+        await self.bulk_loader.store(records, diff=diff)
+        return [record.entry for record in records]
 
     async def load_chapter(
         self,
@@ -197,13 +207,14 @@ class FloridaStatutesLoader:
         chapter_title: str,
         chapter_content: str,
         source_url: Optional[str] = None,
+        diff: bool = True,
     ) -> List[SharedKnowledgeEntry]:
         """Load an entire chapter of Florida statutes"""
         logger.info(
             f"Loading Florida Statutes Chapter {chapter_number}: {chapter_title}"
         )
 
-        entries = []
+        statutes = []
 
         # Parse individual sections
         sections = self._parse_chapter_sections(chapter_content)
@@ -220,20 +231,58 @@ class FloridaStatutesLoader:
                 except:
                     pass
 
-            # Load section
-            entry = await self.load_statute(
-                statute_number=f"{chapter_number}.{section_num}",
-                title=section_title,
-                content=section_content,
-                chapter=f"Chapter {chapter_number} - {chapter_title}",
-                effective_date=effective_date,
-                source_url=source_url,
+            # Section headers carry the full number, e.g. "768.81"
+            statute_number = (
+                section_num
+                if "." in section_num
+                else f"{chapter_number}.{section_num}"
             )
-            entries.append(entry)
+
+            statutes.append(
+                {
+                    "statute_number": statute_number,
+                    "title": section_title,
+                    "content": section_content,
+                    "chapter": f"Chapter {chapter_number} - {chapter_title}",
+                    "effective_date": effective_date,
+                    "source_url": source_url,
+                }
+            )
+
+        # Load all sections in one batch
+        entries = await self.load_statutes(statutes, diff=diff)
 
         logger.info(f"Loaded {len(entries)} sections from Chapter {chapter_number}")
         return entries
 
+    def _build_statute_record(
+        self,
+        statute_number: str,
+        title: str,
+        content: str,
+        chapter: Optional[str] = None,
+        effective_date: Optional[datetime] = None,
+        source_url: Optional[str] = None,
+    ) -> KnowledgeRecord:
+        """Build a statute entry and its payload"""
+        identifier = f"Fla. Stat. § {statute_number}"
+
+        # Create knowledge entry, keyed by its citation so reloads overwrite it
+        entry = SharedKnowledgeEntry(
+            id=knowledge_entry_id("florida_statute", identifier),
+            knowledge_type="florida_statute",
+            identifier=identifier,
+            title=title,
+            content=content,
+            effective_date=effective_date,
+            topics=self._extract_topics(title + " " + content),
+            citations=self._extract_cross_references(content),
+        )
+
+        return KnowledgeRecord(
+            entry=entry, payload=self._statute_payload(entry, chapter, source_url)
+        )
+
     def _parse_chapter_sections(
         self, chapter_content: str
     ) -> List[Tuple[str, str, str]]:
@@ -309,26 +358,20 @@ class FloridaStatutesLoader:
 
         return list(set(citations))  # Remove duplicates
 
-    async def _store_statute(
+    def _statute_payload(
         self,
         entry: SharedKnowledgeEntry,
         chapter: Optional[str],
         source_url: Optional[str],
-    ):
-        """Store statute in shared vector database"""
-        # Generate embedding for statute content
-        text_for_embedding = f"{entry.identifier} {entry.title}\n{entry.content[:500]}"
-        embedding, _ = await self.embedding_generator.generate_embedding_async(
-            text_for_embedding
-        )
-
+    ) -> Dict[str, Any]:
+        """Build the shared collection payload for a statute"""
         # Prepare metadata
         metadata = {
             "knowledge_type": entry.knowledge_type,
             "identifier": entry.identifier,
             "title": entry.title,
-            "topics": json.dumps(entry.topics),
-            "citations": json.dumps(entry.citations),
+            "topics": json.dumps(sorted(entry.topics)),
+            "citations": json.dumps(sorted(entry.citations)),
             "last_updated": entry.last_updated.isoformat(),
             "content_preview": entry.content[:500],  # Store preview for quick access
         }
@@ -340,14 +383,7 @@ class FloridaStatutesLoader:
         if source_url:
             metadata["source_url"] = source_url
 
-        # Store in shared collection
-        point = {"id": entry.id, "vector": embedding, "payload": metadata}
-
-        self.vector_store.client.upsert(
-            collection_name=self.collection_name, points=[point]
-        )
-
-        logger.debug(f"Stored statute {entry.identifier} in shared collection")
+        return metadata
 
     async def search_statutes(
         self, query: str, topic_filter: Optional[List[str]] = None, limit: int = 10
@@ -396,39 +432,23 @@ class FloridaStatutesLoader:
     async def get_statute_by_number(
         self, statute_number: str
     ) -> Optional[SharedKnowledgeEntry]:
-        """Retrieve specific statute by number"""
-        # Search by identifier
-        filter_condition = {
-            "must": [
-                {
-                    "key": "identifier",
-                    "match": {"value": f"Fla. Stat. § {statute_number}"},
-                }
-            ]
-        }
-
-        results = self.vector_store.client.scroll(
-            collection_name=self.collection_name,
-            scroll_filter=filter_condition,
-            limit=1,
-            with_payload=True,
-            with_vectors=False,
-        )[0]
-
-        if results:
-            payload = results[0].payload
-            return SharedKnowledgeEntry(
-                id=results[0].id,
-                knowledge_type=payload["knowledge_type"],
-                identifier=payload["identifier"],
-                title=payload["title"],
-                content=payload.get("content_preview", ""),
-                topics=json.loads(payload["topics"]),
-                citations=json.loads(payload["citations"]),
-                last_updated=datetime.fromisoformat(payload["last_updated"]),
-            )
-
-        return None
+        """
+        Retrieve specific statute by number.
+
+        Accepts citation variants such as "768.81", "§768.81" or
+        "768.81, Fla. Stat." and resolves them from the identifier index.
+        """
+        index = get_knowledge_index(self.collection_name)
+        await index.ensure_loaded(self.vector_store)
+        return index.get(statute_number)
+
+    async def get_statutes_in_chapter(
+        self, chapter_number: str
+    ) -> List[SharedKnowledgeEntry]:
+        """Retrieve every loaded statute in a chapter, e.g. "768" """
+        index = get_knowledge_index(self.collection_name)
+        await index.ensure_loaded(self.vector_store)
+        return index.with_prefix(chapter_number)
 
     async def load_common_statutes(self):
         """Load commonly referenced Florida statutes for personal injury cases"""
@@ -459,15 +479,19 @@ class FloridaStatutesLoader:
             },
         ]
 
-        for statute in common_statutes:
-            await self.load_statute(
-                statute_number=statute["number"],
-                title=statute["title"],
-                content=statute["content"],
-                chapter="Chapter 768 - Negligence"
-                if statute["number"].startswith("768")
-                else "Chapter 316 - Traffic",
-                effective_date=datetime(2023, 7, 1),  # Example date
-            )
+        await self.load_statutes(
+            [
+                {
+                    "statute_number": statute["number"],
+                    "title": statute["title"],
+                    "content": statute["content"],
+                    "chapter": "Chapter 768 - Negligence"
+                    if statute["number"].startswith("768")
+                    else "Chapter 316 - Traffic",
+                    "effective_date": datetime(2023, 7, 1),  # Example date
+                }
+                for statute in common_statutes
+            ]
+        )
 
         logger.info("Loaded common Florida statutes")
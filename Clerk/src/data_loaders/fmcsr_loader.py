@@ -8,9 +8,14 @@ import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import json
-import uuid
 
 from src.models.fact_models import SharedKnowledgeEntry
+from src.data_loaders.bulk_loader import (
+    KnowledgeBulkLoader,
+    KnowledgeRecord,
+    knowledge_entry_id,
+)
+from src.data_loaders.knowledge_index import get_knowledge_index
 from src.vector_storage.qdrant_store import QdrantVectorStore
 from src.vector_storage.embeddings import EmbeddingGenerator
 from qdrant_client.models import VectorParams, Distance
@@ -35,6 +40,11 @@ class FMCSRLoader:
         # Ensure collection exists
         self._ensure_collection_exists()
 
+        # Batched embedding and chunked upserts for whole parts
+        self.bulk_loader = KnowledgeBulkLoader(
+            self.vector_store, self.embedding_generator, self.collection_name
+        )
+
         # Regulation patterns
         self.regulation_patterns = self._compile_regulation_patterns()
 
@@ -173,47 +183,80 @@ class FMCSRLoader:
         """Load a single FMCSR regulation"""
         logger.info(f"Loading 49 CFR § {part}.{section}: {title}")
 
-        # Generate unique ID using UUID
-        reg_id = str(uuid.uuid4())
-
-        # Get part information
-        part_info = self.part_descriptions.get(part, {})
-        topics = part_info.get("topics", [])
+        record = self._build_regulation_record(
+            part, section, title, content, subpart, effective_date, source_url
+        )
 
-        # Extract additional topics from content
-        topics.extend(self._extract_regulation_topics(title + " " + content))
-        topics = list(set(topics))  # Remove duplicates
+        # Store in vector database
+        await self.bulk_loader.store([record])
 
-        # Extract cross-references
-        citations = self._extract_cross_references(content, part)
+        return record.entry
 
-        # Create knowledge entry
-        entry = SharedKnowledgeEntry(
-            id=reg_id,
-            knowledge_type="fmcsr_regulation",
-            identifier=f"49 CFR § {part}.{section}",
-            title=title,
-            content=content,
-            effective_date=effective_date,
-            topics=topics,
-            citations=citations,
-        )
+    async def load_regulations(
+        self, regulations: List[Dict[str, Any]], diff: bool = True
+    ) -> List[SharedKnowledgeEntry]:
+        """
+        Load many regulations with batched embeddings and chunked upserts.
 
-        # Store in vector database
-        await self._store_regulation(entry, part, subpart, source_url)
+        Args:
+            regulations: Dicts with load_regulation keyword arguments
+            diff: Only re-embed regulations whose content changed
 
-        return entry
+        Returns:
+            Knowledge entries for every regulation
+        """
+        records = [self._build_regulation_record(**reg) for reg in regulations]
+        await self.bulk_loader.store(records, diff=diff)
+        return [record.entry for record in records]
 
     async def load_part(
-        self, part_number: str, part_content: str, source_url: Optional[str] = None
+        self,
+        part_number: str,
+        part_content: str,
+        source_url: Optional[str] = None,
+        diff: bool = True,
     ) -> List[SharedKnowledgeEntry]:
         """Load an entire FMCSR part"""
-        part_info = self.part_descriptions.get(part_number, {})
-        part_title = part_info.get("title", f"Part {part_number}")
+        return await self.load_parts({part_number: part_content}, source_url, diff)
 
-        logger.info(f"Loading 49 CFR Part {part_number}: {part_title}")
+    async def load_parts(
+        self,
+        parts: Dict[str, str],
+        source_url: Optional[str] = None,
+        diff: bool = True,
+    ) -> List[SharedKnowledgeEntry]:
+        """
+        Load several FMCSR parts, e.g. 49 CFR Parts 390-399, in one batch.
+
+        Args:
+            parts: Part number -> part text
+            source_url: Source of the regulation text
+            diff: Only re-embed sections whose content changed
+
+        Returns:
+            Knowledge entries for every section
+        """
+        regulations = []
+        for part_number, part_content in parts.items():
+            part_info = self.part_descriptions.get(part_number, {})
+            part_title = part_info.get("title", f"Part {part_number}")
+
+            logger.info(f"Loading 49 CFR Part {part_number}: {part_title}")
+            regulations.extend(
+                self._part_regulations(part_number, part_content, source_url)
+            )
 
-        entries = []
+        # Load all sections in one batch
+        entries = await self.load_regulations(regulations, diff=diff)
+
+        logger.info(f"Loaded {len(entries)} sections from {len(parts)} parts")
+        return entries
+
+    def _part_regulations(
+        self, part_number: str, part_content: str, source_url: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """Turn a part's parsed sections into load_regulation arguments"""
+        regulations = []
 
         # Parse sections within the part
         sections = self._parse_part_sections(part_content, part_number)
@@ -236,20 +279,57 @@ class FMCSRLoader:
                 except:
                     pass
 
-            # Load section
-            entry = await self.load_regulation(
-                part=part_number,
-                section=section_data["section"],
-                title=section_data["title"],
-                content=section_data["content"],
-                subpart=current_subpart,
-                effective_date=effective_date,
-                source_url=source_url,
+            regulations.append(
+                {
+                    "part": part_number,
+                    "section": section_data["section"],
+                    "title": section_data["title"],
+                    "content": section_data["content"],
+                    "subpart": current_subpart,
+                    "effective_date": effective_date,
+                    "source_url": source_url,
+                }
             )
-            entries.append(entry)
 
-        logger.info(f"Loaded {len(entries)} sections from Part {part_number}")
-        return entries
+        return regulations
+
+    def _build_regulation_record(
+        self,
+        part: str,
+        section: str,
+        title: str,
+        content: str,
+        subpart: Optional[str] = None,
+        effective_date: Optional[datetime] = None,
+        source_url: Optional[str] = None,
+    ) -> KnowledgeRecord:
+        """Build a regulation entry and its payload"""
+        identifier = f"49 CFR § {part}.{section}"
+
+        # Get part information, without mutating the shared topic list
+        part_info = self.part_descriptions.get(part, {})
+        topics = list(part_info.get("topics", []))
+
+        # Extract additional topics from content
+        topics.extend(self._extract_regulation_topics(title + " " + content))
+        topics = list(set(topics))  # Remove duplicates
+
+        # Create knowledge entry, keyed by its citation so reloads overwrite it
+        entry = SharedKnowledgeEntry(
+            id=knowledge_entry_id("fmcsr_regulation", identifier),
+            knowledge_type="fmcsr_regulation",
+            identifier=identifier,
+            title=title,
+            content=content,
+            effective_date=effective_date,
+            topics=topics,
+            citations=self._extract_cross_references(content, part),
+        )
+
+        return KnowledgeRecord(
+            entry=entry,
+            payload=self._regulation_payload(entry, part, subpart, source_url),
+        )
 
     def _parse_part_sections(
         self, part_content: str, part_number: str
@@ -262,6 +342,7 @@ class FMCSRLoader:
 
         current_section = None
         current_content = []
+        section_header = re.compile(rf"^§\s*{part_number}\.(\d+)\s+(.+)$")
 
         for line in lines:
             # Check for subpart
@@ -290,9 +371,7 @@ class FMCSRLoader:
                 continue
 
             # Check for section header
-            section_match = re.match(
-                rf"^§\s*{part_number}\.(\d+)\s+(.+)$", line.strip()
-            )
+            section_match = section_header.match(line.strip())
 
             if section_match:
                 # Save previous section
@@ -407,20 +486,14 @@ class FMCSRLoader:
 
         return list(set(citations))  # Remove duplicates
 
-    async def _store_regulation(
+    def _regulation_payload(
         self,
         entry: SharedKnowledgeEntry,
         part: str,
         subpart: Optional[str],
         source_url: Optional[str],
-    ):
-        """Store regulation in shared vector database"""
-        # Generate embedding
-        text_for_embedding = f"{entry.identifier} {entry.title}\n{entry.content[:500]}"
-        embedding, _ = await self.embedding_generator.generate_embedding_async(
-            text_for_embedding
-        )
-
+    ) -> Dict[str, Any]:
+        """Build the shared collection payload for a regulation"""
         # Prepare metadata
         metadata = {
             "knowledge_type": entry.knowledge_type,
@@ -428,8 +501,8 @@ class FMCSRLoader:
             "title": entry.title,
             "part": part,
             "part_title": self.part_descriptions.get(part, {}).get("title", ""),
-            "topics": json.dumps(entry.topics),
-            "citations": json.dumps(entry.citations),
+            "topics": json.dumps(sorted(entry.topics)),
+            "citations": json.dumps(sorted(entry.citations)),
             "last_updated": entry.last_updated.isoformat(),
             "content_preview": entry.content[:500],
         }
@@ -441,14 +514,7 @@ class FMCSRLoader:
         if source_url:
             metadata["source_url"] = source_url
 
-        # Store in shared collection
-        point = {"id": entry.id, "vector": embedding, "payload": metadata}
-
-        self.vector_store.client.upsert(
-            collection_name=self.collection_name, points=[point]
-        )
-
-        logger.debug(f"Stored regulation {entry.identifier} in shared collection")
+        return metadata
 
     async def search_regulations(
         self,
@@ -510,34 +576,26 @@ class FMCSRLoader:
         self, part: str, section: str
     ) -> Optional[SharedKnowledgeEntry]:
         """Retrieve specific regulation by part and section"""
-        identifier = f"49 CFR § {part}.{section}"
+        return await self.get_regulation(f"{part}.{section}")
 
-        filter_condition = {
-            "must": [{"key": "identifier", "match": {"value": identifier}}]
-        }
+    async def get_regulation(self, citation: str) -> Optional[SharedKnowledgeEntry]:
+        """
+        Retrieve a regulation by citation.
 
-        results = self.vector_store.client.scroll(
-            collection_name=self.collection_name,
-            scroll_filter=filter_condition,
-            limit=1,
-            with_payload=True,
-            with_vectors=False,
-        )[0]
-
-        if results:
-            payload = results[0].payload
-            return SharedKnowledgeEntry(
-                id=results[0].id,
-                knowledge_type=payload["knowledge_type"],
-                identifier=payload["identifier"],
-                title=payload["title"],
-                content=payload.get("content_preview", ""),
-                topics=json.loads(payload["topics"]),
-                citations=json.loads(payload["citations"]),
-                last_updated=datetime.fromisoformat(payload["last_updated"]),
-            )
+        Accepts variants such as "49 CFR § 395.8", "49 C.F.R. 395.8" or
+        "§395.8(a)" and resolves them from the identifier index.
+        """
+        index = get_knowledge_index(self.collection_name)
+        await index.ensure_loaded(self.vector_store)
+        return index.get(citation)
 
-        return None
+    async def get_regulations_in_part(
+        self, part_number: str
+    ) -> List[SharedKnowledgeEntry]:
+        """Retrieve every loaded regulation in a part, e.g. "395" """
+        index = get_knowledge_index(self.collection_name)
+        await index.ensure_loaded(self.vector_store)
+        return index.with_prefix(part_number)
 
     async def load_common_regulations(self):
         """Load commonly referenced FMCSR for trucking cases"""
@@ -590,13 +648,11 @@ class FMCSRLoader:
             },
         ]
 
-        for reg in common_regulations:
-            await self.load_regulation(
-                part=reg["part"],
-                section=reg["section"],
-                title=reg["title"],
-                content=reg["content"],
-                effective_date=datetime(2023, 1, 1),  # Example date
-            )
+        await self.load_regulations(
+            [
+                {**reg, "effective_date": datetime(2023, 1, 1)}  # Example date
+                for reg in common_regulations
+            ]
+        )
 
         logger.info("Loaded common FMCSR regulations")
@@ -0,0 +1,270 @@
+"""
+Identifier Index for Shared Legal Knowledge
+Resolves statute and regulation citations to entries without querying Qdrant
+"""
+
+import asyncio
+import json
+import logging
+import re
+import time
+from datetime import datetime
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
+
+from src.models.fact_models import SharedKnowledgeEntry
+
+logger = logging.getLogger("clerk_api")
+
+# Seconds before a loaded index is re-read, picking up entries stored by
+# other processes such as init_shared_knowledge.py
+KNOWLEDGE_INDEX_TTL_SECONDS = 600
+
+# Payload fields needed to rebuild an entry
+INDEX_PAYLOAD_FIELDS = [
+    "knowledge_type",
+    "identifier",
+    "title",
+    "content_preview",
+    "topics",
+    "citations",
+    "effective_date",
+    "last_updated",
+]
+
+# Title prefixes that precede the section number, e.g. "49 CFR", "49 C.F.R."
+TITLE_PREFIX = re.compile(r"\b\d+\s*(?:C\.?\s*F\.?\s*R|U\.?\s*S\.?\s*C)\.?", re.I)
+SECTION_NUMBER = re.compile(r"\d+[A-Za-z]?(?:\.\d+[A-Za-z]?)*")
+
+
+def normalize_citation(citation: str) -> Optional[str]:
+    """
+    Reduce a statute or regulation citation to its section number.
+
+    "Fla. Stat. § 768.81", "§768.81", "768.81, Fla. Stat." and
+    "s. 768.81(2)" all normalize to "768.81"; "49 CFR § 395.8" and
+    "49 C.F.R. 395.8" to "395.8".
+
+    Returns:
+        Section number, or None if the citation has none
+    """
+    match = SECTION_NUMBER.search(TITLE_PREFIX.sub(" ", citation))
+    return match.group(0).lower() if match else None
+
+
+def _section_sort_key(key: str):
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", key)]
+
+
+def entry_from_payload(point_id: Any, payload: Dict[str, Any]) -> SharedKnowledgeEntry:
+    """Build a knowledge entry from a stored shared-collection payload"""
+    effective_date = payload.get("effective_date")
+    return SharedKnowledgeEntry(
+        id=str(point_id),
+        knowledge_type=payload["knowledge_type"],
+        identifier=payload["identifier"],
+        title=payload["title"],
+        content=payload.get("content_preview", ""),
+        effective_date=(
+            datetime.fromisoformat(effective_date) if effective_date else None
+        ),
+        topics=json.loads(payload.get("topics") or "[]"),
+        citations=json.loads(payload.get("citations") or "[]"),
+        last_updated=datetime.fromisoformat(payload["last_updated"]),
+    )
+
+
+# Change made by a loader, applied to an index
+KnowledgeUpdate = Callable[["KnowledgeIdentifierIndex"], None]
+
+
+class KnowledgeIdentifierIndex:
+    """
+    In-memory citation lookup table for one shared knowledge collection.
+
+    Entries are keyed by their normalized section number, with a second map
+    from chapter or part to the sections in it. Exact, variant and prefix
+    lookups are dict reads. The table is filled with one paginated scroll on
+    first use, kept current by the loaders in this process as they store
+    entries, and re-read once older than its TTL.
+    """
+
+    def __init__(
+        self, collection_name: str, ttl_seconds: float = KNOWLEDGE_INDEX_TTL_SECONDS
+    ):
+        """
+        Initialize an empty index.
+
+        Args:
+            collection_name: Shared collection the index mirrors
+            ttl_seconds: Age after which ensure_loaded re-reads the index
+        """
+        self.collection_name = collection_name
+        self.ttl_seconds = ttl_seconds
+        self.loaded = False
+        self.loaded_at = 0.0
+
+        self._entries: Dict[str, SharedKnowledgeEntry] = {}
+        # Chapter or part -> section keys, in insertion order
+        self._prefixes: Dict[str, Dict[str, None]] = {}
+
+        self._load_lock = asyncio.Lock()
+        # Updates recorded while a load is running, replayed onto its result
+        self._pending: Optional[List[KnowledgeUpdate]] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, citation: str) -> bool:
+        return self.get(citation) is not None
+
+    @property
+    def is_stale(self) -> bool:
+        return not self.loaded or time.monotonic() - self.loaded_at >= self.ttl_seconds
+
+    def get(self, citation: str) -> Optional[SharedKnowledgeEntry]:
+        """
+        Look up an entry by any variant of its citation.
+
+        Args:
+            citation: e.g. "Fla. Stat. § 768.81", "768.81" or "§768.81(2)"
+
+        Returns:
+            Knowledge entry, or None if not indexed
+        """
+        key = normalize_citation(citation)
+        return self._entries.get(key) if key else None
+
+    def with_prefix(self, prefix: str) -> List[SharedKnowledgeEntry]:
+        """
+        Return every entry in a chapter or part.
+
+        Args:
+            prefix: Chapter or part, e.g. "768", "Chapter 768", "49 CFR Part 395"
+
+        Returns:
+            Entries in section order
+        """
+        key = normalize_citation(prefix)
+        if not key:
+            return []
+        sections = self._prefixes.get(key.split(".")[0], {})
+        return [
+            self._entries[section]
+            for section in sorted(sections, key=_section_sort_key)
+        ]
+
+    def upsert(self, point_id: Any, payload: Dict[str, Any]):
+        """Add or replace the entry stored under a point"""
+        key = normalize_citation(payload.get("identifier", ""))
+        if not key:
+            return
+        self._entries[key] = entry_from_payload(point_id, payload)
+        self._prefixes.setdefault(key.split(".")[0], {})[key] = None
+
+    def record(self, update: KnowledgeUpdate):
+        """Apply a loader's update to the loaded index and to any load in progress"""
+        if self._pending is not None:
+            self._pending.append(update)
+        # Unloaded indexes read the change from Qdrant when first used
+        if self.loaded:
+            update(self)
+
+    async def ensure_loaded(self, vector_store, page_size: int = 1000):
+        """
+        Populate the index from the collection.
+
+        Reloads once the index is older than its TTL. Updates recorded during
+        the scroll are replayed onto the result before it replaces the
+        current entries.
+        """
+        if not self.is_stale:
+            return
+
+        async with self._load_lock:
+            if not self.is_stale:
+                return
+
+            self._pending = []
+            try:
+                fresh = await self._scan(vector_store, page_size)
+            except Exception:
+                self._pending = None
+                if not self.loaded:
+                    raise
+                # Keep serving the previous entries; retry on the next call
+                logger.warning(
+                    f"Reloading identifier index for {self.collection_name} failed",
+                    exc_info=True,
+                )
+                return
+
+            for update in self._pending:
+                update(fresh)
+            self._pending = None
+
+            self._entries = fresh._entries
+            self._prefixes = fresh._prefixes
+            self.loaded = True
+            self.loaded_at = time.monotonic()
+            logger.info(
+                f"Loaded {len(self)} entries into identifier index for "
+                f"{self.collection_name}"
+            )
+
+    async def _scan(self, vector_store, page_size: int) -> "KnowledgeIdentifierIndex":
+        """Read the collection into a new index"""
+        loop = asyncio.get_running_loop()
+        fresh = KnowledgeIdentifierIndex(self.collection_name)
+        offset = None
+        while True:
+            points, offset = await loop.run_in_executor(
+                None,
+                partial(
+                    vector_store.client.scroll,
+                    collection_name=self.collection_name,
+                    limit=page_size,
+                    offset=offset,
+                    with_payload=INDEX_PAYLOAD_FIELDS,
+                    with_vectors=False,
+                ),
+            )
+            for point in points:
+                try:
+                    fresh.upsert(point.id, point.payload)
+                except (KeyError, TypeError, ValueError) as e:
+                    logger.warning(
+                        f"Skipping malformed knowledge entry {point.id}: {e}"
+                    )
+            if offset is None:
+                break
+        return fresh
+
+
+# Shared per-collection indexes, kept current by the loaders
+_knowledge_indexes: Dict[str, KnowledgeIdentifierIndex] = {}
+
+
+def get_knowledge_index(collection_name: str) -> KnowledgeIdentifierIndex:
+    """Return the shared identifier index for a collection"""
+    index = _knowledge_indexes.get(collection_name)
+    if index is None:
+        index = _knowledge_indexes[collection_name] = KnowledgeIdentifierIndex(
+            collection_name
+        )
+    return index
+
+
+def record_knowledge_payloads(collection_name: str, points: List[Dict[str, Any]]):
+    """Apply stored points to the collection index"""
+    index = _knowledge_indexes.get(collection_name)
+    if index is None:
+        # Indexes not created yet read the new entries from Qdrant when first used
+        return
+    points = [(point["id"], point["payload"]) for point in points]
+
+    def update(index: KnowledgeIdentifierIndex):
+        for point_id, payload in points:
+            index.upsert(point_id, payload)
+
+    index.record(update)
@@ -0,0 +1,162 @@
+"""
+Tests for bulk loading of statutes and regulations
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.data_loaders.florida_statutes_loader import FloridaStatutesLoader
+from src.data_loaders.fmcsr_loader import FMCSRLoader
+
+PART_395 = """
+Subpart A—General
+§ 395.1 Scope of rules in this part.
+(a) The rules in this part apply to all motor carriers and drivers.
+§ 395.2 Definitions.
+As used in this part, driving time means all time spent at the driving controls.
+§ 395.3 Maximum driving time for property-carrying vehicles.
+A driver may not drive after 11 hours of driving. See § 395.8.
+"""
+
+CHAPTER_768 = """CHAPTER 768 NEGLIGENCE
+768.81 Comparative fault.—In a negligence action, contributory fault diminishes damages.
+768.125 Seat belts.—Evidence of failure to wear a seat belt is admissible.
+768.72 Punitive damages.—No claim for punitive damages shall be permitted.
+"""
+
+
+class FakeCollection:
+    """Minimal in-memory stand-in for a Qdrant collection"""
+
+    def __init__(self):
+        self.points = {}
+        self.upsert_calls = 0
+
+    def upsert(self, collection_name, points):
+        self.upsert_calls += 1
+        for point in points:
+            self.points[point["id"]] = point
+
+    def retrieve(self, collection_name, ids, with_payload, with_vectors):
+        return [
+            SimpleNamespace(id=i, payload=self.points[i]["payload"])
+            for i in ids
+            if i in self.points
+        ]
+
+
+def make_loader(loader_cls, module, collection):
+    with patch(f"src.data_loaders.{module}.QdrantVectorStore"), patch(
+        f"src.data_loaders.{module}.EmbeddingGenerator"
+    ):
+        loader = loader_cls()
+    loader.vector_store.client.upsert = Mock(side_effect=collection.upsert)
+    loader.vector_store.client.retrieve = Mock(side_effect=collection.retrieve)
+    loader.embedding_generator.generate_embeddings_batch_async = AsyncMock(
+        side_effect=lambda texts: ([[0.1] * 4 for _ in texts], 10)
+    )
+    loader.bulk_loader.upsert_batch_size = 2
+    return loader
+
+
+@pytest.fixture
+def collection():
+    return FakeCollection()
+
+
+class TestFMCSRBulkLoad:
+    """Test FMCSRLoader bulk loading"""
+
+    @pytest.mark.asyncio
+    async def test_part_is_embedded_once_and_upserted_in_chunks(self, collection):
+        loader = make_loader(FMCSRLoader, "fmcsr_loader", collection)
+
+        entries = await loader.load_part("395", PART_395)
+
+        assert [e.identifier for e in entries] == [
+            "49 CFR § 395.1",
+            "49 CFR § 395.2",
+            "49 CFR § 395.3",
+        ]
+        embed = loader.embedding_generator.generate_embeddings_batch_async
+        embed.assert_awaited_once()
+        assert len(embed.await_args.args[0]) == 3
+        assert collection.upsert_calls == 2
+        assert collection.points[entries[0].id]["payload"]["subpart"] == (
+            "Subpart A - General"
+        )
+
+    @pytest.mark.asyncio
+    async def test_reload_is_idempotent_and_diffs_content(self, collection):
+        loader = make_loader(FMCSRLoader, "fmcsr_loader", collection)
+        first = await loader.load_part("395", PART_395)
+
+        # Same text: same IDs, nothing re-embedded
+        second = await loader.load_part("395", PART_395)
+        assert [e.id for e in first] == [e.id for e in second]
+        assert len(collection.points) == 3
+        embed = loader.embedding_generator.generate_embeddings_batch_async
+        assert embed.await_count == 1
+
+        # One edited section: only it is re-embedded
+        await loader.load_part("395", PART_395.replace("11 hours", "10 hours"))
+        assert embed.await_args.args[0][0].startswith("49 CFR § 395.3")
+        assert len(embed.await_args.args[0]) == 1
+
+        # Diff mode off re-embeds everything
+        await loader.load_part("395", PART_395, diff=False)
+        assert len(embed.await_args.args[0]) == 3
+
+    @pytest.mark.asyncio
+    async def test_part_topics_are_not_mutated(self, collection):
+        loader = make_loader(FMCSRLoader, "fmcsr_loader", collection)
+        topics = list(loader.part_descriptions["395"]["topics"])
+
+        await loader.load_parts({"395": PART_395, "392": ""})
+
+        assert loader.part_descriptions["395"]["topics"] == topics
+
+
+class TestFloridaStatutesBulkLoad:
+    """Test FloridaStatutesLoader bulk loading"""
+
+    @pytest.mark.asyncio
+    async def test_chapter_loads_in_one_batch_with_stable_ids(self, collection):
+        loader = make_loader(
+            FloridaStatutesLoader, "florida_statutes_loader", collection
+        )
+
+        entries = await loader.load_chapter("768", "Negligence", CHAPTER_768)
+        again = await loader.load_chapter("768", "Negligence", CHAPTER_768)
+
+        assert [e.identifier for e in entries] == [
+            "Fla. Stat. § 768.81",
+            "Fla. Stat. § 768.125",
+            "Fla. Stat. § 768.72",
+        ]
+        assert [e.id for e in entries] == [e.id for e in again]
+        embed = loader.embedding_generator.generate_embeddings_batch_async
+        embed.assert_awaited_once()
+        assert len(collection.points) == 3
+
+    @pytest.mark.asyncio
+    async def test_single_statute_uses_same_id_as_bulk(self, collection):
+        loader = make_loader(
+            FloridaStatutesLoader, "florida_statutes_loader", collection
+        )
+
+        single = await loader.load_statute("768.81", "Comparative fault", "Text")
+        bulk = await loader.load_statutes(
+            [
+                {
+                    "statute_number": "768.81",
+                    "title": "Comparative fault",
+                    "content": "Text",
+                }
+            ]
+        )
+
+        assert single.id == bulk[0].id
+        assert len(collection.points) == 1
@@ -0,0 +1,162 @@
+"""
+Tests for the shared knowledge identifier index
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.data_loaders import knowledge_index
+from src.data_loaders.florida_statutes_loader import FloridaStatutesLoader
+from src.data_loaders.fmcsr_loader import FMCSRLoader
+from src.data_loaders.knowledge_index import (
+    KnowledgeIdentifierIndex,
+    get_knowledge_index,
+    normalize_citation,
+    record_knowledge_payloads,
+)
+
+
+def payload(identifier, title="Title", knowledge_type="florida_statute"):
+    return {
+        "knowledge_type": knowledge_type,
+        "identifier": identifier,
+        "title": title,
+        "content_preview": f"Text of {identifier}",
+        "topics": '["negligence"]',
+        "citations": "[]",
+        "last_updated": "2024-01-01T00:00:00",
+    }
+
+
+@pytest.fixture(autouse=True)
+def clear_indexes():
+    knowledge_index._knowledge_indexes.clear()
+    yield
+    knowledge_index._knowledge_indexes.clear()
+
+
+def make_loader(loader_cls, module, pages):
+    with patch(f"src.data_loaders.{module}.QdrantVectorStore"), patch(
+        f"src.data_loaders.{module}.EmbeddingGenerator"
+    ):
+        loader = loader_cls()
+    loader.vector_store.client.scroll = Mock(side_effect=pages)
+    loader.vector_store.client.retrieve = Mock(return_value=[])
+    loader.embedding_generator.generate_embeddings_batch_async = AsyncMock(
+        side_effect=lambda texts: ([[0.1] * 4 for _ in texts], 10)
+    )
+    return loader
+
+
+class TestNormalizeCitation:
+    """Test citation normalization"""
+
+    @pytest.mark.parametrize(
+        "citation",
+        [
+            "Fla. Stat. § 768.81",
+            "§768.81",
+            "768.81, Fla. Stat.",
+            "s. 768.81(2)(a)",
+            "768.81",
+        ],
+    )
+    def test_statute_variants(self, citation):
+        assert normalize_citation(citation) == "768.81"
+
+    def test_regulation_variants(self):
+        assert normalize_citation("49 CFR § 395.8") == "395.8"
+        assert normalize_citation("49 C.F.R. 395.8(a)") == "395.8"
+        assert normalize_citation("49 CFR Part 395") == "395"
+        assert normalize_citation("Fla. Stat.") is None
+
+
+class TestKnowledgeIdentifierIndex:
+    """Test index lookups and loading"""
+
+    def test_exact_variant_and_prefix_lookups(self):
+        index = KnowledgeIdentifierIndex("florida_statutes")
+        for point_id, identifier in enumerate(
+            ["Fla. Stat. § 768.81", "Fla. Stat. § 768.125", "Fla. Stat. § 316.193"]
+        ):
+            index.upsert(point_id, payload(identifier))
+
+        assert index.get("768.81, Fla. Stat.").identifier == "Fla. Stat. § 768.81"
+        assert index.get("Fla. Stat. § 768.8") is None
+        assert [e.identifier for e in index.with_prefix("Chapter 768")] == [
+            "Fla. Stat. § 768.81",
+            "Fla. Stat. § 768.125",
+        ]
+        assert index.with_prefix("999") == []
+
+    @pytest.mark.asyncio
+    async def test_statute_lookups_scroll_once(self):
+        pages = [
+            ([SimpleNamespace(id="a", payload=payload("Fla. Stat. § 768.81"))], "next"),
+            ([SimpleNamespace(id="b", payload=payload("Fla. Stat. § 768.72"))], None),
+        ]
+        loader = make_loader(FloridaStatutesLoader, "florida_statutes_loader", pages)
+
+        entry = await loader.get_statute_by_number("768.81")
+        assert entry.id == "a" and entry.topics == ["negligence"]
+        assert (await loader.get_statute_by_number("§768.72")).id == "b"
+        assert await loader.get_statute_by_number("768.99") is None
+        assert len(await loader.get_statutes_in_chapter("768")) == 2
+
+        assert loader.vector_store.client.scroll.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_loading_refreshes_index(self):
+        loader = make_loader(FMCSRLoader, "fmcsr_loader", [([], None)])
+        assert await loader.get_regulation_by_section("395", "8") is None
+
+        await loader.load_regulation("395", "8", "Driver's record of duty status", "…")
+
+        entry = await loader.get_regulation("49 C.F.R. 395.8(a)")
+        assert entry.identifier == "49 CFR § 395.8"
+        assert [e.identifier for e in await loader.get_regulations_in_part("395")] == [
+            "49 CFR § 395.8"
+        ]
+        assert loader.vector_store.client.scroll.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_index_sees_other_processes(self):
+        """Test entries stored elsewhere appear once the index expires"""
+        store = Mock()
+        store.client.scroll = Mock(
+            return_value=([SimpleNamespace(id="a", payload=payload("768.81"))], None)
+        )
+        index = KnowledgeIdentifierIndex("florida_statutes", ttl_seconds=60)
+        await index.ensure_loaded(store)
+
+        store.client.scroll.return_value = (
+            [
+                SimpleNamespace(id="a", payload=payload("768.81")),
+                SimpleNamespace(id="b", payload=payload("768.72")),
+            ],
+            None,
+        )
+        await index.ensure_loaded(store)
+        assert "768.72" not in index
+
+        index.loaded_at -= 60
+        await index.ensure_loaded(store)
+        assert "768.72" in index and store.client.scroll.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_entries_stored_during_load_are_kept(self):
+        index = get_knowledge_index("florida_statutes")
+
+        def scroll(**kwargs):
+            record_knowledge_payloads(
+                "florida_statutes", [{"id": "b", "payload": payload("768.72")}]
+            )
+            return [SimpleNamespace(id="a", payload=payload("768.81"))], None
+
+        store = Mock()
+        store.client.scroll = Mock(side_effect=scroll)
+        await index.ensure_loaded(store)
+
+        assert index.get("768.72").id == "b" and index.get("768.81").id == "a"
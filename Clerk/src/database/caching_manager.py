@@ -17,12 +17,15 @@ Key Features:
 """
 
 import asyncio
+import heapq
 import json
 import hashlib
 import pickle
+import threading
+from collections import OrderedDict, defaultdict
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Set, Tuple, Union
-from dataclasses import dataclass
+from typing import Callable, Iterable, List, Dict, Any, Optional, Set, Tuple, Union
+from dataclasses import dataclass, field
 from enum import Enum
 import time
 
@@ -34,11 +37,43 @@ except ImportError:
     REDIS_AVAILABLE = False
     redis = None
 
+from qdrant_client.models import FieldCondition, Filter, MatchValue
+
 from ..vector_storage.qdrant_store import QdrantVectorStore
+from ..utils.cache import estimate_size
 from ..utils.logger import setup_logger
+from ..utils.thread_pool import run_blocking
 
 logger = setup_logger(__name__)
 
+# Views created by CachingManager.initialize and on first use
+COMMON_MATERIALIZED_VIEWS = {
+    "case_document_counts": {
+        "config": {
+            "type": "aggregation",
+            "collection": "document_case_junctions",
+            "group_by": "case_id",
+            "aggregations": ["count"],
+        },
+        "refresh_interval_hours": 24,
+    },
+    "document_type_distribution": {
+        "config": {
+            "type": "aggregation",
+            "collection": "document_metadata",
+            "group_by": "document_type",
+            "aggregations": ["count"],
+        },
+        "refresh_interval_hours": 12,
+    },
+}
+
+# Chunk payload fields read when a case aggregate is built from Qdrant;
+# the first date field present on a chunk counts towards the date range
+CASE_DATE_FIELDS = ("document_date", "modified_at")
+CASE_PAYLOAD_FIELDS = ["document_id", "document_type", *CASE_DATE_FIELDS]
+CASE_STATISTICS_REFRESH_HOURS = 6
+
 
 class CacheLevel(str, Enum):
     """Cache levels in the hierarchy"""
@@ -64,6 +99,8 @@ class CacheConfig:
 
     default_ttl_seconds: int = 3600  # 1 hour
     memory_cache_size: int = 1000  # Max items in memory
+    memory_cache_max_bytes: Optional[int] = 256 * 1024 * 1024  # Max L1 memory
+    namespace_quota_bytes: Optional[int] = None  # Max L1 memory per namespace
     redis_max_memory_mb: int = 512  # Max Redis memory
     enable_compression: bool = True
     enable_materialized_views: bool = True
@@ -133,74 +170,265 @@ class CacheStats:
         self.hit_rate = self.hits / total if total > 0 else 0.0
 
 
+@dataclass
+class CaseAggregate:
+    """
+    Materialized statistics for one case.
+
+    Kept current by the chunk and fact writers between full refreshes.
+    Chunks are counted once per point ID, so re-upserted chunks and updates
+    replayed after a refresh are not counted twice. Deletions cannot narrow
+    the date range; the next refresh does.
+    """
+
+    case_name: str
+    chunk_count: int = 0
+    fact_count: int = 0
+    # document_id -> document type
+    documents: Dict[str, str] = field(default_factory=dict)
+    # document_id -> point IDs of its counted chunks
+    document_chunks: Dict[str, Set[str]] = field(default_factory=dict)
+    # Point IDs of every counted chunk
+    counted_chunks: Set[str] = field(default_factory=set)
+    document_types: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    earliest_date: Optional[datetime] = None
+    latest_date: Optional[datetime] = None
+    refreshed_at: Optional[datetime] = None
+    updated_at: datetime = field(default_factory=datetime.now)
+
+    def add_chunks(self, points: Iterable[Tuple[Any, Dict[str, Any]]]):
+        """Count newly stored chunks from their (point ID, payload) pairs"""
+        for point_id, payload in points:
+            point_id = str(point_id)
+            if point_id in self.counted_chunks:
+                continue
+
+            self.chunk_count += 1
+            self.counted_chunks.add(point_id)
+            document_id = payload.get("document_id")
+            if document_id:
+                if document_id not in self.documents:
+                    document_type = payload.get("document_type") or "unknown"
+                    self.documents[document_id] = document_type
+                    self.document_types[document_type] += 1
+                self.document_chunks.setdefault(document_id, set()).add(point_id)
+
+            for date_field in CASE_DATE_FIELDS:
+                value = _parse_payload_date(payload.get(date_field))
+                if value is not None:
+                    if self.earliest_date is None or value < self.earliest_date:
+                        self.earliest_date = value
+                    if self.latest_date is None or value > self.latest_date:
+                        self.latest_date = value
+                    break
+        self.updated_at = datetime.now()
+
+    def remove_document(self, document_id: str):
+        """Uncount a deleted document and its chunks"""
+        document_type = self.documents.pop(document_id, None)
+        if document_type is not None:
+            self.document_types[document_type] -= 1
+            if self.document_types[document_type] <= 0:
+                del self.document_types[document_type]
+        chunks = self.document_chunks.pop(document_id, set())
+        self.counted_chunks -= chunks
+        self.chunk_count = max(0, self.chunk_count - len(chunks))
+        self.updated_at = datetime.now()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "case_name": self.case_name,
+            "total_chunks": self.chunk_count,
+            "unique_documents": len(self.documents),
+            "document_types": dict(self.document_types),
+            "fact_count": self.fact_count,
+            "date_range": {
+                "earliest": (
+                    self.earliest_date.isoformat() if self.earliest_date else None
+                ),
+                "latest": self.latest_date.isoformat() if self.latest_date else None,
+            },
+            "refreshed_at": self.refreshed_at,
+            "updated_at": self.updated_at,
+        }
+
+
+# Incremental change applied to a case's aggregate
+CaseUpdate = Callable[[CaseAggregate], None]
+
+
+def _parse_payload_date(value: Any) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None)
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+def cache_namespace(key: str) -> str:
+    """Quota namespace of a cache key: its first segment"""
+    return key.split(":", 1)[0]
+
+
 class InMemoryCache:
-    """L1 in-memory cache with LRU eviction"""
+    """
+    L1 in-memory cache with O(1) LRU eviction.
+
+    Entries are kept in an OrderedDict in access order, and each namespace
+    keeps its own access order so a namespace over its quota evicts only its
+    own entries. The cache is bounded by entry count and optionally by the
+    total of entry.size_bytes. Expiry times sit in a min-heap, so expired
+    entries are purged without scanning the cache.
+    """
 
-    def __init__(self, max_size: int = 1000):
+    def __init__(
+        self,
+        max_size: int = 1000,
+        max_bytes: Optional[int] = None,
+        namespace_quota_bytes: Optional[int] = None,
+        namespace_quotas: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            max_size: Maximum number of entries
+            max_bytes: Optional bound on the total size of entries
+            namespace_quota_bytes: Optional default byte quota per namespace
+            namespace_quotas: Byte quotas for specific namespaces
+        """
         self.max_size = max_size
-        self.cache: Dict[str, CacheEntry] = {}
-        self.access_order: List[str] = []  # For LRU
+        self.max_bytes = max_bytes
+        self.namespace_quota_bytes = namespace_quota_bytes
+        self.namespace_quotas = namespace_quotas or {}
+        self.cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
         self.total_size_bytes = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        # namespace -> keys in access order, and bytes used
+        self._namespaces: Dict[str, "OrderedDict[str, None]"] = {}
+        self._namespace_bytes: Dict[str, int] = defaultdict(int)
+        # key -> monotonic expiry time, with a lazily cleaned min-heap of them
+        self._expires_at: Dict[str, float] = {}
+        self._expiry_heap: List[Tuple[float, str]] = []
 
     def get(self, key: str) -> Optional[CacheEntry]:
         """Get item from cache"""
-        if key in self.cache:
-            entry = self.cache[key]
-            if not entry.is_expired:
-                # Update access tracking
-                entry.last_accessed = datetime.now()
-                entry.access_count += 1
-
-                # Move to end for LRU
-                if key in self.access_order:
-                    self.access_order.remove(key)
-                self.access_order.append(key)
-
-                return entry
-            else:
-                # Remove expired entry
-                self.remove(key)
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
 
-        return None
+        expires_at = self._expires_at.get(key)
+        if expires_at is not None and expires_at <= time.monotonic():
+            self.remove(key)
+            self.expirations += 1
+            return None
+
+        # Update access tracking
+        entry.last_accessed = datetime.now()
+        entry.access_count += 1
+        self.cache.move_to_end(key)
+        self._namespaces[cache_namespace(key)].move_to_end(key)
+        return entry
 
     def put(self, key: str, entry: CacheEntry) -> bool:
-        """Put item in cache"""
+        """
+        Put item in cache
+
+        Returns:
+            False if the entry is larger than its namespace quota or the
+            byte bound and was not cached
+        """
         # Remove existing entry if present
-        if key in self.cache:
-            self.remove(key)
+        self.remove(key)
+        self.purge_expired()
+
+        namespace = cache_namespace(key)
+        quota = self.namespace_quotas.get(namespace, self.namespace_quota_bytes)
+        size = entry.size_bytes
+        if (quota is not None and size > quota) or (
+            self.max_bytes is not None and size > self.max_bytes
+        ):
+            logger.warning(
+                f"Cache entry {key} ({size} bytes) exceeds its size limit, not cached"
+            )
+            return False
 
-        # Check if we need to evict
-        while len(self.cache) >= self.max_size:
-            self._evict_lru()
+        # Make room within the namespace first, then in the whole cache
+        if quota is not None:
+            while self._namespace_bytes[namespace] + size > quota:
+                self._evict(next(iter(self._namespaces[namespace])))
+        while self.cache and (
+            len(self.cache) >= self.max_size
+            or (
+                self.max_bytes is not None
+                and self.total_size_bytes + size > self.max_bytes
+            )
+        ):
+            self._evict(next(iter(self.cache)))
 
         # Add new entry
         self.cache[key] = entry
-        self.access_order.append(key)
-        self.total_size_bytes += entry.size_bytes
+        self._namespaces.setdefault(namespace, OrderedDict())[key] = None
+        self._namespace_bytes[namespace] += size
+        self.total_size_bytes += size
+
+        if entry.ttl_seconds:
+            expires_at = time.monotonic() + entry.ttl_seconds
+            self._expires_at[key] = expires_at
+            heapq.heappush(self._expiry_heap, (expires_at, key))
+            # Replaced and removed entries leave stale heap items behind
+            if len(self._expiry_heap) > 2 * len(self._expires_at) + 64:
+                self._expiry_heap = [(t, k) for k, t in self._expires_at.items()]
+                heapq.heapify(self._expiry_heap)
 
         return True
 
     def remove(self, key: str) -> bool:
         """Remove item from cache"""
-        if key in self.cache:
-            entry = self.cache[key]
-            del self.cache[key]
-            if key in self.access_order:
-                self.access_order.remove(key)
-            self.total_size_bytes -= entry.size_bytes
-            return True
-        return False
+        entry = self.cache.pop(key, None)
+        if entry is None:
+            return False
+
+        namespace = cache_namespace(key)
+        keys = self._namespaces[namespace]
+        del keys[key]
+        self._namespace_bytes[namespace] -= entry.size_bytes
+        if not keys:
+            del self._namespaces[namespace]
+            del self._namespace_bytes[namespace]
+        self._expires_at.pop(key, None)
+        self.total_size_bytes -= entry.size_bytes
+        return True
 
-    def _evict_lru(self):
-        """Evict least recently used item"""
-        if self.access_order:
-            lru_key = self.access_order[0]
-            self.remove(lru_key)
+    def _evict(self, key: str):
+        self.remove(key)
+        self.evictions += 1
+
+    def purge_expired(self) -> List[str]:
+        """Remove expired entries, oldest expiry first"""
+        now = time.monotonic()
+        expired = []
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            if self._expires_at.get(key) == expires_at:
+                self.remove(key)
+                expired.append(key)
+        self.expirations += len(expired)
+        return expired
 
     def clear(self):
         """Clear all cache entries"""
         self.cache.clear()
-        self.access_order.clear()
+        self._namespaces.clear()
+        self._namespace_bytes.clear()
+        self._expires_at.clear()
+        self._expiry_heap.clear()
         self.total_size_bytes = 0
 
     def get_stats(self) -> Dict[str, Any]:
@@ -209,7 +437,11 @@ class InMemoryCache:
             "size": len(self.cache),
             "max_size": self.max_size,
             "memory_usage_bytes": self.total_size_bytes,
+            "max_bytes": self.max_bytes,
             "utilization": len(self.cache) / self.max_size if self.max_size > 0 else 0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "namespace_usage_bytes": dict(self._namespace_bytes),
         }
 
 
@@ -315,14 +547,51 @@ class RedisCache:
 
 
 class MaterializedViewManager:
-    """L3 materialized views for complex aggregations"""
+    """
+    L3 materialized views for complex aggregations.
+
+    Besides generic group-by views, keeps one CaseAggregate per case that
+    the chunk and fact writers update incrementally, so case statistics
+    are dictionary reads. Aggregates are keyed by the case's collection
+    name, so writers passing a folder name and readers listing collections
+    meet on the same entry. Updates that arrive while a case is being
+    rescanned are replayed on the new aggregate before it is installed.
+    Stale views are refreshed in the background.
+    """
 
-    def __init__(self, qdrant_store: QdrantVectorStore):
+    def __init__(self, qdrant_store: Optional[QdrantVectorStore] = None):
         self.qdrant_store = qdrant_store
         self.materialized_views: Dict[str, Dict[str, Any]] = {}
         self.view_refresh_schedule: Dict[str, datetime] = {}
+        self.case_aggregates: Dict[str, CaseAggregate] = {}
+        self.scroll_page_size = 1000
         self.logger = logger
 
+        self._case_lock = threading.Lock()
+        # Case key -> updates recorded while a scan of the case is running
+        self._pending_case_updates: Dict[str, List[CaseUpdate]] = {}
+        self._refresh_tasks: Dict[str, asyncio.Task] = {}
+
+    def _register_view(
+        self,
+        view_name: str,
+        query_config: Dict[str, Any],
+        data: Any,
+        refresh_interval_hours: int,
+    ):
+        now = datetime.now()
+        self.materialized_views[view_name] = {
+            "data": data,
+            "config": query_config,
+            "created_at": now,
+            "last_refreshed": now,
+            "refresh_interval_hours": refresh_interval_hours,
+            "access_count": 0,
+        }
+        self.view_refresh_schedule[view_name] = now + timedelta(
+            hours=refresh_interval_hours
+        )
+
     async def create_materialized_view(
         self,
         view_name: str,
@@ -334,19 +603,8 @@ class MaterializedViewManager:
             # Execute the aggregation query
             result = await self._execute_aggregation_query(query_config)
 
-            # Store the materialized view
-            self.materialized_views[view_name] = {
-                "data": result,
-                "config": query_config,
-                "created_at": datetime.now(),
-                "last_refreshed": datetime.now(),
-                "refresh_interval_hours": refresh_interval_hours,
-                "access_count": 0,
-            }
-
-            # Schedule next refresh
-            next_refresh = datetime.now() + timedelta(hours=refresh_interval_hours)
-            self.view_refresh_schedule[view_name] = next_refresh
+            # Store the materialized view and schedule its next refresh
+            self._register_view(view_name, query_config, result, refresh_interval_hours)
 
             self.logger.info(f"Created materialized view: {view_name}")
             return True
@@ -363,12 +621,57 @@ class MaterializedViewManager:
         view = self.materialized_views[view_name]
         view["access_count"] += 1
 
-        # Check if refresh is needed
+        # Stale views are refreshed in the background; readers get the last data
         if self._needs_refresh(view_name):
-            await self.refresh_materialized_view(view_name)
+            self._schedule_refresh(view_name)
 
+        if view["config"].get("type") == "case_statistics":
+            # Kept current by incremental updates between refreshes
+            return self.get_case_statistics(view["config"]["case_name"])
         return view["data"]
 
+    async def ensure_common_view(self, view_name: str) -> Optional[Dict[str, Any]]:
+        """Read one of COMMON_MATERIALIZED_VIEWS, creating it on first use"""
+        if view_name not in self.materialized_views:
+            spec = COMMON_MATERIALIZED_VIEWS[view_name]
+            if not await self.create_materialized_view(
+                view_name, spec["config"], spec["refresh_interval_hours"]
+            ):
+                return None
+        return await self.get_materialized_view(view_name)
+
+    def _schedule_refresh(self, view_name: str):
+        task = self._refresh_tasks.get(view_name)
+        if task is not None and not task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Sync callers leave stale views to the background refresher
+            return
+        self._refresh_tasks[view_name] = loop.create_task(
+            self.refresh_materialized_view(view_name)
+        )
+
+    async def refresh_due_views(self) -> int:
+        """Refresh every view past its scheduled refresh time"""
+        refreshed = 0
+        for view_name in list(self.materialized_views):
+            if self._needs_refresh(view_name):
+                refreshed += await self.refresh_materialized_view(view_name)
+        return refreshed
+
+    async def run_background_refresh(self, interval_seconds: float = 300):
+        """Refresh due views until cancelled"""
+        while True:
+            try:
+                await self.refresh_due_views()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Background view refresh error: {e}")
+            await asyncio.sleep(interval_seconds)
+
     async def refresh_materialized_view(self, view_name: str) -> bool:
         """Refresh a materialized view"""
         if view_name not in self.materialized_views:
@@ -404,15 +707,193 @@ class MaterializedViewManager:
     async def _execute_aggregation_query(
         self, query_config: Dict[str, Any]
     ) -> Dict[str, Any]:
-        """Execute aggregation query"""
-        # This would implement complex aggregation queries
-        # For now, return a placeholder
-        return {
-            "query_type": query_config.get("type", "unknown"),
-            "result_count": 0,
-            "aggregations": {},
-            "computed_at": datetime.now(),
-        }
+        """
+        Execute an aggregation query against Qdrant
+
+        Supported types:
+            aggregation: count points per value of group_by in collection
+            case_statistics: rebuild the CaseAggregate of case_name
+        """
+        query_type = query_config.get("type", "unknown")
+
+        if query_type == "case_statistics":
+            aggregate = await run_blocking(
+                self._rebuild_case_aggregate, query_config["case_name"]
+            )
+            return aggregate.to_dict()
+
+        if query_type == "aggregation":
+            counts, result_count = await run_blocking(
+                self._scan_group_counts,
+                query_config["collection"],
+                query_config["group_by"],
+            )
+            return {
+                "query_type": query_type,
+                "result_count": result_count,
+                "aggregations": counts,
+                "computed_at": datetime.now(),
+            }
+
+        raise ValueError(f"Unsupported aggregation query type: {query_type}")
+
+    def _scroll_points(self, collection_name: str, payload_fields: List[str]):
+        """Yield pages of points from a whole collection"""
+        offset = None
+        while True:
+            points, offset = self.qdrant_store.client.scroll(
+                collection_name=collection_name,
+                limit=self.scroll_page_size,
+                offset=offset,
+                with_payload=payload_fields,
+                with_vectors=False,
+            )
+            yield points
+            if offset is None:
+                break
+
+    def _scan_group_counts(
+        self, collection_name: str, group_by: str
+    ) -> Tuple[Dict[str, int], int]:
+        counts: Dict[str, int] = defaultdict(int)
+        total = 0
+        for points in self._scroll_points(collection_name, [group_by]):
+            for point in points:
+                counts[str((point.payload or {}).get(group_by))] += 1
+                total += 1
+        return dict(counts), total
+
+    def _scan_case(self, case_name: str) -> CaseAggregate:
+        """Build a case's aggregate from its chunk and fact collections"""
+        client = self.qdrant_store.client
+        aggregate = CaseAggregate(case_name=case_name)
+
+        # Facts carry no IDs in the aggregate, so count them first to keep
+        # the window for double-counting a replayed fact update small
+        facts_collection = f"{case_name}_facts"
+        if client.collection_exists(facts_collection):
+            aggregate.fact_count = client.count(
+                collection_name=facts_collection,
+                count_filter=Filter(
+                    must_not=[
+                        FieldCondition(key="is_deleted", match=MatchValue(value=True))
+                    ]
+                ),
+                exact=True,
+            ).count
+
+        collection_name = self.qdrant_store.get_collection_name(case_name)
+        if client.collection_exists(collection_name):
+            for points in self._scroll_points(collection_name, CASE_PAYLOAD_FIELDS):
+                aggregate.add_chunks(
+                    (point.id, point.payload or {}) for point in points
+                )
+
+        aggregate.refreshed_at = datetime.now()
+        return aggregate
+
+    def _case_key(self, case_name: str) -> str:
+        """Key of a case's aggregate: its chunk collection name"""
+        if self.qdrant_store is None:
+            return case_name
+        return self.qdrant_store.get_collection_name(case_name)
+
+    def _rebuild_case_aggregate(self, case_name: str) -> CaseAggregate:
+        """Scan a case and install its aggregate. Blocking."""
+        key = self._case_key(case_name)
+        with self._case_lock:
+            self._pending_case_updates.setdefault(key, [])
+        try:
+            aggregate = self._scan_case(case_name)
+        except Exception:
+            with self._case_lock:
+                self._pending_case_updates.pop(key, None)
+            raise
+        self._install_case_aggregate(aggregate)
+        return aggregate
+
+    def _install_case_aggregate(self, aggregate: CaseAggregate):
+        key = self._case_key(aggregate.case_name)
+        with self._case_lock:
+            # Apply what the writers recorded while the scan was running
+            for update in self._pending_case_updates.pop(key, []):
+                update(aggregate)
+            self.case_aggregates[key] = aggregate
+
+        view_name = f"case_statistics:{aggregate.case_name}"
+        if view_name not in self.materialized_views:
+            self._register_view(
+                view_name,
+                {"type": "case_statistics", "case_name": aggregate.case_name},
+                None,
+                CASE_STATISTICS_REFRESH_HOURS,
+            )
+
+    # Per-case aggregates
+
+    def get_case_statistics(
+        self, case_name: str, include_document_ids: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """Materialized statistics of a case, or None if not yet built"""
+        with self._case_lock:
+            aggregate = self.case_aggregates.get(self._case_key(case_name))
+            if aggregate is None:
+                return None
+            stats = aggregate.to_dict()
+            if include_document_ids:
+                stats["document_ids"] = list(aggregate.documents)
+            return stats
+
+    def materialize_case_statistics(self, case_name: str) -> CaseAggregate:
+        """
+        Return a case's aggregate, scanning Qdrant once if it is not built yet.
+
+        Blocking; async callers should go through run_blocking.
+        """
+        aggregate = self.case_aggregates.get(self._case_key(case_name))
+        if aggregate is None:
+            aggregate = self._rebuild_case_aggregate(case_name)
+            self.logger.info(
+                f"Materialized statistics for case {case_name}: "
+                f"{aggregate.chunk_count} chunks, {len(aggregate.documents)} documents"
+            )
+        return aggregate
+
+    def _record_case_update(self, case_name: str, update: CaseUpdate):
+        """Apply an update to a built aggregate and to any scan in progress"""
+        key = self._case_key(case_name)
+        with self._case_lock:
+            pending = self._pending_case_updates.get(key)
+            if pending is not None:
+                pending.append(update)
+            aggregate = self.case_aggregates.get(key)
+            # Unbuilt aggregates read the change from Qdrant when first used
+            if aggregate is not None:
+                update(aggregate)
+
+    def record_chunk_upserts(
+        self, case_name: str, points: List[Tuple[Any, Dict[str, Any]]]
+    ):
+        """Apply newly stored chunks, given as (point ID, payload) pairs"""
+        points = list(points)
+        self._record_case_update(
+            case_name, lambda aggregate: aggregate.add_chunks(points)
+        )
+
+    def record_document_removal(self, case_name: str, document_id: str):
+        """Apply a deleted document"""
+        self._record_case_update(
+            case_name, lambda aggregate: aggregate.remove_document(document_id)
+        )
+
+    def record_fact_count_change(self, case_name: str, delta: int):
+        """Apply created (positive) or deleted (negative) facts"""
+
+        def update(aggregate: CaseAggregate):
+            aggregate.fact_count = max(0, aggregate.fact_count + delta)
+            aggregate.updated_at = datetime.now()
+
+        self._record_case_update(case_name, update)
 
 
 class CachingManager:
@@ -439,9 +920,13 @@ class CachingManager:
         self.logger = logger
 
         # Initialize cache levels
-        self.l1_cache = InMemoryCache(self.config.memory_cache_size)
+        self.l1_cache = InMemoryCache(
+            self.config.memory_cache_size,
+            max_bytes=self.config.memory_cache_max_bytes,
+            namespace_quota_bytes=self.config.namespace_quota_bytes,
+        )
         self.l2_cache = RedisCache(redis_url)
-        self.l3_cache = MaterializedViewManager(qdrant_store)
+        self.l3_cache = get_materialized_view_manager(qdrant_store)
 
         # Cache statistics
         self.stats = CacheStats()
@@ -564,12 +1049,8 @@ class CachingManager:
             )
             ttl = ttl_seconds or self.config.default_ttl_seconds
 
-            # Calculate size
-            size_bytes = (
-                len(pickle.dumps(value))
-                if self.config.enable_compression
-                else len(str(value))
-            )
+            # Calculate in-memory size
+            size_bytes = estimate_size(value)
 
             # Store in L1
             l1_entry = CacheEntry(
@@ -680,7 +1161,7 @@ class CachingManager:
             created_at=datetime.now(),
             last_accessed=datetime.now(),
             ttl_seconds=self.config.default_ttl_seconds,
-            size_bytes=len(str(value)),
+            size_bytes=estimate_size(value),
             cache_level=CacheLevel.L1_MEMORY,
         )
         self.l1_cache.put(key, l1_entry)
@@ -721,29 +1202,12 @@ class CachingManager:
     async def _create_common_materialized_views(self):
         """Create commonly used materialized views"""
         try:
-            # Case document counts
-            await self.l3_cache.create_materialized_view(
-                "case_document_counts",
-                {
-                    "type": "aggregation",
-                    "collection": "document_case_junctions",
-                    "group_by": "case_id",
-                    "aggregations": ["count"],
-                },
-                refresh_interval_hours=24,
-            )
-
-            # Document type distribution
-            await self.l3_cache.create_materialized_view(
-                "document_type_distribution",
-                {
-                    "type": "aggregation",
-                    "collection": "document_metadata",
-                    "group_by": "document_type",
-                    "aggregations": ["count"],
-                },
-                refresh_interval_hours=12,
-            )
+            for view_name, spec in COMMON_MATERIALIZED_VIEWS.items():
+                await self.l3_cache.create_materialized_view(
+                    view_name,
+                    spec["config"],
+                    refresh_interval_hours=spec["refresh_interval_hours"],
+                )
 
             self.logger.info("Created common materialized views")
 
@@ -773,14 +1237,8 @@ class CachingManager:
         while self._running:
             try:
                 # Clean expired entries from L1 cache
-                expired_keys = []
-                for key, entry in self.l1_cache.cache.items():
-                    if entry.is_expired:
-                        expired_keys.append(key)
-
-                for key in expired_keys:
-                    self.l1_cache.remove(key)
-                    self.stats.evictions += 1
+                expired_keys = self.l1_cache.purge_expired()
+                self.stats.evictions += len(expired_keys)
 
                 if expired_keys:
                     self.logger.info(
@@ -823,8 +1281,9 @@ class CachingManager:
     async def _warm_case_statistics(self):
         """Warm case statistics cache"""
         try:
-            # Pre-calculate case statistics
-            self.logger.debug("Warming case statistics cache")
+            # Rebuild stale case aggregates and aggregation views
+            refreshed = await self.l3_cache.refresh_due_views()
+            self.logger.debug(f"Warmed case statistics: {refreshed} views refreshed")
         except Exception as e:
             self.logger.error(f"Case statistics warming failed: {e}")
 
@@ -901,13 +1360,38 @@ class CachingManager:
             self.logger.error(f"Failed to clear all caches: {e}")
 
 
+# Shared view manager, kept current by the chunk and fact writers
+_view_manager: Optional[MaterializedViewManager] = None
+_view_manager_lock = threading.Lock()
+
+
+def get_materialized_view_manager(
+    qdrant_store: Optional[QdrantVectorStore] = None,
+) -> MaterializedViewManager:
+    """Return the shared materialized view manager, binding a store on first use"""
+    global _view_manager
+    with _view_manager_lock:
+        if _view_manager is None:
+            _view_manager = MaterializedViewManager(qdrant_store)
+        elif _view_manager.qdrant_store is None and qdrant_store is not None:
+            _view_manager.qdrant_store = qdrant_store
+        return _view_manager
+
+
 # Utility functions for creating cache keys
 
 
-def create_document_cache_key(document_id: str, operation: str = "get") -> CacheKey:
+def case_cache_namespace(case_id: Optional[str]) -> str:
+    """Cache namespace of a case, so its entries count against its own quota"""
+    return f"legal_docs.{case_id}" if case_id else "legal_docs"
+
+
+def create_document_cache_key(
+    document_id: str, operation: str = "get", case_id: Optional[str] = None
+) -> CacheKey:
     """Create cache key for document operations"""
     return CacheKey(
-        namespace="legal_docs",
+        namespace=case_cache_namespace(case_id),
         entity_type="document",
         entity_id=document_id,
         operation=operation,
@@ -915,13 +1399,14 @@ def create_document_cache_key(document_id: str, operation: str = "get") -> Cache
 
 
 def create_search_cache_key(query: str, filters: Dict[str, Any]) -> CacheKey:
-    """Create cache key for search operations"""
+    """Create cache key for search operations, namespaced by the filtered case"""
     filters_str = json.dumps(filters, sort_keys=True)
     filters_hash = hashlib.md5(filters_str.encode()).hexdigest()[:8]
     query_hash = hashlib.md5(query.encode()).hexdigest()[:8]
+    case_id = filters.get("case_id") or filters.get("case_name")
 
     return CacheKey(
-        namespace="legal_docs",
+        namespace=case_cache_namespace(case_id if isinstance(case_id, str) else None),
         entity_type="search",
         entity_id=query_hash,
         operation="results",
@@ -932,7 +1417,7 @@ def create_search_cache_key(query: str, filters: Dict[str, Any]) -> CacheKey:
 def create_case_cache_key(case_id: str, operation: str = "stats") -> CacheKey:
     """Create cache key for case operations"""
     return CacheKey(
-        namespace="legal_docs",
+        namespace=case_cache_namespace(case_id),
         entity_type="case",
         entity_id=case_id,
         operation=operation,
@@ -15,10 +15,12 @@ Key Features:
 """
 
 import hashlib
+import threading
+from bisect import bisect_left
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import Deque, List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
-from collections import defaultdict, Counter
+from collections import defaultdict, deque
 
 from ..models.normalized_document_models import IndexStrategy, QueryPattern
 from ..vector_storage.qdrant_store import QdrantVectorStore
@@ -26,6 +28,9 @@ from ..utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Upper bounds (ms) of the latency buckets kept per query aggregate
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
 
 @dataclass
 class QueryMetrics:
@@ -42,6 +47,152 @@ class QueryMetrics:
     full_scan: bool = False
 
 
+@dataclass
+class QueryAggregate:
+    """Totals for one query signature over one or more time buckets"""
+
+    query_signature: str
+    collection_name: str
+    filters_used: List[str]
+    sort_fields: List[str]
+    count: int = 0
+    total_time_ms: float = 0.0
+    min_time_ms: float = float("inf")
+    max_time_ms: float = 0.0
+    total_results: int = 0
+    slow_count: int = 0
+    latency_buckets: List[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    )
+
+    def add(self, execution_time_ms: float, result_count: int, slow: bool):
+        """Fold one query execution into the totals"""
+        self.count += 1
+        self.total_time_ms += execution_time_ms
+        self.min_time_ms = min(self.min_time_ms, execution_time_ms)
+        self.max_time_ms = max(self.max_time_ms, execution_time_ms)
+        self.total_results += result_count
+        self.slow_count += slow
+        self.latency_buckets[bisect_left(LATENCY_BUCKETS_MS, execution_time_ms)] += 1
+
+    def merge(self, other: "QueryAggregate"):
+        """Fold another aggregate for the same signature into this one"""
+        self.count += other.count
+        self.total_time_ms += other.total_time_ms
+        self.min_time_ms = min(self.min_time_ms, other.min_time_ms)
+        self.max_time_ms = max(self.max_time_ms, other.max_time_ms)
+        self.total_results += other.total_results
+        self.slow_count += other.slow_count
+        for i, bucket_count in enumerate(other.latency_buckets):
+            self.latency_buckets[i] += bucket_count
+
+    def copy(self) -> "QueryAggregate":
+        aggregate = QueryAggregate(
+            self.query_signature,
+            self.collection_name,
+            self.filters_used,
+            self.sort_fields,
+        )
+        aggregate.merge(self)
+        return aggregate
+
+
+class QueryMetricsWindow:
+    """
+    Time-bucketed query aggregates with a fixed retention.
+
+    Recording updates a single per-signature aggregate in the current bucket
+    and whole buckets are dropped once they age out, so the cost of a query
+    does not grow with history. The slowest individual queries are kept in a
+    fixed-capacity ring buffer for reporting.
+    """
+
+    def __init__(
+        self,
+        retention: timedelta,
+        bucket_seconds: int = 60,
+        slow_query_capacity: int = 500,
+    ):
+        """
+        Initialize an empty window
+
+        Args:
+            retention: How long aggregates are kept
+            bucket_seconds: Width of one aggregation bucket
+            slow_query_capacity: Number of slow queries kept individually
+        """
+        self.bucket_seconds = bucket_seconds
+        self.retention_buckets = int(retention.total_seconds()) // bucket_seconds
+        self._buckets: Deque[Tuple[int, Dict[str, QueryAggregate]]] = deque()
+        self.slow_queries: Deque[QueryMetrics] = deque(maxlen=slow_query_capacity)
+        self._lock = threading.Lock()
+
+    def _bucket_key(self, timestamp: datetime) -> int:
+        return int(timestamp.timestamp()) // self.bucket_seconds
+
+    def record(self, metric: QueryMetrics, slow: bool = False):
+        """Add one query execution to the current bucket"""
+        key = self._bucket_key(metric.timestamp)
+        with self._lock:
+            if not self._buckets or self._buckets[-1][0] < key:
+                self._buckets.append((key, {}))
+                oldest = key - self.retention_buckets
+                while self._buckets[0][0] < oldest:
+                    self._buckets.popleft()
+
+            aggregates = self._buckets[-1][1]
+            aggregate = aggregates.get(metric.query_signature)
+            if aggregate is None:
+                aggregate = aggregates[metric.query_signature] = QueryAggregate(
+                    query_signature=metric.query_signature,
+                    collection_name=metric.collection_name,
+                    filters_used=metric.filters_used,
+                    sort_fields=metric.sort_fields,
+                )
+            aggregate.add(metric.execution_time_ms, metric.result_count, slow)
+            if slow:
+                self.slow_queries.append(metric)
+
+    def aggregate(self, start: datetime, end: datetime) -> Dict[str, QueryAggregate]:
+        """
+        Merge the buckets that start within a time range
+
+        Returns:
+            Aggregates keyed by query signature
+        """
+        first, last = self._bucket_key(start), self._bucket_key(end)
+        with self._lock:
+            selected = [
+                aggregates for key, aggregates in self._buckets if first <= key <= last
+            ]
+            merged: Dict[str, QueryAggregate] = {}
+            for aggregates in selected:
+                for signature, aggregate in aggregates.items():
+                    if signature in merged:
+                        merged[signature].merge(aggregate)
+                    else:
+                        merged[signature] = aggregate.copy()
+        return merged
+
+    def slow_queries_between(
+        self, start: datetime, end: datetime
+    ) -> List[QueryMetrics]:
+        """Slow queries from the ring buffer within a time range"""
+        with self._lock:
+            return [m for m in self.slow_queries if start <= m.timestamp <= end]
+
+    def count_since(self, since: datetime) -> int:
+        """Number of queries recorded in buckets starting at or after since"""
+        first = self._bucket_key(since)
+        with self._lock:
+            return sum(
+                aggregate.count
+                for key, aggregates in self._buckets
+                if key >= first
+                for aggregate in aggregates.values()
+            )
+
+
 @dataclass
 class IndexPerformance:
     """Performance metrics for an index"""
@@ -86,17 +237,19 @@ class IndexingStrategyManager:
         self.qdrant_store = qdrant_store
         self.logger = logger
 
-        # Query pattern tracking
-        self.query_patterns: Dict[str, QueryPattern] = {}
-        self.query_metrics: List[QueryMetrics] = []
-        self.index_performance: Dict[str, IndexPerformance] = {}
-
         # Configuration
         self.analysis_window_days = 7
         self.min_query_frequency = 5  # Minimum frequency to consider for optimization
         self.slow_query_threshold_ms = 1000  # Queries slower than this are prioritized
         self.index_benefit_threshold_ms = 100  # Minimum benefit to justify an index
 
+        # Query pattern tracking
+        self.query_patterns: Dict[str, QueryPattern] = {}
+        self.query_metrics = QueryMetricsWindow(
+            retention=timedelta(days=self.analysis_window_days * 2)
+        )
+        self.index_performance: Dict[str, IndexPerformance] = {}
+
         # Collections to monitor
         self.monitored_collections = {
             "legal_matters": [
@@ -155,18 +308,16 @@ class IndexingStrategyManager:
                 f"Analyzing query patterns from {start_date} to {end_date}"
             )
 
-            # Step 1: Collect query metrics
-            relevant_metrics = [
-                metric
-                for metric in self.query_metrics
-                if start_date <= metric.timestamp <= end_date
-            ]
+            # Step 1: Collect query aggregates
+            aggregates = self.query_metrics.aggregate(start_date, end_date)
 
             # Step 2: Identify common patterns
-            pattern_analysis = self._analyze_patterns(relevant_metrics)
+            pattern_analysis = self._analyze_patterns(aggregates)
 
             # Step 3: Identify slow queries
-            slow_queries = self._identify_slow_queries(relevant_metrics)
+            slow_queries = self._identify_slow_queries(
+                self.query_metrics.slow_queries_between(start_date, end_date)
+            )
 
             # Step 4: Generate index recommendations
             recommendations = await self._generate_index_recommendations(
@@ -180,15 +331,13 @@ class IndexingStrategyManager:
                 "analysis_period": {
                     "start": start_date,
                     "end": end_date,
-                    "total_queries": len(relevant_metrics),
+                    "total_queries": sum(a.count for a in aggregates.values()),
                 },
                 "pattern_analysis": pattern_analysis,
                 "slow_queries": slow_queries,
                 "index_recommendations": recommendations,
                 "current_index_usage": index_usage,
-                "performance_summary": self._create_performance_summary(
-                    relevant_metrics
-                ),
+                "performance_summary": self._create_performance_summary(aggregates),
             }
 
             self.logger.info(
@@ -235,7 +384,9 @@ class IndexingStrategyManager:
                 collection_name=collection_name,
             )
 
-            self.query_metrics.append(metrics)
+            self.query_metrics.record(
+                metrics, slow=execution_time_ms > self.slow_query_threshold_ms
+            )
 
             # Update or create query pattern
             if query_signature in self.query_patterns:
@@ -256,14 +407,6 @@ class IndexingStrategyManager:
                 )
                 self.query_patterns[query_signature] = pattern
 
-            # Keep only recent metrics to prevent memory bloat
-            cutoff_date = datetime.now() - timedelta(days=self.analysis_window_days * 2)
-            self.query_metrics = [
-                metric
-                for metric in self.query_metrics
-                if metric.timestamp > cutoff_date
-            ]
-
         except Exception as e:
             self.logger.error(f"Failed to record query metrics: {e}")
 
@@ -280,36 +423,25 @@ class IndexingStrategyManager:
         signature = "::".join(signature_parts)
         return hashlib.md5(signature.encode()).hexdigest()[:16]
 
-    def _analyze_patterns(self, metrics: List[QueryMetrics]) -> Dict[str, Any]:
+    def _analyze_patterns(
+        self, aggregates: Dict[str, QueryAggregate]
+    ) -> Dict[str, Any]:
         """Analyze query patterns to identify optimization opportunities"""
-        pattern_stats = defaultdict(
-            lambda: {
-                "count": 0,
-                "total_time_ms": 0.0,
-                "collections": set(),
-                "common_filters": Counter(),
-                "common_sorts": Counter(),
-            }
-        )
-
-        for metric in metrics:
-            pattern = pattern_stats[metric.query_signature]
-            pattern["count"] += 1
-            pattern["total_time_ms"] += metric.execution_time_ms
-            pattern["collections"].add(metric.collection_name)
-            pattern["common_filters"].update(metric.filters_used)
-            pattern["common_sorts"].update(metric.sort_fields)
-
-        # Convert to analyzable format
+        # A signature fixes the collection, filter keys and sort fields, so
+        # every query in an aggregate used each of them
         analyzed_patterns = {}
-        for signature, stats in pattern_stats.items():
-            if stats["count"] >= self.min_query_frequency:
+        for signature, aggregate in aggregates.items():
+            if aggregate.count >= self.min_query_frequency:
                 analyzed_patterns[signature] = {
-                    "frequency": stats["count"],
-                    "avg_execution_time_ms": stats["total_time_ms"] / stats["count"],
-                    "collections": list(stats["collections"]),
-                    "most_common_filters": dict(stats["common_filters"].most_common(5)),
-                    "most_common_sorts": dict(stats["common_sorts"].most_common(3)),
+                    "frequency": aggregate.count,
+                    "avg_execution_time_ms": aggregate.total_time_ms / aggregate.count,
+                    "collections": [aggregate.collection_name],
+                    "most_common_filters": {
+                        f: aggregate.count for f in aggregate.filters_used[:5]
+                    },
+                    "most_common_sorts": {
+                        f: aggregate.count for f in aggregate.sort_fields[:3]
+                    },
                 }
 
         return analyzed_patterns
@@ -525,32 +657,41 @@ class IndexingStrategyManager:
         return {}
 
     def _create_performance_summary(
-        self, metrics: List[QueryMetrics]
+        self, aggregates: Dict[str, QueryAggregate]
     ) -> Dict[str, Any]:
-        """Create a performance summary from metrics"""
-        if not metrics:
+        """Create a performance summary from query aggregates"""
+        if not aggregates:
             return {}
 
-        execution_times = [m.execution_time_ms for m in metrics]
-        result_counts = [m.result_count for m in metrics]
+        totals = QueryAggregate("", "", [], [])
+        for aggregate in aggregates.values():
+            totals.merge(aggregate)
 
         return {
-            "total_queries": len(metrics),
-            "avg_execution_time_ms": sum(execution_times) / len(execution_times),
-            "median_execution_time_ms": sorted(execution_times)[
-                len(execution_times) // 2
-            ],
-            "slowest_query_ms": max(execution_times),
-            "fastest_query_ms": min(execution_times),
-            "avg_result_count": sum(result_counts) / len(result_counts),
-            "slow_query_percentage": len(
-                [t for t in execution_times if t > self.slow_query_threshold_ms]
-            )
-            / len(execution_times)
-            * 100,
-            "collections_queried": len(set(m.collection_name for m in metrics)),
+            "total_queries": totals.count,
+            "avg_execution_time_ms": totals.total_time_ms / totals.count,
+            "median_execution_time_ms": self._estimate_median_ms(totals),
+            "slowest_query_ms": totals.max_time_ms,
+            "fastest_query_ms": totals.min_time_ms,
+            "avg_result_count": totals.total_results / totals.count,
+            "slow_query_percentage": totals.slow_count / totals.count * 100,
+            "collections_queried": len(
+                set(a.collection_name for a in aggregates.values())
+            ),
         }
 
+    def _estimate_median_ms(self, aggregate: QueryAggregate) -> float:
+        """Median from the latency buckets, reported as the bucket's upper bound"""
+        rank = (aggregate.count + 1) // 2
+        seen = 0
+        for i, bucket_count in enumerate(aggregate.latency_buckets):
+            seen += bucket_count
+            if seen >= rank:
+                if i == len(LATENCY_BUCKETS_MS):
+                    return aggregate.max_time_ms
+                return min(LATENCY_BUCKETS_MS[i], aggregate.max_time_ms)
+        return aggregate.max_time_ms
+
     async def apply_index_recommendation(
         self, recommendation: IndexRecommendation
     ) -> bool:
@@ -651,11 +792,10 @@ class IndexingStrategyManager:
     def get_query_statistics(self) -> Dict[str, Any]:
         """Get comprehensive query statistics"""
         recent_cutoff = datetime.now() - timedelta(hours=24)
-        recent_metrics = [m for m in self.query_metrics if m.timestamp > recent_cutoff]
 
         return {
             "total_patterns": len(self.query_patterns),
-            "recent_queries_24h": len(recent_metrics),
+            "recent_queries_24h": self.query_metrics.count_since(recent_cutoff),
             "top_patterns": sorted(
                 [
                     (p.query_signature, p.frequency, p.avg_execution_time_ms)
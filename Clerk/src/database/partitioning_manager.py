@@ -14,15 +14,30 @@ Key Features:
 6. Partition pruning for improved performance
 """
 
+import asyncio
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 import hashlib
+import heapq
 import math
 
+from qdrant_client.models import (
+    DatetimeRange,
+    FieldCondition,
+    Filter,
+    MatchAny,
+    MatchValue,
+    PointIdsList,
+    PointStruct,
+    Range,
+)
+
 from ..vector_storage.qdrant_store import QdrantVectorStore
 from ..utils.logger import setup_logger
+from ..utils.thread_pool import run_blocking
 
 logger = setup_logger(__name__)
 
@@ -92,6 +107,17 @@ class PartitionPlan:
     estimated_performance_improvement: float = 0.0
 
 
+@dataclass
+class PartitionCursor:
+    """Search progress within one partition of a cross-partition query"""
+
+    collection_name: str
+    results: List[Any] = field(default_factory=list)
+    fetched: int = 0
+    frontier: float = math.inf  # Lowest score returned so far
+    exhausted: bool = False
+
+
 @dataclass
 class PartitionMaintenance:
     """Maintenance task for partitions"""
@@ -136,11 +162,20 @@ class PartitioningManager:
         self.warm_data_threshold_days = 180
         self.cold_data_threshold_days = 365
 
+        # Per-case access times; defaults to the shared tiering manager
+        self.access_tracker = None
+
         # Performance thresholds
         self.slow_query_threshold_ms = 1000
         self.partition_split_threshold = 0.8  # Split when 80% full
         self.partition_merge_threshold = 0.3  # Merge when < 30% full
 
+        # Cross-partition search and migration
+        self.min_partition_limit = 3
+        self.partition_overfetch = 1.5  # Slack on each partition's share of k
+        self.migration_batch_size = 256
+        self._migration_tasks: Dict[str, asyncio.Task] = {}
+
     async def analyze_partitioning_needs(self, collection_name: str) -> PartitionPlan:
         """
         Analyze a collection to determine optimal partitioning strategy
@@ -269,15 +304,40 @@ class PartitioningManager:
             return {}
 
     async def _analyze_access_patterns(self, collection_name: str) -> Dict[str, Any]:
-        """Analyze access patterns for the collection"""
+        """Analyze access patterns for the collection
+
+        The collection's temperature comes from when its case was last
+        searched; the hot/warm/cold split comes from a sample of its points.
+        """
         try:
-            # This would integrate with the query optimizer to get access patterns
-            # For now, provide estimated patterns
+            access_tracker = self.access_tracker
+            if access_tracker is None:
+                # Import here to avoid circular dependency
+                from .storage_tiering import get_storage_tiering_manager
+
+                access_tracker = get_storage_tiering_manager(self.qdrant_store)
+            access = access_tracker.access_summary(collection_name)
+            sample = await self._sample_point_temperatures(collection_name)
+            sample_size = sum(sample.values())
+
+            if sample_size:
+                hot = sample[DataTemperature.HOT] / sample_size
+                warm = sample[DataTemperature.WARM] / sample_size
+                cold = 1 - hot - warm
+            else:
+                # Estimated split when the collection cannot be sampled
+                hot, warm, cold = 0.2, 0.3, 0.5
 
             access_patterns = {
-                "hot_data_percentage": 0.2,  # 20% of data is frequently accessed
-                "warm_data_percentage": 0.3,  # 30% is moderately accessed
-                "cold_data_percentage": 0.5,  # 50% is rarely accessed
+                "collection_temperature": self._calculate_data_temperature(
+                    access["idle_since"]
+                ),
+                "last_accessed": access["last_accessed"],
+                "access_count": access["access_count"],
+                "sample_size": sample_size,
+                "hot_data_percentage": hot,
+                "warm_data_percentage": warm,
+                "cold_data_percentage": cold,
                 "access_temporal_bias": 0.8,  # 80% bias toward recent data
                 "query_selectivity": 0.1,  # Average query returns 10% of results
                 "common_filters": ["case_id", "document_type", "document_date"],
@@ -290,6 +350,31 @@ class PartitioningManager:
             self.logger.error(f"Access pattern analysis failed: {e}")
             return {}
 
+    async def _sample_point_temperatures(
+        self, collection_name: str, sample_size: int = 1000
+    ) -> Dict[DataTemperature, int]:
+        """Count sampled points by temperature"""
+        counts = {temperature: 0 for temperature in DataTemperature}
+        try:
+            points, _ = await self.qdrant_store.async_client.scroll(
+                collection_name=collection_name,
+                limit=sample_size,
+                with_payload=[
+                    "last_accessed",
+                    "created_at",
+                    "first_ingested_at",
+                    "document_date",
+                ],
+                with_vectors=False,
+            )
+        except Exception as e:
+            self.logger.warning(f"Could not sample {collection_name}: {e}")
+            return counts
+
+        for point in points:
+            counts[self._calculate_point_temperature(point.payload or {})] += 1
+        return counts
+
     def _determine_optimal_strategy(
         self, stats: Dict[str, Any], access_patterns: Dict[str, Any]
     ) -> PartitionStrategy:
@@ -555,7 +640,10 @@ class PartitioningManager:
                     partition_id=partition_id,
                     collection_name=plan.collection_name,
                     strategy=plan.strategy,
-                    criteria={"case_group": i},
+                    criteria={
+                        "case_group": i,
+                        "case_groups": plan.estimated_partitions,
+                    },
                     max_documents=10000,  # 10k documents per case group
                 )
                 configs.append(config)
@@ -578,6 +666,9 @@ class PartitioningManager:
 
     def _calculate_data_temperature(self, date: datetime) -> DataTemperature:
         """Calculate data temperature based on date"""
+        if date.tzinfo is not None:
+            # Payload dates are often UTC-suffixed ISO strings
+            date = date.astimezone().replace(tzinfo=None)
         age_days = (datetime.now() - date).days
 
         if age_days <= self.hot_data_threshold_days:
@@ -594,12 +685,12 @@ class PartitioningManager:
         try:
             partition_name = config.partition_name
 
-            # Create the Qdrant collection for this partition
-            self.qdrant_store.create_collection_if_not_exists(
-                collection_name=partition_name,
-                vector_size=1536,  # Standard embedding size
-                distance="Cosine",
-            )
+            # Create the Qdrant collection for this partition, with the same
+            # vector layout as unpartitioned collections
+            if not await self.qdrant_store.async_client.collection_exists(
+                partition_name
+            ):
+                await run_blocking(self.qdrant_store.create_collection, partition_name)
 
             self.logger.info(f"Created physical partition: {partition_name}")
             return True
@@ -621,21 +712,21 @@ class PartitioningManager:
                 "errors": [],
             }
 
+            client = self.qdrant_store.async_client
+
             # Get all documents from source collection
             all_points = []
-            scroll_result = self.qdrant_store.scroll_points(
-                collection_name=collection_name, limit=1000
-            )
-
-            while scroll_result and scroll_result[0]:
-                all_points.extend(scroll_result[0])
-                if scroll_result[1]:  # Has next offset
-                    scroll_result = self.qdrant_store.scroll_points(
-                        collection_name=collection_name,
-                        limit=1000,
-                        offset=scroll_result[1],
-                    )
-                else:
+            offset = None
+            while True:
+                points, offset = await client.scroll(
+                    collection_name=collection_name,
+                    limit=1000,
+                    offset=offset,
+                    with_payload=True,
+                    with_vectors=True,
+                )
+                all_points.extend(points)
+                if offset is None:
                     break
 
             # Distribute points to partitions based on strategy
@@ -650,9 +741,12 @@ class PartitioningManager:
                 )
                 if points_for_partition:
                     try:
-                        self.qdrant_store.upsert_points(
+                        await client.upsert(
                             collection_name=config.partition_name,
-                            points=points_for_partition,
+                            points=[
+                                PointStruct(id=p.id, vector=p.vector, payload=p.payload)
+                                for p in points_for_partition
+                            ],
                         )
 
                         # Update partition statistics
@@ -721,17 +815,17 @@ class PartitioningManager:
 
         elif config.strategy == PartitionStrategy.ACCESS_PATTERN:
             # Check access temperature
-            point_temp = self._calculate_point_temperature(payload)
+            point_temp = self._storage_temperature(
+                self._calculate_point_temperature(payload)
+            )
             return point_temp.value == criteria["temperature"]
 
         elif config.strategy == PartitionStrategy.CASE_BASED:
-            # Check case grouping (simplified)
+            # Check case grouping; must match _can_prune_partition
             case_id = payload.get("case_id", "")
-            case_hash = hashlib.md5(case_id.encode()).hexdigest()
-            case_group = int(case_hash[:8], 16) % len(
-                criteria
-            )  # Simple hash distribution
-            return case_group == criteria["case_group"]
+            return config.partition_id == self._determine_case_partition(
+                case_id, criteria.get("case_groups", 10)
+            )
 
         # Default: round-robin assignment for size-based or other strategies
         return True
@@ -805,109 +899,397 @@ class PartitioningManager:
         query_vector: List[float],
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 10,
+        temperatures: Optional[List[DataTemperature]] = None,
     ) -> List[Any]:
         """
         Query across all partitions of a collection
 
+        Surviving partitions are searched concurrently, each asked for a
+        share of the limit proportional to its size. After every round the
+        per-partition results are heap-merged; a partition is only asked for
+        more while its lowest returned score still beats the current k-th
+        best, so the loop stops as soon as the global top-k cannot change.
+
         Args:
             collection_name: Base collection name
             query_vector: Query vector
-            filters: Query filters
+            filters: Query filters; dict values are ranges, lists match any
             limit: Maximum results
+            temperatures: Only search partitions at these temperatures
 
         Returns:
-            Combined results from all partitions
+            Scored points from all partitions, best first
         """
         try:
+            query_filter = self._build_query_filter(filters)
             partition_ids = self.partition_mappings.get(collection_name, [])
             if not partition_ids:
                 # No partitions, query original collection
-                return self.qdrant_store.search_points(
-                    collection_name=collection_name,
-                    query_vector=query_vector,
-                    query_filter=filters,
-                    limit=limit,
+                cursor = PartitionCursor(collection_name)
+                await self._fetch_partition(
+                    cursor, query_vector, query_filter, limit, None
                 )
+                return cursor.results
 
-            # Query all partitions
-            all_results = []
-            for partition_id in partition_ids:
-                config = self.partitions[partition_id]
-
-                # Partition pruning: skip partitions that don't match filters
-                if self._can_prune_partition(config, filters):
-                    continue
-
-                try:
-                    results = self.qdrant_store.search_points(
-                        collection_name=config.partition_name,
-                        query_vector=query_vector,
-                        query_filter=filters,
-                        limit=limit * 2,  # Get more results per partition
-                    )
-                    all_results.extend(results)
+            configs = [
+                self.partitions[partition_id]
+                for partition_id in partition_ids
+                if not self._can_prune_partition(
+                    self.partitions[partition_id], filters, temperatures
+                )
+            ]
+            cursors = [PartitionCursor(config.partition_name) for config in configs]
+            total_documents = sum(config.document_count for config in configs)
+            batch_limits = [
+                self._initial_partition_limit(
+                    config, total_documents, len(configs), limit
+                )
+                for config in configs
+            ]
 
-                except Exception as e:
-                    self.logger.warning(
-                        f"Query failed on partition {partition_id}: {e}"
+            threshold = None
+            merged = []
+            while any(batch_limits):
+                await asyncio.gather(
+                    *(
+                        self._fetch_partition(
+                            cursor, query_vector, query_filter, batch, threshold
+                        )
+                        for cursor, batch in zip(cursors, batch_limits)
+                        if batch
                     )
+                )
+                merged = self._merge_partition_results(cursors, limit)
+                if len(merged) == limit:
+                    threshold = merged[-1].score
+                batch_limits = [
+                    self._next_partition_limit(cursor, threshold, limit)
+                    for cursor in cursors
+                ]
 
-            # Sort and limit results
-            all_results.sort(key=lambda x: x.score, reverse=True)
-            return all_results[:limit]
+            return merged
 
         except Exception as e:
             self.logger.error(f"Cross-partition query failed: {e}")
             return []
 
+    async def _fetch_partition(
+        self,
+        cursor: "PartitionCursor",
+        query_vector: List[float],
+        query_filter: Optional[Filter],
+        batch: int,
+        score_threshold: Optional[float],
+    ):
+        """Fetch the next batch of results from one partition"""
+        try:
+            named_vectors, _ = await self.qdrant_store._get_collection_layout(
+                cursor.collection_name
+            )
+            response = await self.qdrant_store.async_client.query_points(
+                collection_name=cursor.collection_name,
+                query=query_vector,
+                using="semantic" if named_vectors else None,
+                query_filter=query_filter,
+                limit=batch,
+                # Everything already fetched scored above the threshold, so
+                # the offset still skips exactly those points
+                offset=cursor.fetched,
+                score_threshold=score_threshold,
+                with_payload=True,
+                with_vectors=False,
+            )
+        except Exception as e:
+            self.logger.warning(
+                f"Query failed on partition {cursor.collection_name}: {e}"
+            )
+            cursor.exhausted = True
+            return
+
+        points = response.points
+        cursor.results.extend(points)
+        cursor.fetched += len(points)
+        cursor.exhausted = len(points) < batch
+        if points:
+            cursor.frontier = points[-1].score
+
+    def _initial_partition_limit(
+        self,
+        config: PartitionConfig,
+        total_documents: int,
+        partition_count: int,
+        limit: int,
+    ) -> int:
+        """First-round limit for a partition, sized to its share of the data"""
+        if total_documents:
+            share = config.document_count / total_documents
+        else:
+            share = 1 / partition_count
+        return min(
+            limit,
+            max(
+                self.min_partition_limit,
+                math.ceil(limit * share * self.partition_overfetch),
+            ),
+        )
+
+    def _next_partition_limit(
+        self, cursor: "PartitionCursor", threshold: Optional[float], limit: int
+    ) -> int:
+        """Next-round limit for a partition, or 0 once it cannot change the top-k"""
+        if cursor.exhausted or cursor.fetched >= limit:
+            return 0
+        if threshold is not None and cursor.frontier <= threshold:
+            return 0
+        # Double what the partition has returned so far
+        return min(
+            limit - cursor.fetched, max(cursor.fetched, self.min_partition_limit)
+        )
+
+    def _merge_partition_results(
+        self, cursors: List["PartitionCursor"], limit: int
+    ) -> List[Any]:
+        """K-way merge of per-partition results, which arrive best first"""
+        merged = []
+        seen = set()
+        for point in heapq.merge(
+            *(cursor.results for cursor in cursors),
+            key=lambda point: point.score,
+            reverse=True,
+        ):
+            # A point being migrated can briefly exist in two partitions
+            if point.id in seen:
+                continue
+            seen.add(point.id)
+            merged.append(point)
+            if len(merged) == limit:
+                break
+        return merged
+
+    def _build_query_filter(
+        self, filters: Optional[Dict[str, Any]]
+    ) -> Optional[Filter]:
+        """Build a Qdrant filter from field/value pairs"""
+        if not filters:
+            return None
+
+        conditions = []
+        for key, value in filters.items():
+            if isinstance(value, dict):
+                bounds = {
+                    op: value[op] for op in ("gt", "gte", "lt", "lte") if op in value
+                }
+                if any(isinstance(v, (datetime, str)) for v in bounds.values()):
+                    condition = FieldCondition(key=key, range=DatetimeRange(**bounds))
+                else:
+                    condition = FieldCondition(key=key, range=Range(**bounds))
+            elif isinstance(value, (list, tuple, set)):
+                condition = FieldCondition(key=key, match=MatchAny(any=list(value)))
+            elif isinstance(value, datetime):
+                condition = FieldCondition(
+                    key=key, range=DatetimeRange(gte=value, lte=value)
+                )
+            else:
+                condition = FieldCondition(key=key, match=MatchValue(value=value))
+            conditions.append(condition)
+        return Filter(must=conditions)
+
     def _can_prune_partition(
-        self, config: PartitionConfig, filters: Optional[Dict[str, Any]]
+        self,
+        config: PartitionConfig,
+        filters: Optional[Dict[str, Any]],
+        temperatures: Optional[List[DataTemperature]] = None,
     ) -> bool:
         """Determine if a partition can be pruned from the query"""
+        # Temperature pruning
+        if temperatures:
+            wanted = {self._storage_temperature(t) for t in temperatures}
+            if self._storage_temperature(config.temperature) not in wanted:
+                return True
+
         if not filters:
             return False
 
-        # Time-based pruning
+        # Time-based pruning; partitions cover [start_date, end_date)
         if (
             config.strategy == PartitionStrategy.TIME_BASED
             and "document_date" in filters
         ):
+            start = config.criteria["start_date"]
+            end = config.criteria["end_date"]
             filter_date = filters["document_date"]
             if isinstance(filter_date, dict):
                 # Range query
-                if (
-                    "gte" in filter_date
-                    and filter_date["gte"] > config.criteria["end_date"]
-                ):
+                lower = self._coerce_datetime(
+                    filter_date.get("gte", filter_date.get("gt"))
+                )
+                upper = self._coerce_datetime(
+                    filter_date.get("lte", filter_date.get("lt"))
+                )
+                if lower is not None and lower >= end:
                     return True
-                if (
-                    "lte" in filter_date
-                    and filter_date["lte"] < config.criteria["start_date"]
-                ):
+                if upper is not None and upper < start:
                     return True
-            elif isinstance(filter_date, datetime):
+            else:
                 # Exact date query
-                if not (
-                    config.criteria["start_date"]
-                    <= filter_date
-                    < config.criteria["end_date"]
-                ):
+                exact = self._coerce_datetime(filter_date)
+                if exact is not None and not start <= exact < end:
                     return True
 
         # Case-based pruning
         if config.strategy == PartitionStrategy.CASE_BASED and "case_id" in filters:
-            case_id = filters["case_id"]
-            expected_partition = self._determine_case_partition(case_id)
-            if expected_partition != config.partition_id:
+            case_ids = filters["case_id"]
+            if isinstance(case_ids, str):
+                case_ids = [case_ids]
+            case_groups = config.criteria.get("case_groups", 10)
+            if all(
+                self._determine_case_partition(case_id, case_groups)
+                != config.partition_id
+                for case_id in case_ids
+            ):
                 return True
 
         return False
 
-    def _determine_case_partition(self, case_id: str) -> str:
+    def _coerce_datetime(self, value: Any) -> Optional[datetime]:
+        """Read a filter bound as a datetime, if it is one"""
+        if isinstance(value, datetime):
+            return value
+        if isinstance(value, str):
+            try:
+                return datetime.fromisoformat(value)
+            except ValueError:
+                return None
+        return None
+
+    def _storage_temperature(self, temperature: DataTemperature) -> DataTemperature:
+        """Access-pattern partitions stop at cold; frozen data lives there too"""
+        if temperature == DataTemperature.FROZEN:
+            return DataTemperature.COLD
+        return temperature
+
+    def _determine_case_partition(self, case_id: str, case_groups: int = 10) -> str:
         """Determine which partition a case should be in"""
         case_hash = hashlib.md5(case_id.encode()).hexdigest()
-        # This would need to match the logic used during partitioning
-        return f"case_{int(case_hash[:8], 16) % 10:03d}"
+        return f"case_{int(case_hash[:8], 16) % case_groups:03d}"
+
+    def start_temperature_migration(self, collection_name: str) -> asyncio.Task:
+        """
+        Re-tier a collection's partitions in the background
+
+        Returns the running migration for the collection if there is one.
+        """
+        task = self._migration_tasks.get(collection_name)
+        if task is None or task.done():
+            task = asyncio.create_task(
+                self.migrate_partition_temperatures(collection_name)
+            )
+            self._migration_tasks[collection_name] = task
+        return task
+
+    async def migrate_partition_temperatures(
+        self, collection_name: str
+    ) -> Dict[str, Any]:
+        """
+        Move data between partitions as its temperature changes
+
+        Time partitions are re-labelled as they age. In access-pattern
+        partitions, points that have cooled down or been accessed again are
+        copied to the partition for their temperature and only then deleted
+        from the old one, so concurrent searches always see them.
+
+        Args:
+            collection_name: Base collection name
+
+        Returns:
+            Migration results
+        """
+        results = {"points_moved": 0, "partitions_retiered": 0, "errors": []}
+        configs = [
+            self.partitions[partition_id]
+            for partition_id in self.partition_mappings.get(collection_name, [])
+        ]
+        access_partitions = {
+            config.criteria["temperature"]: config
+            for config in configs
+            if config.strategy == PartitionStrategy.ACCESS_PATTERN
+        }
+
+        for config in configs:
+            if config.strategy == PartitionStrategy.TIME_BASED:
+                temperature = self._calculate_data_temperature(
+                    config.criteria["start_date"]
+                )
+                if temperature != config.temperature:
+                    config.temperature = temperature
+                    results["partitions_retiered"] += 1
+
+            elif config.strategy == PartitionStrategy.ACCESS_PATTERN:
+                try:
+                    results["points_moved"] += await self._move_retiered_points(
+                        config, access_partitions
+                    )
+                except Exception as e:
+                    error_msg = (
+                        f"Failed to migrate partition {config.partition_id}: {e}"
+                    )
+                    results["errors"].append(error_msg)
+                    self.logger.error(error_msg)
+
+        self.logger.info(
+            f"Temperature migration for {collection_name}: "
+            f"{results['points_moved']} points moved, "
+            f"{results['partitions_retiered']} partitions re-tiered"
+        )
+        return results
+
+    async def _move_retiered_points(
+        self, config: PartitionConfig, access_partitions: Dict[str, PartitionConfig]
+    ) -> int:
+        """Move points whose temperature no longer matches their partition"""
+        client = self.qdrant_store.async_client
+        moved = 0
+        offset = None
+
+        while True:
+            points, offset = await client.scroll(
+                collection_name=config.partition_name,
+                limit=self.migration_batch_size,
+                offset=offset,
+                with_payload=True,
+                with_vectors=True,
+            )
+
+            moves: Dict[str, List[Any]] = defaultdict(list)
+            for point in points:
+                temperature = self._storage_temperature(
+                    self._calculate_point_temperature(point.payload)
+                )
+                target = access_partitions.get(temperature.value)
+                if target is not None and target is not config:
+                    moves[temperature.value].append(point)
+
+            for temperature, batch in moves.items():
+                target = access_partitions[temperature]
+                await client.upsert(
+                    collection_name=target.partition_name,
+                    points=[
+                        PointStruct(id=p.id, vector=p.vector, payload=p.payload)
+                        for p in batch
+                    ],
+                )
+                await client.delete(
+                    collection_name=config.partition_name,
+                    points_selector=PointIdsList(points=[p.id for p in batch]),
+                )
+                target.document_count += len(batch)
+                config.document_count = max(0, config.document_count - len(batch))
+                moved += len(batch)
+
+            if offset is None:
+                break
+
+        return moved
 
     async def get_partitioning_status(self) -> Dict[str, Any]:
         """Get comprehensive partitioning status"""
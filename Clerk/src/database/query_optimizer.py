@@ -49,19 +49,16 @@ class QueryInterceptor:
 
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
+            # Execute original query; its errors propagate to the caller
+            start_time = time.perf_counter()
+            result = await func(*args, **kwargs)
+            execution_time_ms = (time.perf_counter() - start_time) * 1000
 
             try:
                 # Extract query parameters
                 collection_name = self._extract_collection_name(args, kwargs)
                 filters = self._extract_filters(args, kwargs)
                 sort_fields = self._extract_sort_fields(args, kwargs)
-
-                # Execute original query
-                result = await func(*args, **kwargs)
-
-                # Calculate metrics
-                execution_time_ms = (time.time() - start_time) * 1000
                 result_count = self._extract_result_count(result)
 
                 # Record metrics
@@ -79,12 +76,11 @@ class QueryInterceptor:
                         collection_name, filters, sort_fields, execution_time_ms
                     )
 
-                return result
-
             except Exception as e:
-                self.logger.error(f"Query interception failed: {e}")
-                # Still execute original function if monitoring fails
-                return await func(*args, **kwargs)
+                # Monitoring must never re-run or fail the query
+                self.logger.error(f"Query monitoring failed: {e}")
+
+            return result
 
         return wrapper
 
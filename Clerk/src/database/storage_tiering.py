@@ -0,0 +1,492 @@
+"""
+Storage Tiering for Case Collections
+
+Moves case collections between Qdrant storage layouts as their access
+temperature changes. Hot cases keep full-precision vectors and the HNSW
+graph in RAM. Colder tiers keep original vectors on disk, hold only scalar
+or binary quantized vectors in memory and build a sparser graph. A demoted
+case is promoted back to hot in the background the first time it is
+searched again.
+
+Key Features:
+1. Per-case access tracking fed by the vector store's search paths
+2. Tier decisions from PartitioningManager access-pattern analysis, with
+   last access times kept in collection metadata across restarts
+3. On-disk vectors, quantization and reduced HNSW m/ef for cold cases
+4. Automatic promotion on access
+5. Per-case report of RAM saved against the hot layout
+"""
+
+import asyncio
+import math
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from qdrant_client.models import (
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    Disabled,
+    HnswConfigDiff,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SparseIndexParams,
+    SparseVectorParams,
+    VectorParamsDiff,
+)
+
+from config.settings import settings
+from .partitioning_manager import DataTemperature, PartitioningManager
+from ..vector_storage.qdrant_store import QdrantVectorStore
+from ..utils.logger import setup_logger
+from ..utils.thread_pool import get_blocking_executor, run_blocking
+
+logger = setup_logger(__name__)
+
+# Collections created per case by QdrantVectorStore.create_case_collections
+CASE_COLLECTION_SUFFIXES = ("_facts", "_timeline", "_depositions")
+
+# Warmest first
+TIER_ORDER = [
+    DataTemperature.HOT,
+    DataTemperature.WARM,
+    DataTemperature.COLD,
+    DataTemperature.FROZEN,
+]
+
+
+@dataclass(frozen=True)
+class StorageTier:
+    """Qdrant storage layout for one data temperature"""
+
+    temperature: DataTemperature
+    vectors_on_disk: bool
+    quantization: Optional[str]  # "scalar", "binary" or None
+    quantized_in_ram: bool
+    hnsw_m: int
+    hnsw_ef_construct: int
+    hnsw_on_disk: bool
+
+    def ram_bytes(self, points: int, dimensions: int) -> int:
+        """Estimated resident memory for one dense vector of every point"""
+        total = 0
+        if not self.vectors_on_disk:
+            total += points * dimensions * 4  # float32
+        if self.quantization and self.quantized_in_ram:
+            if self.quantization == "binary":
+                total += points * math.ceil(dimensions / 8)
+            else:
+                total += points * dimensions  # int8
+        if not self.hnsw_on_disk:
+            # Level-0 links dominate the graph: 2 * m neighbours of 4 bytes
+            total += points * self.hnsw_m * 2 * 4
+        return total
+
+    def quantization_config(self):
+        """Qdrant quantization config for this tier"""
+        if self.quantization == "binary":
+            return BinaryQuantization(
+                binary=BinaryQuantizationConfig(always_ram=self.quantized_in_ram)
+            )
+        if self.quantization == "scalar":
+            return ScalarQuantization(
+                scalar=ScalarQuantizationConfig(
+                    type=ScalarType.INT8,
+                    quantile=0.99,
+                    always_ram=self.quantized_in_ram,
+                )
+            )
+        return Disabled.DISABLED
+
+
+def default_storage_tiers() -> Dict[DataTemperature, StorageTier]:
+    """Storage layouts by temperature; hot matches how collections are created"""
+    return {
+        DataTemperature.HOT: StorageTier(
+            temperature=DataTemperature.HOT,
+            vectors_on_disk=False,
+            quantization="scalar" if settings.vector.quantization else None,
+            quantized_in_ram=True,
+            hnsw_m=settings.vector.hnsw_m,
+            hnsw_ef_construct=settings.vector.hnsw_ef_construct,
+            hnsw_on_disk=False,
+        ),
+        DataTemperature.WARM: StorageTier(
+            temperature=DataTemperature.WARM,
+            vectors_on_disk=True,
+            quantization="scalar",
+            quantized_in_ram=True,
+            hnsw_m=16,
+            hnsw_ef_construct=100,
+            hnsw_on_disk=False,
+        ),
+        DataTemperature.COLD: StorageTier(
+            temperature=DataTemperature.COLD,
+            vectors_on_disk=True,
+            quantization="binary",
+            quantized_in_ram=True,
+            hnsw_m=8,
+            hnsw_ef_construct=64,
+            hnsw_on_disk=True,
+        ),
+        DataTemperature.FROZEN: StorageTier(
+            temperature=DataTemperature.FROZEN,
+            vectors_on_disk=True,
+            quantization="binary",
+            quantized_in_ram=False,
+            hnsw_m=8,
+            hnsw_ef_construct=64,
+            hnsw_on_disk=True,
+        ),
+    }
+
+
+def case_collection_base(collection_name: str) -> str:
+    """Case a collection belongs to, so a case's collections tier together"""
+    for suffix in CASE_COLLECTION_SUFFIXES:
+        if collection_name.endswith(suffix):
+            return collection_name[: -len(suffix)]
+    return collection_name
+
+
+class StorageTieringManager:
+    """
+    Moves case collections between storage tiers by access temperature
+    """
+
+    def __init__(
+        self,
+        qdrant_store: Optional[QdrantVectorStore] = None,
+        partitioning_manager: Optional[PartitioningManager] = None,
+    ):
+        """
+        Initialize the tiering manager
+
+        Args:
+            qdrant_store: Vector database store; may be bound later
+            partitioning_manager: Source of access-pattern analysis
+        """
+        self.qdrant_store = qdrant_store
+        self._partitioning_manager = partitioning_manager
+        self.logger = logger
+
+        self.tiers = default_storage_tiers()
+        self.min_points_to_tier = 1000  # Small cases are not worth re-indexing
+
+        # Access tracking; cases never seen count as idle since tracking began
+        self.tracking_started = time.time()
+        self.last_access: Dict[str, float] = {}
+        self.access_counts: Dict[str, int] = {}
+        self._persisted_access: Dict[str, float] = {}
+
+        # case -> applied tier; cases missing here are read from Qdrant
+        self.case_tiers: Dict[str, DataTemperature] = {}
+        self._promoting: set = set()
+        self._lock = threading.Lock()
+
+    @property
+    def partitioning_manager(self) -> PartitioningManager:
+        if self._partitioning_manager is None:
+            self._partitioning_manager = PartitioningManager(self.qdrant_store)
+            self._partitioning_manager.access_tracker = self
+        return self._partitioning_manager
+
+    def record_access(self, collection_name: str):
+        """
+        Record a search on a collection, promoting its case if it was demoted
+
+        Cheap enough for the search path; reading the tier of a case not
+        seen before and the promotion run in the blocking thread pool, and
+        the search itself is served by the current layout.
+        """
+        case = case_collection_base(collection_name)
+        with self._lock:
+            self.last_access[case] = time.time()
+            self.access_counts[case] = self.access_counts.get(case, 0) + 1
+            tier = self.case_tiers.get(case)
+            if tier == DataTemperature.HOT or case in self._promoting:
+                return
+            self._promoting.add(case)
+
+        get_blocking_executor().submit(self._promote_case, case)
+
+    def access_summary(self, collection_name: str) -> Dict[str, Any]:
+        """Last access and access count for a collection's case"""
+        case = case_collection_base(collection_name)
+        with self._lock:
+            last_access = self.last_access.get(case)
+            return {
+                "last_accessed": (
+                    datetime.fromtimestamp(last_access) if last_access else None
+                ),
+                "idle_since": datetime.fromtimestamp(
+                    last_access or self.tracking_started
+                ),
+                "access_count": self.access_counts.get(case, 0),
+            }
+
+    def _promote_case(self, case: str):
+        """Restore a demoted case's hot layout; runs off the event loop"""
+        try:
+            collections = self._case_collections().get(case, [case])
+            # Cases demoted by an earlier process are not in case_tiers yet
+            if self._current_tier(case, collections) != DataTemperature.HOT:
+                self._apply_case_tier(case, collections, DataTemperature.HOT)
+        except Exception as e:
+            self.logger.error(f"Failed to promote case {case}: {e}")
+        finally:
+            with self._lock:
+                self._promoting.discard(case)
+
+    async def run_tiering_cycle(self) -> Dict[str, Any]:
+        """
+        Move every case to the tier its access pattern calls for
+
+        Returns:
+            Changes made and the per-case memory report
+        """
+        changes = []
+        cases = await run_blocking(self._case_collections)
+
+        for case, collections in cases.items():
+            try:
+                # Reads the tier and persisted last access on first sight
+                current = await run_blocking(self._current_tier, case, collections)
+                patterns = await self.partitioning_manager._analyze_access_patterns(
+                    case
+                )
+                target = patterns.get("collection_temperature", DataTemperature.HOT)
+                if target == current:
+                    continue
+
+                if TIER_ORDER.index(target) < TIER_ORDER.index(current):
+                    # Only a search seen by this process promotes a case, so a
+                    # restart without persisted access times promotes nothing
+                    if not patterns.get("access_count"):
+                        continue
+                else:
+                    points = await run_blocking(self._case_points, collections)
+                    if points < self.min_points_to_tier:
+                        continue
+
+                with self._lock:
+                    # Accessed while we were deciding; leave it to the promotion
+                    if case in self._promoting:
+                        continue
+                await run_blocking(self._apply_case_tier, case, collections, target)
+                changes.append(
+                    {"case": case, "from": current.value, "to": target.value}
+                )
+
+            except Exception as e:
+                self.logger.error(f"Tiering failed for case {case}: {e}")
+
+        await run_blocking(self._persist_access_times, cases)
+        report = await run_blocking(self.get_memory_report)
+        if changes:
+            self.logger.info(
+                f"Storage tiering moved {len(changes)} cases, "
+                f"{report['total_saved_bytes'] / 2**20:.0f} MB RAM saved overall"
+            )
+        return {"changes": changes, "report": report}
+
+    async def run_background_tiering(self, interval_seconds: float = 3600):
+        """Run tiering cycles until cancelled"""
+        while True:
+            try:
+                await self.run_tiering_cycle()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Background tiering error: {e}")
+            await asyncio.sleep(interval_seconds)
+
+    def get_memory_report(self) -> Dict[str, Any]:
+        """
+        RAM used and saved per case against the hot layout
+
+        Blocking; async callers should go through run_blocking.
+        """
+        cases = []
+        total_saved = 0
+
+        for case, collections in sorted(self._case_collections().items()):
+            tier = self._current_tier(case, collections)
+            hot_bytes = 0
+            current_bytes = 0
+            points = 0
+            for name in collections:
+                info = self.qdrant_store.client.get_collection(name)
+                count = info.points_count or 0
+                points += count
+                for dimensions in self._vector_dimensions(info):
+                    hot_bytes += self.tiers[DataTemperature.HOT].ram_bytes(
+                        count, dimensions
+                    )
+                    current_bytes += self.tiers[tier].ram_bytes(count, dimensions)
+
+            saved = max(0, hot_bytes - current_bytes)
+            total_saved += saved
+            cases.append(
+                {
+                    "case": case,
+                    "tier": tier.value,
+                    "collections": collections,
+                    "points": points,
+                    "hot_ram_bytes": hot_bytes,
+                    "ram_bytes": current_bytes,
+                    "saved_bytes": saved,
+                }
+            )
+
+        return {"cases": cases, "total_saved_bytes": total_saved}
+
+    def _case_collections(self) -> Dict[str, List[str]]:
+        """Case collections grouped by case, shared resources excluded"""
+        # Import here to avoid circular dependency
+        from src.config.shared_resources import is_shared_resource
+
+        cases: Dict[str, List[str]] = {}
+        for collection in self.qdrant_store.client.get_collections().collections:
+            if is_shared_resource(collection.name):
+                continue
+            cases.setdefault(case_collection_base(collection.name), []).append(
+                collection.name
+            )
+        return cases
+
+    def _case_points(self, collections: List[str]) -> int:
+        return sum(
+            self.qdrant_store.client.get_collection(name).points_count or 0
+            for name in collections
+        )
+
+    def _current_tier(self, case: str, collections: List[str]) -> DataTemperature:
+        """Applied tier of a case, read from its main collection on first use"""
+        with self._lock:
+            tier = self.case_tiers.get(case)
+        if tier is not None:
+            return tier
+
+        info = self.qdrant_store.client.get_collection(
+            self._main_collection(case, collections)
+        )
+        tier = self._detect_tier(info)
+        metadata = getattr(info.config, "metadata", None) or {}
+        with self._lock:
+            tier = self.case_tiers.setdefault(case, tier)
+            last_access = metadata.get("last_accessed")
+            if last_access and case not in self.last_access:
+                self.last_access[case] = float(last_access)
+                self._persisted_access[case] = float(last_access)
+        return tier
+
+    def _main_collection(self, case: str, collections: List[str]) -> str:
+        return case if case in collections else collections[0]
+
+    def _persist_access_times(self, cases: Dict[str, List[str]]):
+        """Store last access times in collection metadata to survive restarts"""
+        with self._lock:
+            pending = {
+                case: last_access
+                for case, last_access in self.last_access.items()
+                if case in cases and self._persisted_access.get(case) != last_access
+            }
+
+        for case, last_access in pending.items():
+            try:
+                self.qdrant_store.client.update_collection(
+                    collection_name=self._main_collection(case, cases[case]),
+                    metadata={"last_accessed": last_access},
+                )
+                with self._lock:
+                    self._persisted_access[case] = last_access
+            except Exception as e:
+                # Qdrant before 1.16 has no collection metadata
+                self.logger.debug(f"Could not persist access time of {case}: {e}")
+
+    def _detect_tier(self, info) -> DataTemperature:
+        """Match a collection's config to the tier that produces it"""
+        params = info.config.params
+        vectors = params.vectors
+        if isinstance(vectors, dict):
+            vectors = next(iter(vectors.values()), None)
+        if vectors is None or not vectors.on_disk:
+            return DataTemperature.HOT
+
+        quantization = info.config.quantization_config
+        if isinstance(quantization, BinaryQuantization):
+            if quantization.binary.always_ram is False:
+                return DataTemperature.FROZEN
+            return DataTemperature.COLD
+        return DataTemperature.WARM
+
+    def _vector_dimensions(self, info) -> List[int]:
+        """Dimensions of each dense vector stored per point"""
+        vectors = info.config.params.vectors
+        if isinstance(vectors, dict):
+            return [params.size for params in vectors.values()]
+        return [vectors.size] if vectors is not None else []
+
+    def _apply_case_tier(
+        self, case: str, collections: List[str], temperature: DataTemperature
+    ):
+        """Apply a tier's storage layout to all of a case's collections"""
+        tier = self.tiers[temperature]
+        client = self.qdrant_store.client
+
+        for name in collections:
+            info = client.get_collection(name)
+            vectors = info.config.params.vectors
+            vector_names = list(vectors) if isinstance(vectors, dict) else [""]
+            sparse_vectors = info.config.params.sparse_vectors or {}
+
+            client.update_collection(
+                collection_name=name,
+                vectors_config={
+                    vector_name: VectorParamsDiff(on_disk=tier.vectors_on_disk)
+                    for vector_name in vector_names
+                },
+                sparse_vectors_config=(
+                    {
+                        vector_name: SparseVectorParams(
+                            index=SparseIndexParams(on_disk=tier.vectors_on_disk)
+                        )
+                        for vector_name in sparse_vectors
+                    }
+                    or None
+                ),
+                hnsw_config=HnswConfigDiff(
+                    m=tier.hnsw_m,
+                    ef_construct=tier.hnsw_ef_construct,
+                    on_disk=tier.hnsw_on_disk,
+                ),
+                quantization_config=tier.quantization_config(),
+            )
+
+        with self._lock:
+            self.case_tiers[case] = temperature
+        self.logger.info(
+            f"Moved case {case} to {temperature.value} storage "
+            f"({len(collections)} collections)"
+        )
+
+
+_tiering_manager: Optional[StorageTieringManager] = None
+_tiering_manager_lock = threading.Lock()
+
+
+def get_storage_tiering_manager(
+    qdrant_store: Optional[QdrantVectorStore] = None,
+) -> StorageTieringManager:
+    """Return the shared tiering manager, binding a store on first use"""
+    global _tiering_manager
+    with _tiering_manager_lock:
+        if _tiering_manager is None:
+            _tiering_manager = StorageTieringManager(qdrant_store)
+        elif _tiering_manager.qdrant_store is None and qdrant_store is not None:
+            _tiering_manager.qdrant_store = qdrant_store
+        return _tiering_manager
@@ -0,0 +1,246 @@
+"""
+Unit tests for the L1 memory cache, materialized case aggregates and views.
+"""
+
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from src.database import caching_manager
+from src.database.caching_manager import (
+    CacheEntry,
+    CaseAggregate,
+    InMemoryCache,
+    MaterializedViewManager,
+    create_search_cache_key,
+    get_materialized_view_manager,
+)
+
+
+def chunk(document_id, document_type="motion", modified_at=None):
+    return {
+        "document_id": document_id,
+        "document_type": document_type,
+        "modified_at": modified_at,
+    }
+
+
+def make_store(pages, fact_count=0):
+    """Store whose client scrolls the given payload pages"""
+    client = Mock()
+    client.collection_exists.return_value = True
+    responses = []
+    for i, page in enumerate(pages):
+        points = [
+            SimpleNamespace(id=f"p{i}-{j}", payload=payload)
+            for j, payload in enumerate(page)
+        ]
+        responses.append((points, i + 1 if i + 1 < len(pages) else None))
+    client.scroll.side_effect = lambda **kwargs: responses[kwargs["offset"] or 0]
+    client.count.return_value = SimpleNamespace(count=fact_count)
+    return SimpleNamespace(client=client, get_collection_name=lambda name: name)
+
+
+def entry(key, size_bytes=10, ttl_seconds=None):
+    now = datetime.now()
+    return CacheEntry(
+        key=key,
+        value=key,
+        created_at=now,
+        last_accessed=now,
+        ttl_seconds=ttl_seconds,
+        size_bytes=size_bytes,
+    )
+
+
+class TestInMemoryCache:
+    """Test LRU order, byte bounds, namespace quotas and expiry"""
+
+    def test_evicts_least_recently_used(self):
+        cache = InMemoryCache(max_size=2)
+        cache.put("ns:a", entry("ns:a"))
+        cache.put("ns:b", entry("ns:b"))
+        assert cache.get("ns:a") is not None
+        cache.put("ns:c", entry("ns:c"))
+
+        assert list(cache.cache) == ["ns:a", "ns:c"]
+        assert cache.evictions == 1
+
+    def test_byte_bound_and_oversized_entries(self):
+        cache = InMemoryCache(max_size=100, max_bytes=25)
+        cache.put("ns:a", entry("ns:a", 10))
+        cache.put("ns:b", entry("ns:b", 10))
+        cache.put("ns:c", entry("ns:c", 10))
+
+        assert list(cache.cache) == ["ns:b", "ns:c"]
+        assert cache.total_size_bytes == 20
+        assert not cache.put("ns:huge", entry("ns:huge", 26))
+        assert cache.total_size_bytes == 20
+
+    def test_namespace_quota_evicts_only_its_own_entries(self):
+        cache = InMemoryCache(max_size=100, namespace_quota_bytes=20)
+        cache.put("case_a:search:1", entry("case_a:search:1"))
+        for i in range(5):
+            cache.put(f"case_b:search:{i}", entry(f"case_b:search:{i}"))
+
+        assert "case_a:search:1" in cache.cache
+        assert [k for k in cache.cache if k.startswith("case_b")] == [
+            "case_b:search:3",
+            "case_b:search:4",
+        ]
+        assert cache.get_stats()["namespace_usage_bytes"] == {
+            "case_a": 10,
+            "case_b": 20,
+        }
+
+    def test_expired_entries_are_purged_from_the_heap(self, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr(caching_manager.time, "monotonic", lambda: clock[0])
+        cache = InMemoryCache()
+        cache.put("ns:short", entry("ns:short", ttl_seconds=5))
+        cache.put("ns:long", entry("ns:long", ttl_seconds=50))
+        cache.put("ns:short", entry("ns:short", ttl_seconds=5))
+
+        clock[0] += 10
+        assert cache.purge_expired() == ["ns:short"]
+        assert cache.get("ns:long") is not None
+        clock[0] += 100
+        assert cache.get("ns:long") is None
+        assert cache.total_size_bytes == 0
+
+    def test_search_keys_are_namespaced_by_case(self):
+        key = create_search_cache_key("breach", {"case_name": "smith_v_jones"})
+        assert key.to_string().startswith("legal_docs.smith_v_jones:search:")
+        assert create_search_cache_key("breach", {}).namespace == "legal_docs"
+
+
+class TestCaseAggregate:
+    """Test incremental counting"""
+
+    def test_add_and_remove_documents(self):
+        aggregate = CaseAggregate(case_name="smith_v_jones")
+        aggregate.add_chunks(
+            [
+                ("c1", chunk("d1", modified_at="2023-03-01T00:00:00Z")),
+                ("c2", chunk("d1")),
+                ("c3", chunk("d2", "deposition", modified_at="2021-06-15")),
+            ]
+        )
+        # Re-upserted chunks are not counted again
+        aggregate.add_chunks([("c1", chunk("d1"))])
+
+        stats = aggregate.to_dict()
+        assert stats["total_chunks"] == 3
+        assert stats["unique_documents"] == 2
+        assert stats["document_types"] == {"motion": 1, "deposition": 1}
+        assert stats["date_range"] == {
+            "earliest": "2021-06-15T00:00:00",
+            "latest": "2023-03-01T00:00:00",
+        }
+
+        aggregate.remove_document("d1")
+        stats = aggregate.to_dict()
+        assert stats["total_chunks"] == 1
+        assert stats["document_types"] == {"deposition": 1}
+        assert aggregate.document_chunks == {"d2": {"c3"}}
+        assert aggregate.counted_chunks == {"c3"}
+
+        aggregate.add_chunks([("c1", chunk("d1"))])
+        assert aggregate.chunk_count == 2
+
+
+class TestMaterializedViewManager:
+    """Test building, incremental updates and refresh"""
+
+    def test_case_statistics_scan_once_then_incremental(self):
+        store = make_store([[chunk("d1"), chunk("d1")], [chunk("d2")]], fact_count=4)
+        views = MaterializedViewManager(store)
+
+        assert views.get_case_statistics("smith_v_jones") is None
+        views.materialize_case_statistics("smith_v_jones")
+        assert store.client.scroll.call_count == 2
+
+        views.record_chunk_upserts("smith_v_jones", [("p2", chunk("d3", "exhibit"))])
+        views.record_document_removal("smith_v_jones", "d1")
+        views.record_fact_count_change("smith_v_jones", 1)
+        views.materialize_case_statistics("smith_v_jones")
+
+        stats = views.get_case_statistics("smith_v_jones", include_document_ids=True)
+        assert store.client.scroll.call_count == 2
+        assert stats["total_chunks"] == 2
+        assert sorted(stats["document_ids"]) == ["d2", "d3"]
+        assert stats["fact_count"] == 5
+        assert "case_statistics:smith_v_jones" in views.materialized_views
+
+    def test_aggregates_are_keyed_by_collection_name(self):
+        store = make_store([[chunk("d1")]])
+        store.get_collection_name = lambda name: name.replace(" ", "_")
+        views = MaterializedViewManager(store)
+
+        views.materialize_case_statistics("Smith v Jones")
+        views.record_chunk_upserts("Smith v Jones", [("p9", chunk("d2"))])
+
+        stats = views.get_case_statistics("Smith_v_Jones")
+        assert stats["total_chunks"] == 2
+
+    def test_updates_during_scan_are_merged(self):
+        store = make_store([[chunk("d1")], [chunk("d2")]], fact_count=4)
+        views = MaterializedViewManager(store)
+        scroll = store.client.scroll.side_effect
+
+        def scroll_with_writes(**kwargs):
+            # A writer stores a new chunk and re-stores a scanned one mid-scan
+            views.record_chunk_upserts(
+                "smith_v_jones", [("p1-0", chunk("d2")), ("new", chunk("d3"))]
+            )
+            return scroll(**kwargs)
+
+        store.client.scroll.side_effect = scroll_with_writes
+        views.materialize_case_statistics("smith_v_jones")
+
+        stats = views.get_case_statistics("smith_v_jones", include_document_ids=True)
+        assert stats["total_chunks"] == 3
+        assert sorted(stats["document_ids"]) == ["d1", "d2", "d3"]
+        assert views._pending_case_updates == {}
+
+    def test_updates_before_build_are_left_to_the_scan(self):
+        views = MaterializedViewManager(make_store([[]]))
+        views.record_chunk_upserts("other_case", [("p1", chunk("d1"))])
+        views.record_fact_count_change("other_case", 3)
+        assert views.case_aggregates == {}
+
+    @pytest.mark.asyncio
+    async def test_aggregation_view_groups_whole_collection(self):
+        store = make_store([[{"case_id": "a"}, {"case_id": "b"}], [{"case_id": "a"}]])
+        views = MaterializedViewManager(store)
+
+        data = await views.ensure_common_view("case_document_counts")
+
+        assert data["aggregations"] == {"a": 2, "b": 1}
+        assert data["result_count"] == 3
+
+    @pytest.mark.asyncio
+    async def test_stale_view_is_refreshed_in_background(self):
+        store = make_store([[{"case_id": "a"}]])
+        views = MaterializedViewManager(store)
+        await views.ensure_common_view("case_document_counts")
+        views.view_refresh_schedule["case_document_counts"] = caching_manager.datetime(
+            2000, 1, 1
+        )
+
+        data = await views.get_materialized_view("case_document_counts")
+        assert data["aggregations"] == {"a": 1}
+        await asyncio.gather(*views._refresh_tasks.values())
+        assert not views._needs_refresh("case_document_counts")
+
+    def test_shared_manager_binds_store_once(self, monkeypatch):
+        monkeypatch.setattr(caching_manager, "_view_manager", None)
+        store = make_store([[]])
+
+        views = get_materialized_view_manager()
+        assert get_materialized_view_manager(store) is views
+        assert views.qdrant_store is store
+        assert get_materialized_view_manager(make_store([[]])).qdrant_store is store
@@ -0,0 +1,124 @@
+"""
+Unit tests for bucketed query metrics and the query interceptor.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.database.indexing_strategy_manager import (
+    IndexingStrategyManager,
+    QueryMetrics,
+    QueryMetricsWindow,
+)
+from src.database.query_optimizer import QueryInterceptor
+
+
+def make_metric(timestamp, signature="sig", execution_time_ms=10.0):
+    return QueryMetrics(
+        query_signature=signature,
+        execution_time_ms=execution_time_ms,
+        result_count=2,
+        filters_used=["case_id"],
+        sort_fields=[],
+        timestamp=timestamp,
+        collection_name="document_cores",
+    )
+
+
+@pytest.fixture
+def manager():
+    return IndexingStrategyManager(MagicMock())
+
+
+class TestQueryMetricsWindow:
+    """Test per-bucket aggregation and retention"""
+
+    def test_aggregates_merge_across_buckets(self):
+        window = QueryMetricsWindow(retention=timedelta(hours=1))
+        now = datetime(2025, 1, 6, 12, 0, 30)
+        window.record(make_metric(now, execution_time_ms=4.0))
+        window.record(make_metric(now, execution_time_ms=6.0))
+        window.record(make_metric(now + timedelta(minutes=1), execution_time_ms=20))
+
+        (aggregate,) = window.aggregate(now, now + timedelta(minutes=5)).values()
+        assert aggregate.count == 3
+        assert aggregate.total_time_ms == 30.0
+        assert (aggregate.min_time_ms, aggregate.max_time_ms) == (4.0, 20)
+        # Merging copies; the stored buckets are untouched
+        assert window.count_since(now) == 3
+
+    def test_old_buckets_are_dropped(self):
+        window = QueryMetricsWindow(retention=timedelta(minutes=10))
+        start = datetime(2025, 1, 6, 12, 0)
+        for minute in range(30):
+            window.record(make_metric(start + timedelta(minutes=minute)))
+
+        assert len(window._buckets) == 11
+        assert window.count_since(start) == 11
+
+    def test_slow_queries_ring_buffer_is_bounded(self):
+        window = QueryMetricsWindow(retention=timedelta(hours=1), slow_query_capacity=3)
+        now = datetime(2025, 1, 6, 12, 0)
+        for i in range(5):
+            window.record(make_metric(now, execution_time_ms=2000 + i), slow=True)
+
+        slow = window.slow_queries_between(now, now)
+        assert [m.execution_time_ms for m in slow] == [2002, 2003, 2004]
+
+
+class TestIndexingStrategyManager:
+    """Test analysis from aggregates"""
+
+    @pytest.mark.asyncio
+    async def test_analyze_query_patterns(self, manager):
+        for _ in range(6):
+            manager.record_query_metrics("document_cores", {"case_id": 1}, [], 150, 4)
+        manager.record_query_metrics("document_cores", {"case_id": 1}, [], 1500, 4)
+
+        analysis = await manager.analyze_query_patterns()
+
+        assert analysis["analysis_period"]["total_queries"] == 7
+        (pattern,) = analysis["pattern_analysis"].values()
+        assert pattern["frequency"] == 7
+        assert pattern["most_common_filters"] == {"case_id": 7}
+        assert [q["execution_time_ms"] for q in analysis["slow_queries"]] == [1500]
+
+        summary = analysis["performance_summary"]
+        assert summary["median_execution_time_ms"] == 250
+        assert summary["slowest_query_ms"] == 1500
+        assert summary["slow_query_percentage"] == pytest.approx(100 / 7)
+        assert manager.get_query_statistics()["recent_queries_24h"] == 7
+
+
+class TestQueryInterceptor:
+    """Test monitoring never affects the wrapped query"""
+
+    @pytest.mark.asyncio
+    async def test_monitoring_failure_does_not_rerun_query(self, manager):
+        interceptor = QueryInterceptor(manager)
+        manager.record_query_metrics = MagicMock(side_effect=RuntimeError("boom"))
+        calls = []
+
+        @interceptor.intercept_query
+        async def query(collection_name):
+            calls.append(collection_name)
+            return [1, 2]
+
+        assert await query(collection_name="document_cores") == [1, 2]
+        assert calls == ["document_cores"]
+
+    @pytest.mark.asyncio
+    async def test_query_errors_propagate_once(self, manager):
+        interceptor = QueryInterceptor(manager)
+        calls = []
+
+        @interceptor.intercept_query
+        async def query(collection_name):
+            calls.append(collection_name)
+            raise ValueError("bad filter")
+
+        with pytest.raises(ValueError):
+            await query(collection_name="document_cores")
+        assert len(calls) == 1
@@ -0,0 +1,230 @@
+"""
+Unit tests for cross-partition search, partition pruning and temperature migration.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.database.partitioning_manager import (
+    DataTemperature,
+    PartitionConfig,
+    PartitioningManager,
+    PartitionStrategy,
+)
+
+
+class FakeAsyncClient:
+    """Async Qdrant client over in-memory collections of scored points"""
+
+    def __init__(self, collections):
+        self.collections = collections
+        self.queries = []
+
+    async def query_points(
+        self, collection_name, limit, offset=0, score_threshold=None, **kwargs
+    ):
+        if collection_name == "docs_broken":
+            raise RuntimeError("partition offline")
+        self.queries.append((collection_name, limit, offset, score_threshold))
+        points = sorted(
+            self.collections[collection_name], key=lambda p: p.score, reverse=True
+        )
+        if score_threshold is not None:
+            points = [p for p in points if p.score >= score_threshold]
+        return SimpleNamespace(points=points[offset : offset + limit])
+
+    async def scroll(self, collection_name, limit, offset=None, **kwargs):
+        # Like Qdrant, the offset is the id of the first point of the next page
+        points = self.collections[collection_name]
+        ids = [p.id for p in points]
+        start = ids.index(offset) if offset is not None else 0
+        page = points[start : start + limit]
+        next_offset = ids[start + limit] if start + limit < len(ids) else None
+        return page, next_offset
+
+    async def upsert(self, collection_name, points):
+        self.collections[collection_name].extend(
+            SimpleNamespace(id=p.id, score=0.0, payload=p.payload, vector=p.vector)
+            for p in points
+        )
+
+    async def delete(self, collection_name, points_selector):
+        ids = set(points_selector.points)
+        self.collections[collection_name] = [
+            p for p in self.collections[collection_name] if p.id not in ids
+        ]
+
+
+def point(point_id, score, **payload):
+    return SimpleNamespace(id=point_id, score=score, payload=payload, vector=[0.0])
+
+
+def make_manager(collections):
+    client = FakeAsyncClient(collections)
+    store = SimpleNamespace(
+        async_client=client,
+        _get_collection_layout=AsyncMock(return_value=(False, False)),
+    )
+    return PartitioningManager(store), client
+
+
+def add_partition(manager, partition_id, strategy, criteria, **kwargs):
+    config = PartitionConfig(
+        partition_id=partition_id,
+        collection_name="docs",
+        strategy=strategy,
+        criteria=criteria,
+        **kwargs,
+    )
+    manager.partitions[partition_id] = config
+    manager.partition_mappings.setdefault("docs", []).append(partition_id)
+    return config
+
+
+class TestQueryAcrossPartitions:
+    """Test concurrent fan-out, merging and early stopping"""
+
+    @pytest.mark.asyncio
+    async def test_matches_global_top_k_and_stops_early(self):
+        strong = [point(f"s{i}", 0.99 - i / 100) for i in range(20)]
+        weak = [point(f"w{i}", 0.5 - i / 100) for i in range(20)]
+        manager, client = make_manager({"docs_a": strong, "docs_b": weak})
+        for name in ("a", "b"):
+            add_partition(
+                manager, name, PartitionStrategy.SIZE_BASED, {}, document_count=20
+            )
+
+        results = await manager.query_across_partitions("docs", [0.1], limit=10)
+
+        assert [p.id for p in results] == [f"s{i}" for i in range(10)]
+        # The weak partition is never asked again once its best score is beaten
+        assert [q for q in client.queries if q[0] == "docs_b"] == [
+            ("docs_b", 8, 0, None)
+        ]
+        assert sum(q[1] for q in client.queries) < 2 * 2 * 10
+
+    @pytest.mark.asyncio
+    async def test_interleaved_partitions_and_duplicates(self):
+        evens = [point(i, 1 - i / 100) for i in range(0, 30, 2)]
+        odds = [point(i, 1 - i / 100) for i in range(1, 30, 2)]
+        odds.append(point(0, 1.0))  # Mid-migration copy of the top point
+        manager, _ = make_manager({"docs_a": evens, "docs_b": odds})
+        for name in ("a", "b", "broken"):
+            add_partition(manager, name, PartitionStrategy.SIZE_BASED, {})
+
+        results = await manager.query_across_partitions("docs", [0.1], limit=12)
+
+        assert [p.id for p in results] == list(range(12))
+
+    @pytest.mark.asyncio
+    async def test_unpartitioned_collection_is_queried_directly(self):
+        manager, client = make_manager({"plain": [point("p", 0.8)]})
+
+        results = await manager.query_across_partitions("plain", [0.1], limit=5)
+
+        assert [p.id for p in results] == ["p"]
+        assert client.queries == [("plain", 5, 0, None)]
+
+
+class TestPartitionPruning:
+    """Test pruning on time, case and temperature"""
+
+    def test_time_case_and_temperature(self):
+        manager, _ = make_manager({})
+        june = add_partition(
+            manager,
+            "time_202406",
+            PartitionStrategy.TIME_BASED,
+            {"start_date": datetime(2024, 6, 1), "end_date": datetime(2024, 7, 1)},
+        )
+        assert manager._can_prune_partition(
+            june, {"document_date": {"gte": "2024-07-01"}}
+        )
+        assert not manager._can_prune_partition(
+            june, {"document_date": {"gte": datetime(2024, 6, 15)}}
+        )
+        assert manager._can_prune_partition(
+            june, {"document_date": datetime(2024, 5, 31)}
+        )
+
+        case_partition = manager._determine_case_partition("smith_v_jones", 4)
+        case_config = add_partition(
+            manager,
+            case_partition,
+            PartitionStrategy.CASE_BASED,
+            {"case_group": int(case_partition[-3:]), "case_groups": 4},
+        )
+        assert not manager._can_prune_partition(
+            case_config, {"case_id": "smith_v_jones"}
+        )
+        assert manager._point_matches_partition_criteria(
+            {"case_id": "smith_v_jones"}, case_config
+        )
+        other = next(
+            c
+            for c in ("a", "b", "c", "d", "e", "f", "g", "h")
+            if manager._determine_case_partition(c, 4) != case_partition
+        )
+        assert manager._can_prune_partition(case_config, {"case_id": other})
+
+        cold = add_partition(
+            manager,
+            "access_cold",
+            PartitionStrategy.ACCESS_PATTERN,
+            {"temperature": "cold"},
+            temperature=DataTemperature.COLD,
+        )
+        assert manager._can_prune_partition(cold, None, [DataTemperature.HOT])
+        assert not manager._can_prune_partition(cold, None, [DataTemperature.FROZEN])
+
+
+class TestTemperatureMigration:
+    """Test moving data between hot and cold partitions"""
+
+    @pytest.mark.asyncio
+    async def test_points_move_to_their_temperature_partition(self):
+        recent = datetime.now().isoformat()
+        old = (datetime.now() - timedelta(days=400)).isoformat()
+        collections = {
+            "docs_access_hot": [
+                point("stale", 0, last_accessed=old),
+                point("fresh", 0, last_accessed=recent),
+            ],
+            "docs_access_warm": [],
+            "docs_access_cold": [point("revived", 0, last_accessed=recent)],
+        }
+        manager, client = make_manager(collections)
+        manager.migration_batch_size = 1
+        for temperature in ("hot", "warm", "cold"):
+            add_partition(
+                manager,
+                f"access_{temperature}",
+                PartitionStrategy.ACCESS_PATTERN,
+                {"temperature": temperature},
+                temperature=DataTemperature(temperature),
+                document_count=1,
+            )
+        time_partition = add_partition(
+            manager,
+            "time_202001",
+            PartitionStrategy.TIME_BASED,
+            {"start_date": datetime(2020, 1, 1), "end_date": datetime(2020, 2, 1)},
+        )
+
+        task = manager.start_temperature_migration("docs")
+        assert manager.start_temperature_migration("docs") is task
+        results = await asyncio.wait_for(task, 5)
+
+        assert results["points_moved"] == 2
+        assert results["partitions_retiered"] == 1
+        assert time_partition.temperature == DataTemperature.FROZEN
+        assert sorted(p.id for p in client.collections["docs_access_hot"]) == [
+            "fresh",
+            "revived",
+        ]
+        assert [p.id for p in client.collections["docs_access_cold"]] == ["stale"]
+        assert manager.partitions["access_hot"].document_count == 1
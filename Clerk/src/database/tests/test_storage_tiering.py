@@ -0,0 +1,184 @@
+"""
+Unit tests for hot/warm/cold storage tiering of case collections.
+"""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from qdrant_client.models import BinaryQuantization, ScalarQuantization
+
+from src.database import storage_tiering
+from src.database.partitioning_manager import DataTemperature
+from src.database.storage_tiering import (
+    StorageTieringManager,
+    case_collection_base,
+)
+
+DAY = 24 * 3600
+
+
+class FakeClient:
+    """Sync Qdrant client keeping just the config fields tiering touches"""
+
+    def __init__(self, collections):
+        self.collections = {
+            name: SimpleNamespace(
+                points_count=points,
+                config=SimpleNamespace(
+                    params=SimpleNamespace(
+                        vectors=SimpleNamespace(size=1536, on_disk=None),
+                        sparse_vectors=None,
+                    ),
+                    quantization_config=None,
+                    metadata=metadata,
+                ),
+            )
+            for name, (points, metadata) in collections.items()
+        }
+        self.updates = []
+
+    def get_collections(self):
+        return SimpleNamespace(
+            collections=[SimpleNamespace(name=name) for name in self.collections]
+        )
+
+    def get_collection(self, name):
+        return self.collections[name]
+
+    def update_collection(self, collection_name, **kwargs):
+        self.updates.append((collection_name, kwargs))
+        config = self.collections[collection_name].config
+        if "metadata" in kwargs:
+            config.metadata = kwargs["metadata"]
+        if "vectors_config" in kwargs:
+            config.params.vectors.on_disk = kwargs["vectors_config"][""].on_disk
+            quantization = kwargs["quantization_config"]
+            config.quantization_config = (
+                quantization
+                if isinstance(quantization, (BinaryQuantization, ScalarQuantization))
+                else None
+            )
+
+
+def make_manager(collections):
+    client = FakeClient(collections)
+    store = SimpleNamespace(
+        client=client,
+        async_client=SimpleNamespace(scroll=AsyncMock(return_value=([], None))),
+    )
+    return StorageTieringManager(store), client
+
+
+@pytest.fixture
+def inline_executor(monkeypatch):
+    """Run promotions on the calling thread"""
+    executor = SimpleNamespace(submit=lambda func, *args: func(*args))
+    monkeypatch.setattr(storage_tiering, "get_blocking_executor", lambda: executor)
+
+
+class TestStorageTiers:
+    """Test tier layouts and memory estimates"""
+
+    def test_colder_tiers_use_less_ram(self):
+        manager, _ = make_manager({})
+        ram = [
+            manager.tiers[t].ram_bytes(100_000, 1536)
+            for t in storage_tiering.TIER_ORDER
+        ]
+        assert ram == sorted(ram, reverse=True)
+        assert manager.tiers[DataTemperature.FROZEN].ram_bytes(100_000, 1536) == 0
+
+    def test_case_collections_tier_together(self):
+        assert case_collection_base("smith_v_jones_facts") == "smith_v_jones"
+        assert case_collection_base("smith_v_jones") == "smith_v_jones"
+
+
+class TestStorageTieringManager:
+    """Test demotion, promotion on access and the memory report"""
+
+    @pytest.mark.asyncio
+    async def test_idle_cases_are_demoted_and_reported(self):
+        idle = {"last_accessed": time.time() - 200 * DAY}
+        manager, client = make_manager(
+            {
+                "old_case": (50_000, idle),
+                "old_case_facts": (5_000, None),
+                "busy_case": (50_000, None),
+                "tiny_case": (10, idle),
+            }
+        )
+        manager.record_access("busy_case")
+
+        result = await manager.run_tiering_cycle()
+
+        assert result["changes"] == [{"case": "old_case", "from": "hot", "to": "cold"}]
+        assert sorted(name for name, _ in client.updates if name != "busy_case") == [
+            "old_case",
+            "old_case_facts",
+        ]
+        cold = client.collections["old_case"].config
+        assert cold.params.vectors.on_disk
+        assert isinstance(cold.quantization_config, BinaryQuantization)
+
+        report = {case["case"]: case for case in result["report"]["cases"]}
+        assert report["old_case"]["tier"] == "cold"
+        assert report["old_case"]["points"] == 55_000
+        assert report["old_case"]["saved_bytes"] > 0
+        assert report["busy_case"]["saved_bytes"] == 0
+        # Access times are persisted for the next process
+        assert client.collections["busy_case"].config.metadata["last_accessed"]
+
+    @pytest.mark.asyncio
+    async def test_access_promotes_a_demoted_case(self, inline_executor):
+        idle = {"last_accessed": time.time() - 400 * DAY}
+        manager, client = make_manager({"old_case": (50_000, idle)})
+        await manager.run_tiering_cycle()
+        assert manager.case_tiers["old_case"] == DataTemperature.FROZEN
+
+        manager.record_access("old_case_facts")
+
+        assert manager.case_tiers["old_case"] == DataTemperature.HOT
+        assert client.collections["old_case"].config.params.vectors.on_disk is False
+
+    def test_access_after_restart_promotes_a_demoted_case(self, inline_executor):
+        manager, client = make_manager(
+            {"old_case": (50_000, None), "new_case": (50_000, None)}
+        )
+        client.collections["old_case"].config.params.vectors.on_disk = True
+        client.collections["old_case"].config.quantization_config = manager.tiers[
+            DataTemperature.COLD
+        ].quantization_config()
+
+        manager.record_access("old_case")
+        manager.record_access("new_case")
+
+        assert manager.case_tiers == {
+            "old_case": DataTemperature.HOT,
+            "new_case": DataTemperature.HOT,
+        }
+        assert [name for name, _ in client.updates] == ["old_case"]
+
+    @pytest.mark.asyncio
+    async def test_restart_without_access_keeps_cold_cases_cold(self):
+        manager, client = make_manager({"old_case": (50_000, None)})
+        client.collections["old_case"].config.params.vectors.on_disk = True
+        client.collections["old_case"].config.quantization_config = manager.tiers[
+            DataTemperature.COLD
+        ].quantization_config()
+
+        result = await manager.run_tiering_cycle()
+
+        assert result["changes"] == []
+        assert manager.case_tiers["old_case"] == DataTemperature.COLD
+
+    @pytest.mark.asyncio
+    async def test_access_patterns_come_from_the_tracker(self):
+        manager, _ = make_manager({"case_a": (10, None)})
+        manager.record_access("case_a_timeline")
+
+        patterns = await manager.partitioning_manager._analyze_access_patterns("case_a")
+
+        assert patterns["collection_temperature"] == DataTemperature.HOT
+        assert patterns["access_count"] == 1
@@ -10,15 +10,17 @@ from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
-from src.document_processing.box_client import BoxClient, BoxDocument
+from src.document_processing.box_client import BoxDocument
 from src.document_processing.pdf_extractor import PDFExtractor
 from src.document_processing.chunker import DocumentChunker
 from src.document_processing.qdrant_deduplicator import QdrantDocumentDeduplicator
 from src.document_processing.context_generator import ContextGenerator
 from src.vector_storage.embeddings import EmbeddingGenerator
 from src.vector_storage.qdrant_store import QdrantVectorStore, SearchResult
-from src.vector_storage.sparse_encoder import SparseVectorEncoder, LegalQueryAnalyzer
+from src.vector_storage.sparse_encoder import LegalQueryAnalyzer, get_sparse_encoder
 from config.settings import settings
+from src.utils.background_loop import get_background_loop
+from src.utils.client_registry import get_client_registry
 from src.utils.cost_tracker import CostTracker
 
 # Fact extraction imports
@@ -64,7 +66,7 @@ class DocumentInjector:
         logger.info("Initializing Document Injector with Qdrant backend")
 
         # Initialize components
-        self.box_client = BoxClient()
+        self.box_client = get_client_registry().box_client()
         self.pdf_extractor = PDFExtractor()
         self.chunker = DocumentChunker()
         # Note: deduplicator will be created per-case in process_case_folder
@@ -76,7 +78,7 @@ class DocumentInjector:
         self.vector_store = QdrantVectorStore()
 
         # Initialize sparse encoder for hybrid search
-        self.sparse_encoder = SparseVectorEncoder()
+        self.sparse_encoder = get_sparse_encoder()
         self.query_analyzer = LegalQueryAnalyzer(self.sparse_encoder)
 
         # Cost tracking
@@ -90,6 +92,11 @@ class DocumentInjector:
         # Fact extraction flag
         self.enable_fact_extraction = enable_fact_extraction
 
+        # Enrichment runs on one long-lived loop with per-case components that
+        # are built once (spaCy models, collection checks) and reused
+        self.background_loop = get_background_loop()
+        self._case_components: Dict[str, Dict[str, Any]] = {}
+
         # Processing statistics
         self.stats = {
             "total_processed": 0,
@@ -232,46 +239,32 @@ class DocumentInjector:
             source_docs_indexed = 0
             source_document_id = None
 
+            doc_type = self._determine_document_type(box_doc.name, extracted.text)
+
             if self.enable_fact_extraction:
                 logger.info(f"Extracting facts from {box_doc.name}")
 
-                # Extract facts
-                fact_result = self._extract_facts_sync(
-                    box_doc.case_name,
-                    doc_hash,
-                    extracted.text,
-                    {
-                        "document_name": box_doc.name,
-                        "document_type": self._determine_document_type(
-                            box_doc.name, extracted.text
-                        ),
-                    },
-                )
-                if fact_result:
-                    facts_extracted = fact_result["facts"]
-                    logger.info(f"Extracted {facts_extracted} facts")
-
-                # Parse depositions if it's a deposition
-                doc_type = self._determine_document_type(box_doc.name, extracted.text)
-                if doc_type == "deposition":
-                    depo_result = self._parse_depositions_sync(
+                # Facts, deposition citations and the source document index
+                # are independent, so they run concurrently
+                fact_result, depo_result, source_doc_result = self.background_loop.run(
+                    self._enrich_document(
                         box_doc.case_name,
+                        doc_hash,
                         box_doc.path,
                         extracted.text,
-                        {"document_name": box_doc.name},
+                        box_doc.name,
+                        doc_type,
                     )
-                    if depo_result:
-                        depositions_parsed = depo_result["depositions"]
-                        logger.info(f"Parsed {depositions_parsed} deposition citations")
-
-                # Index source document for evidence discovery
-                logger.info(f"Attempting to index source document: {box_doc.name}")
-                source_doc_result = self._index_source_document_sync(
-                    box_doc.case_name,
-                    box_doc.path,
-                    extracted.text,
-                    {"document_name": box_doc.name},
                 )
+
+                if fact_result:
+                    facts_extracted = fact_result["facts"]
+                    logger.info(f"Extracted {facts_extracted} facts")
+
+                if depo_result:
+                    depositions_parsed = depo_result["depositions"]
+                    logger.info(f"Parsed {depositions_parsed} deposition citations")
+
                 if source_doc_result:
                     source_docs_indexed = 1  # One document indexed
                     source_document_id = source_doc_result["id"]
@@ -290,9 +283,7 @@ class DocumentInjector:
                 "document_hash": doc_hash,
                 "document_link": doc_link,  # Add Box link
                 "page_count": extracted.page_count,
-                "document_type": self._determine_document_type(
-                    box_doc.name, extracted.text
-                ),
+                "document_type": doc_type,
                 "folder_path": "/".join(box_doc.folder_path),
                 "subfolder": box_doc.subfolder_name or "root",  # Track subfolder
                 "file_size": box_doc.size,
@@ -542,65 +533,113 @@ class DocumentInjector:
 
         return results
 
-    def _extract_facts_sync(
+    async def _get_case_component(self, case_name: str, component: str) -> Any:
+        """Return a cached per-case enrichment component, creating it once
+
+        Construction loads spaCy models and checks collections, so it runs in
+        the default executor instead of blocking the loop.
+
+        Args:
+            case_name: Case the component is scoped to
+            component: "fact_extractor", "deposition_parser" or "source_indexer"
+        """
+        components = self._case_components.setdefault(case_name, {})
+        if component not in components:
+            factory = {
+                "fact_extractor": FactExtractor,
+                "deposition_parser": DepositionParser,
+                "source_indexer": SourceDocumentIndexer,
+            }[component]
+            loop = asyncio.get_running_loop()
+            instance = await loop.run_in_executor(None, factory, case_name)
+            components.setdefault(component, instance)
+        return components[component]
+
+    async def _enrich_document(
+        self,
+        case_name: str,
+        doc_id: str,
+        doc_path: str,
+        content: str,
+        document_name: str,
+        doc_type: str,
+    ):
+        """Run fact extraction, deposition parsing and source indexing concurrently
+
+        Returns:
+            Tuple of (fact result, deposition result, source document result),
+            each None if the step was skipped or failed
+        """
+        steps = [
+            self._extract_facts(
+                case_name,
+                doc_id,
+                content,
+                {"document_name": document_name, "document_type": doc_type},
+            ),
+            # Only depositions have citations to parse; sleep(0) yields None
+            (
+                self._parse_depositions(
+                    case_name, doc_path, content, {"document_name": document_name}
+                )
+                if doc_type == "deposition"
+                else asyncio.sleep(0)
+            ),
+            self._index_source_document(
+                case_name, doc_path, content, {"document_name": document_name}
+            ),
+        ]
+        return tuple(await asyncio.gather(*steps))
+
+    async def _extract_facts(
         self, case_name: str, doc_id: str, content: str, metadata: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
-        """Synchronous wrapper for async fact extraction
+        """Extract facts from a document
 
         Returns:
             Dict with extraction results or None if failed
         """
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
         try:
-            fact_extractor = FactExtractor(case_name)
-            fact_collection = loop.run_until_complete(
-                fact_extractor.extract_facts_from_document(doc_id, content, metadata)
+            fact_extractor = await self._get_case_component(case_name, "fact_extractor")
+            fact_collection = await fact_extractor.extract_facts_from_document(
+                doc_id, content, metadata
             )
             return {"facts": len(fact_collection.facts), "collection": fact_collection}
         except Exception as e:
             logger.error(f"Error extracting facts: {e}")
             return None
-        finally:
-            loop.close()
 
-    def _parse_depositions_sync(
+    async def _parse_depositions(
         self, case_name: str, doc_path: str, content: str, metadata: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
-        """Synchronous wrapper for async deposition parsing
+        """Parse deposition citations from a transcript
 
         Returns:
             Dict with parsing results or None if failed
         """
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
         try:
-            depo_parser = DepositionParser(case_name)
-            depositions = loop.run_until_complete(
-                depo_parser.parse_deposition(doc_path, content, metadata)
+            depo_parser = await self._get_case_component(case_name, "deposition_parser")
+            depositions = await depo_parser.parse_deposition(
+                doc_path, content, metadata
             )
             return {"depositions": len(depositions), "citations": depositions}
         except Exception as e:
             logger.error(f"Error parsing depositions: {e}")
             return None
-        finally:
-            loop.close()
 
-    def _index_source_document_sync(
+    async def _index_source_document(
         self, case_name: str, doc_path: str, content: str, metadata: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
-        """Synchronous wrapper for async source document indexing
+        """Index a document for evidence discovery
 
         Returns:
             Dict with document info or None if failed
         """
         logger.debug(f"Starting source document indexing for {doc_path}")
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
         try:
-            source_indexer = SourceDocumentIndexer(case_name)
-            source_doc = loop.run_until_complete(
-                source_indexer.index_source_document(doc_path, content, metadata)
+            source_indexer = await self._get_case_component(case_name, "source_indexer")
+            source_doc = await source_indexer.index_source_document(
+                doc_path, content, metadata
             )
             return {
                 "id": source_doc.id,
@@ -611,8 +650,6 @@ class DocumentInjector:
         except Exception as e:
             logger.error(f"Error indexing source document: {e}", exc_info=True)
             return None
-        finally:
-            loop.close()
 
     def _log_processing_summary(self):
         """Log processing summary statistics"""
@@ -4,22 +4,24 @@ Uses the new unified document management system for deduplication and discovery
 """
 
 import logging
-import asyncio
 import re
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
-from src.document_processing.box_client import BoxClient, BoxDocument
+from src.document_processing.box_client import BoxDocument
 from src.document_processing.pdf_extractor import PDFExtractor
 from src.document_processing.chunker import DocumentChunker
 from src.document_processing.unified_document_manager import UnifiedDocumentManager
 from src.document_processing.context_generator import ContextGenerator
 from src.vector_storage.embeddings import EmbeddingGenerator
 from src.vector_storage.qdrant_store import QdrantVectorStore
-from src.vector_storage.sparse_encoder import SparseVectorEncoder, LegalQueryAnalyzer
+from src.vector_storage.sparse_encoder import LegalQueryAnalyzer, get_sparse_encoder
 from config.settings import settings
+from src.utils.background_loop import get_background_loop
+from src.utils.client_registry import get_client_registry
 from src.utils.cost_tracker import CostTracker
+from src.utils.thread_pool import run_blocking
 
 # Fact extraction imports (still using existing system)
 from src.ai_agents.fact_extractor import FactExtractor
@@ -152,7 +154,7 @@ class UnifiedDocumentInjector:
         logger.info("Initializing Unified Document Injector")
 
         # Initialize components
-        self.box_client = BoxClient()
+        self.box_client = get_client_registry().box_client()
         self.pdf_extractor = PDFExtractor()
         self.chunker = DocumentChunker()
         self.context_generator = ContextGenerator()
@@ -165,7 +167,7 @@ class UnifiedDocumentInjector:
         self.vector_store = QdrantVectorStore()
 
         # Initialize sparse encoder for hybrid search
-        self.sparse_encoder = SparseVectorEncoder()
+        self.sparse_encoder = get_sparse_encoder()
         self.query_analyzer = LegalQueryAnalyzer(self.sparse_encoder)
 
         # Cost tracking
@@ -180,6 +182,11 @@ class UnifiedDocumentInjector:
         self.enable_fact_extraction = enable_fact_extraction
         self.force_fact_extraction = force_fact_extraction
 
+        # Async work runs on one long-lived loop with per-case components that
+        # are built once (spaCy models, collection checks) and reused
+        self.background_loop = get_background_loop()
+        self._case_components: Dict[str, Dict[str, Any]] = {}
+
         # Processing statistics
         self.stats = {
             "total_processed": 0,
@@ -286,18 +293,13 @@ class UnifiedDocumentInjector:
             }
 
             # Run async processing
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                doc_result = loop.run_until_complete(
-                    self.document_manager.process_document(
-                        file_path=box_doc.path,
-                        file_content=content,
-                        file_metadata=metadata,
-                    )
+            doc_result = self.background_loop.run(
+                self.document_manager.process_document(
+                    file_path=box_doc.path,
+                    file_content=content,
+                    file_metadata=metadata,
                 )
-            finally:
-                loop.close()
+            )
 
             # If duplicate, return early
             if doc_result.is_duplicate:
@@ -571,16 +573,42 @@ class UnifiedDocumentInjector:
                 processing_time=(datetime.utcnow() - start_time).total_seconds(),
             )
 
+    async def _get_case_component(self, case_name: str, component: str) -> Any:
+        """Return a cached per-case enrichment component, creating it once
+
+        Construction loads spaCy models and checks collections, so it runs in
+        the shared thread pool instead of blocking the loop.
+
+        Args:
+            case_name: Case the component is scoped to
+            component: "fact_extractor" or "deposition_parser"
+        """
+        components = self._case_components.setdefault(case_name, {})
+        if component not in components:
+            factory = {
+                "fact_extractor": FactExtractor,
+                "deposition_parser": DepositionParser,
+            }[component]
+            instance = await run_blocking(factory, case_name)
+            components.setdefault(component, instance)
+        return components[component]
+
     def _extract_facts_sync(
         self, case_name: str, doc_id: str, content: str, metadata: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
         """Synchronous wrapper for async fact extraction"""
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        return self.background_loop.run(
+            self._extract_facts(case_name, doc_id, content, metadata)
+        )
+
+    async def _extract_facts(
+        self, case_name: str, doc_id: str, content: str, metadata: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Extract facts with the case's cached extractor"""
         try:
-            fact_extractor = FactExtractor(case_name)
-            fact_collection = loop.run_until_complete(
-                fact_extractor.extract_facts_from_document(doc_id, content, metadata)
+            fact_extractor = await self._get_case_component(case_name, "fact_extractor")
+            fact_collection = await fact_extractor.extract_facts_from_document(
+                doc_id, content, metadata
             )
             return {
                 "facts": len(fact_collection.facts),
@@ -589,26 +617,28 @@ class UnifiedDocumentInjector:
         except Exception as e:
             logger.error(f"Error extracting facts: {e}")
             return None
-        finally:
-            loop.close()
 
     def _parse_depositions_sync(
         self, case_name: str, doc_path: str, content: str, metadata: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
         """Synchronous wrapper for async deposition parsing"""
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        return self.background_loop.run(
+            self._parse_depositions(case_name, doc_path, content, metadata)
+        )
+
+    async def _parse_depositions(
+        self, case_name: str, doc_path: str, content: str, metadata: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Parse deposition citations with the case's cached parser"""
         try:
-            depo_parser = DepositionParser(case_name)
-            depositions = loop.run_until_complete(
-                depo_parser.parse_deposition(doc_path, content, metadata)
+            depo_parser = await self._get_case_component(case_name, "deposition_parser")
+            depositions = await depo_parser.parse_deposition(
+                doc_path, content, metadata
             )
             return {"depositions": len(depositions), "citations": depositions}
         except Exception as e:
             logger.error(f"Error parsing depositions: {e}")
             return None
-        finally:
-            loop.close()
 
     def _extract_bates_number(
         self, text: str, filename: str
@@ -696,8 +726,25 @@ class UnifiedDocumentInjector:
         limit: int = 20,
     ) -> List[Dict[str, Any]]:
         """Search for documents using the unified system"""
-        if not self.document_manager or self.document_manager.case_name != case_name:
-            self.document_manager = UnifiedDocumentManager(case_name=case_name)
+        return self.background_loop.run(
+            self.search_documents_async(case_name, query, document_types, limit)
+        )
+
+    async def search_documents_async(
+        self,
+        case_name: str,
+        query: str,
+        document_types: Optional[List[str]] = None,
+        limit: int = 20,
+    ) -> List[Dict[str, Any]]:
+        """Search for documents using the unified system without blocking"""
+        # Keep a local reference: concurrent searches may switch cases
+        manager = self.document_manager
+        if not manager or manager.case_name != case_name:
+            # Manager setup checks the collection with the sync client
+            manager = self.document_manager = await run_blocking(
+                UnifiedDocumentManager, case_name=case_name
+            )
 
         from src.models.unified_document_models import (
             DocumentSearchRequest,
@@ -713,30 +760,22 @@ class UnifiedDocumentInjector:
             limit=limit,
         )
 
-        # Run async search
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            results = loop.run_until_complete(
-                self.document_manager.search_documents(search_request)
-            )
-
-            # Convert to simple dict format
-            return [
-                {
-                    "document_id": result.document.id,
-                    "title": result.document.title,
-                    "type": result.document.document_type.value,
-                    "summary": result.document.summary,
-                    "score": result.score,
-                    "file_path": result.document.file_path,
-                    "key_facts": result.document.key_facts,
-                    "relevance": [tag.value for tag in result.document.relevance_tags],
-                }
-                for result in results
-            ]
-        finally:
-            loop.close()
+        results = await manager.search_documents(search_request)
+
+        # Convert to simple dict format
+        return [
+            {
+                "document_id": result.document.id,
+                "title": result.document.title,
+                "type": result.document.document_type.value,
+                "summary": result.document.summary,
+                "score": result.score,
+                "file_path": result.document.file_path,
+                "key_facts": result.document.key_facts,
+                "relevance": [tag.value for tag in result.document.relevance_tags],
+            }
+            for result in results
+        ]
 
     def process_discovery_folder(
         self, folder_id: str, case_name: str, discovery_metadata: Dict[str, Any]
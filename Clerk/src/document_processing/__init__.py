@@ -4,15 +4,7 @@ Handles PDF extraction, chunking, deduplication, and context generation.
 All database operations now use Qdrant.
 """
 
-from .box_client import BoxClient, BoxDocument
-from .pdf_extractor import PDFExtractor, ExtractedDocument
-from .chunker import DocumentChunker, DocumentChunk
-from .qdrant_deduplicator import QdrantDocumentDeduplicator, DocumentRecord
-from .context_generator import ContextGenerator, ChunkWithContext
-from .source_document_indexer import SourceDocumentIndexer
-
-# Backward compatibility alias
-DocumentDeduplicator = QdrantDocumentDeduplicator
+from src.utils.lazy_imports import lazy_exports
 
 __all__ = [
     "BoxClient",
@@ -29,4 +21,23 @@ __all__ = [
     "SourceDocumentIndexer",
 ]
 
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BoxClient": ".box_client",
+        "BoxDocument": ".box_client",
+        "PDFExtractor": ".pdf_extractor",
+        "ExtractedDocument": ".pdf_extractor",
+        "DocumentChunker": ".chunker",
+        "DocumentChunk": ".chunker",
+        "QdrantDocumentDeduplicator": ".qdrant_deduplicator",
+        # Backward compatibility alias
+        "DocumentDeduplicator": ".qdrant_deduplicator:QdrantDocumentDeduplicator",
+        "DocumentRecord": ".qdrant_deduplicator",
+        "ContextGenerator": ".context_generator",
+        "ChunkWithContext": ".context_generator",
+        "SourceDocumentIndexer": ".source_document_indexer",
+    },
+)
+
 __version__ = "0.2.0"  # Version bump for Qdrant-only implementation
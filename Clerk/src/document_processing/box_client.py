@@ -36,9 +36,13 @@ class BoxDocument:
 class BoxClient:
     """Manages Box API connections and file operations"""
 
-    def __init__(self):
-        """Initialize Box client with JWT authentication"""
-        self.client = self._create_client()
+    def __init__(self, client: Optional[Client] = None):
+        """Initialize Box client with JWT authentication
+
+        Args:
+            client: Authenticated boxsdk client to reuse instead of creating one
+        """
+        self.client = client or self._create_client()
 
     def _create_client(self) -> Client:
         """Create authenticated Box client"""
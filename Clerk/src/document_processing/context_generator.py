@@ -13,6 +13,7 @@ import openai
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from config.settings import settings
+from src.utils.metrics import metrics
 
 # Suppress the event loop closing warnings from httpx
 warnings.filterwarnings("ignore", message=".*Event loop is closed.*")
@@ -73,18 +74,19 @@ Please give a short succinct context to situate this chunk within the overall do
             )
 
             # Call OpenAI API
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a legal document analysis assistant.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.3,
-                max_tokens=150,
-            )
+            with metrics.timer("llm_call_seconds", model=self.model):
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": "You are a legal document analysis assistant.",
+                        },
+                        {"role": "user", "content": prompt},
+                    ],
+                    temperature=0.3,
+                    max_tokens=150,
+                )
 
             context = response.choices[0].message.content.strip()
 
@@ -4,15 +4,27 @@ Extracts testimony citations and content from deposition transcripts
 """
 
 import re
+import time
+import asyncio
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 from dataclasses import dataclass
-import uuid
+from functools import partial
+from collections import OrderedDict
+from pathlib import Path
 
+from config.settings import settings
 from src.models.fact_models import DepositionCitation
+from src.document_processing.transcript_index import (
+    TranscriptIndex,
+    parse_page_line_range,
+)
 from src.vector_storage.qdrant_store import QdrantVectorStore
 from src.vector_storage.embeddings import EmbeddingGenerator
+from src.vector_storage.bulk_upsert import upsert_in_chunks, upsert_stats
+from src.vector_storage.point_ids import deterministic_point_id
+from src.utils.legal_entity_scanner import get_legal_entity_scanner
 
 logger = logging.getLogger("clerk_api")
 
@@ -35,11 +47,27 @@ class DepositionParser:
     Maintains strict case isolation.
     """
 
-    def __init__(self, case_name: str):
+    def __init__(
+        self,
+        case_name: str,
+        upsert_batch_size: int = 256,
+        index_dir: Optional[Path] = None,
+        max_cached_indexes: int = 16,
+        vector_store: Optional[QdrantVectorStore] = None,
+        embedding_generator: Optional[EmbeddingGenerator] = None,
+    ):
         """Initialize parser for specific case"""
         self.case_name = case_name
-        self.vector_store = QdrantVectorStore()
-        self.embedding_generator = EmbeddingGenerator()
+        self.upsert_batch_size = upsert_batch_size
+
+        # Page/line transcript indexes, stored per case on disk
+        self.index_dir = Path(
+            index_dir or Path(settings.data_dir) / "transcript_indexes" / case_name
+        )
+        self.max_cached_indexes = max_cached_indexes
+        self._transcript_indexes: "OrderedDict[str, TranscriptIndex]" = OrderedDict()
+        self.vector_store = vector_store or QdrantVectorStore()
+        self.embedding_generator = embedding_generator or EmbeddingGenerator()
 
         # Case-specific collection
         self.depositions_collection = f"{case_name}_depositions"
@@ -48,6 +76,7 @@ class DepositionParser:
         self._ensure_collection_exists()
 
         # Citation patterns
+        self.scanner = get_legal_entity_scanner()
         self.citation_patterns = self._compile_citation_patterns()
 
         # Page/line patterns
@@ -70,26 +99,10 @@ class DepositionParser:
             logger.info(f"Created collection: {self.depositions_collection}")
 
     def _compile_citation_patterns(self) -> Dict[str, re.Pattern]:
-        """Compile regex patterns for citation formats"""
-        return {
-            # Short form: "Smith Dep. 45:12-23"
-            "short_form": re.compile(
-                r"(\w+)\s+Dep\.\s*(?:at\s*)?(\d+):(\d+)(?:-(?:(\d+):)?(\d+))?",
-                re.IGNORECASE,
-            ),
-            # Long form: "Deposition of John Smith, taken on January 15, 2023, p. 45"
-            "long_form": re.compile(
-                r"Deposition\s+of\s+([^,]+),\s*(?:taken\s+on\s+)?([^,]+),\s*(?:at\s*)?(?:pp?\.\s*)?(\d+)(?:-(\d+))?",
-                re.IGNORECASE,
-            ),
-            # Page reference: "Page 45, Line 12"
-            "page_line": re.compile(
-                r"(?:Page|Pg\.?|P\.?)\s*(\d+),?\s*(?:Line|Ln\.?|L\.?)\s*(\d+)(?:\s*-\s*(?:Line|Ln\.?|L\.?)?\s*(\d+))?",
-                re.IGNORECASE,
-            ),
-            # Transcript format: "45:12 Q:"
-            "transcript": re.compile(r"^(\d+):(\d+)\s*([QA]):", re.MULTILINE),
-        }
+        """Return the regex patterns for citation formats"""
+        # Short form ("Smith Dep. 45:12-23"), long form, page/line and
+        # transcript patterns live in the shared entity scanner
+        return self.scanner.patterns_for("deposition")
 
     def _compile_page_line_patterns(self) -> Dict[str, re.Pattern]:
         """Compile patterns for page/line extraction"""
@@ -132,10 +145,83 @@ class DepositionParser:
         citations.extend(self._extract_transcript_testimony(document_content, metadata))
 
         # Store citations in vector database
-        await self._store_citations(citations)
+        await self._store_citations(citations, document_path)
+
+        # Index page/line offsets so cites resolve without a vector search
+        try:
+            await self.build_transcript_index(document_path, document_content)
+        except Exception as e:
+            logger.warning(f"Failed to build transcript index for {document_path}: {e}")
 
         return citations
 
+    def _transcript_index_path(self, document_path: str) -> Path:
+        index_name = deterministic_point_id(self.case_name, document_path)
+        return self.index_dir / f"{index_name}.npz"
+
+    async def build_transcript_index(
+        self, document_path: str, document_content: str
+    ) -> TranscriptIndex:
+        """Build and persist the page/line index for a transcript"""
+        loop = asyncio.get_running_loop()
+        index = await loop.run_in_executor(
+            None, TranscriptIndex.build, document_content
+        )
+        await loop.run_in_executor(
+            None, index.save, self._transcript_index_path(document_path)
+        )
+        self._cache_transcript_index(document_path, index)
+
+        logger.info(f"Indexed {len(index)} transcript lines for {document_path}")
+        return index
+
+    def get_transcript_index(self, document_path: str) -> Optional[TranscriptIndex]:
+        """Return the page/line index for a transcript, loading it from disk once"""
+        index = self._transcript_indexes.get(document_path)
+        if index is not None:
+            self._transcript_indexes.move_to_end(document_path)
+            return index
+
+        path = self._transcript_index_path(document_path)
+        if not path.exists():
+            return None
+
+        index = TranscriptIndex.load(path)
+        self._cache_transcript_index(document_path, index)
+        return index
+
+    def _cache_transcript_index(self, document_path: str, index: TranscriptIndex):
+        self._transcript_indexes[document_path] = index
+        self._transcript_indexes.move_to_end(document_path)
+        while len(self._transcript_indexes) > self.max_cached_indexes:
+            self._transcript_indexes.popitem(last=False)
+
+    def quote_testimony(
+        self, document_path: str, cite: str, context_lines: int = 0
+    ) -> Optional[str]:
+        """
+        Resolve a cite such as "Smith Dep. 45:3-47:12" to the transcript text.
+
+        Args:
+            document_path: Transcript the cite refers to
+            cite: Page:line citation
+            context_lines: Extra lines to include around a single-line cite
+
+        Returns:
+            Testimony text, or None if the transcript or range is not indexed
+        """
+        index = self.get_transcript_index(document_path)
+        if index is None:
+            return None
+
+        if context_lines:
+            parsed = parse_page_line_range(cite)
+            if parsed:
+                return index.expand(
+                    parsed[0], parsed[1], before=context_lines, after=context_lines
+                )
+        return index.lookup_citation(cite)
+
     def _extract_metadata(self, content: str) -> DepositionMetadata:
         """Extract metadata from deposition content"""
         # Look for deponent name
@@ -183,7 +269,7 @@ class DepositionParser:
         """Extract short form citations like 'Smith Dep. 45:12-23'"""
         citations = []
 
-        for match in self.citation_patterns["short_form"].finditer(content):
+        for match in self.scanner.finditer(content, "deposition.short_form"):
             deponent = match.group(1)
             page_start = int(match.group(2))
             line_start = int(match.group(3))
@@ -195,8 +281,8 @@ class DepositionParser:
             end_pos = min(len(content), match.end() + 200)
             context = content[start_pos:end_pos].strip()
 
-            # Generate unique ID using UUID
-            citation_id = str(uuid.uuid4())
+            # Stable ID so re-parsing the same transcript is idempotent
+            citation_id = self._citation_id(metadata, "short_form", match.start())
 
             citation = DepositionCitation(
                 id=citation_id,
@@ -222,7 +308,7 @@ class DepositionParser:
         """Extract page/line references"""
         citations = []
 
-        for match in self.citation_patterns["page_line"].finditer(content):
+        for match in self.scanner.finditer(content, "deposition.page_line"):
             page = int(match.group(1))
             line_start = int(match.group(2))
             line_end = int(match.group(3)) if match.group(3) else line_start
@@ -232,8 +318,8 @@ class DepositionParser:
             end_pos = min(len(content), match.end() + 300)
             context = content[start_pos:end_pos].strip()
 
-            # Generate unique ID using UUID
-            citation_id = str(uuid.uuid4())
+            # Stable ID so re-parsing the same transcript is idempotent
+            citation_id = self._citation_id(metadata, "page_line", match.start())
 
             citation = DepositionCitation(
                 id=citation_id,
@@ -286,8 +372,10 @@ class DepositionParser:
 
                 # Only create citations for questions that seem significant
                 if qa_type == "Q" and len(text) > 20:
-                    # Generate unique ID using UUID
-                    citation_id = str(uuid.uuid4())
+                    # Stable ID so re-parsing the same transcript is idempotent
+                    citation_id = self._citation_id(
+                        metadata, "transcript", f"{current_page}:{match.start()}"
+                    )
 
                     citation = DepositionCitation(
                         id=citation_id,
@@ -333,19 +421,43 @@ class DepositionParser:
 
         return topics
 
-    async def _store_citations(self, citations: List[DepositionCitation]):
-        """Store citations in case-specific vector database"""
+    def _citation_id(
+        self, metadata: DepositionMetadata, kind: str, position: Any
+    ) -> str:
+        """Derive a deterministic point ID for a citation"""
+        return deterministic_point_id(
+            self.case_name, metadata.document_path, kind, position
+        )
+
+    async def _store_citations(
+        self, citations: List[DepositionCitation], document_path: str = ""
+    ) -> Dict[str, Any]:
+        """
+        Store citations in case-specific vector database.
+
+        Citations are embedded with one batched call and upserted in chunks.
+
+        Returns:
+            Per-document throughput statistics
+        """
+        started = time.perf_counter()
+        stats = {
+            "document_path": document_path,
+            **upsert_stats("citations", 0, started, started, started),
+        }
         if not citations:
-            return
+            return stats
 
-        points = []
+        # Same ID means the same citation; keep one point per ID
+        unique = list({citation.id: citation for citation in citations}.values())
 
-        for citation in citations:
-            # Generate embedding for testimony
-            embedding, _ = await self.embedding_generator.generate_embedding_async(
-                citation.testimony_excerpt
-            )
+        embeddings, _ = await self.embedding_generator.generate_embeddings_batch_async(
+            [citation.testimony_excerpt for citation in unique]
+        )
+        embedded = time.perf_counter()
 
+        points = []
+        for citation, embedding in zip(unique, embeddings):
             # Prepare metadata
             metadata = {
                 "case_name": self.case_name,
@@ -367,26 +479,47 @@ class DepositionParser:
             points.append({"id": citation.id, "vector": embedding, "payload": metadata})
 
         # Store in case-specific collection
-        self.vector_store.client.upsert(
-            collection_name=self.depositions_collection, points=points
+        await upsert_in_chunks(
+            self.vector_store.client,
+            self.depositions_collection,
+            points,
+            self.upsert_batch_size,
+            target="depositions",
+        )
+
+        finished = time.perf_counter()
+        elapsed = finished - started
+        stats.update(
+            upsert_stats("citations", len(points), started, embedded, finished)
         )
 
         logger.info(
-            f"Stored {len(points)} deposition citations in {self.depositions_collection}"
+            f"Stored {len(points)} deposition citations in {self.depositions_collection} "
+            f"for {document_path or 'unknown document'} in {elapsed:.2f}s "
+            f"({stats['citations_per_second']} citations/s)"
         )
 
+        return stats
+
     async def search_testimony(
         self,
         query: str,
         deponent_filter: Optional[str] = None,
         topic_filter: Optional[List[str]] = None,
         limit: int = 20,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[DepositionCitation]:
-        """Search deposition testimony within this case"""
+        """Search deposition testimony within this case
+
+        A precomputed query_embedding can be passed to share one embedding
+        across several searches for the same query.
+        """
         # Generate query embedding
-        query_embedding, _ = await self.embedding_generator.generate_embedding_async(
-            query
-        )
+        if query_embedding is None:
+            (
+                query_embedding,
+                _,
+            ) = await self.embedding_generator.generate_embedding_async(query)
 
         # Build filter
         must_conditions = [{"key": "case_name", "match": {"value": self.case_name}}]
@@ -403,12 +536,17 @@ class DepositionParser:
                 should_conditions.append({"key": "topics", "match": {"text": topic}})
             must_conditions.append({"should": should_conditions})
 
-        # Search
-        results = self.vector_store.client.search(
-            collection_name=self.depositions_collection,
-            query_vector=query_embedding,
-            query_filter={"must": must_conditions},
-            limit=limit,
+        # Search, running the blocking Qdrant call off the event loop
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(
+            None,
+            partial(
+                self.vector_store.client.search,
+                collection_name=self.depositions_collection,
+                query_vector=query_embedding,
+                query_filter={"must": must_conditions},
+                limit=limit,
+            ),
         )
 
         # Convert results to citations
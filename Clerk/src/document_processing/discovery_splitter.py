@@ -17,7 +17,6 @@ from concurrent.futures import ThreadPoolExecutor
 
 import PyPDF2
 import pdfplumber
-from openai import AsyncOpenAI
 import httpx
 
 from src.models.unified_document_models import (
@@ -30,6 +29,9 @@ from src.document_processing.pdf_extractor import PDFExtractor
 from src.document_processing.chunker import DocumentChunker
 from src.document_processing.context_generator import ContextGenerator
 from src.document_processing.document_boundary_detector import DocumentBoundary
+from src.utils.client_registry import get_client_registry
+from src.utils.logger import LogSummary
+from src.utils.metrics import metrics
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -65,12 +67,9 @@ class BoundaryDetector:
         """Initialize boundary detector with specified model"""
         # Use model from settings with fallback to gpt-4.1-mini
         self.model = model or os.getenv('DISCOVERY_BOUNDARY_MODEL', settings.discovery.boundary_detection_model)
-        # Create async OpenAI client with timeout
-        self.client = AsyncOpenAI(
-            api_key=settings.openai.api_key,
-            timeout=httpx.Timeout(30.0, connect=10.0),
-            max_retries=2
-        )
+        # Shared pooled async OpenAI client; the timeout is applied per request
+        self.client = get_client_registry().async_openai_client()
+        self.request_timeout = httpx.Timeout(30.0, connect=10.0)
         self.confidence_threshold = float(os.getenv('DISCOVERY_CONFIDENCE_THRESHOLD', settings.discovery.boundary_confidence_threshold))
         # Get window settings from environment
         self.default_window_size = int(os.getenv('DISCOVERY_WINDOW_SIZE', '5'))
@@ -104,12 +103,15 @@ class BoundaryDetector:
         window_size = window_size or self.default_window_size
         window_overlap = window_overlap or self.default_window_overlap
 
-        logger.info(f"Using AI sliding window approach")
-        logger.info(f"Window size: {window_size}, Overlap: {window_overlap}")
-
         # Get total page count
         total_pages = await self._get_pdf_page_count_async(pdf_path)
-        logger.info(f"Total pages in PDF: {total_pages}")
+        summary = LogSummary(
+            logger,
+            "Boundary detection complete",
+            pages=total_pages,
+            window_size=window_size,
+            window_overlap=window_overlap,
+        )
 
         # Process windows
         all_boundaries = []
@@ -118,7 +120,8 @@ class BoundaryDetector:
         for window_start in range(0, total_pages, stride):
             window_end = min(window_start + window_size, total_pages)
 
-            logger.info(f"Processing window: pages {window_start} to {window_end}")
+            logger.debug("Processing window: pages %d to %d", window_start, window_end)
+            summary.count("windows")
             
             # Emit progress for each window
             if progress_callback:
@@ -148,7 +151,10 @@ class BoundaryDetector:
         # Reconcile overlapping detections
         reconciled_boundaries = self._reconcile_boundaries(all_boundaries)
 
-        logger.info(f"Found {len(reconciled_boundaries)} unique document boundaries")
+        summary.set(
+            window_boundaries=len(all_boundaries), boundaries=len(reconciled_boundaries)
+        )
+        summary.emit()
         return reconciled_boundaries
 
     def _get_pdf_page_count(self, pdf_path: str) -> int:
@@ -181,6 +187,7 @@ class BoundaryDetector:
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(executor, self._extract_pages, pdf_path, start_page, end_page)
 
+    @metrics.timer("boundary_window_seconds")
     async def _detect_boundaries_in_window(
         self, window_text: str, start_page: int, end_page: int
     ) -> List[DocumentBoundary]:
@@ -228,21 +235,26 @@ Text to analyze:
 """
 
         try:
-            logger.info(f"Making OpenAI API call with model {self.model}")
-            logger.info(f"Prompt length: {len(prompt)} characters")
-            
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a legal document analysis expert specializing in discovery document processing.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.1,  # Low temperature for consistency
-                response_format={"type": "json_object"},
+            logger.debug(
+                "Making OpenAI API call with model %s (prompt length: %d characters)",
+                self.model,
+                len(prompt),
             )
+            
+            with metrics.timer("llm_call_seconds", model=self.model):
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": "You are a legal document analysis expert specializing in discovery document processing.",
+                        },
+                        {"role": "user", "content": prompt},
+                    ],
+                    temperature=0.1,  # Low temperature for consistency
+                    response_format={"type": "json_object"},
+                    timeout=self.request_timeout,
+                )
 
             boundaries_data = json.loads(response.choices[0].message.content)
 
@@ -411,7 +423,7 @@ class DiscoveryDocumentProcessor:
         else:
             logger.info(f"OpenAI API key is configured (length: {len(api_key)})")
         
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.client = get_client_registry().async_openai_client()
         self.classification_model = settings.discovery.classification_model
         logger.info(f"Using classification model: {self.classification_model}")
 
@@ -495,18 +507,19 @@ Document preview:
 Provide ONLY the context summary, no additional explanation."""
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.classification_model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a legal document analyst creating concise context summaries.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.3,
-                max_tokens=150,
-            )
+            with metrics.timer("llm_call_seconds", model=self.classification_model):
+                response = self.client.chat.completions.create(
+                    model=self.classification_model,
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": "You are a legal document analyst creating concise context summaries.",
+                        },
+                        {"role": "user", "content": prompt},
+                    ],
+                    temperature=0.3,
+                    max_tokens=150,
+                )
 
             context = response.choices[0].message.content.strip()
             logger.debug(f"Generated context: {context}")
@@ -592,18 +605,19 @@ Return ONLY the category name, nothing else."""
         
         response = None
         try:
-            response = await self.client.chat.completions.create(
-                model=self.classification_model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a legal document classifier.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.1,
-                max_tokens=50,
-            )
+            with metrics.timer("llm_call_seconds", model=self.classification_model):
+                response = await self.client.chat.completions.create(
+                    model=self.classification_model,
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": "You are a legal document classifier.",
+                        },
+                        {"role": "user", "content": prompt},
+                    ],
+                    temperature=0.1,
+                    max_tokens=50,
+                )
         except Exception as e:
             logger.error(f"OpenAI API call failed: {type(e).__name__}: {str(e)}", exc_info=True)
             # Re-raise for retry decorator
@@ -4,15 +4,21 @@ Indexes and manages exhibits for legal cases with strict data separation
 """
 
 import re
+import time
+import asyncio
 import logging
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 import json
-import uuid
+from functools import partial
 
 from src.models.fact_models import ExhibitIndex
 from src.vector_storage.qdrant_store import QdrantVectorStore
 from src.vector_storage.embeddings import EmbeddingGenerator
+from src.vector_storage.bulk_upsert import upsert_in_chunks, upsert_stats
+from src.vector_storage.point_ids import deterministic_point_id
+from src.utils.legal_entity_scanner import get_legal_entity_scanner
+from src.utils.metrics import metrics
 
 logger = logging.getLogger("clerk_api")
 
@@ -34,11 +40,18 @@ class ExhibitIndexer:
     Tracks exhibit metadata, references, and relationships.
     """
 
-    def __init__(self, case_name: str):
+    def __init__(
+        self,
+        case_name: str,
+        upsert_batch_size: int = 256,
+        vector_store: Optional[QdrantVectorStore] = None,
+        embedding_generator: Optional[EmbeddingGenerator] = None,
+    ):
         """Initialize exhibit indexer for specific case"""
         self.case_name = case_name
-        self.vector_store = QdrantVectorStore()
-        self.embedding_generator = EmbeddingGenerator()
+        self.upsert_batch_size = upsert_batch_size
+        self.vector_store = vector_store or QdrantVectorStore()
+        self.embedding_generator = embedding_generator or EmbeddingGenerator()
 
         # Case-specific collection
         self.exhibits_collection = f"{case_name}_exhibits"
@@ -47,6 +60,7 @@ class ExhibitIndexer:
         self._ensure_collection_exists()
 
         # Exhibit patterns
+        self.scanner = get_legal_entity_scanner()
         self.exhibit_patterns = self._compile_exhibit_patterns()
 
         # Document type classifiers
@@ -69,34 +83,10 @@ class ExhibitIndexer:
             logger.info(f"Created collection: {self.exhibits_collection}")
 
     def _compile_exhibit_patterns(self) -> Dict[str, re.Pattern]:
-        """Compile regex patterns for exhibit identification"""
-        return {
-            # Standard exhibit references: "Exhibit A", "Ex. 12", "Plaintiff's Exhibit 3"
-            "standard": re.compile(
-                r"(?:Plaintiff[\'s]*|Defendant[\'s]*|Defense|State[\'s]*|Government[\'s]*)?\s*"
-                r"(?:Exhibit|Ex\.?|Exh\.?)\s*"
-                r"([A-Z]+|\d+(?:\.\d+)?|[A-Z]-\d+)",
-                re.IGNORECASE,
-            ),
-            # Parenthetical references: "(Ex. A)", "(See Exhibit 12)"
-            "parenthetical": re.compile(
-                r"\((?:See\s+)?(?:Exhibit|Ex\.?)\s*([A-Z]+|\d+)\)", re.IGNORECASE
-            ),
-            # Composite exhibits: "Exhibit 1-A", "Ex. 2(b)"
-            "composite": re.compile(
-                r"(?:Exhibit|Ex\.?)\s*(\d+)[-\s]*\(?([A-Za-z]+)\)?", re.IGNORECASE
-            ),
-            # Bates stamped: "SMITH000123"
-            "bates": re.compile(r"\b([A-Z]{3,})\s*(\d{6,})\b"),
-            # Deposition exhibits: "Smith Dep. Ex. 1"
-            "deposition": re.compile(
-                r"(\w+)\s+Dep\.\s*(?:Exhibit|Ex\.?)\s*(\d+)", re.IGNORECASE
-            ),
-            # Trial exhibits: "Trial Ex. 1", "T-1"
-            "trial": re.compile(
-                r"(?:Trial\s+)?(?:Exhibit|Ex\.?|T)[-\s]*(\d+)", re.IGNORECASE
-            ),
-        }
+        """Return the regex patterns for exhibit identification"""
+        # Standard, parenthetical, composite, Bates, deposition and trial
+        # exhibit patterns live in the shared entity scanner
+        return self.scanner.patterns_for("exhibit")
 
     def _define_document_types(self) -> Dict[str, List[str]]:
         """Define keywords for classifying document types"""
@@ -134,8 +124,9 @@ class ExhibitIndexer:
         exhibit_refs = []
 
         # Extract exhibit references
-        for pattern_name, pattern in self.exhibit_patterns.items():
-            for match in pattern.finditer(document_content):
+        for pattern_name in self.exhibit_patterns:
+            kind = f"exhibit.{pattern_name}"
+            for match in self.scanner.finditer(document_content, kind):
                 ref = self._process_exhibit_match(
                     match, pattern_name, document_content, document_path
                 )
@@ -153,7 +144,7 @@ class ExhibitIndexer:
             exhibits.append(exhibit)
 
         # Store exhibits in vector database
-        await self._store_exhibits(exhibits)
+        await self._store_exhibits(exhibits, document_path)
 
         return exhibits
 
@@ -231,8 +222,8 @@ class ExhibitIndexer:
         metadata: Optional[Dict[str, Any]],
     ) -> ExhibitIndex:
         """Create exhibit index entry from references"""
-        # Generate unique ID using UUID
-        index_id = str(uuid.uuid4())
+        # Stable ID so re-indexing the same document is idempotent
+        index_id = deterministic_point_id(self.case_name, document_path, exhibit_id)
 
         # Combine all contexts for description
         all_contexts = " ".join([ref.context for ref in references])
@@ -296,20 +287,36 @@ class ExhibitIndexer:
         doc_type = self._classify_document_type(context)
         return f"{doc_type.replace('_', ' ').title()} - {exhibit_id}"
 
-    async def _store_exhibits(self, exhibits: List[ExhibitIndex]):
-        """Store exhibits in case-specific vector database"""
+    async def _store_exhibits(
+        self, exhibits: List[ExhibitIndex], document_path: str = ""
+    ) -> Dict[str, Any]:
+        """
+        Store exhibits in case-specific vector database.
+
+        Exhibits are embedded with one batched call and upserted in chunks.
+
+        Returns:
+            Per-document throughput statistics
+        """
+        started = time.perf_counter()
+        stats = {
+            "document_path": document_path,
+            **upsert_stats("exhibits", 0, started, started, started),
+        }
         if not exhibits:
-            return
+            return stats
 
-        points = []
+        # Same ID means the same exhibit; keep one point per ID
+        unique = list({exhibit.id: exhibit for exhibit in exhibits}.values())
 
-        for exhibit in exhibits:
-            # Generate embedding for exhibit description and context
-            text_for_embedding = f"{exhibit.exhibit_number}: {exhibit.description}"
-            embedding, _ = await self.embedding_generator.generate_embedding_async(
-                text_for_embedding
-            )
+        # Embed exhibit number and description together
+        embeddings, _ = await self.embedding_generator.generate_embeddings_batch_async(
+            [f"{exhibit.exhibit_number}: {exhibit.description}" for exhibit in unique]
+        )
+        embedded = time.perf_counter()
 
+        points = []
+        for exhibit, embedding in zip(unique, embeddings):
             # Prepare metadata
             metadata = {
                 "case_name": self.case_name,
@@ -331,11 +338,25 @@ class ExhibitIndexer:
             points.append({"id": exhibit.id, "vector": embedding, "payload": metadata})
 
         # Store in case-specific collection
-        self.vector_store.client.upsert(
-            collection_name=self.exhibits_collection, points=points
+        await upsert_in_chunks(
+            self.vector_store.client,
+            self.exhibits_collection,
+            points,
+            self.upsert_batch_size,
+            target="exhibits",
+        )
+
+        finished = time.perf_counter()
+        elapsed = finished - started
+        stats.update(upsert_stats("exhibits", len(points), started, embedded, finished))
+
+        logger.info(
+            f"Stored {len(points)} exhibits in {self.exhibits_collection} "
+            f"for {document_path or 'unknown document'} in {elapsed:.2f}s "
+            f"({stats['exhibits_per_second']} exhibits/s)"
         )
 
-        logger.info(f"Stored {len(points)} exhibits in {self.exhibits_collection}")
+        return stats
 
     async def search_exhibits(
         self,
@@ -343,10 +364,19 @@ class ExhibitIndexer:
         document_type_filter: Optional[str] = None,
         authenticity_filter: Optional[str] = None,
         limit: int = 20,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[ExhibitIndex]:
-        """Search exhibits within this case"""
+        """Search exhibits within this case
+
+        A precomputed query_embedding can be passed to share one embedding
+        across several searches for the same query.
+        """
         # Generate query embedding
-        query_embedding = await self.embedding_generator.generate_embedding(query)
+        if query_embedding is None:
+            (
+                query_embedding,
+                _,
+            ) = await self.embedding_generator.generate_embedding_async(query)
 
         # Build filter
         must_conditions = [{"key": "case_name", "match": {"value": self.case_name}}]
@@ -361,12 +391,17 @@ class ExhibitIndexer:
                 {"key": "authenticity_status", "match": {"value": authenticity_filter}}
             )
 
-        # Search
-        results = self.vector_store.client.search(
-            collection_name=self.exhibits_collection,
-            query_vector=query_embedding,
-            query_filter={"must": must_conditions},
-            limit=limit,
+        # Search, running the blocking Qdrant call off the event loop
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(
+            None,
+            partial(
+                self.vector_store.client.search,
+                collection_name=self.exhibits_collection,
+                query_vector=query_embedding,
+                query_filter={"must": must_conditions},
+                limit=limit,
+            ),
         )
 
         # Convert results to exhibit objects
@@ -408,9 +443,10 @@ class ExhibitIndexer:
             exhibit_point.payload["related_facts"] = json.dumps(related_facts)
 
             # Update in database
-            self.vector_store.client.upsert(
-                collection_name=self.exhibits_collection, points=[exhibit_point]
-            )
+            with metrics.timer("qdrant_upsert_seconds", target="exhibits"):
+                self.vector_store.client.upsert(
+                    collection_name=self.exhibits_collection, points=[exhibit_point]
+                )
 
     async def get_exhibit_summary(self) -> Dict[str, Any]:
         """Get summary statistics for exhibits in this case"""
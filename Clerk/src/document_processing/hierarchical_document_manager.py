@@ -36,6 +36,7 @@ from ..models.normalized_document_models import (
 )
 from ..models.unified_document_models import DocumentType
 from ..vector_storage.qdrant_store import QdrantVectorStore
+from ..database.caching_manager import get_materialized_view_manager
 from ..utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -678,15 +679,20 @@ class HierarchicalDocumentManager:
     async def get_case_statistics(self, case_id: str) -> Dict[str, Any]:
         """Get comprehensive statistics for a case"""
         try:
-            # Count documents in case
-            doc_results = self.qdrant_store.search_points(
-                collection_name=self.collections["document_case_junctions"],
-                query_vector=[0.0],
-                limit=10000,
-                query_filter={"case_id": case_id},
-            )
-
-            total_documents = len(doc_results)
+            # Count documents in case from the materialized per-case counts
+            document_counts = await get_materialized_view_manager(
+                self.qdrant_store
+            ).ensure_common_view("case_document_counts")
+            if document_counts is not None:
+                total_documents = document_counts["aggregations"].get(case_id, 0)
+            else:
+                doc_results = self.qdrant_store.search_points(
+                    collection_name=self.collections["document_case_junctions"],
+                    query_vector=[0.0],
+                    limit=10000,
+                    query_filter={"case_id": case_id},
+                )
+                total_documents = len(doc_results)
 
             # Get document types breakdown (would need join with metadata)
             document_types = defaultdict(int)
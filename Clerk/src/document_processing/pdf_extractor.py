@@ -8,9 +8,7 @@ import logging
 from typing import Dict, Any
 from dataclasses import dataclass
 
-import PyPDF2
-import pdfplumber
-from pdfminer.high_level import extract_text as pdfminer_extract
+from src.utils.metrics import metrics
 
 logger = logging.getLogger(__name__)
 
@@ -53,7 +51,8 @@ class PDFExtractor:
         # Try each extraction method until one succeeds
         for method_name, method_func in self.extraction_methods:
             try:
-                result = method_func(pdf_content)
+                with metrics.timer("pdf_extraction_seconds", extractor=method_name):
+                    result = method_func(pdf_content)
                 if result and result.text.strip():
                     logger.info(f"Successfully extracted text using {method_name}")
                     result.extraction_method = method_name
@@ -73,6 +72,9 @@ class PDFExtractor:
 
     def _extract_with_pdfplumber(self, pdf_content: bytes) -> ExtractedDocument:
         """Extract text using pdfplumber (best for tables and complex layouts)"""
+        # PDF libraries load on first extraction, not at API startup
+        import pdfplumber
+
         text_parts = []
         page_count = 0
 
@@ -98,6 +100,8 @@ class PDFExtractor:
 
     def _extract_with_pypdf2(self, pdf_content: bytes) -> ExtractedDocument:
         """Extract text using PyPDF2 (fast but less accurate)"""
+        import PyPDF2
+
         text_parts = []
         page_count = 0
 
@@ -123,6 +127,8 @@ class PDFExtractor:
 
     def _extract_with_pdfminer(self, pdf_content: bytes) -> ExtractedDocument:
         """Extract text using pdfminer (good for complex PDFs)"""
+        from pdfminer.high_level import extract_text as pdfminer_extract
+
         try:
             text = pdfminer_extract(io.BytesIO(pdf_content))
 
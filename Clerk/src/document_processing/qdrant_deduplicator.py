@@ -21,6 +21,7 @@ from qdrant_client.models import (
 )
 
 from config.settings import settings
+from src.utils.metrics import metrics
 
 logger = logging.getLogger(__name__)
 
@@ -239,9 +240,10 @@ class QdrantDocumentDeduplicator:
             )
 
             # Store in Qdrant
-            self.client.upsert(
-                collection_name=self.collection_name, points=[point], wait=True
-            )
+            with metrics.timer("qdrant_upsert_seconds", target="documents"):
+                self.client.upsert(
+                    collection_name=self.collection_name, points=[point], wait=True
+                )
 
             logger.info(
                 f"Registered new document: {file_name} (hash: {doc_hash[:8]}...)"
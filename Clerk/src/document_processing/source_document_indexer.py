@@ -18,8 +18,9 @@ from src.models.source_document_models import (
 )
 from src.vector_storage.qdrant_store import QdrantVectorStore
 from src.vector_storage.embeddings import EmbeddingGenerator
+from src.utils.client_registry import get_client_registry
+from src.utils.metrics import metrics
 from config.settings import settings
-import openai
 
 logger = logging.getLogger("clerk_api")
 
@@ -30,13 +31,19 @@ class SourceDocumentIndexer:
     Replaces exhibit tracking with source document discovery.
     """
 
-    def __init__(self, case_name: str):
+    def __init__(
+        self,
+        case_name: str,
+        vector_store: Optional[QdrantVectorStore] = None,
+        embedding_generator: Optional[EmbeddingGenerator] = None,
+    ):
         """Initialize source document indexer for a specific case"""
         self.case_name = case_name
-        self.vector_store = QdrantVectorStore()
-        self.embedding_generator = EmbeddingGenerator()
-        self.openai_client = openai.OpenAI(api_key=settings.openai.api_key)
-        self.async_openai_client = openai.AsyncOpenAI(api_key=settings.openai.api_key)
+        self.vector_store = vector_store or QdrantVectorStore()
+        self.embedding_generator = embedding_generator or EmbeddingGenerator()
+        registry = get_client_registry()
+        self.openai_client = registry.openai_client()
+        self.async_openai_client = registry.async_openai_client()
 
         # Case-specific collection for source documents
         self.source_docs_collection = f"{case_name}_source_documents"
@@ -144,19 +151,20 @@ Provide:
 Format as JSON."""
 
         try:
-            response = await self.async_openai_client.chat.completions.create(
-                model=settings.ai.default_model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a legal document classifier.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.3,
-                max_tokens=500,
-                response_format={"type": "json_object"},
-            )
+            with metrics.timer("llm_call_seconds", model=settings.ai.default_model):
+                response = await self.async_openai_client.chat.completions.create(
+                    model=settings.ai.default_model,
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": "You are a legal document classifier.",
+                        },
+                        {"role": "user", "content": prompt},
+                    ],
+                    temperature=0.3,
+                    max_tokens=500,
+                    response_format={"type": "json_object"},
+                )
 
             classification = json.loads(response.choices[0].message.content)
 
@@ -479,9 +487,10 @@ Format as JSON."""
         # Store in vector database
         point = {"id": doc.id, "vector": embedding, "payload": metadata}
 
-        self.vector_store.client.upsert(
-            collection_name=self.source_docs_collection, points=[point]
-        )
+        with metrics.timer("qdrant_upsert_seconds", target="source_documents"):
+            self.vector_store.client.upsert(
+                collection_name=self.source_docs_collection, points=[point]
+            )
 
         logger.info(f"Stored source document: {doc.title}")
 
@@ -0,0 +1,128 @@
+"""
+Test batched embedding and chunked upserts for deposition and exhibit indexing
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.document_processing.deposition_parser import DepositionParser
+from src.document_processing.exhibit_indexer import ExhibitIndexer
+
+TRANSCRIPT = """
+JOHN SMITH, sworn
+Page 12
+12:3 Q. Did you inspect the trailer brakes before leaving the yard?
+12:5 A. No.
+12:7 Q. What speed were you traveling when you entered the intersection?
+12:9 A. About forty.
+Page 13
+13:1 Q. Were you looking at your phone at the time of the collision?
+13:4 A. I don't remember.
+See Smith Dep. 12:3-9 and Page 13, Line 1.
+"""
+
+EXHIBITS = """
+Plaintiff's Exhibit 4, a photograph of the intersection, shows the skid marks.
+The maintenance log, marked as Exhibit 7, was produced in discovery.
+Defendant's Exhibit 4 was also discussed at length during the deposition.
+"""
+
+
+def batch_embeddings(texts):
+    return [[0.1] * 4 for _ in texts], 10
+
+
+@pytest.fixture
+def parser(tmp_path):
+    with patch("src.document_processing.deposition_parser.QdrantVectorStore"), patch(
+        "src.document_processing.deposition_parser.EmbeddingGenerator"
+    ):
+        parser = DepositionParser(
+            "Smith_v_Jones", upsert_batch_size=2, index_dir=tmp_path
+        )
+    parser.embedding_generator.generate_embeddings_batch_async = AsyncMock(
+        side_effect=batch_embeddings
+    )
+    return parser
+
+
+@pytest.fixture
+def indexer():
+    with patch("src.document_processing.exhibit_indexer.QdrantVectorStore"), patch(
+        "src.document_processing.exhibit_indexer.EmbeddingGenerator"
+    ):
+        indexer = ExhibitIndexer("Smith_v_Jones")
+    indexer.embedding_generator.generate_embeddings_batch_async = AsyncMock(
+        side_effect=batch_embeddings
+    )
+    return indexer
+
+
+def upserted_ids(client):
+    return [
+        point["id"]
+        for call in client.upsert.call_args_list
+        for point in call.kwargs["points"]
+    ]
+
+
+class TestDepositionBatchIndexing:
+    """Test DepositionParser citation storage"""
+
+    @pytest.mark.asyncio
+    async def test_citations_embedded_once_and_upserted_in_chunks(self, parser):
+        """Test one embedding call and bounded upsert chunks"""
+        citations = await parser.parse_deposition("depos/smith.pdf", TRANSCRIPT)
+
+        embed = parser.embedding_generator.generate_embeddings_batch_async
+        embed.assert_awaited_once()
+        assert len(embed.await_args.args[0]) == len(citations)
+        parser.embedding_generator.generate_embedding_async.assert_not_called()
+
+        client = parser.vector_store.client
+        assert all(len(c.kwargs["points"]) <= 2 for c in client.upsert.call_args_list)
+        assert upserted_ids(client) == [c.id for c in citations]
+
+    @pytest.mark.asyncio
+    async def test_reparsing_produces_same_point_ids(self, parser):
+        """Test re-parsing a transcript overwrites rather than duplicates"""
+        first = await parser.parse_deposition("depos/smith.pdf", TRANSCRIPT)
+        second = await parser.parse_deposition("depos/smith.pdf", TRANSCRIPT)
+        other = await parser.parse_deposition("depos/jones.pdf", TRANSCRIPT)
+
+        assert [c.id for c in first] == [c.id for c in second]
+        assert len({c.id for c in first}) == len(first)
+        assert not {c.id for c in first} & {c.id for c in other}
+
+    @pytest.mark.asyncio
+    async def test_store_reports_throughput(self, parser):
+        """Test per-document throughput statistics"""
+        citations = parser._extract_short_form_citations(
+            TRANSCRIPT, parser._extract_metadata(TRANSCRIPT)
+        )
+
+        stats = await parser._store_citations(citations + citations, "smith.pdf")
+
+        assert stats["document_path"] == "smith.pdf"
+        assert stats["citations"] == len(citations)
+        assert stats["citations_per_second"] > 0
+
+
+class TestExhibitBatchIndexing:
+    """Test ExhibitIndexer exhibit storage"""
+
+    @pytest.mark.asyncio
+    async def test_exhibits_embedded_once_with_stable_ids(self, indexer):
+        """Test one embedding call and idempotent exhibit IDs"""
+        first = await indexer.index_document_exhibits("motions/msj.pdf", EXHIBITS)
+        second = await indexer.index_document_exhibits("motions/msj.pdf", EXHIBITS)
+
+        embed = indexer.embedding_generator.generate_embeddings_batch_async
+        assert embed.await_count == 2
+        assert embed.await_args.args[0] == [
+            f"{e.exhibit_number}: {e.description}" for e in second
+        ]
+
+        assert [e.id for e in first] == [e.id for e in second]
+        client = indexer.vector_store.client
+        assert upserted_ids(client) == [e.id for e in first + second]
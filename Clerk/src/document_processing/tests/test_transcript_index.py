@@ -0,0 +1,152 @@
+"""
+Test the page/line transcript index
+"""
+
+import time
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.ai_agents.citation_formatter import Citation, CitationFormatter, CitationType
+from src.document_processing.deposition_parser import DepositionParser
+from src.document_processing.transcript_index import (
+    TranscriptIndex,
+    parse_page_line_range,
+)
+
+TRANSCRIPT = """CAPTION AND APPEARANCES
+Page 45
+1  Q. State your name for the record.
+2  A. John Smith.
+3  Q. Where were you on the night of March 3rd?
+4  A. Driving northbound on I-95
+   near exit 12.
+5  Q. How fast were you going?
+Page 46
+1  A. About sixty.
+2  Q. Was it raining?
+3  A. Yes.
+Page 47
+47:1 Q. Did you brake?
+47:2 A. I tried to.
+"""
+
+
+@pytest.fixture
+def index():
+    return TranscriptIndex.build(TRANSCRIPT)
+
+
+class TestParsePageLineRange:
+    """Test cite parsing"""
+
+    def test_cross_page_range(self):
+        assert parse_page_line_range("Smith Dep. 45:3-47:12") == (45, 3, 47, 12)
+
+    def test_same_page_range_and_single_line(self):
+        assert parse_page_line_range("45:3-12") == (45, 3, 45, 12)
+        assert parse_page_line_range("Smith Dep. at 46:2") == (46, 2, 46, 2)
+        assert parse_page_line_range("Smith Dep.") is None
+
+
+class TestTranscriptIndex:
+    """Test TranscriptIndex lookups"""
+
+    def test_single_line_includes_continuation(self, index):
+        assert (
+            index.lookup(45, 4) == "4  A. Driving northbound on I-95\n   near exit 12."
+        )
+
+    def test_cross_page_range(self, index):
+        text = index.lookup_citation("Smith Dep. 45:5-46:2")
+
+        assert text.startswith("5  Q. How fast were you going?")
+        assert "1  A. About sixty." in text
+        assert text.endswith("2  Q. Was it raining?")
+        # Page headers between lines are not part of the testimony
+        assert "Page 46" not in text
+
+    def test_inline_page_line_format(self, index):
+        assert [line for _, line, _ in index.lines(47, 1, 47, 2)] == [1, 2]
+        assert index.lookup(47, 2) == "47:2 A. I tried to."
+
+    def test_missing_range_and_expand(self, index):
+        assert index.lookup(99, 1) is None
+        assert index.expand(99, 1) is None
+
+        context = index.expand(46, 1, before=1, after=1)
+        assert context.startswith("5  Q. How fast")
+        assert context.endswith("2  Q. Was it raining?")
+
+    def test_round_trip_and_lookup_speed(self, index, tmp_path):
+        path = tmp_path / "smith.npz"
+        index.save(path)
+        loaded = TranscriptIndex.load(path)
+
+        assert loaded.lookup(45, 3, 46, 3) == index.lookup(45, 3, 46, 3)
+
+        started = time.perf_counter()
+        for _ in range(1000):
+            loaded.lookup(45, 3, 46, 3)
+        assert (time.perf_counter() - started) / 1000 < 1e-4
+
+
+class TestDepositionParserIndex:
+    """Test transcript index integration"""
+
+    @pytest.mark.asyncio
+    async def test_parse_builds_index_for_quotes(self, tmp_path):
+        with patch(
+            "src.document_processing.deposition_parser.QdrantVectorStore"
+        ), patch("src.document_processing.deposition_parser.EmbeddingGenerator"):
+            parser = DepositionParser("Smith_v_Jones", index_dir=tmp_path)
+        parser.embedding_generator.generate_embeddings_batch_async = AsyncMock(
+            side_effect=lambda texts: ([[0.1] * 4 for _ in texts], 10)
+        )
+
+        await parser.parse_deposition("depos/smith.pdf", TRANSCRIPT)
+        assert list(tmp_path.glob("*.npz"))
+
+        # A fresh parser loads the stored index from disk
+        with patch(
+            "src.document_processing.deposition_parser.QdrantVectorStore"
+        ), patch("src.document_processing.deposition_parser.EmbeddingGenerator"):
+            reader = DepositionParser("Smith_v_Jones", index_dir=tmp_path)
+
+        assert reader.quote_testimony("depos/smith.pdf", "Smith Dep. 46:3") == (
+            "3  A. Yes."
+        )
+        assert reader.quote_testimony(
+            "depos/smith.pdf", "Smith Dep. 46:2", context_lines=1
+        ).startswith("1  A. About sixty.")
+        assert reader.quote_testimony("depos/other.pdf", "Smith Dep. 46:3") is None
+        reader.vector_store.client.search.assert_not_called()
+
+    def test_citation_formatter_verifies_against_index(self, index):
+        formatter = CitationFormatter()
+        citation = formatter.extract_citations_from_text(
+            "See Deposition of John Smith at 45:3-5."
+        )[0]
+
+        assert formatter.quote_deposition_citation(citation, index).startswith(
+            "3  Q. Where were you"
+        )
+        assert formatter.verify_deposition_citation(citation, index)
+
+        whole_page = Citation(
+            citation_type=CitationType.DEPOSITION,
+            full_text="Smith Dep. 47",
+            formatted_citation="Smith Dep. 47",
+            page_reference="47",
+        )
+        assert formatter.quote_deposition_citation(whole_page, index).endswith(
+            "I tried to."
+        )
+        missing = Citation(
+            citation_type=CitationType.DEPOSITION,
+            full_text="Smith Dep. 80:1",
+            formatted_citation="Smith Dep. 80:1",
+            page_reference="80",
+            line_reference="1",
+        )
+        assert not formatter.verify_deposition_citation(missing, index)
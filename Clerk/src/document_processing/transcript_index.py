@@ -0,0 +1,259 @@
+"""
+Page/Line Transcript Index
+Maps deposition page:line references to offsets in the full transcript text
+"""
+
+import os
+import re
+import tempfile
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+# Lines are keyed as page << LINE_BITS | line so keys sort in reading order
+LINE_BITS = 16
+LINE_MASK = (1 << LINE_BITS) - 1
+
+PAGE_HEADER = re.compile(r"^\s*(?:Page|PAGE)\s+(\d+)\s*$")
+PAGE_LINE_PREFIX = re.compile(r"^\s*(\d+):(\d+)\s+\S")
+LINE_NUMBER_PREFIX = re.compile(r"^\s*(\d{1,2})\s+\S")
+
+# "45:3-47:12", "45:3-12", "45:3"
+PAGE_LINE_RANGE = re.compile(r"(\d+):(\d+)(?:\s*[-–]\s*(?:(\d+):)?(\d+))?")
+
+
+def parse_page_line_range(cite: str) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Parse a page:line citation into a range.
+
+    Args:
+        cite: Citation such as "Smith Dep. 45:3-47:12"
+
+    Returns:
+        (page_start, line_start, page_end, line_end) or None if no range found
+    """
+    match = PAGE_LINE_RANGE.search(cite)
+    if not match:
+        return None
+
+    page_start, line_start = int(match.group(1)), int(match.group(2))
+    page_end = int(match.group(3)) if match.group(3) else page_start
+    line_end = int(match.group(4)) if match.group(4) else line_start
+    return page_start, line_start, page_end, line_end
+
+
+def _key(page: int, line: int) -> int:
+    return (page << LINE_BITS) | (line & LINE_MASK)
+
+
+class TranscriptIndex:
+    """
+    Compact page/line index over a deposition transcript.
+
+    Holds the transcript text plus three parallel arrays sorted by key:
+    the (page, line) key, and the start and end offset of that line's text.
+    Range lookups are two binary searches and a string slice.
+    """
+
+    def __init__(
+        self, text: str, keys: np.ndarray, starts: np.ndarray, ends: np.ndarray
+    ):
+        self.text = text
+        self.keys = keys
+        self.starts = starts
+        self.ends = ends
+        # Plain lists for bisect and slicing, faster than numpy for scalar access
+        self._key_list = keys.tolist()
+        self._starts = starts.tolist()
+        self._ends = ends.tolist()
+
+    def __len__(self) -> int:
+        return len(self._key_list)
+
+    @classmethod
+    def build(cls, text: str) -> "TranscriptIndex":
+        """
+        Index every numbered transcript line.
+
+        Recognizes "Page N" headers followed by numbered lines ("12  Q. ...")
+        and inline page:line prefixes ("45:12 Q. ..."). Unnumbered lines are
+        treated as continuations of the previous numbered line.
+
+        Args:
+            text: Full transcript text
+
+        Returns:
+            Transcript index
+        """
+        keys: List[int] = []
+        starts: List[int] = []
+        headers: List[int] = []
+
+        current_page = None
+        offset = 0
+        for raw_line in text.splitlines(keepends=True):
+            header = PAGE_HEADER.match(raw_line)
+            if header:
+                current_page = int(header.group(1))
+                headers.append(offset)
+            else:
+                page_line = PAGE_LINE_PREFIX.match(raw_line)
+                numbered = None if page_line else LINE_NUMBER_PREFIX.match(raw_line)
+                if page_line:
+                    keys.append(_key(int(page_line.group(1)), int(page_line.group(2))))
+                    starts.append(offset)
+                elif numbered and current_page is not None:
+                    keys.append(_key(current_page, int(numbered.group(1))))
+                    starts.append(offset)
+            offset += len(raw_line)
+
+        # A line ends where the next numbered line or page header begins
+        boundaries = sorted(set(starts) | set(headers) | {len(text)})
+        ends = [boundaries[bisect_right(boundaries, start)] for start in starts]
+
+        key_array = np.asarray(keys, dtype=np.int64)
+        order = np.argsort(key_array, kind="stable")
+        key_array = key_array[order]
+
+        # Keep the first occurrence of a repeated page:line
+        first = np.ones(len(key_array), dtype=bool)
+        first[1:] = key_array[1:] != key_array[:-1]
+
+        return cls(
+            text,
+            key_array[first],
+            np.asarray(starts, dtype=np.int64)[order][first],
+            np.asarray(ends, dtype=np.int64)[order][first],
+        )
+
+    def lines(
+        self,
+        page_start: int,
+        line_start: int,
+        page_end: Optional[int] = None,
+        line_end: Optional[int] = None,
+    ) -> List[Tuple[int, int, str]]:
+        """
+        Return the indexed lines in a page:line range.
+
+        Args:
+            page_start: First page
+            line_start: First line on the first page
+            page_end: Last page (defaults to page_start)
+            line_end: Last line on the last page (defaults to line_start)
+
+        Returns:
+            List of (page, line, text) tuples in transcript order
+        """
+        lo, hi = self._bounds(page_start, line_start, page_end, line_end)
+        return [self._line(i) for i in range(lo, hi)]
+
+    def lookup(
+        self,
+        page_start: int,
+        line_start: int,
+        page_end: Optional[int] = None,
+        line_end: Optional[int] = None,
+    ) -> Optional[str]:
+        """
+        Return the transcript text for a page:line range.
+
+        Returns:
+            Testimony text, or None if no indexed line falls in the range
+        """
+        lo, hi = self._bounds(page_start, line_start, page_end, line_end)
+        if lo >= hi:
+            return None
+        return "".join(
+            self.text[self._starts[i] : self._ends[i]] for i in range(lo, hi)
+        ).strip()
+
+    def lookup_citation(self, cite: str) -> Optional[str]:
+        """
+        Return the transcript text for a citation such as "Smith Dep. 45:3-47:12".
+
+        Returns:
+            Testimony text, or None if the citation cannot be resolved
+        """
+        parsed = parse_page_line_range(cite)
+        if not parsed:
+            return None
+        return self.lookup(*parsed)
+
+    def expand(
+        self, page: int, line: int, before: int = 5, after: int = 5
+    ) -> Optional[str]:
+        """
+        Return a line together with surrounding lines for context.
+
+        Args:
+            page: Page of the cited line
+            line: Cited line
+            before: Number of indexed lines to include before it
+            after: Number of indexed lines to include after it
+
+        Returns:
+            Context text, or None if the line is not indexed
+        """
+        key = _key(page, line)
+        position = bisect_left(self._key_list, key)
+        if position >= len(self._key_list) or self._key_list[position] != key:
+            return None
+
+        lo = max(0, position - before)
+        hi = min(len(self._key_list), position + after + 1)
+        return "".join(
+            self.text[self._starts[i] : self._ends[i]] for i in range(lo, hi)
+        ).strip()
+
+    def save(self, path: Union[str, Path]):
+        """Write the index atomically to a .npz file"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".npz")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                np.savez_compressed(
+                    handle,
+                    text=np.frombuffer(self.text.encode("utf-8"), dtype=np.uint8),
+                    keys=self.keys,
+                    starts=self.starts,
+                    ends=self.ends,
+                )
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "TranscriptIndex":
+        """Read an index written by save()"""
+        with np.load(path) as data:
+            return cls(
+                data["text"].tobytes().decode("utf-8"),
+                data["keys"],
+                data["starts"],
+                data["ends"],
+            )
+
+    def _bounds(
+        self,
+        page_start: int,
+        line_start: int,
+        page_end: Optional[int],
+        line_end: Optional[int],
+    ) -> Tuple[int, int]:
+        page_end = page_start if page_end is None else page_end
+        line_end = line_start if line_end is None else line_end
+        lo = bisect_left(self._key_list, _key(page_start, line_start))
+        hi = bisect_right(self._key_list, _key(page_end, line_end))
+        return lo, hi
+
+    def _line(self, i: int) -> Tuple[int, int, str]:
+        key = self._key_list[i]
+        text = self.text[self._starts[i] : self._ends[i]].strip()
+        return key >> LINE_BITS, key & LINE_MASK, text
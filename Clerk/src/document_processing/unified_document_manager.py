@@ -11,17 +11,16 @@ from datetime import datetime
 import json
 import uuid
 
-from qdrant_client import QdrantClient
 from qdrant_client.models import (
     Distance,
     VectorParams,
     PointStruct,
     Filter,
     FieldCondition,
+    MatchAny,
     MatchValue,
     PayloadSchemaType,
 )
-import openai
 
 from src.models.unified_document_models import (
     UnifiedDocument,
@@ -34,6 +33,8 @@ from src.models.unified_document_models import (
     DocumentSearchResult,
 )
 from src.vector_storage.embeddings import EmbeddingGenerator
+from src.utils.client_registry import get_client_registry
+from src.utils.metrics import metrics
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -54,17 +55,14 @@ class UnifiedDocumentManager:
         self.case_name = case_name
         self.collection_name = f"{case_name}_documents"
 
-        # Initialize clients
-        self.client = QdrantClient(
-            url=settings.qdrant.url,
-            api_key=settings.qdrant.api_key,
-            prefer_grpc=settings.qdrant.prefer_grpc,
-            timeout=settings.qdrant.timeout,
-        )
+        # Shared pooled clients from the client registry
+        registry = get_client_registry()
+        self.client = registry.qdrant_client()
+        self.async_client = registry.async_qdrant_client()
 
         self.embedding_generator = EmbeddingGenerator()
-        self.openai_client = openai.OpenAI(api_key=settings.openai.api_key)
-        self.async_openai_client = openai.AsyncOpenAI(api_key=settings.openai.api_key)
+        self.openai_client = registry.openai_client()
+        self.async_openai_client = registry.async_openai_client()
 
         # Compile patterns for document analysis
         self.patterns = self._compile_patterns()
@@ -298,9 +296,10 @@ class UnifiedDocumentManager:
         """Store document in Qdrant"""
         point = PointStruct(id=doc.id, vector=embedding, payload=doc.to_storage_dict())
 
-        self.client.upsert(
-            collection_name=self.collection_name, points=[point], wait=True
-        )
+        with metrics.timer("qdrant_upsert_seconds", target="documents"):
+            self.client.upsert(
+                collection_name=self.collection_name, points=[point], wait=True
+            )
 
         logger.info(f"Stored unified document: {doc.title} (ID: {doc.id})")
 
@@ -357,19 +356,20 @@ Provide a JSON response with:
 Format as valid JSON."""
 
         try:
-            response = await self.async_openai_client.chat.completions.create(
-                model=settings.ai.default_model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a legal document classifier.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.3,
-                max_tokens=500,
-                response_format={"type": "json_object"},
-            )
+            with metrics.timer("llm_call_seconds", model=settings.ai.default_model):
+                response = await self.async_openai_client.chat.completions.create(
+                    model=settings.ai.default_model,
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": "You are a legal document classifier.",
+                        },
+                        {"role": "user", "content": prompt},
+                    ],
+                    temperature=0.3,
+                    max_tokens=500,
+                    response_format={"type": "json_object"},
+                )
 
             classification = json.loads(response.choices[0].message.content)
 
@@ -573,7 +573,9 @@ Format as valid JSON."""
     ) -> List[DocumentSearchResult]:
         """Search for documents using vector similarity and filters"""
         # Generate embedding for query
-        query_embedding, _ = self.embedding_generator.generate_embedding(request.query)
+        query_embedding, _ = await self.embedding_generator.generate_embedding_async(
+            request.query
+        )
 
         # Build filter conditions
         must_conditions = [
@@ -588,9 +590,7 @@ Format as valid JSON."""
             must_conditions.append(
                 FieldCondition(
                     key="document_type",
-                    match=MatchValue(
-                        value=[dt.value for dt in request.document_types], any=True
-                    ),
+                    match=MatchAny(any=[dt.value for dt in request.document_types]),
                 )
             )
 
@@ -600,9 +600,9 @@ Format as valid JSON."""
             )
 
         # Search
-        results = self.client.search(
+        response = await self.async_client.query_points(
             collection_name=self.collection_name,
-            query_vector=query_embedding,
+            query=query_embedding,
             query_filter=Filter(must=must_conditions),
             limit=request.limit,
             with_payload=True,
@@ -610,7 +610,7 @@ Format as valid JSON."""
 
         # Convert to search results
         search_results = []
-        for result in results:
+        for result in response.points:
             doc = UnifiedDocument.from_storage_dict(result.payload)
             search_results.append(
                 DocumentSearchResult(
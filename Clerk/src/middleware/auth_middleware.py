@@ -46,6 +46,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
         # Default exempt paths
         self.exempt_paths = exempt_paths or [
             "/health",
+            "/metrics",
             "/api/auth/login",
             "/api/auth/register",
             "/api/auth/refresh",
@@ -100,17 +101,19 @@ class AuthMiddleware(BaseHTTPMiddleware):
         Returns:
             JSONResponse: Response from the endpoint or error response.
         """
-        # Debug logging
-        logger.info(f"Auth middleware processing: {request.url.path}")
-        logger.info(f"AUTH_ENABLED: {settings.auth.auth_enabled}")
-        logger.info(f"Is Development: {settings.is_development}")
-        logger.info(
-            f"Headers: Authorization={request.headers.get('Authorization', 'None')}"
+        # Debug logging; never log the header value itself
+        logger.debug(
+            "Auth middleware processing: %s (auth_enabled=%s, development=%s, "
+            "authorization header=%s)",
+            request.url.path,
+            settings.auth.auth_enabled,
+            settings.is_development,
+            "Authorization" in request.headers,
         )
 
         # Check if path is exempt
         if self.is_exempt(request.url.path):
-            logger.info(f"Path {request.url.path} is exempt from auth")
+            logger.debug("Path %s is exempt from auth", request.url.path)
             return await call_next(request)
 
         # Extract token from Authorization header
@@ -136,13 +139,10 @@ class AuthMiddleware(BaseHTTPMiddleware):
 
         # Check if auth is disabled in development mode
         if not settings.auth.auth_enabled and settings.is_development:
-            logger.info(
-                f"Dev mode auth check: token={token[:20]}... expected={settings.auth.dev_mock_token[:20]}..."
-            )
             # Check if it's the development mock token
             if token == settings.auth.dev_mock_token:
                 # Fetch the actual dev user from the database
-                logger.info("Development mode: Fetching dev user from database")
+                logger.debug("Development mode: Fetching dev user from database")
                 try:
                     async with AsyncSessionLocal() as db:
                         # Get the dev user by ID
@@ -165,8 +165,10 @@ class AuthMiddleware(BaseHTTPMiddleware):
                             request.state.law_firm_id = dev_user.law_firm_id
                             request.state.is_admin = dev_user.is_admin
                             request.state.user = dev_user
-                            logger.info(
-                                f"Development mode: Authenticated as {dev_user.email} with law_firm_id {dev_user.law_firm_id}"
+                            logger.debug(
+                                "Development mode: Authenticated as %s with law_firm_id %s",
+                                dev_user.email,
+                                dev_user.law_firm_id,
                             )
                         else:
                             # Fallback to mock user if dev user doesn't exist
@@ -261,7 +263,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
                     request.state.is_admin = user.is_admin
                     request.state.user = user  # Full user object
 
-                    logger.debug(f"Authenticated request from user: {user.email}")
+                    logger.debug("Authenticated request from user: %s", user.email)
 
             except Exception as e:
                 logger.error(f"Authentication error: {e}")
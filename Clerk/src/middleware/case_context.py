@@ -29,6 +29,7 @@ class CaseContextMiddleware(BaseHTTPMiddleware):
     EXEMPT_PATHS = {
         "/",
         "/health",
+        "/metrics",
         "/docs",
         "/openapi.json",
         "/api/auth",
@@ -0,0 +1,263 @@
+"""
+Batch Fact Deduplication Service.
+Detects duplicate candidate facts within a batch and against a case's stored facts.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import List, Optional, FrozenSet
+
+import numpy as np
+from qdrant_client.models import Filter, FieldCondition, MatchValue, QueryRequest
+
+from src.utils.thread_pool import run_blocking
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def text_shingles(text: str) -> FrozenSet[str]:
+    """
+    Build normalized word shingles (unigrams and bigrams) for a text.
+
+    Args:
+        text: Text to shingle
+
+    Returns:
+        Set of lowercase word unigrams and bigrams
+    """
+    tokens = _TOKEN_PATTERN.findall(text.lower())
+    bigrams = (f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+    return frozenset(tokens).union(bigrams)
+
+
+def shingle_similarity(text1: str, text2: str) -> float:
+    """
+    Jaccard similarity of two texts' word shingles.
+
+    Args:
+        text1: First text
+        text2: Second text
+
+    Returns:
+        Similarity score (0-1)
+    """
+    shingles1 = text_shingles(text1)
+    shingles2 = text_shingles(text2)
+
+    if not shingles1 and not shingles2:
+        return 1.0 if text1.strip().lower() == text2.strip().lower() else 0.0
+
+    return len(shingles1 & shingles2) / len(shingles1 | shingles2)
+
+
+@dataclass
+class DeduplicationResult:
+    """Outcome of checking a batch of candidate facts"""
+
+    # Per candidate: None if unique, otherwise the ID of the fact it duplicates
+    duplicate_of: List[Optional[str]]
+    # Candidate embeddings, in input order, for reuse when storing
+    embeddings: List[List[float]] = field(default_factory=list)
+
+    @property
+    def is_duplicate(self) -> List[bool]:
+        return [match is not None for match in self.duplicate_of]
+
+    @property
+    def unique_indices(self) -> List[int]:
+        return [i for i, match in enumerate(self.duplicate_of) if match is None]
+
+
+class FactDeduplicator:
+    """
+    Checks whole batches of candidate facts for duplicates.
+
+    A candidate is a duplicate when its embedding is close to an earlier
+    candidate or a stored fact and their texts overlap. Candidates are first
+    compared with each other in NumPy, a block of rows at a time on the
+    blocking pool. The rest are then checked against the collection with one
+    batched Qdrant search.
+    """
+
+    def __init__(
+        self,
+        vector_store,
+        embedding_generator,
+        similarity_threshold: float = 0.85,
+        text_similarity_threshold: float = 0.8,
+        search_limit: int = 5,
+        block_size: int = 512,
+    ):
+        """
+        Initialize the deduplicator.
+
+        Args:
+            vector_store: Qdrant store whose client is searched
+            embedding_generator: Generator used for batched embeddings
+            similarity_threshold: Minimum cosine similarity for a candidate pair
+            text_similarity_threshold: Minimum shingle similarity to confirm a pair
+            search_limit: Stored neighbours checked per candidate
+            block_size: Candidate rows compared per similarity block
+        """
+        self.vector_store = vector_store
+        self.embedding_generator = embedding_generator
+        self.similarity_threshold = similarity_threshold
+        self.text_similarity_threshold = text_similarity_threshold
+        self.search_limit = search_limit
+        self.block_size = block_size
+
+    async def find_duplicates(
+        self,
+        contents: List[str],
+        collection_name: str,
+        ids: Optional[List[str]] = None,
+    ) -> DeduplicationResult:
+        """
+        Find duplicates among candidates and against stored facts.
+
+        Args:
+            contents: Candidate fact texts
+            collection_name: Case facts collection to check against
+            ids: Candidate fact IDs, used to report intra-batch matches
+
+        Returns:
+            Deduplication result with per-candidate matches and embeddings
+        """
+        if not contents:
+            return DeduplicationResult(duplicate_of=[], embeddings=[])
+
+        ids = ids or [str(i) for i in range(len(contents))]
+        embeddings, _ = await self.embedding_generator.generate_embeddings_batch_async(
+            contents
+        )
+
+        duplicate_of = await run_blocking(
+            self._find_batch_duplicates, contents, ids, embeddings
+        )
+
+        remaining = [i for i, match in enumerate(duplicate_of) if match is None]
+        stored_matches = await self._find_stored_duplicates(
+            [contents[i] for i in remaining],
+            [embeddings[i] for i in remaining],
+            collection_name,
+        )
+        for i, match in zip(remaining, stored_matches):
+            duplicate_of[i] = match
+
+        found = sum(match is not None for match in duplicate_of)
+        if found:
+            logger.info(
+                f"Found {found} duplicate facts among {len(contents)} candidates "
+                f"for {collection_name}"
+            )
+
+        return DeduplicationResult(duplicate_of=duplicate_of, embeddings=embeddings)
+
+    def _find_batch_duplicates(
+        self, contents: List[str], ids: List[str], embeddings: List[List[float]]
+    ) -> List[Optional[str]]:
+        """Mark candidates that repeat an earlier candidate in the same batch"""
+        duplicate_of: List[Optional[str]] = [None] * len(contents)
+        if len(contents) < 2:
+            return duplicate_of
+
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix /= norms
+
+        shingles = {}
+        for start in range(1, len(contents), self.block_size):
+            stop = min(start + self.block_size, len(contents))
+
+            # Similarities of this block of later rows to all earlier rows,
+            # so memory stays at block_size x n instead of n x n
+            similar = matrix[start:stop] @ matrix[:stop].T >= self.similarity_threshold
+            rows, earlier = np.nonzero(np.tril(similar, k=start - 1))
+
+            # Pairs (earlier, later) above the vector threshold need a text check
+            for row, i in zip(rows.tolist(), earlier.tolist()):
+                j = start + row
+                # Compare each later candidate only with surviving earlier ones
+                if duplicate_of[j] is not None or duplicate_of[i] is not None:
+                    continue
+
+                for k in (i, j):
+                    if k not in shingles:
+                        shingles[k] = text_shingles(contents[k])
+
+                if (
+                    self._jaccard(shingles[i], shingles[j])
+                    >= self.text_similarity_threshold
+                ):
+                    duplicate_of[j] = ids[i]
+
+        return duplicate_of
+
+    async def _find_stored_duplicates(
+        self,
+        contents: List[str],
+        embeddings: List[List[float]],
+        collection_name: str,
+    ) -> List[Optional[str]]:
+        """Check candidates against stored facts with one batched search"""
+        if not contents:
+            return []
+
+        try:
+            named_vectors, _ = await self.vector_store._get_collection_layout(
+                collection_name
+            )
+        except Exception as e:
+            logger.warning(f"Could not read layout of {collection_name}: {e}")
+            named_vectors = False
+
+        # Extracted facts carry no is_deleted field, so exclude deleted ones
+        not_deleted = Filter(
+            must_not=[FieldCondition(key="is_deleted", match=MatchValue(value=True))]
+        )
+        requests = [
+            QueryRequest(
+                query=list(embedding),
+                using="semantic" if named_vectors else None,
+                filter=not_deleted,
+                limit=self.search_limit,
+                score_threshold=self.similarity_threshold,
+                with_payload=True,
+            )
+            for embedding in embeddings
+        ]
+
+        try:
+            responses = await self.vector_store.async_client.query_batch_points(
+                collection_name=collection_name, requests=requests
+            )
+        except Exception as e:
+            logger.error(f"Failed to check for duplicates: {e}")
+            # On error, assume not duplicate to avoid blocking
+            return [None] * len(contents)
+
+        matches = []
+        for content, response in zip(contents, responses):
+            matches.append(self._best_text_match(content, response.points))
+        return matches
+
+    def _best_text_match(self, content: str, results) -> Optional[str]:
+        """Return the ID of the first search hit whose text overlaps the candidate"""
+        shingles = text_shingles(content)
+        for result in results:
+            existing = result.payload.get("content", "")
+            similarity = self._jaccard(shingles, text_shingles(existing))
+            if similarity >= self.text_similarity_threshold:
+                logger.debug(f"Found duplicate fact with score {result.score}")
+                return str(result.payload.get("id", result.id))
+        return None
+
+    @staticmethod
+    def _jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+        if not a and not b:
+            return 1.0
+        return len(a & b) / len(a | b)
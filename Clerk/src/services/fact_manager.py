@@ -3,7 +3,9 @@ Fact Management Service for Discovery Processing.
 Handles CRUD operations for facts with case isolation and deduplication.
 """
 
+import asyncio
 import logging
+import uuid
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
@@ -20,8 +22,25 @@ from src.models.case_models import CaseContext
 from src.vector_storage.qdrant_store import QdrantVectorStore
 from src.vector_storage.embeddings import EmbeddingGenerator
 from src.services.case_manager import CaseManager
+from src.services.fact_deduplicator import FactDeduplicator, shingle_similarity
+from src.utils.logger import log_case_access
+from src.utils.metrics import metrics
+from src.database.caching_manager import get_materialized_view_manager
+from src.utils.fact_date_index import (
+    record_fact_category_changes,
+    record_fact_payloads,
+    record_fact_removals,
+    record_fact_upserts,
+)
 
-from qdrant_client.models import Filter, FieldCondition, MatchValue, PointStruct
+from qdrant_client.models import (
+    Filter,
+    FieldCondition,
+    MatchValue,
+    PointStruct,
+    SetPayload,
+    SetPayloadOperation,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +57,12 @@ class FactManager:
         self.embedding_generator = EmbeddingGenerator()
         self.case_manager = CaseManager()
         self.similarity_threshold = 0.85  # For deduplication
+        self.bulk_chunk_size = 500  # Fact IDs per bulk lookup and update
+        self.deduplicator = FactDeduplicator(
+            self.vector_store,
+            self.embedding_generator,
+            similarity_threshold=self.similarity_threshold,
+        )
 
     async def create_fact(
         self, fact: ExtractedFactWithSource, case_context: CaseContext
@@ -58,35 +83,86 @@ class FactManager:
                 f"Case name mismatch: {fact.case_name} != {case_context.case_name}"
             )
 
+        created = await self.create_facts([fact], case_context)
+        return created[0]
+
+    async def create_facts(
+        self, facts: List[ExtractedFactWithSource], case_context: CaseContext
+    ) -> List[Optional[ExtractedFactWithSource]]:
+        """
+        Create a batch of facts, skipping duplicates.
+
+        Candidates are embedded together and deduplicated against each other
+        and the stored facts before a single upsert.
+
+        Args:
+            facts: The facts to create
+            case_context: Case context from middleware
+
+        Returns:
+            Per input fact, the created fact or None if it was a duplicate
+        """
+        # Ensure facts belong to the correct case
+        for fact in facts:
+            if fact.case_name != case_context.case_name:
+                raise ValueError(
+                    f"Case name mismatch: {fact.case_name} != {case_context.case_name}"
+                )
+
+        if not facts:
+            return []
+
+        collection_name = f"{case_context.case_name}_facts"
+
         # Check for duplicates
-        is_duplicate = await self._check_duplicate(fact, case_context)
-        if is_duplicate:
-            logger.info(
-                f"Duplicate fact found for case {case_context.case_name}, skipping"
+        dedup = await self.deduplicator.find_duplicates(
+            [fact.content for fact in facts],
+            collection_name,
+            ids=[fact.id for fact in facts],
+        )
+
+        created: List[Optional[ExtractedFactWithSource]] = [None] * len(facts)
+        points = []
+        for i in dedup.unique_indices:
+            fact = facts[i]
+
+            # Prepare payload
+            payload = self._fact_to_payload(fact)
+            payload["created_by"] = case_context.user_id
+
+            points.append(
+                PointStruct(id=fact.id, vector=list(dedup.embeddings[i]), payload=payload)
             )
-            return None
+            created[i] = fact
 
-        # Generate embedding
-        embedding = await self.embedding_generator.generate_embedding(fact.content)
+        skipped = len(facts) - len(points)
+        if skipped:
+            logger.info(
+                f"Skipping {skipped} duplicate facts for case {case_context.case_name}"
+            )
 
-        # Prepare payload
-        payload = self._fact_to_payload(fact)
-        payload["created_by"] = case_context.user_id
+        if not points:
+            return created
 
         # Store in Qdrant
-        collection_name = f"{case_context.case_name}_facts"
         try:
-            await self.vector_store.client.upsert(
-                collection_name=collection_name,
-                points=[
-                    PointStruct(id=fact.id, vector=embedding.tolist(), payload=payload)
-                ],
+            with metrics.timer("qdrant_upsert_seconds", target="facts"):
+                await self.vector_store.async_client.upsert(
+                    collection_name=collection_name, points=points
+                )
+            logger.info(
+                f"Created {len(points)} facts in case {case_context.case_name}"
             )
-            logger.info(f"Created fact {fact.id} in case {case_context.case_name}")
-            return fact
+            record_fact_upserts(
+                case_context.case_name, [fact for fact in created if fact is not None]
+            )
+            get_materialized_view_manager().record_fact_count_change(
+                case_context.case_name, len(points)
+            )
+            return created
 
         except Exception as e:
-            logger.error(f"Failed to create fact: {e}")
+            logger.error(f"Failed to create facts: {e}")
             raise
 
     async def update_fact(
@@ -107,7 +183,7 @@ class FactManager:
 
         # Get existing fact
         try:
-            points = await self.vector_store.client.retrieve(
+            points = await self.vector_store.async_client.retrieve(
                 collection_name=collection_name, ids=[fact_id]
             )
 
@@ -148,18 +224,20 @@ class FactManager:
 
         # Update in Qdrant
         try:
-            await self.vector_store.client.upsert(
-                collection_name=collection_name,
-                points=[
-                    PointStruct(
-                        id=fact_id,
-                        vector=new_embedding.tolist(),
-                        payload=updated_payload,
-                    )
-                ],
-            )
+            with metrics.timer("qdrant_upsert_seconds", target="facts"):
+                await self.vector_store.async_client.upsert(
+                    collection_name=collection_name,
+                    points=[
+                        PointStruct(
+                            id=fact_id,
+                            vector=new_embedding.tolist(),
+                            payload=updated_payload,
+                        )
+                    ],
+                )
 
             logger.info(f"Updated fact {fact_id} in case {case_context.case_name}")
+            record_fact_payloads(case_context.case_name, [updated_payload])
 
             # Reconstruct and return the updated fact
             return self._payload_to_fact(updated_payload)
@@ -186,7 +264,7 @@ class FactManager:
 
         # Get existing fact
         try:
-            points = await self.vector_store.client.retrieve(
+            points = await self.vector_store.async_client.retrieve(
                 collection_name=collection_name, ids=[fact_id]
             )
 
@@ -210,13 +288,17 @@ class FactManager:
 
         # Keep the same vector but update payload
         try:
-            await self.vector_store.client.set_payload(
+            await self.vector_store.async_client.set_payload(
                 collection_name=collection_name,
                 payload=updated_payload,
                 points=[fact_id],
             )
 
             logger.info(f"Soft deleted fact {fact_id} in case {case_context.case_name}")
+            record_fact_removals(case_context.case_name, [fact_id])
+            get_materialized_view_manager().record_fact_count_change(
+                case_context.case_name, -1
+            )
             return True
 
         except Exception as e:
@@ -239,7 +321,7 @@ class FactManager:
         collection_name = f"{case_context.case_name}_facts"
 
         try:
-            points = await self.vector_store.client.retrieve(
+            points = await self.vector_store.async_client.retrieve(
                 collection_name=collection_name, ids=[fact_id]
             )
 
@@ -320,7 +402,7 @@ class FactManager:
                     search_filter.query
                 )
 
-                results = await self.vector_store.client.search(
+                results = await self.vector_store.async_client.search(
                     collection_name=collection_name,
                     query_vector=query_embedding.tolist(),
                     query_filter=filter_obj,
@@ -329,7 +411,7 @@ class FactManager:
                 )
             else:
                 # Browse without query
-                results = await self.vector_store.client.scroll(
+                results = await self.vector_store.async_client.scroll(
                     collection_name=collection_name,
                     scroll_filter=filter_obj,
                     limit=search_filter.limit,
@@ -358,6 +440,10 @@ class FactManager:
         """
         Perform bulk operations on multiple facts.
 
+        The whole ID set is checked for existence in chunks and updated with a
+        single Qdrant batch of set_payload operations, instead of a
+        read-modify-write per fact. One audit record is written per call.
+
         Args:
             bulk_request: Bulk update details
             case_context: Case context from middleware
@@ -365,38 +451,132 @@ class FactManager:
         Returns:
             Dict of fact_id -> success status
         """
-        results = {}
+        results = {fact_id: False for fact_id in bulk_request.fact_ids}
 
-        for fact_id in bulk_request.fact_ids:
-            try:
-                if bulk_request.action == "mark_reviewed":
-                    await self._mark_fact_reviewed(fact_id, case_context)
-                    results[fact_id] = True
+        payload = self._bulk_payload(bulk_request, case_context)
+        if payload is None or not results:
+            return results
 
-                elif bulk_request.action == "delete":
-                    delete_request = FactDeleteRequest(
-                        fact_id=fact_id, delete_reason=bulk_request.reason
-                    )
-                    success = await self.delete_fact(
-                        fact_id, delete_request, case_context
-                    )
-                    results[fact_id] = success
+        collection_name = f"{case_context.case_name}_facts"
+        operation_id = str(uuid.uuid4())
+        payload["bulk_operation_id"] = operation_id
+
+        fact_ids = list(results)
+        chunks = [
+            fact_ids[i : i + self.bulk_chunk_size]
+            for i in range(0, len(fact_ids), self.bulk_chunk_size)
+        ]
+
+        # Look up which facts exist, one request per chunk, concurrently
+        lookups = await asyncio.gather(
+            *(self._existing_fact_ids(collection_name, chunk) for chunk in chunks),
+            return_exceptions=True,
+        )
 
-                elif bulk_request.action == "change_category" and bulk_request.category:
-                    await self._change_fact_category(
-                        fact_id, bulk_request.category, case_context
-                    )
-                    results[fact_id] = True
+        operations = []
+        updated_chunks = []
+        already_deleted = set()
+        for chunk, found in zip(chunks, lookups):
+            if isinstance(found, Exception):
+                logger.error(
+                    f"Failed to look up {len(chunk)} facts for bulk "
+                    f"{bulk_request.action}: {found}"
+                )
+                continue
 
-                else:
-                    results[fact_id] = False
+            existing = [fact_id for fact_id in chunk if fact_id in found]
+            already_deleted.update(fact_id for fact_id in existing if found[fact_id])
+            if existing:
+                operations.append(
+                    SetPayloadOperation(
+                        set_payload=SetPayload(payload=payload, points=existing)
+                    )
+                )
+                updated_chunks.append(existing)
 
+        if operations:
+            try:
+                await self.vector_store.async_client.batch_update_points(
+                    collection_name=collection_name, update_operations=operations
+                )
+                for existing in updated_chunks:
+                    for fact_id in existing:
+                        results[fact_id] = True
             except Exception as e:
-                logger.error(f"Failed to process fact {fact_id} in bulk update: {e}")
-                results[fact_id] = False
+                logger.error(f"Bulk {bulk_request.action} failed: {e}")
+
+        # Keep the case's date index in step with the stored facts
+        updated_ids = [fact_id for fact_id, ok in results.items() if ok]
+        if bulk_request.action == "delete":
+            record_fact_removals(case_context.case_name, updated_ids)
+            # Facts that were already soft-deleted are no longer counted
+            newly_deleted = [i for i in updated_ids if i not in already_deleted]
+            get_materialized_view_manager().record_fact_count_change(
+                case_context.case_name, -len(newly_deleted)
+            )
+        elif bulk_request.action == "change_category":
+            record_fact_category_changes(
+                case_context.case_name, updated_ids, payload["category"]
+            )
+
+        succeeded = sum(results.values())
+        log_case_access(
+            logger,
+            case_context.user_id,
+            case_context.case_name,
+            f"bulk_{bulk_request.action}: {succeeded}/{len(results)} facts "
+            f"(operation {operation_id})",
+        )
 
         return results
 
+    def _bulk_payload(
+        self, bulk_request: FactBulkUpdateRequest, case_context: CaseContext
+    ) -> Optional[Dict[str, Any]]:
+        """Build the payload fields a bulk action sets on every fact"""
+        now = datetime.utcnow().isoformat()
+
+        if bulk_request.action == "mark_reviewed":
+            return {
+                "reviewed": True,
+                "reviewed_by": case_context.user_id,
+                "reviewed_at": now,
+            }
+
+        if bulk_request.action == "delete":
+            # Soft delete, keeping the vector
+            return {
+                "is_deleted": True,
+                "deleted_at": now,
+                "deleted_by": case_context.user_id,
+                "delete_reason": bulk_request.reason,
+            }
+
+        if bulk_request.action == "change_category" and bulk_request.category:
+            return {
+                "category": bulk_request.category.value,
+                "category_changed_by": case_context.user_id,
+                "category_changed_at": now,
+            }
+
+        logger.warning(f"Unsupported bulk fact action: {bulk_request.action}")
+        return None
+
+    async def _existing_fact_ids(
+        self, collection_name: str, fact_ids: List[str]
+    ) -> Dict[str, bool]:
+        """Map the fact IDs present in the collection to their is_deleted flag"""
+        points = await self.vector_store.async_client.retrieve(
+            collection_name=collection_name,
+            ids=fact_ids,
+            with_payload=["is_deleted"],
+            with_vectors=False,
+        )
+        return {
+            str(point.id): bool((point.payload or {}).get("is_deleted"))
+            for point in points
+        }
+
     async def _check_duplicate(
         self, fact: ExtractedFactWithSource, case_context: CaseContext
     ) -> bool:
@@ -410,47 +590,16 @@ class FactManager:
         Returns:
             True if duplicate found
         """
-        collection_name = f"{case_context.case_name}_facts"
-
-        # Generate embedding for the new fact
-        embedding = await self.embedding_generator.generate_embedding(fact.content)
-
-        try:
-            # Search for similar facts
-            results = await self.vector_store.client.search(
-                collection_name=collection_name,
-                query_vector=embedding.tolist(),
-                query_filter=Filter(
-                    must=[
-                        FieldCondition(key="is_deleted", match=MatchValue(value=False))
-                    ]
-                ),
-                limit=5,
-                score_threshold=self.similarity_threshold,
-            )
-
-            # Check text similarity for high-scoring results
-            for result in results:
-                existing_content = result.payload.get("content", "")
-
-                # Simple text similarity check (could be enhanced)
-                if (
-                    self._calculate_text_similarity(fact.content, existing_content)
-                    > 0.9
-                ):
-                    logger.debug(f"Found duplicate fact with score {result.score}")
-                    return True
-
-            return False
-
-        except Exception as e:
-            logger.error(f"Failed to check for duplicates: {e}")
-            # On error, assume not duplicate to avoid blocking
-            return False
+        dedup = await self.deduplicator.find_duplicates(
+            [fact.content],
+            f"{case_context.case_name}_facts",
+            ids=[fact.id],
+        )
+        return dedup.is_duplicate[0]
 
     def _calculate_text_similarity(self, text1: str, text2: str) -> float:
         """
-        Calculate simple text similarity between two strings.
+        Calculate text similarity as Jaccard overlap of word shingles.
 
         Args:
             text1: First text
@@ -459,60 +608,7 @@ class FactManager:
         Returns:
             Similarity score (0-1)
         """
-        # Normalize texts
-        text1_lower = text1.lower().strip()
-        text2_lower = text2.lower().strip()
-
-        # Exact match
-        if text1_lower == text2_lower:
-            return 1.0
-
-        # Levenshtein-like similarity (simplified)
-        longer = text1_lower if len(text1_lower) > len(text2_lower) else text2_lower
-        shorter = text2_lower if longer == text1_lower else text1_lower
-
-        if len(longer) == 0:
-            return 1.0
-
-        # Check if shorter is substring of longer
-        if shorter in longer:
-            return len(shorter) / len(longer)
-
-        # Basic character overlap
-        common_chars = sum(1 for c in shorter if c in longer)
-        return common_chars / max(len(longer), len(shorter))
-
-    async def _mark_fact_reviewed(
-        self, fact_id: str, case_context: CaseContext
-    ) -> None:
-        """Mark a fact as reviewed"""
-        collection_name = f"{case_context.case_name}_facts"
-
-        await self.vector_store.client.set_payload(
-            collection_name=collection_name,
-            payload={
-                "reviewed": True,
-                "reviewed_by": case_context.user_id,
-                "reviewed_at": datetime.utcnow().isoformat(),
-            },
-            points=[fact_id],
-        )
-
-    async def _change_fact_category(
-        self, fact_id: str, new_category: FactCategory, case_context: CaseContext
-    ) -> None:
-        """Change the category of a fact"""
-        collection_name = f"{case_context.case_name}_facts"
-
-        await self.vector_store.client.set_payload(
-            collection_name=collection_name,
-            payload={
-                "category": new_category.value,
-                "category_changed_by": case_context.user_id,
-                "category_changed_at": datetime.utcnow().isoformat(),
-            },
-            points=[fact_id],
-        )
+        return shingle_similarity(text1, text2)
 
     def _fact_to_payload(self, fact: ExtractedFactWithSource) -> Dict[str, Any]:
         """Convert fact to Qdrant payload"""
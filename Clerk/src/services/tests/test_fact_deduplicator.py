@@ -0,0 +1,172 @@
+"""
+Tests for Batch Fact Deduplication Service
+"""
+
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from src.services.fact_deduplicator import (
+    FactDeduplicator,
+    shingle_similarity,
+    text_shingles,
+)
+
+
+def unit(*components):
+    """Build a 4-dimensional embedding"""
+    return list(components) + [0.0] * (4 - len(components))
+
+
+@pytest.fixture
+def vector_store():
+    store = Mock()
+    store._get_collection_layout = AsyncMock(return_value=(False, False))
+    store.async_client.query_batch_points = AsyncMock(
+        side_effect=lambda collection_name, requests: [
+            Mock(points=[]) for _ in requests
+        ]
+    )
+    return store
+
+
+def make_deduplicator(vector_store, embeddings, **kwargs):
+    embedding_generator = Mock()
+    embedding_generator.generate_embeddings_batch_async = AsyncMock(
+        return_value=(embeddings, 10)
+    )
+    return FactDeduplicator(vector_store, embedding_generator, **kwargs)
+
+
+class TestShingleSimilarity:
+    """Test shingle-based text similarity"""
+
+    def test_normalizes_case_and_punctuation(self):
+        assert (
+            shingle_similarity(
+                "The truck ran a red light.", "the TRUCK ran a red light"
+            )
+            == 1.0
+        )
+
+    def test_near_duplicate_scores_high(self):
+        similarity = shingle_similarity(
+            "The defendant was driving 15 mph over the posted speed limit on I-95",
+            "The defendant was driving 15 mph over the posted speed limit on I-95 southbound",
+        )
+        assert similarity > 0.8
+
+    def test_unrelated_texts_score_low(self):
+        assert shingle_similarity("Apple", "Orange") == 0.0
+        assert text_shingles("back pain") == {"back", "pain", "back pain"}
+
+
+class TestFactDeduplicator:
+    """Test FactDeduplicator class"""
+
+    @pytest.mark.asyncio
+    async def test_intra_batch_duplicates_found_before_search(self, vector_store):
+        """Test repeated candidates are removed in NumPy and never searched"""
+        contents = [
+            "Plaintiff was treated for a herniated disc on March 3, 2023",
+            "Plaintiff was treated for a herniated disc on March 3, 2023.",
+            "The trailer brakes were last inspected in 2021",
+        ]
+        deduplicator = make_deduplicator(
+            vector_store, [unit(1.0), unit(0.99, 0.05), unit(0.0, 1.0)]
+        )
+
+        result = await deduplicator.find_duplicates(
+            contents, "Smith_v_Jones_facts", ids=["f1", "f2", "f3"]
+        )
+
+        assert result.duplicate_of == [None, "f1", None]
+        assert result.unique_indices == [0, 2]
+
+        # One batched search, only for the unique candidates
+        vector_store.async_client.query_batch_points.assert_awaited_once()
+        requests = vector_store.async_client.query_batch_points.call_args.kwargs[
+            "requests"
+        ]
+        assert len(requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_block_comparison_spans_blocks(self, vector_store):
+        """Test duplicates are found across row blocks"""
+        contents = [
+            "Plaintiff was treated for a herniated disc on March 3, 2023",
+            "The trailer brakes were last inspected in 2021",
+            "Medical bills total $48,000",
+            "Plaintiff was treated for a herniated disc on March 3, 2023.",
+            "The trailer brakes were last inspected in 2021.",
+        ]
+        embeddings = [
+            unit(1.0),
+            unit(0.0, 1.0),
+            unit(0.0, 0.0, 1.0),
+            unit(0.99, 0.05),
+            unit(0.05, 0.99),
+        ]
+        deduplicator = make_deduplicator(vector_store, embeddings, block_size=2)
+
+        result = await deduplicator.find_duplicates(
+            contents, "Smith_v_Jones_facts", ids=["f1", "f2", "f3", "f4", "f5"]
+        )
+
+        assert result.duplicate_of == [None, None, None, "f1", "f2"]
+
+    @pytest.mark.asyncio
+    async def test_named_vector_collections_search_semantic(self, vector_store):
+        """Test hybrid fact collections are searched on the semantic vector"""
+        vector_store._get_collection_layout = AsyncMock(return_value=(True, False))
+        deduplicator = make_deduplicator(vector_store, [unit(1.0)])
+
+        await deduplicator.find_duplicates(["A fact"], "Smith_v_Jones_facts")
+
+        requests = vector_store.async_client.query_batch_points.call_args.kwargs[
+            "requests"
+        ]
+        assert requests[0].using == "semantic"
+
+    @pytest.mark.asyncio
+    async def test_similar_vectors_with_different_text_are_kept(self, vector_store):
+        """Test the text check rejects vector-only matches"""
+        deduplicator = make_deduplicator(vector_store, [unit(1.0), unit(1.0)])
+
+        result = await deduplicator.find_duplicates(
+            ["Driver logs show 14 hours on duty", "Medical bills total $48,000"],
+            "Smith_v_Jones_facts",
+        )
+
+        assert result.is_duplicate == [False, False]
+
+    @pytest.mark.asyncio
+    async def test_stored_duplicates_detected(self, vector_store):
+        """Test candidates matching stored facts report the stored ID"""
+        stored = Mock(
+            id="point-1",
+            score=0.97,
+            payload={"id": "fact-9", "content": "The truck ran a red light"},
+        )
+        vector_store.async_client.query_batch_points = AsyncMock(
+            return_value=[Mock(points=[stored]), Mock(points=[])]
+        )
+        deduplicator = make_deduplicator(vector_store, [unit(1.0), unit(0.0, 1.0)])
+
+        result = await deduplicator.find_duplicates(
+            ["The truck ran a red light.", "It was raining"], "Smith_v_Jones_facts"
+        )
+
+        assert result.duplicate_of == ["fact-9", None]
+
+    @pytest.mark.asyncio
+    async def test_search_failure_keeps_candidates(self, vector_store):
+        """Test a failed search does not block fact creation"""
+        vector_store.async_client.query_batch_points = AsyncMock(
+            side_effect=RuntimeError("down")
+        )
+        deduplicator = make_deduplicator(vector_store, [unit(1.0)])
+
+        result = await deduplicator.find_duplicates(["A fact"], "Smith_v_Jones_facts")
+
+        assert result.is_duplicate == [False]
+        assert result.embeddings == [unit(1.0)]
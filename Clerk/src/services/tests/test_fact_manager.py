@@ -30,14 +30,22 @@ def mock_dependencies():
         patch("src.services.fact_manager.CaseManager") as mock_case_manager,
     ):
         # Configure mocks
+        # The sync client must never be awaited; Qdrant calls go through async_client
         mock_qdrant_instance = Mock()
-        mock_qdrant_instance.client = AsyncMock()
+        mock_qdrant_instance.client = Mock()
+        mock_qdrant_instance.async_client = AsyncMock()
+        mock_qdrant_instance._get_collection_layout = AsyncMock(
+            return_value=(False, False)
+        )
         mock_qdrant.return_value = mock_qdrant_instance
 
         mock_embedding_instance = Mock()
         mock_embedding_instance.generate_embedding = AsyncMock(
             return_value=np.array([0.1] * 1536)
         )
+        mock_embedding_instance.generate_embeddings_batch_async = AsyncMock(
+            side_effect=lambda texts: ([[0.1] * 1536 for _ in texts], 10)
+        )
         mock_embedding.return_value = mock_embedding_instance
 
         mock_case_manager_instance = Mock()
@@ -50,6 +58,12 @@ def mock_dependencies():
         }
 
 
+@pytest.fixture
+def bulk_client(mock_dependencies):
+    """Async Qdrant client used by the bulk operations"""
+    return mock_dependencies["qdrant"].async_client
+
+
 @pytest.fixture
 def sample_fact():
     """Create a sample fact for testing"""
@@ -62,7 +76,9 @@ def sample_fact():
         bates_number="DEF00042",
     )
 
-    return ExtractedFactWithSource(
+    # ExtractedFactWithSource inherits the CaseFact dataclass __init__, so the
+    # source and tracking fields are set after construction
+    fact = ExtractedFactWithSource(
         id="fact-" + str(uuid.uuid4()),
         case_name="Smith_v_Jones_2024",
         content="Patient was treated for severe back pain on January 15, 2024",
@@ -71,9 +87,19 @@ def sample_fact():
         page_references=[42],
         extraction_timestamp=datetime.utcnow(),
         confidence_score=0.95,
-        source=source,
         entities={EntityType.DATE: ["January 15, 2024"]},
     )
+    fact.source = source
+    fact.is_edited = False
+    fact.edit_history = []
+    fact.is_deleted = False
+    fact.deleted_at = None
+    fact.deleted_by = None
+    fact.reviewed = False
+    fact.reviewed_by = None
+    fact.reviewed_at = None
+    fact.review_notes = None
+    return fact
 
 
 @pytest.fixture
@@ -82,6 +108,7 @@ def case_context():
     return CaseContext(
         case_id="case-123",
         case_name="Smith_v_Jones_2024",
+        law_firm_id="firm-789",
         user_id="user-456",
         permissions=["read", "write"],
     )
@@ -98,21 +125,24 @@ class TestFactManager:
         fact_manager = FactManager()
 
         # Configure mocks
-        mock_dependencies["qdrant"].client.search.return_value = []  # No duplicates
-        mock_dependencies["qdrant"].client.upsert.return_value = None
+        # No duplicates
+        mock_dependencies["qdrant"].async_client.query_batch_points.return_value = [
+            Mock(points=[])
+        ]
+        mock_dependencies["qdrant"].async_client.upsert.return_value = None
 
         # Create fact
         result = await fact_manager.create_fact(sample_fact, case_context)
 
         # Verify
         assert result == sample_fact
-        mock_dependencies["embedding"].generate_embedding.assert_called_once_with(
-            sample_fact.content
-        )
-        mock_dependencies["qdrant"].client.upsert.assert_called_once()
+        mock_dependencies[
+            "embedding"
+        ].generate_embeddings_batch_async.assert_called_once_with([sample_fact.content])
+        mock_dependencies["qdrant"].async_client.upsert.assert_called_once()
 
         # Check collection name
-        call_args = mock_dependencies["qdrant"].client.upsert.call_args
+        call_args = mock_dependencies["qdrant"].async_client.upsert.call_args
         assert call_args[1]["collection_name"] == "Smith_v_Jones_2024_facts"
 
     @pytest.mark.asyncio
@@ -125,15 +155,17 @@ class TestFactManager:
         # Configure mock to return similar fact
         similar_result = Mock()
         similar_result.score = 0.95
-        similar_result.payload = {"content": sample_fact.content}
-        mock_dependencies["qdrant"].client.search.return_value = [similar_result]
+        similar_result.payload = {"id": "fact-existing", "content": sample_fact.content}
+        mock_dependencies["qdrant"].async_client.query_batch_points.return_value = [
+            Mock(points=[similar_result])
+        ]
 
         # Create fact
         result = await fact_manager.create_fact(sample_fact, case_context)
 
         # Should return None for duplicate
         assert result is None
-        mock_dependencies["qdrant"].client.upsert.assert_not_called()
+        mock_dependencies["qdrant"].async_client.upsert.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_create_fact_case_mismatch(
@@ -162,8 +194,10 @@ class TestFactManager:
             "content": "Original content",
             "edit_history": [],
         }
-        mock_dependencies["qdrant"].client.retrieve.return_value = [existing_point]
-        mock_dependencies["qdrant"].client.upsert.return_value = None
+        mock_dependencies["qdrant"].async_client.retrieve.return_value = [
+            existing_point
+        ]
+        mock_dependencies["qdrant"].async_client.upsert.return_value = None
 
         # Update request
         update_request = FactUpdateRequest(
@@ -178,10 +212,10 @@ class TestFactManager:
         mock_dependencies["embedding"].generate_embedding.assert_called_with(
             "Updated content"
         )
-        mock_dependencies["qdrant"].client.upsert.assert_called_once()
+        mock_dependencies["qdrant"].async_client.upsert.assert_called_once()
 
         # Check updated payload
-        call_args = mock_dependencies["qdrant"].client.upsert.call_args
+        call_args = mock_dependencies["qdrant"].async_client.upsert.call_args
         points = call_args[1]["points"]
         assert points[0].payload["content"] == "Updated content"
         assert points[0].payload["is_edited"] is True
@@ -193,7 +227,7 @@ class TestFactManager:
         fact_manager = FactManager()
 
         # Configure mock to return no facts
-        mock_dependencies["qdrant"].client.retrieve.return_value = []
+        mock_dependencies["qdrant"].async_client.retrieve.return_value = []
 
         update_request = FactUpdateRequest(
             fact_id="non-existent", new_content="Updated content"
@@ -212,8 +246,10 @@ class TestFactManager:
         # Configure mock
         existing_point = Mock()
         existing_point.payload = {"id": fact_id, "content": "Fact content"}
-        mock_dependencies["qdrant"].client.retrieve.return_value = [existing_point]
-        mock_dependencies["qdrant"].client.set_payload.return_value = None
+        mock_dependencies["qdrant"].async_client.retrieve.return_value = [
+            existing_point
+        ]
+        mock_dependencies["qdrant"].async_client.set_payload.return_value = None
 
         # Delete request
         delete_request = FactDeleteRequest(
@@ -225,10 +261,10 @@ class TestFactManager:
 
         # Verify
         assert result is True
-        mock_dependencies["qdrant"].client.set_payload.assert_called_once()
+        mock_dependencies["qdrant"].async_client.set_payload.assert_called_once()
 
         # Check payload update
-        call_args = mock_dependencies["qdrant"].client.set_payload.call_args
+        call_args = mock_dependencies["qdrant"].async_client.set_payload.call_args
         payload = call_args[1]["payload"]
         assert payload["is_deleted"] is True
         assert payload["deleted_by"] == case_context.user_id
@@ -261,7 +297,7 @@ class TestFactManager:
             },
             "is_deleted": False,
         }
-        mock_dependencies["qdrant"].client.retrieve.return_value = [point]
+        mock_dependencies["qdrant"].async_client.retrieve.return_value = [point]
 
         # Get fact
         result = await fact_manager.get_fact(fact_id, case_context)
@@ -279,7 +315,7 @@ class TestFactManager:
         # Configure mock with deleted fact
         point = Mock()
         point.payload = {"id": "fact-123", "is_deleted": True}
-        mock_dependencies["qdrant"].client.retrieve.return_value = [point]
+        mock_dependencies["qdrant"].async_client.retrieve.return_value = [point]
 
         # Get fact
         result = await fact_manager.get_fact("fact-123", case_context)
@@ -312,7 +348,7 @@ class TestFactManager:
                 "text_snippet": "text",
             },
         }
-        mock_dependencies["qdrant"].client.search.return_value = [result_point]
+        mock_dependencies["qdrant"].async_client.search.return_value = [result_point]
 
         # Search filter
         search_filter = FactSearchFilter(
@@ -333,12 +369,16 @@ class TestFactManager:
         )
 
     @pytest.mark.asyncio
-    async def test_bulk_update_mark_reviewed(self, mock_dependencies, case_context):
+    async def test_bulk_update_mark_reviewed(self, bulk_client, case_context):
         """Test bulk marking facts as reviewed"""
         fact_manager = FactManager()
 
         # Configure mock
-        mock_dependencies["qdrant"].client.set_payload.return_value = None
+        bulk_client.retrieve.return_value = [
+            Mock(id="fact-1", payload={}),
+            Mock(id="fact-2", payload={}),
+            Mock(id="fact-3", payload={}),
+        ]
 
         # Bulk request
         bulk_request = FactBulkUpdateRequest(
@@ -350,7 +390,77 @@ class TestFactManager:
 
         # Verify
         assert all(results.values())  # All should succeed
-        assert mock_dependencies["qdrant"].client.set_payload.call_count == 3
+        client = bulk_client
+        assert client.retrieve.call_count == 1
+        assert client.batch_update_points.call_count == 1
+        client.set_payload.assert_not_called()
+
+        operations = client.batch_update_points.call_args.kwargs["update_operations"]
+        assert operations[0].set_payload.points == ["fact-1", "fact-2", "fact-3"]
+        assert operations[0].set_payload.payload["reviewed_by"] == "user-456"
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_chunks_and_reports_missing(
+        self, bulk_client, case_context
+    ):
+        """Test large bulk deletes are chunked and report missing facts"""
+        fact_manager = FactManager()
+        fact_manager.bulk_chunk_size = 2
+
+        existing = {"fact-1", "fact-2", "fact-4"}
+        bulk_client.retrieve.side_effect = lambda collection_name, ids, **kwargs: [
+            Mock(id=fact_id, payload={"is_deleted": fact_id == "fact-4"})
+            for fact_id in ids
+            if fact_id in existing
+        ]
+
+        bulk_request = FactBulkUpdateRequest(
+            fact_ids=["fact-1", "fact-2", "fact-3", "fact-4", "fact-5"],
+            action="delete",
+            reason="duplicate",
+        )
+
+        with patch("src.services.fact_manager.get_materialized_view_manager") as views:
+            results = await fact_manager.bulk_update_facts(bulk_request, case_context)
+
+        assert results == {
+            "fact-1": True,
+            "fact-2": True,
+            "fact-3": False,
+            "fact-4": True,
+            "fact-5": False,
+        }
+
+        # fact-4 was already soft-deleted, so the fact count drops by two
+        views.return_value.record_fact_count_change.assert_called_once_with(
+            case_context.case_name, -2
+        )
+
+        client = bulk_client
+        assert client.retrieve.call_count == 3
+        assert client.batch_update_points.call_count == 1
+
+        operations = client.batch_update_points.call_args.kwargs["update_operations"]
+        assert [op.set_payload.points for op in operations] == [
+            ["fact-1", "fact-2"],
+            ["fact-4"],
+        ]
+        assert operations[0].set_payload.payload["is_deleted"] is True
+        assert operations[0].set_payload.payload["delete_reason"] == "duplicate"
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_invalid_action(self, bulk_client, case_context):
+        """Test unsupported bulk actions touch nothing"""
+        fact_manager = FactManager()
+
+        bulk_request = FactBulkUpdateRequest(
+            fact_ids=["fact-1"], action="change_category"
+        )
+
+        results = await fact_manager.bulk_update_facts(bulk_request, case_context)
+
+        assert results == {"fact-1": False}
+        bulk_client.batch_update_points.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_text_similarity_calculation(self, mock_dependencies):
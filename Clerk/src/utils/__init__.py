@@ -2,7 +2,10 @@
 Utility modules for Clerk legal AI system.
 """
 
+from importlib.util import find_spec
+
 from .cost_tracker import CostTracker, TokenUsage, DocumentCost
+from .lazy_imports import lazy_exports
 from .logger import setup_logging, get_logger, QueryLogger
 
 __all__ = [
@@ -14,10 +17,10 @@ __all__ = [
     "QueryLogger",
 ]
 
-# Optional Excel reporting (requires pandas)
-try:
-    from .cost_report_excel import ExcelCostReporter
-
+# Optional Excel reporting (requires pandas), imported on first use
+_exports = {}
+if find_spec("pandas") is not None:
+    _exports["ExcelCostReporter"] = ".cost_report_excel"
     __all__.append("ExcelCostReporter")
-except ImportError:
-    pass
+
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
@@ -0,0 +1,101 @@
+"""
+Long-lived background event loop for running async work from sync code.
+Replaces creating and closing a new event loop for every call, so async
+clients, semaphores and caches bound to the loop survive across calls.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class BackgroundLoop:
+    """
+    An asyncio event loop running forever in a daemon thread.
+
+    Sync callers submit coroutines with run(), which blocks until the result
+    is ready. Coroutines from any number of threads share the same loop, so
+    objects created on it (AsyncOpenAI clients, asyncio locks) stay usable.
+    """
+
+    def __init__(self, name: str = "clerk-background-loop"):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running loop, started on first use"""
+        with self._lock:
+            if self._loop is None or not self._thread.is_alive():
+                self._start()
+            return self._loop
+
+    def run(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """
+        Run a coroutine on the background loop and wait for its result.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait before cancelling it
+
+        Returns:
+            The coroutine's result; its exception is re-raised here
+        """
+        loop = self.loop
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError(
+                "BackgroundLoop.run() called from its own loop; await the "
+                "coroutine instead"
+            )
+
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def stop(self):
+        """Stop the loop and wait for its thread to finish"""
+        with self._lock:
+            if self._loop is None:
+                return
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        if not loop.is_running():
+            loop.close()
+
+    def _start(self):
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def run_forever():
+            asyncio.set_event_loop(loop)
+            loop.call_soon(ready.set)
+            loop.run_forever()
+
+        thread = threading.Thread(target=run_forever, name=self.name, daemon=True)
+        thread.start()
+        ready.wait()
+
+        self._loop, self._thread = loop, thread
+        logger.debug(f"Started background event loop {self.name}")
+
+
+# Shared loop for sync pipelines such as the document injectors
+_background_loop = BackgroundLoop()
+
+
+def get_background_loop() -> BackgroundLoop:
+    """Return the shared background loop"""
+    return _background_loop
@@ -0,0 +1,717 @@
+"""
+Shared cache backend for the motion drafting caches
+Bounded in-process LRU with optional spill to local disk or Redis so that
+entries written by one worker are visible to the others
+"""
+
+import asyncio
+import hashlib
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+try:
+    import redis.asyncio as redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    redis = None
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def estimate_size(value: Any) -> int:
+    """Estimate the in-memory size of a value in bytes
+
+    Walks containers once instead of serializing the whole value, so it is
+    cheap enough to call on every write.
+    """
+    seen = set()
+    stack = [value]
+    total = 0
+
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+
+        if isinstance(obj, (str, bytes, bytearray)):
+            total += len(obj)
+            continue
+
+        total += sys.getsizeof(obj, 64)
+
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, "__dict__"):
+            stack.append(vars(obj))
+
+    return total
+
+
+@dataclass
+class CacheEntry:
+    """Single cache entry with metadata"""
+
+    key: str
+    value: Any
+    created_at: datetime
+    accessed_at: datetime
+    access_count: int = 0
+    size_bytes: int = 0
+    ttl_seconds: int = 3600
+    tags: List[str] = field(default_factory=list)
+
+    def is_expired(self) -> bool:
+        """Check if cache entry has expired"""
+        return (datetime.utcnow() - self.created_at).total_seconds() > self.ttl_seconds
+
+    def remaining_ttl(self) -> int:
+        """Seconds until the entry expires"""
+        age = (datetime.utcnow() - self.created_at).total_seconds()
+        return max(int(self.ttl_seconds - age), 0)
+
+    def touch(self):
+        """Update access time and count"""
+        self.accessed_at = datetime.utcnow()
+        self.access_count += 1
+
+
+class LRUCache:
+    """Size-bounded LRU of cache entries
+
+    Entries are kept in an OrderedDict in access order, so lookups, inserts
+    and evictions are O(1). The total size is updated incrementally on every
+    insert and removal rather than recomputed.
+    """
+
+    def __init__(
+        self,
+        max_size_bytes: int,
+        max_entries: Optional[int] = None,
+        on_evict: Optional[Callable[[CacheEntry], None]] = None,
+    ):
+        self.max_size_bytes = max_size_bytes
+        self.max_entries = max_entries
+        self.on_evict = on_evict
+        self.current_size_bytes = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Get a live entry and mark it most recently used"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if entry.is_expired():
+            self.remove(key)
+            return None
+
+        self._entries.move_to_end(key)
+        entry.touch()
+        return entry
+
+    def put(self, entry: CacheEntry) -> List[str]:
+        """Insert or replace an entry, evicting LRU entries to make room
+
+        Returns:
+            Keys evicted to make room
+        """
+        self.remove(entry.key)
+
+        evicted = []
+        while self._entries and self._over_capacity(entry.size_bytes):
+            key, old = self._entries.popitem(last=False)
+            self.current_size_bytes -= old.size_bytes
+            self.evictions += 1
+            evicted.append(key)
+            if self.on_evict is not None:
+                self.on_evict(old)
+
+        if entry.size_bytes > self.max_size_bytes:
+            logger.warning(
+                f"Cache entry {entry.key[:8]}... ({entry.size_bytes} bytes) "
+                f"exceeds the {self.max_size_bytes} byte limit, not cached in memory"
+            )
+            return evicted
+
+        self._entries[entry.key] = entry
+        self.current_size_bytes += entry.size_bytes
+        return evicted
+
+    def _over_capacity(self, incoming_bytes: int) -> bool:
+        if self.current_size_bytes + incoming_bytes > self.max_size_bytes:
+            return True
+        return self.max_entries is not None and len(self._entries) >= self.max_entries
+
+    def remove(self, key: str) -> Optional[CacheEntry]:
+        """Remove an entry if present"""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.current_size_bytes -= entry.size_bytes
+        return entry
+
+    def purge_expired(self) -> List[str]:
+        """Remove all expired entries"""
+        expired = [key for key, entry in self._entries.items() if entry.is_expired()]
+        for key in expired:
+            self.remove(key)
+        return expired
+
+    def keys_with_tags(self, tags: List[str]) -> List[str]:
+        """Keys of entries carrying any of the tags"""
+        wanted = set(tags)
+        return [
+            key
+            for key, entry in self._entries.items()
+            if wanted.intersection(entry.tags)
+        ]
+
+    def entries(self) -> Iterator[CacheEntry]:
+        """Iterate entries from least to most recently used"""
+        return iter(list(self._entries.values()))
+
+    def clear(self):
+        """Remove all entries"""
+        self._entries.clear()
+        self.current_size_bytes = 0
+
+
+class SpillStore(ABC):
+    """Second cache tier shared between processes"""
+
+    name = "none"
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get a stored payload, None if missing or expired"""
+
+    @abstractmethod
+    async def set(self, key: str, payload: bytes, ttl_seconds: int, tags: List[str]):
+        """Store a payload for ttl_seconds under the given tags"""
+
+    @abstractmethod
+    async def delete(self, key: str):
+        """Remove a payload if present"""
+
+    @abstractmethod
+    async def invalidate_tags(self, tags: List[str]) -> int:
+        """Remove payloads carrying any of the tags, returns how many"""
+
+    @abstractmethod
+    async def clear(self):
+        """Remove all payloads"""
+
+
+class DiskSpillStore(SpillStore):
+    """Spill store backed by one pickle file per entry in a local directory
+
+    Suitable for several workers on the same host. Writes go through a
+    temporary file and os.replace so readers never see a partial entry.
+    Each file's mtime is set to the entry's expiry time. Tags are kept as
+    directories of marker files named after the entries they tag, so
+    invalidation does not read the entries. Expired files are swept
+    periodically, and once the directory grows past max_size_bytes the
+    entries closest to expiry are removed first.
+    """
+
+    name = "disk"
+
+    def __init__(
+        self,
+        directory: str,
+        namespace: str,
+        max_size_bytes: int = 1024 * 1024 * 1024,
+        sweep_interval: int = 60,
+    ):
+        self.directory = Path(directory) / namespace
+        self.tag_directory = self.directory / "tags"
+        self.tag_directory.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_bytes
+        self.sweep_interval = sweep_interval
+
+        # Size found by the last sweep plus bytes written since
+        self._size_bytes = 0
+        self._last_sweep = 0.0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.pkl"
+
+    def _tag_path(self, tag: str) -> Path:
+        return self.tag_directory / hashlib.sha256(tag.encode()).hexdigest()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+
+        def read() -> Optional[bytes]:
+            try:
+                if path.stat().st_mtime < time.time():
+                    path.unlink(missing_ok=True)
+                    return None
+                return path.read_bytes()
+            except FileNotFoundError:
+                return None
+
+        return await asyncio.to_thread(read)
+
+    async def set(self, key: str, payload: bytes, ttl_seconds: int, tags: List[str]):
+        path = self._path(key)
+        expires_at = time.time() + max(ttl_seconds, 1)
+
+        def write():
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.utime(tmp, (expires_at, expires_at))
+            os.replace(tmp, path)
+
+            for tag in tags:
+                marker = self._tag_path(tag) / path.stem
+                try:
+                    marker.touch()
+                except FileNotFoundError:
+                    marker.parent.mkdir(exist_ok=True)
+                    marker.touch()
+
+        await asyncio.to_thread(write)
+
+        self._size_bytes += len(payload)
+        if (
+            self._size_bytes > self.max_size_bytes
+            or time.monotonic() - self._last_sweep > self.sweep_interval
+        ):
+            await self.sweep()
+
+    async def delete(self, key: str):
+        await asyncio.to_thread(self._path(key).unlink, missing_ok=True)
+
+    async def invalidate_tags(self, tags: List[str]) -> int:
+        def remove() -> int:
+            removed = 0
+            for tag in tags:
+                tag_path = self._tag_path(tag)
+                try:
+                    markers = list(tag_path.iterdir())
+                except FileNotFoundError:
+                    continue
+
+                for marker in markers:
+                    try:
+                        (self.directory / f"{marker.name}.pkl").unlink()
+                        removed += 1
+                    except FileNotFoundError:
+                        pass
+                    marker.unlink(missing_ok=True)
+                self._remove_empty(tag_path)
+            return removed
+
+        return await asyncio.to_thread(remove)
+
+    async def sweep(self) -> int:
+        """Remove expired entries, then the soonest to expire over the size cap
+
+        Returns:
+            Number of entries removed
+        """
+        self._last_sweep = time.monotonic()
+
+        def run():
+            now = time.time()
+            removed = 0
+            live = []
+            for path in self.directory.glob("*.pkl"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                if stat.st_mtime < now:
+                    path.unlink(missing_ok=True)
+                    removed += 1
+                else:
+                    live.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in live)
+            for _, size, path in sorted(live):
+                if total <= self.max_size_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                removed += 1
+
+            # Drop tag markers of entries that are gone
+            for tag_path in self.tag_directory.iterdir():
+                try:
+                    markers = list(tag_path.iterdir())
+                except FileNotFoundError:
+                    continue
+                for marker in markers:
+                    if not (self.directory / f"{marker.name}.pkl").exists():
+                        marker.unlink(missing_ok=True)
+                self._remove_empty(tag_path)
+
+            return removed, total
+
+        removed, self._size_bytes = await asyncio.to_thread(run)
+        if removed:
+            logger.debug(f"Swept {removed} spilled entries from {self.directory}")
+        return removed
+
+    @staticmethod
+    def _remove_empty(directory: Path):
+        try:
+            directory.rmdir()
+        except OSError:
+            pass
+
+    async def clear(self):
+        def remove_all():
+            for path in self.directory.glob("*.pkl"):
+                path.unlink(missing_ok=True)
+            shutil.rmtree(self.tag_directory, ignore_errors=True)
+            self.tag_directory.mkdir(exist_ok=True)
+            self._size_bytes = 0
+
+        await asyncio.to_thread(remove_all)
+
+
+class RedisSpillStore(SpillStore):
+    """Spill store backed by a Redis-compatible server
+
+    Entries expire server-side with the entry TTL. Tags are kept as Redis
+    sets of entry keys so invalidation does not scan the keyspace.
+    """
+
+    name = "redis"
+
+    def __init__(self, redis_url: str, namespace: str):
+        self.prefix = f"clerk:cache:{namespace}"
+        self.client = redis.Redis.from_url(redis_url)
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:entry:{key}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}:tag:{tag}"
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.client.get(self._key(key))
+
+    async def set(self, key: str, payload: bytes, ttl_seconds: int, tags: List[str]):
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.set(self._key(key), payload, ex=max(ttl_seconds, 1))
+            for tag in tags:
+                pipe.sadd(self._tag_key(tag), key)
+                pipe.expire(self._tag_key(tag), max(ttl_seconds, 1))
+            await pipe.execute()
+
+    async def delete(self, key: str):
+        await self.client.delete(self._key(key))
+
+    async def invalidate_tags(self, tags: List[str]) -> int:
+        keys = set()
+        for tag in tags:
+            members = await self.client.smembers(self._tag_key(tag))
+            keys.update(m.decode() if isinstance(m, bytes) else m for m in members)
+
+        if keys:
+            await self.client.delete(*(self._key(k) for k in keys))
+        await self.client.delete(*(self._tag_key(t) for t in tags))
+        return len(keys)
+
+    async def clear(self):
+        batch = []
+        async for key in self.client.scan_iter(match=f"{self.prefix}:*"):
+            batch.append(key)
+            if len(batch) >= 500:
+                await self.client.delete(*batch)
+                batch = []
+        if batch:
+            await self.client.delete(*batch)
+
+
+def create_spill_store(namespace: str) -> Optional[SpillStore]:
+    """Build the spill store configured in settings, if any
+
+    Redis is used when CACHE_REDIS_URL is set and the redis package is
+    installed, otherwise a local directory when CACHE_SPILL_DIR is set.
+    """
+    from config.settings import settings
+
+    redis_url = settings.cache.redis_url
+    if redis_url:
+        if REDIS_AVAILABLE:
+            logger.info(f"Cache '{namespace}' spilling to Redis")
+            return RedisSpillStore(redis_url, namespace)
+        logger.warning("CACHE_REDIS_URL is set but redis is not installed")
+
+    if settings.cache.spill_dir:
+        logger.info(f"Cache '{namespace}' spilling to {settings.cache.spill_dir}")
+        return DiskSpillStore(
+            settings.cache.spill_dir,
+            namespace,
+            max_size_bytes=settings.cache.spill_max_mb * 1024 * 1024,
+        )
+
+    return None
+
+
+class SharedCache:
+    """In-process LRU in front of an optional shared spill store
+
+    With write_through, writes go to both tiers so a value cached by one
+    worker is visible to every worker sharing the store. Otherwise values are
+    pickled and spilled only when they are evicted from memory. Reads are
+    served from memory and fall back to the spill store, promoting what they
+    find. Spill failures are logged and never fail the caller.
+    """
+
+    def __init__(
+        self,
+        max_size_bytes: int,
+        default_ttl: int = 3600,
+        max_entries: Optional[int] = None,
+        spill_store: Optional[SpillStore] = None,
+        write_through: bool = True,
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            max_size_bytes: Memory budget for the in-process tier
+            default_ttl: Default time-to-live in seconds
+            max_entries: Optional cap on the number of in-memory entries
+            spill_store: Optional shared second tier
+            write_through: Spill every write instead of only evicted entries
+        """
+        self.default_ttl = default_ttl
+        self.spill_store = spill_store
+        self.write_through = spill_store is not None and write_through
+
+        # Entries evicted from memory and waiting to be spilled
+        self._evicted: List[CacheEntry] = []
+        spill_evicted = spill_store is not None and not write_through
+        self.memory = LRUCache(
+            max_size_bytes,
+            max_entries,
+            on_evict=self._evicted.append if spill_evicted else None,
+        )
+
+        self.hits = 0
+        self.misses = 0
+        self.spill_hits = 0
+        self.spill_errors = 0
+
+    @property
+    def current_size_bytes(self) -> int:
+        return self.memory.current_size_bytes
+
+    @property
+    def evictions(self) -> int:
+        return self.memory.evictions
+
+    def __len__(self) -> int:
+        return len(self.memory)
+
+    async def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Get a live entry from memory or the spill store"""
+        entry = self.memory.get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry
+
+        entry = await self._load_spilled(key)
+        if entry is not None:
+            self.hits += 1
+            self.spill_hits += 1
+            entry.touch()
+            self.memory.put(entry)
+            await self._spill_evicted()
+            return entry
+
+        self.misses += 1
+        return None
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a cached value"""
+        entry = await self.get_entry(key)
+        return entry.value if entry is not None else None
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        tags: Optional[List[str]] = None,
+        size_bytes: Optional[int] = None,
+    ) -> CacheEntry:
+        """Cache a value in memory and the spill store
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time-to-live in seconds, defaults to the cache default
+            tags: Tags for group invalidation
+            size_bytes: Known size of the value, skips estimation
+        """
+        now = datetime.utcnow()
+        entry = CacheEntry(
+            key=key,
+            value=value,
+            created_at=now,
+            accessed_at=now,
+            ttl_seconds=ttl or self.default_ttl,
+            tags=tags or [],
+        )
+
+        payload = self._pickle(entry) if self.write_through else None
+
+        if size_bytes is not None:
+            entry.size_bytes = size_bytes
+        elif payload is not None:
+            entry.size_bytes = len(payload)
+        else:
+            entry.size_bytes = estimate_size(value)
+
+        self.memory.put(entry)
+
+        if payload is not None:
+            await self._spill(
+                "set", self.spill_store.set, key, payload, entry.ttl_seconds, entry.tags
+            )
+        elif self.spill_store is not None and key not in self.memory:
+            # Too large for memory, keep it in the spill store only
+            self._evicted.append(entry)
+        await self._spill_evicted()
+
+        return entry
+
+    async def delete(self, key: str):
+        """Remove an entry from both tiers"""
+        self.memory.remove(key)
+        if self.spill_store is not None:
+            await self._spill("delete", self.spill_store.delete, key)
+
+    async def invalidate_by_tags(self, tags: List[str]) -> int:
+        """Remove all entries carrying any of the tags"""
+        keys = self.memory.keys_with_tags(tags)
+        for key in keys:
+            self.memory.remove(key)
+
+        if self.spill_store is not None:
+            spilled = await self._spill(
+                "invalidate", self.spill_store.invalidate_tags, tags
+            )
+            return max(len(keys), spilled or 0)
+
+        return len(keys)
+
+    def purge_expired(self) -> List[str]:
+        """Drop expired entries from memory"""
+        return self.memory.purge_expired()
+
+    def entries(self) -> Iterator[CacheEntry]:
+        """Iterate in-memory entries"""
+        return self.memory.entries()
+
+    async def clear(self):
+        """Clear both tiers"""
+        self.memory.clear()
+        if self.spill_store is not None:
+            await self._spill("clear", self.spill_store.clear)
+
+    async def _load_spilled(self, key: str) -> Optional[CacheEntry]:
+        if self.spill_store is None:
+            return None
+
+        payload = await self._spill("get", self.spill_store.get, key)
+        if not payload:
+            return None
+
+        try:
+            entry = pickle.loads(payload)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable spilled entry {key[:8]}...: {e}")
+            await self._spill("delete", self.spill_store.delete, key)
+            return None
+
+        if entry.is_expired():
+            await self._spill("delete", self.spill_store.delete, key)
+            return None
+
+        entry.size_bytes = len(payload)
+        return entry
+
+    def _pickle(self, entry: CacheEntry) -> Optional[bytes]:
+        try:
+            return pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.warning(f"Cannot spill cache entry {entry.key[:8]}...: {e}")
+            return None
+
+    async def _spill_evicted(self):
+        """Spill entries evicted from memory since the last call"""
+        if not self._evicted:
+            return
+
+        evicted = list(self._evicted)
+        self._evicted.clear()
+        for entry in evicted:
+            if entry.is_expired():
+                continue
+            payload = self._pickle(entry)
+            if payload is not None:
+                await self._spill(
+                    "set",
+                    self.spill_store.set,
+                    entry.key,
+                    payload,
+                    entry.remaining_ttl(),
+                    entry.tags,
+                )
+
+    async def _spill(self, operation: str, func, *args):
+        try:
+            return await func(*args)
+        except Exception as e:
+            self.spill_errors += 1
+            logger.warning(f"{self.spill_store.name} spill {operation} failed: {e}")
+            return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        total_requests = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "spill_hits": self.spill_hits,
+            "spill_errors": self.spill_errors,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total_requests if total_requests > 0 else 0,
+            "entries": len(self.memory),
+            "size_bytes": self.current_size_bytes,
+            "size_mb": self.current_size_bytes / (1024 * 1024),
+            "spill_backend": self.spill_store.name if self.spill_store else None,
+        }
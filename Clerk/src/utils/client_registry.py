@@ -0,0 +1,249 @@
+"""
+Process-wide registry of pooled service clients.
+Builds each Qdrant, OpenAI, Cohere and Box client once, with the pool limits
+from settings.client_pool, and hands the same instance to every component,
+so components created per request or per document reuse warm connections
+instead of paying for new TCP/TLS handshakes and HTTP pools.
+"""
+
+import asyncio
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, Optional
+
+import cohere
+import httpx
+import openai
+from qdrant_client import AsyncQdrantClient, QdrantClient
+
+from config.settings import settings
+from src.utils.logger import get_logger
+from src.utils.thread_pool import run_blocking
+
+logger = get_logger(__name__)
+
+
+class LoopLocalClient:
+    """
+    Proxy to one async client per event loop.
+
+    Async HTTP connections belong to the loop that opened them, so sharing a
+    single async client between the API loop, the background loop and
+    per-call loops would break. Attribute access resolves to the client of
+    the running loop, created on first use.
+    """
+
+    def __init__(self, name: str, factory: Callable[[], Any]):
+        self._name = name
+        self._factory = factory
+        self._clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+        self._loopless: Optional[Any] = None
+        self._lock = threading.Lock()
+
+    def _current(self) -> Any:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        with self._lock:
+            if loop is None:
+                if self._loopless is None:
+                    self._loopless = self._factory()
+                return self._loopless
+
+            client = self._clients.get(loop)
+            if client is None:
+                # Drop clients of loops that have since been closed
+                for closed in [other for other in self._clients if other.is_closed()]:
+                    del self._clients[closed]
+                client = self._clients[loop] = self._factory()
+                logger.debug(f"Created {self._name} client for event loop {id(loop)}")
+            return client
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._current(), name)
+
+    async def aclose(self):
+        """Close the running loop's client"""
+        with self._lock:
+            client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
+
+
+class ClientRegistry:
+    """Shared, lazily created service clients"""
+
+    def __init__(self):
+        self.config = settings.client_pool
+        self._clients: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+
+    def _shared(self, key: str, factory: Callable[[], Any]) -> Any:
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._clients[key] = factory()
+                logger.info(f"Created shared {key.split(':')[0]} client")
+            return client
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.config.max_connections,
+            max_keepalive_connections=self.config.max_keepalive_connections,
+            keepalive_expiry=self.config.keepalive_expiry,
+        )
+
+    @staticmethod
+    def qdrant_url(database_name: Optional[str] = None) -> str:
+        """Qdrant URL, with the database name appended if provided"""
+        base_url = settings.qdrant.url
+        if database_name:
+            base_url = f"{base_url.rstrip('/')}/{database_name}"
+        return base_url
+
+    def _qdrant_args(self, url: str) -> Dict[str, Any]:
+        return {
+            "url": url,
+            "api_key": settings.qdrant.api_key,
+            "prefer_grpc": settings.qdrant.prefer_grpc,
+            "timeout": settings.qdrant.timeout,
+            "check_compatibility": False,  # Skip version check for Docker/Cloud
+            "limits": self._limits(),
+        }
+
+    def qdrant_client(self, url: Optional[str] = None) -> QdrantClient:
+        """Shared sync Qdrant client for a URL"""
+        url = url or self.qdrant_url()
+        return self._shared(
+            f"qdrant:{url}", lambda: QdrantClient(**self._qdrant_args(url))
+        )
+
+    def async_qdrant_client(self, url: Optional[str] = None) -> LoopLocalClient:
+        """Shared async Qdrant client for a URL, one per event loop"""
+        url = url or self.qdrant_url()
+        return self._shared(
+            f"async_qdrant:{url}",
+            lambda: LoopLocalClient(
+                "async_qdrant", lambda: AsyncQdrantClient(**self._qdrant_args(url))
+            ),
+        )
+
+    def openai_client(self) -> openai.OpenAI:
+        """Shared sync OpenAI client"""
+        return self._shared(
+            "openai",
+            lambda: openai.OpenAI(
+                api_key=settings.openai.api_key,
+                http_client=openai.DefaultHttpxClient(limits=self._limits()),
+            ),
+        )
+
+    def async_openai_client(self) -> LoopLocalClient:
+        """Shared async OpenAI client, one per event loop"""
+        return self._shared(
+            "async_openai",
+            lambda: LoopLocalClient(
+                "async_openai",
+                lambda: openai.AsyncOpenAI(
+                    api_key=settings.openai.api_key,
+                    http_client=openai.DefaultAsyncHttpxClient(limits=self._limits()),
+                ),
+            ),
+        )
+
+    def cohere_client(self) -> Optional[cohere.Client]:
+        """Shared Cohere client, or None without an API key"""
+        if not settings.cohere.api_key:
+            return None
+        return self._shared(
+            "cohere",
+            lambda: cohere.Client(
+                settings.cohere.api_key,
+                httpx_client=httpx.Client(limits=self._limits(), timeout=300),
+            ),
+        )
+
+    def box_client(self):
+        """Shared authenticated Box client"""
+        # Import here to avoid circular dependency
+        from src.document_processing.box_client import BoxClient
+
+        return self._shared("box", BoxClient)
+
+    async def health_check(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Probe every client created so far.
+
+        Returns:
+            Status and latency per client, keyed like the registry
+        """
+        with self._lock:
+            clients = dict(self._clients)
+
+        probes = {}
+        for key, client in clients.items():
+            probe = self._health_probe(key, client)
+            if probe is not None:
+                probes[key] = probe
+        results = await asyncio.gather(
+            *(self._run_probe(probe) for probe in probes.values())
+        )
+        return dict(zip(probes, results))
+
+    def _health_probe(self, key: str, client: Any) -> Optional[Callable[[], Any]]:
+        kind = key.split(":")[0]
+        if kind == "qdrant":
+            return lambda: run_blocking(client.get_collections)
+        if kind == "async_qdrant":
+            return client.get_collections
+        if kind == "openai":
+            return lambda: run_blocking(client.models.list)
+        if kind == "async_openai":
+            return client.models.list
+        if kind == "box":
+            return lambda: run_blocking(client.check_connection)
+        return None
+
+    async def _run_probe(self, probe: Callable[[], Any]) -> Dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(
+                probe(), timeout=self.config.health_check_timeout
+            )
+            status = "unhealthy" if result is False else "healthy"
+            return {
+                "status": status,
+                "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+            }
+        except Exception as e:
+            return {"status": "unhealthy", "error": str(e) or type(e).__name__}
+
+    async def aclose(self):
+        """Close all clients; async ones are closed for the running loop"""
+        with self._lock:
+            clients, self._clients = self._clients, {}
+
+        for key, client in clients.items():
+            try:
+                if isinstance(client, LoopLocalClient):
+                    await client.aclose()
+                elif hasattr(client, "close"):
+                    client.close()
+            except Exception as e:
+                logger.warning(f"Error closing {key} client: {e}")
+
+
+_registry: Optional[ClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_client_registry() -> ClientRegistry:
+    """Return the shared client registry"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ClientRegistry()
+        return _registry
@@ -0,0 +1,392 @@
+"""
+Date-sorted index of case facts.
+Keeps (timestamp, fact) entries in order so timeline range queries are binary searches.
+"""
+
+import asyncio
+import time
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.models.fact_models import CaseFact, DateReference
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Seconds before a loaded index is re-read, picking up facts written by
+# other processes
+DATE_INDEX_TTL_SECONDS = 300
+
+# Payload fields needed to rebuild a dated fact
+INDEX_PAYLOAD_FIELDS = [
+    "fact_id",
+    "id",
+    "content",
+    "category",
+    "source_document",
+    "extraction_timestamp",
+    "confidence_score",
+    "primary_date",
+    "date_references",
+    "is_deleted",
+]
+
+
+def _timestamp(value: datetime) -> float:
+    return value.timestamp()
+
+
+def _parse_date(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def fact_from_payload(case_name: str, payload: Dict[str, Any]) -> Optional[CaseFact]:
+    """
+    Build a minimal CaseFact with its dates from a stored fact payload.
+
+    Handles payloads written by FactExtractor (fact_id, primary_date) and by
+    FactManager (id, date_references).
+
+    Returns:
+        Fact, or None for deleted or malformed payloads
+    """
+    if payload.get("is_deleted"):
+        return None
+
+    fact_id = payload.get("fact_id") or payload.get("id")
+    if not fact_id:
+        return None
+
+    date_references = []
+    for ref in payload.get("date_references") or []:
+        start_date = _parse_date(ref.get("start_date"))
+        if start_date:
+            date_references.append(
+                DateReference(
+                    date_text=ref.get("date_text", ""),
+                    start_date=start_date,
+                    end_date=_parse_date(ref.get("end_date")),
+                    is_range=ref.get("is_range", False),
+                    is_approximate=ref.get("is_approximate", False),
+                    confidence=ref.get("confidence", 1.0),
+                )
+            )
+    if not date_references:
+        primary_date = _parse_date(payload.get("primary_date"))
+        if primary_date:
+            date_references.append(DateReference(date_text="", start_date=primary_date))
+
+    return CaseFact(
+        id=str(fact_id),
+        case_name=case_name,
+        content=payload.get("content", ""),
+        category=payload.get("category", ""),
+        source_document=payload.get("source_document", ""),
+        page_references=[],
+        extraction_timestamp=_parse_date(payload.get("extraction_timestamp"))
+        or datetime.now(),
+        confidence_score=payload.get("confidence_score", 1.0),
+        date_references=date_references,
+    )
+
+
+class FactDateIndex:
+    """
+    Per-case index of dated facts.
+
+    Every date reference with a start date becomes one entry. Entries are held
+    in two parallel lists sorted by timestamp. Each change bumps a version so
+    readers can tell when their derived views are stale; each load from Qdrant
+    bumps the generation.
+    """
+
+    def __init__(self, case_name: str, ttl_seconds: float = DATE_INDEX_TTL_SECONDS):
+        """
+        Initialize an empty index.
+
+        Args:
+            case_name: Case the index belongs to
+            ttl_seconds: Age after which ensure_loaded re-reads the index
+        """
+        self.case_name = case_name
+        self.ttl_seconds = ttl_seconds
+        self.loaded = False
+        self.loaded_at = 0.0
+        self.version = 0
+        self.generation = 0
+
+        self._timestamps: List[float] = []
+        # (fact_id, position in fact.date_references), parallel to _timestamps
+        self._entries: List[Tuple[str, int]] = []
+        self._facts: Dict[str, CaseFact] = {}
+
+        self._load_lock = asyncio.Lock()
+        # Updates recorded while a load is running, replayed onto its result
+        self._pending: Optional[List[Callable[["FactDateIndex"], None]]] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, fact_id: str) -> bool:
+        return fact_id in self._facts
+
+    @property
+    def fact_count(self) -> int:
+        return len(self._facts)
+
+    @property
+    def is_stale(self) -> bool:
+        return not self.loaded or time.monotonic() - self.loaded_at >= self.ttl_seconds
+
+    def get(self, fact_id: str) -> Optional[CaseFact]:
+        return self._facts.get(fact_id)
+
+    def record(self, update: Callable[["FactDateIndex"], None]):
+        """Apply a writer's update to the loaded index and to any load in progress"""
+        if self._pending is not None:
+            self._pending.append(update)
+        # Unloaded indexes read the change from Qdrant when first used
+        if self.loaded:
+            update(self)
+
+    def upsert(self, fact: CaseFact):
+        """Add or replace a fact's entries"""
+        removed = self._remove_entries(fact.id)
+
+        dated = [
+            (position, ref)
+            for position, ref in enumerate(fact.date_references or [])
+            if ref.start_date
+        ]
+        if dated:
+            self._facts[fact.id] = fact
+            for position, ref in dated:
+                ts = _timestamp(ref.start_date)
+                i = bisect_right(self._timestamps, ts)
+                self._timestamps.insert(i, ts)
+                self._entries.insert(i, (fact.id, position))
+
+        if dated or removed:
+            self.version += 1
+
+    def set_category(self, fact_id: str, category: Any):
+        """Change the category of an indexed fact"""
+        fact = self._facts.get(fact_id)
+        if fact is not None:
+            fact.category = category
+            self.version += 1
+
+    def remove(self, fact_id: str):
+        """Drop a fact's entries"""
+        if self._remove_entries(fact_id):
+            self.version += 1
+
+    def events(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[Tuple[datetime, CaseFact, DateReference]]:
+        """
+        Return dated entries in chronological order.
+
+        Args:
+            start_date: Inclusive lower bound
+            end_date: Inclusive upper bound
+
+        Returns:
+            List of (date, fact, date reference) tuples
+        """
+        lo = (
+            0
+            if start_date is None
+            else bisect_left(self._timestamps, _timestamp(start_date))
+        )
+        hi = (
+            len(self._timestamps)
+            if end_date is None
+            else bisect_right(self._timestamps, _timestamp(end_date))
+        )
+
+        events = []
+        for fact_id, position in self._entries[lo:hi]:
+            fact = self._facts[fact_id]
+            ref = fact.date_references[position]
+            events.append((ref.start_date, fact, ref))
+        return events
+
+    async def ensure_loaded(
+        self, vector_store, collection_name: str, page_size: int = 1000
+    ):
+        """
+        Populate the index from the case's facts collection.
+
+        Reloads once the index is older than its TTL. Scrolls every page, so
+        cases with many dated facts are not truncated. Updates recorded during
+        the scroll are replayed onto the result before it replaces the
+        current entries.
+        """
+        if not self.is_stale:
+            return
+
+        async with self._load_lock:
+            if not self.is_stale:
+                return
+
+            self._pending = []
+            try:
+                fresh = await self._scan(vector_store, collection_name, page_size)
+            except Exception:
+                self._pending = None
+                if not self.loaded:
+                    raise
+                # Keep serving the previous entries; retry on the next call
+                logger.warning(
+                    f"Reloading date index for case {self.case_name} failed",
+                    exc_info=True,
+                )
+                return
+
+            for update in self._pending:
+                update(fresh)
+            self._pending = None
+
+            self._timestamps = fresh._timestamps
+            self._entries = fresh._entries
+            self._facts = fresh._facts
+            self.loaded = True
+            self.loaded_at = time.monotonic()
+            self.version += 1
+            self.generation += 1
+            logger.info(
+                f"Loaded {self.fact_count} dated facts ({len(self)} entries) into "
+                f"date index for case {self.case_name}"
+            )
+
+    async def _scan(
+        self, vector_store, collection_name: str, page_size: int
+    ) -> "FactDateIndex":
+        """Read the case's dated facts into a new index"""
+        loop = asyncio.get_running_loop()
+        # FactManager payloads carry no has_dates flag, so filter on case
+        # only and fetch just the fields the index needs
+        scroll_filter = {
+            "must": [{"key": "case_name", "match": {"value": self.case_name}}]
+        }
+
+        fresh = FactDateIndex(self.case_name)
+        offset = None
+        while True:
+            points, offset = await loop.run_in_executor(
+                None,
+                partial(
+                    vector_store.client.scroll,
+                    collection_name=collection_name,
+                    scroll_filter=scroll_filter,
+                    limit=page_size,
+                    offset=offset,
+                    with_payload=INDEX_PAYLOAD_FIELDS,
+                    with_vectors=False,
+                ),
+            )
+            for point in points:
+                fact = fact_from_payload(self.case_name, point.payload)
+                if fact and fact.id not in fresh._facts:
+                    fresh.upsert(fact)
+            if offset is None:
+                break
+        return fresh
+
+    def _remove_entries(self, fact_id: str) -> bool:
+        fact = self._facts.pop(fact_id, None)
+        if fact is None:
+            return False
+
+        for position, ref in enumerate(fact.date_references or []):
+            if not ref.start_date:
+                continue
+            ts = _timestamp(ref.start_date)
+            i = bisect_left(self._timestamps, ts)
+            while i < len(self._timestamps) and self._timestamps[i] == ts:
+                if self._entries[i] == (fact_id, position):
+                    del self._timestamps[i]
+                    del self._entries[i]
+                    break
+                i += 1
+        return True
+
+
+# Shared per-case indexes, kept current by the fact writers
+_date_indexes: Dict[str, FactDateIndex] = {}
+
+
+def get_fact_date_index(case_name: str) -> FactDateIndex:
+    """Return the shared date index for a case"""
+    index = _date_indexes.get(case_name)
+    if index is None:
+        index = _date_indexes[case_name] = FactDateIndex(case_name)
+    return index
+
+
+def _record(case_name: str, update: Callable[[FactDateIndex], None]):
+    index = _date_indexes.get(case_name)
+    if index is not None:
+        index.record(update)
+
+
+def record_fact_upserts(case_name: str, facts: List[CaseFact]):
+    """Apply created or replaced facts to the case index"""
+    facts = list(facts)
+
+    def update(index: FactDateIndex):
+        for fact in facts:
+            index.upsert(fact)
+
+    _record(case_name, update)
+
+
+def record_fact_payloads(case_name: str, payloads: List[Dict[str, Any]]):
+    """Apply stored fact payloads to the case index"""
+    changes = []
+    for payload in payloads:
+        fact = fact_from_payload(case_name, payload)
+        fact_id = payload.get("fact_id") or payload.get("id")
+        if fact is not None or fact_id:
+            changes.append((fact, str(fact_id)))
+
+    def update(index: FactDateIndex):
+        for fact, fact_id in changes:
+            if fact is not None:
+                index.upsert(fact)
+            else:
+                index.remove(fact_id)
+
+    _record(case_name, update)
+
+
+def record_fact_removals(case_name: str, fact_ids: List[str]):
+    """Drop deleted facts from the case index"""
+    fact_ids = list(fact_ids)
+
+    def update(index: FactDateIndex):
+        for fact_id in fact_ids:
+            index.remove(fact_id)
+
+    _record(case_name, update)
+
+
+def record_fact_category_changes(case_name: str, fact_ids: List[str], category: Any):
+    """Apply a category change to the case index"""
+    fact_ids = list(fact_ids)
+
+    def update(index: FactDateIndex):
+        for fact_id in fact_ids:
+            index.set_category(fact_id, category)
+
+    _record(case_name, update)
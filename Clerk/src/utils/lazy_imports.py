@@ -0,0 +1,41 @@
+"""
+Lazy package re-exports.
+Packages list their public names here instead of importing every submodule
+in __init__, so importing one module does not pull in spaCy, sklearn, the
+PDF stack and every agent. Each name is imported on first attribute access.
+"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build module-level __getattr__ and __dir__ for a package.
+
+    Args:
+        package: The package's __name__
+        exports: Public name -> ".submodule" or ".submodule:attribute" when
+            the attribute is exported under another name
+
+    Returns:
+        (__getattr__, __dir__) to assign in the package __init__
+    """
+
+    def __getattr__(name: str) -> Any:
+        target = exports.get(name)
+        if target is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module_name, _, attribute = target.partition(":")
+        module = importlib.import_module(module_name, package)
+        value = getattr(module, attribute or name)
+        # Cache on the package so later lookups skip __getattr__
+        setattr(importlib.import_module(package), name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(importlib.import_module(package))) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,435 @@
+"""
+Shared legal entity scanner.
+Holds every citation and entity pattern used during ingestion, compiled once,
+and scans each text once for all the consumers that look at it.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class EntityPattern(NamedTuple):
+    """
+    A named entity pattern.
+
+    kind is "<consumer group>.<name>". triggers are lowercase literals of which
+    at least one must occur in any match; texts without them skip the pattern.
+    """
+
+    kind: str
+    pattern: str
+    flags: int = 0
+    triggers: Tuple[str, ...] = ()
+
+
+class EntitySpan(NamedTuple):
+    """A typed match of one entity pattern"""
+
+    kind: str
+    start: int
+    end: int
+    text: str
+    groups: Tuple[Optional[str], ...]
+
+
+# Literals one of which occurs in every date: a month name or a date separator
+_DATE_TRIGGERS = ("/", "-") + tuple(
+    "jan feb mar apr may jun jul aug sep oct nov dec".split()
+)
+
+LEGAL_ENTITY_PATTERNS: List[EntityPattern] = [
+    # SparseVectorEncoder.extract_legal_entities
+    EntityPattern(
+        "sparse.citation",
+        r"(?:"
+        r"\d+\s+U\.S\.C\.\s+§\s*\d+|"  # USC citations
+        r"\d+\s+F\.\d+d\s+\d+|"  # Federal Reporter
+        r"\d+\s+S\.\s*Ct\.\s+\d+|"  # Supreme Court Reporter
+        r"§\s*\d+(?:\.\d+)?|"  # Section references
+        r"Rule\s+\d+(?:\.\d+)?|"  # Rule references
+        r"\d+\s+[A-Z][a-z]+(?:\.\s*\d+d)?\s+\d+"  # State reporters
+        r")",
+    ),
+    EntityPattern(
+        "sparse.monetary",
+        r"\$[\d,]+(?:\.\d{2})?(?:\s*(?:million|billion|thousand|k|m|b))?",
+        triggers=("$",),
+    ),
+    EntityPattern(
+        "sparse.date",
+        r"(?:"
+        r"\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{1,2},?\s+\d{4}|"
+        r"\b\d{1,2}[-/]\d{1,2}[-/]\d{2,4}|"
+        r"\b\d{4}[-/]\d{1,2}[-/]\d{1,2}"
+        r")",
+        triggers=_DATE_TRIGGERS,
+    ),
+    EntityPattern("sparse.section", r"§\s*\d+(?:\.\d+)?", triggers=("§",)),
+    EntityPattern(
+        "sparse.rule", r"Rule\s+\d+(?:\.\d+)?", re.IGNORECASE, triggers=("rule",)
+    ),
+    # CitationFormatter
+    EntityPattern(
+        "citation.deposition_full",
+        r"(?:Deposition\s+of|Dep\.\s+of|Depo\.\s+of)\s+([^,]+?)\s+"
+        r"(?:at|p\.|pp\.)\s*(\d+(?:[-]\d+)?)"
+        r"(?:\s*:\s*(\d+(?:[-]\d+)?))?",
+        re.IGNORECASE,
+        triggers=("dep",),
+    ),
+    EntityPattern(
+        "citation.deposition_page_line",
+        r"(\d+:\d+(?:[-]\d+)?)",
+        re.IGNORECASE,
+        triggers=(":",),
+    ),
+    EntityPattern(
+        "citation.exhibit",
+        r"(?:Exhibit|Ex\.|Exh\.)\s*([A-Z0-9]+(?:[-][A-Z0-9]+)?)",
+        re.IGNORECASE,
+        triggers=("ex",),
+    ),
+    EntityPattern(
+        "citation.exhibit_with_desc",
+        r"(?:Exhibit|Ex\.|Exh\.)\s*([A-Z0-9]+)(?:\s*[-]\s*([^,\.\)]+))?",
+        re.IGNORECASE,
+        triggers=("ex",),
+    ),
+    EntityPattern(
+        "citation.document_log",
+        r"(?:Maintenance\s+Log|Driver\s+Log|Safety\s+Report|Inspection\s+Report)"
+        r"\s*(?:No\.|Nos\.|#)?\s*(\d+(?:[-]\d+)?)",
+        re.IGNORECASE,
+        triggers=("log", "report"),
+    ),
+    EntityPattern(
+        "citation.expert_report",
+        r"(?:Expert\s+Report\s+of|Report\s+of)\s+(?:Dr\.|Mr\.|Ms\.)\s*([^,]+?)"
+        r"(?:\s+at\s+(\d+(?:[-]\d+)?))?",
+        re.IGNORECASE,
+        triggers=("report",),
+    ),
+    EntityPattern(
+        "citation.email",
+        r"(?:Email|E-mail)\s+(?:from|by)\s+([^,]+?)\s+"
+        r"(?:dated|on)\s+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})",
+        re.IGNORECASE,
+        triggers=("mail",),
+    ),
+    EntityPattern(
+        "citation.date",
+        r"(?:January|February|March|April|May|June|July|August|September|October|November|December)"
+        r"\s+\d{1,2},?\s+\d{4}|"
+        r"\d{1,2}[/-]\d{1,2}[/-]\d{2,4}",
+        re.IGNORECASE,
+        triggers=_DATE_TRIGGERS,
+    ),
+    EntityPattern(
+        "citation.case_law",
+        r"([A-Z][a-zA-Z]+(?:\s+[a-zA-Z]+)*)\s+v\.\s+"
+        r"([A-Z][a-zA-Z]+(?:\s+[a-zA-Z]+)*),?\s*"
+        r"(\d+\s+(?:So\.|F\.|U\.S\.|S\.\s*Ct\.)\s*(?:\d+d)?\s+\d+)"
+        r"(?:\s*\(([^)]+)\))?",
+        triggers=("v.",),
+    ),
+    EntityPattern(
+        "citation.statute",
+        r"(\d+)\s+(U\.S\.C\.|Fla\.\s*Stat\.)\s*(?:§|section)*\s*(\d+[\w\-\.]*)",
+        re.IGNORECASE,
+        triggers=("u.s.c.", "fla."),
+    ),
+    EntityPattern(
+        "citation.regulation",
+        r"(\d+)\s+C\.F\.R\.\s*(?:§|section)*\s*(\d+\.\d+)",
+        re.IGNORECASE,
+        triggers=("c.f.r.",),
+    ),
+    EntityPattern(
+        "citation.fmcsr",
+        r"FMCSR\s+(\d+\.\d+(?:\([a-z]\)(?:\(\d+\))?)?)",
+        re.IGNORECASE,
+        triggers=("fmcsr",),
+    ),
+    # FactExtractor._extract_citations
+    EntityPattern(
+        "fact.deposition",
+        r"(\w+)\s+Dep\.\s*(?:at\s*)?(\d+):(\d+)(?:-(\d+))?(?::(\d+))?",
+        triggers=("dep.",),
+    ),
+    EntityPattern(
+        "fact.case_citation",
+        r"(\d+)\s+(\w+\.?\s*\d*[dst]?)\s+(\d+)(?:\s*\(([^)]+)\))?",
+    ),
+    EntityPattern(
+        "fact.statute",
+        r"(?:Fla\.\s*Stat\.|F\.S\.)\s*§?\s*([\d.]+)",
+        triggers=("fla.", "f.s."),
+    ),
+    EntityPattern(
+        "fact.cfr", r"(\d+)\s+C\.F\.R\.\s*§?\s*([\d.]+)", triggers=("c.f.r.",)
+    ),
+    # DepositionParser
+    EntityPattern(
+        "deposition.short_form",
+        r"(\w+)\s+Dep\.\s*(?:at\s*)?(\d+):(\d+)(?:-(?:(\d+):)?(\d+))?",
+        re.IGNORECASE,
+        triggers=("dep.",),
+    ),
+    EntityPattern(
+        "deposition.long_form",
+        r"Deposition\s+of\s+([^,]+),\s*(?:taken\s+on\s+)?([^,]+),\s*(?:at\s*)?(?:pp?\.\s*)?(\d+)(?:-(\d+))?",
+        re.IGNORECASE,
+        triggers=("deposition",),
+    ),
+    EntityPattern(
+        "deposition.page_line",
+        r"(?:Page|Pg\.?|P\.?)\s*(\d+),?\s*(?:Line|Ln\.?|L\.?)\s*(\d+)(?:\s*-\s*(?:Line|Ln\.?|L\.?)?\s*(\d+))?",
+        re.IGNORECASE,
+    ),
+    EntityPattern(
+        "deposition.transcript",
+        r"^(\d+):(\d+)\s*([QA]):",
+        re.MULTILINE,
+        triggers=(":",),
+    ),
+    # ExhibitIndexer
+    EntityPattern(
+        "exhibit.standard",
+        r"(?:Plaintiff[\'s]*|Defendant[\'s]*|Defense|State[\'s]*|Government[\'s]*)?\s*"
+        r"(?:Exhibit|Ex\.?|Exh\.?)\s*"
+        r"([A-Z]+|\d+(?:\.\d+)?|[A-Z]-\d+)",
+        re.IGNORECASE,
+        triggers=("ex",),
+    ),
+    EntityPattern(
+        "exhibit.parenthetical",
+        r"\((?:See\s+)?(?:Exhibit|Ex\.?)\s*([A-Z]+|\d+)\)",
+        re.IGNORECASE,
+        triggers=("ex",),
+    ),
+    EntityPattern(
+        "exhibit.composite",
+        r"(?:Exhibit|Ex\.?)\s*(\d+)[-\s]*\(?([A-Za-z]+)\)?",
+        re.IGNORECASE,
+        triggers=("ex",),
+    ),
+    EntityPattern("exhibit.bates", r"\b([A-Z]{3,})\s*(\d{6,})\b"),
+    EntityPattern(
+        "exhibit.deposition",
+        r"(\w+)\s+Dep\.\s*(?:Exhibit|Ex\.?)\s*(\d+)",
+        re.IGNORECASE,
+        triggers=("dep.",),
+    ),
+    EntityPattern(
+        "exhibit.trial",
+        r"(?:Trial\s+)?(?:Exhibit|Ex\.?|T)[-\s]*(\d+)",
+        re.IGNORECASE,
+    ),
+    # EnhancedMotionDraftingAgent._extract_citations_from_text
+    EntityPattern(
+        "motion.us_reports", r"\d+\s+U\.S\.\s+\d+(?:\s+\(\d{4}\))?", triggers=("u.s.",)
+    ),
+    EntityPattern(
+        "motion.federal_reporter",
+        r"\d+\s+F\.\d+d\s+\d+(?:\s+\([^)]+\d{4}\))?",
+        triggers=("f.",),
+    ),
+    EntityPattern(
+        "motion.federal_supplement",
+        r"\d+\s+F\.\s*Supp\.\s*\d+d?\s+\d+(?:\s+\([^)]+\d{4}\))?",
+        triggers=("supp.",),
+    ),
+    EntityPattern(
+        "motion.supreme_court",
+        r"\d+\s+S\.\s*Ct\.\s+\d+(?:\s+\(\d{4}\))?",
+        triggers=("ct.",),
+    ),
+    EntityPattern(
+        "motion.state_reporter",
+        r"\d+\s+[A-Z][a-z]+\.(?:\s+\d+d)?\s+\d+(?:\s+\([^)]+\d{4}\))?",
+    ),
+    EntityPattern(
+        "motion.case_name",
+        r"[A-Z][a-zA-Z]+\s+v\.\s+[A-Z][a-zA-Z]+(?:,\s+\d+)?",
+        triggers=("v.",),
+    ),
+    EntityPattern(
+        "motion.usc", r"\d+\s+U\.S\.C\.\s+§+\s*\d+[\w\-\.]*", triggers=("u.s.c.",)
+    ),
+    EntityPattern(
+        "motion.state_statute",
+        r"[A-Z][a-z]+\.\s+Stat\.\s+(?:Ann\.\s+)?§+\s*\d+[\w\-\.]*",
+        triggers=("stat.",),
+    ),
+    EntityPattern(
+        "motion.cfr", r"\d+\s+C\.F\.R\.\s+§*\s*\d+\.\d+", triggers=("c.f.r.",)
+    ),
+    EntityPattern(
+        "motion.federal_rule",
+        r"Fed\.\s*R\.\s*(?:Civ|Crim|Evid|App)\.\s*P\.\s*\d+[a-z]*",
+        triggers=("fed.",),
+    ),
+]
+
+
+class _TextScan:
+    """Matches found so far in one text"""
+
+    __slots__ = ("_text", "_lowered", "matches")
+
+    def __init__(self, text: str):
+        self._text = text
+        self._lowered: Optional[str] = None
+        self.matches: Dict[str, List[re.Match]] = {}
+
+    @property
+    def lowered(self) -> str:
+        # Lowercased once, on the first pattern that has triggers
+        if self._lowered is None:
+            self._lowered = self._text.lower()
+        return self._lowered
+
+
+class LegalEntityScanner:
+    """
+    Scans text for all registered entity patterns with shared, cached results.
+
+    Each text is lowercased once and checked for every trigger literal with a
+    substring test, so patterns that cannot match are never run. The matches
+    of each pattern are computed at most once per text and kept in a small
+    LRU, so consumers that scan the same chunk during ingestion (sparse
+    encoding, fact extraction, citation and exhibit indexing) share the work.
+    """
+
+    def __init__(
+        self,
+        patterns: Iterable[EntityPattern],
+        cache_size: int = 128,
+        max_cached_chars: int = 200_000,
+    ):
+        """
+        Compile the patterns.
+
+        Args:
+            patterns: Entity patterns to register
+            cache_size: Number of recent texts whose matches are kept
+            max_cached_chars: Longer texts are scanned without caching
+        """
+        self._patterns: Dict[str, re.Pattern] = {}
+        self._triggers: Dict[str, Tuple[str, ...]] = {}
+        for entity in patterns:
+            self._patterns[entity.kind] = re.compile(entity.pattern, entity.flags)
+            self._triggers[entity.kind] = entity.triggers
+
+        self.cache_size = cache_size
+        self.max_cached_chars = max_cached_chars
+        self._cache: "OrderedDict[str, _TextScan]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def kinds(self) -> List[str]:
+        return list(self._patterns)
+
+    def pattern(self, kind: str) -> re.Pattern:
+        """Return the compiled pattern of a kind"""
+        return self._patterns[kind]
+
+    def patterns_for(self, group: str) -> Dict[str, re.Pattern]:
+        """Return a consumer group's patterns keyed by their short name"""
+        prefix = f"{group}."
+        return {
+            kind[len(prefix) :]: pattern
+            for kind, pattern in self._patterns.items()
+            if kind.startswith(prefix)
+        }
+
+    def finditer(self, text: str, kind: str) -> List[re.Match]:
+        """
+        Return all matches of one pattern in a text.
+
+        Equivalent to pattern(kind).finditer(text), computed once per text.
+        """
+        scan = self._text_scan(text)
+        matches = scan.matches.get(kind)
+        if matches is None:
+            triggers = self._triggers[kind]
+            if triggers and not any(trigger in scan.lowered for trigger in triggers):
+                matches = []
+            else:
+                matches = list(self._patterns[kind].finditer(text))
+            scan.matches[kind] = matches
+        return matches
+
+    def findall(self, text: str, kind: str) -> List[str]:
+        """Return the matched text of every match of one pattern"""
+        return [match.group(0) for match in self.finditer(text, kind)]
+
+    def scan(
+        self, text: str, kinds: Optional[Sequence[str]] = None
+    ) -> List[EntitySpan]:
+        """
+        Scan a text for several kinds at once.
+
+        Args:
+            text: Text to scan
+            kinds: Kinds or consumer groups (e.g. "motion") to scan for;
+                every registered kind when omitted
+
+        Returns:
+            Typed spans ordered by position
+        """
+        spans = []
+        for kind in self._expand(kinds):
+            for match in self.finditer(text, kind):
+                spans.append(
+                    EntitySpan(
+                        kind, match.start(), match.end(), match.group(0), match.groups()
+                    )
+                )
+        spans.sort(key=lambda span: (span.start, span.end))
+        return spans
+
+    def clear_cache(self):
+        with self._lock:
+            self._cache.clear()
+
+    def _expand(self, kinds: Optional[Sequence[str]]) -> List[str]:
+        if kinds is None:
+            return list(self._patterns)
+        expanded = []
+        for kind in kinds:
+            if kind in self._patterns:
+                expanded.append(kind)
+            else:
+                expanded.extend(k for k in self._patterns if k.startswith(f"{kind}."))
+        return expanded
+
+    def _text_scan(self, text: str) -> "_TextScan":
+        if len(text) > self.max_cached_chars:
+            return _TextScan(text)
+
+        with self._lock:
+            scan = self._cache.get(text)
+            if scan is not None:
+                self._cache.move_to_end(text)
+                return scan
+
+            scan = self._cache[text] = _TextScan(text)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            return scan
+
+
+# Shared scanner used by every consumer
+legal_entity_scanner = LegalEntityScanner(LEGAL_ENTITY_PATTERNS)
+
+
+def get_legal_entity_scanner() -> LegalEntityScanner:
+    """Return the shared legal entity scanner"""
+    return legal_entity_scanner
@@ -3,9 +3,13 @@ Logging utilities for the Clerk legal AI system.
 Provides structured logging with security considerations for legal data.
 """
 
+import atexit
 import logging
 import logging.handlers
 import json
+import queue
+import threading
+import time
 from datetime import datetime
 from typing import Dict, Any, Optional
 from pathlib import Path
@@ -95,6 +99,12 @@ class LegalAIFormatter(logging.Formatter):
         if hasattr(record, "execution_time"):
             log_record["execution_time"] = record.execution_time
 
+        if hasattr(record, "summary"):
+            log_record["summary"] = record.summary
+
+        if hasattr(record, "suppressed"):
+            log_record["suppressed"] = record.suppressed
+
         # Add exception info if present
         if record.exc_info:
             log_record["exception"] = self.formatException(record.exc_info)
@@ -127,6 +137,68 @@ class CaseIsolationFilter(logging.Filter):
         return True
 
 
+# Argument types that cannot change between the log call and the writer thread
+_IMMUTABLE_ARGS = (str, int, float, bool, type(None), bytes)
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that leaves formatting to the writer thread.
+
+    Records whose arguments are all immutable are queued as they are, so
+    %-style interpolation, JSON serialization and sanitizing happen on the
+    listener thread. Records with mutable arguments are interpolated here
+    so a later change to the arguments cannot alter what gets logged.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        args = record.args
+        if args and not (
+            isinstance(args, tuple)
+            and all(isinstance(a, _IMMUTABLE_ARGS) for a in args)
+        ):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+# Writer threads per logger name, stopped and flushed at exit
+_queue_listeners: Dict[str, logging.handlers.QueueListener] = {}
+_queue_listeners_lock = threading.Lock()
+
+
+def _attach_queued_handlers(logger: logging.Logger, *handlers: logging.Handler):
+    """Route a logger's records through a queue to handlers on a writer thread"""
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+
+    with _queue_listeners_lock:
+        previous = _queue_listeners.pop(logger.name, None)
+        for handler in list(logger.handlers):
+            if isinstance(handler, DeferredQueueHandler):
+                logger.removeHandler(handler)
+        logger.addHandler(DeferredQueueHandler(log_queue))
+        listener.start()
+        _queue_listeners[logger.name] = listener
+
+    if previous:
+        previous.stop()
+
+
+def stop_logging():
+    """Flush queued log records and stop the writer threads"""
+    with _queue_listeners_lock:
+        listeners = list(_queue_listeners.values())
+        _queue_listeners.clear()
+    for listener in listeners:
+        listener.stop()
+
+
+atexit.register(stop_logging)
+
+
 def setup_logging(
     app_name: str = "clerk_legal_ai",
     log_level: str = "INFO",
@@ -136,6 +208,9 @@ def setup_logging(
     """
     Set up comprehensive logging for the legal AI system.
 
+    Records are handed to a queue on the calling thread and written to the
+    console and JSON files by a background listener.
+
     Args:
         app_name: Name of the application
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
@@ -169,8 +244,6 @@ def setup_logging(
         case_filter = CaseIsolationFilter(allowed_case)
         console_handler.addFilter(case_filter)
 
-    logger.addHandler(console_handler)
-
     # File handler with JSON format for production
     file_handler = logging.handlers.RotatingFileHandler(
         log_dir / f"{app_name}.log", maxBytes=MAX_LOG_SIZE, backupCount=BACKUP_COUNT
@@ -184,7 +257,7 @@ def setup_logging(
         case_filter = CaseIsolationFilter(allowed_case)
         file_handler.addFilter(case_filter)
 
-    logger.addHandler(file_handler)
+    _attach_queued_handlers(logger, console_handler, file_handler)
 
     # Separate security log
     security_logger = logging.getLogger("security")
@@ -193,7 +266,7 @@ def setup_logging(
     )
     security_handler.setLevel(logging.WARNING)
     security_handler.setFormatter(file_formatter)
-    security_logger.addHandler(security_handler)
+    _attach_queued_handlers(security_logger, security_handler)
 
     # Performance log
     performance_logger = logging.getLogger("performance")
@@ -202,7 +275,7 @@ def setup_logging(
     )
     performance_handler.setLevel(logging.INFO)
     performance_handler.setFormatter(file_formatter)
-    performance_logger.addHandler(performance_handler)
+    _attach_queued_handlers(performance_logger, performance_handler)
 
     logger.info(f"Logging initialized for {app_name} at level {log_level}")
     if allowed_case:
@@ -232,6 +305,122 @@ def get_logger(name: str, **kwargs) -> logging.Logger:
     return logger
 
 
+class RateLimitFilter(logging.Filter):
+    """
+    Token bucket per call site for loggers on hot paths.
+
+    Each call site (file and line) may log burst records at once and then
+    per_second records per second; the rest are dropped. The next record
+    let through carries the number dropped in a suppressed attribute.
+    """
+
+    def __init__(self, per_second: float = 1.0, burst: int = 10):
+        super().__init__()
+        self.per_second = per_second
+        self.burst = burst
+        # (pathname, lineno) -> [tokens, last refill, suppressed]
+        self._buckets: Dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = (record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [float(self.burst), now, 0]
+            else:
+                bucket[0] = min(
+                    self.burst, bucket[0] + (now - bucket[1]) * self.per_second
+                )
+                bucket[1] = now
+
+            if bucket[0] < 1:
+                bucket[2] += 1
+                return False
+
+            bucket[0] -= 1
+            if bucket[2]:
+                record.suppressed = bucket[2]
+                bucket[2] = 0
+        return True
+
+
+def get_hot_path_logger(
+    name: str, per_second: float = 1.0, burst: int = 10
+) -> logging.Logger:
+    """
+    Get a rate-limited child logger for per-item messages in hot loops.
+
+    Records propagate to the parent's handlers, so output goes to the same
+    files. The limit applies per call site.
+
+    Args:
+        name: Parent logger name
+        per_second: Sustained records per second per call site
+        burst: Records allowed at once per call site
+
+    Returns:
+        Logger named "<name>.hot"
+    """
+    logger = logging.getLogger(f"{name}.hot")
+    if not any(isinstance(f, RateLimitFilter) for f in logger.filters):
+        logger.addFilter(RateLimitFilter(per_second, burst))
+    return logger
+
+
+class LogSummary:
+    """
+    One structured record per request in place of per-item log lines.
+
+    Counters and fields are collected while the request runs and logged
+    once on exit, with the elapsed time, as a summary attribute that the
+    JSON formatter writes out.
+    """
+
+    def __init__(
+        self, logger: logging.Logger, message: str, level: int = logging.INFO, **fields
+    ):
+        self.logger = logger
+        self.message = message
+        self.level = level
+        self.fields: Dict[str, Any] = dict(fields)
+        self._started = time.perf_counter()
+
+    def count(self, key: str, amount: int = 1):
+        """Add to a counter field"""
+        self.fields[key] = self.fields.get(key, 0) + amount
+
+    def set(self, **fields):
+        """Set or replace fields"""
+        self.fields.update(fields)
+
+    def __enter__(self) -> "LogSummary":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None:
+            self.fields["error"] = exc_type.__name__
+        self.emit()
+
+    def emit(self):
+        """Log the summary record"""
+        if not self.logger.isEnabledFor(self.level):
+            return
+        execution_time = round(time.perf_counter() - self._started, 4)
+        self.logger.log(
+            self.level,
+            "%s %s",
+            self.message,
+            " ".join(f"{key}={value}" for key, value in self.fields.items()),
+            extra={
+                "summary": sanitize_log_data(self.fields),
+                "execution_time": execution_time,
+            },
+        )
+
+
 class QueryLogger:
     """Context manager for logging query execution"""
 
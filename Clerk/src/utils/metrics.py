@@ -0,0 +1,277 @@
+"""
+In-memory latency histograms for hot-path stages.
+Timers feed log-linear histograms that are exported in the Prometheus text
+format by the /metrics endpoint, so stage latencies can be read as
+distributions rather than individual log lines.
+"""
+
+import math
+import threading
+from functools import wraps
+from inspect import iscoroutinefunction
+from time import perf_counter
+from typing import Callable, Dict, Iterable, List, Tuple
+
+# Hot-path stages and their help text
+HOT_PATH_METRICS = {
+    "embedding_seconds": "OpenAI embedding request latency by operation",
+    "sparse_encoding_seconds": "Keyword and citation sparse vector encoding time",
+    "hybrid_search_leg_seconds": "Qdrant query latency per hybrid search leg",
+    "rrf_fusion_seconds": "Reciprocal rank fusion time",
+    "rerank_seconds": "Cohere rerank request latency",
+    "pdf_extraction_seconds": "PDF text extraction time by extractor",
+    "boundary_window_seconds": "Document boundary detection time per window",
+    "llm_call_seconds": "LLM request latency by model",
+    "qdrant_upsert_seconds": "Qdrant upsert latency",
+}
+
+DEFAULT_QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of durations in seconds, HdrHistogram style.
+
+    Each power of two between lowest and highest is split into sub_buckets
+    linear buckets, so any quantile is reported within 1 / (2 * sub_buckets)
+    relative error (about 3% by default) from a fixed array of counters.
+    Recording is one frexp and one increment.
+    """
+
+    def __init__(
+        self, lowest: float = 1e-6, highest: float = 3600.0, sub_buckets: int = 16
+    ):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            lowest: Smallest distinguishable duration; smaller values share
+                the first bucket
+            highest: Largest tracked duration; larger values share the last
+            sub_buckets: Linear buckets per power of two
+        """
+        self.lowest = lowest
+        self.sub_buckets = sub_buckets
+        octaves = math.ceil(math.log2(highest / lowest)) + 1
+        self._counts = [0] * (octaves * sub_buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def _index(self, value: float) -> int:
+        if value < self.lowest:
+            return 0
+        mantissa, exponent = math.frexp(value / self.lowest)
+        index = (exponent - 1) * self.sub_buckets + int(
+            (mantissa - 0.5) * 2 * self.sub_buckets
+        )
+        return min(index, len(self._counts) - 1)
+
+    def _bucket_value(self, index: int) -> float:
+        """Midpoint of a bucket"""
+        octave, sub = divmod(index, self.sub_buckets)
+        return self.lowest * 2**octave * (1 + (sub + 0.5) / self.sub_buckets)
+
+    def record(self, seconds: float):
+        """Add one duration"""
+        index = self._index(seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.sum += seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def quantiles(self, qs: Iterable[float]) -> List[float]:
+        """
+        Read several quantiles in one pass.
+
+        Args:
+            qs: Quantiles in [0, 1], ascending
+
+        Returns:
+            Durations in seconds; 0.0 for an empty histogram
+        """
+        qs = list(qs)
+        with self._lock:
+            counts, total, largest = list(self._counts), self.count, self.max
+        if not total:
+            return [0.0] * len(qs)
+
+        results, seen, index = [], 0, 0
+        for q in qs:
+            rank = max(1, math.ceil(q * total))
+            while seen + counts[index] < rank:
+                seen += counts[index]
+                index += 1
+            if index == len(counts) - 1:
+                # Overflow bucket: its midpoint says nothing about the values
+                results.append(largest)
+            else:
+                # The top bucket's midpoint can overshoot the largest sample
+                results.append(min(self._bucket_value(index), largest))
+        return results
+
+    def quantile(self, q: float) -> float:
+        """Duration below which a fraction q of recordings fall"""
+        return self.quantiles([q])[0]
+
+    def reset(self):
+        with self._lock:
+            self._counts = [0] * len(self._counts)
+            self.count = 0
+            self.sum = 0.0
+            self.max = 0.0
+
+
+class Timer:
+    """
+    Times a block or a function into a histogram.
+
+    Use as a context manager (``with metrics.timer(...)``) or as a decorator
+    on sync or async functions. Time is recorded even if the block raises.
+    """
+
+    __slots__ = ("_histogram", "_started")
+
+    def __init__(self, histogram: LatencyHistogram):
+        self._histogram = histogram
+        self._started = 0.0
+
+    def __enter__(self) -> "Timer":
+        self._started = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        self._histogram.record(perf_counter() - self._started)
+        return False
+
+    def __call__(self, func: Callable) -> Callable:
+        histogram = self._histogram
+
+        if iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                started = perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    histogram.record(perf_counter() - started)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            started = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                histogram.record(perf_counter() - started)
+
+        return wrapper
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: LabelKey, *extra: Tuple[str, str]) -> str:
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape_label(v)}"' for k, v in pairs) + "}"
+
+
+class MetricsRegistry:
+    """
+    Named, labelled latency histograms with Prometheus text export.
+
+    Histograms are created on first use. Keep label values low-cardinality
+    (operation, leg, model), never per-case or per-document.
+    """
+
+    def __init__(self, namespace: str = "clerk"):
+        self.namespace = namespace
+        self._histograms: Dict[str, Dict[LabelKey, LatencyHistogram]] = {}
+        self._help: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def describe(self, name: str, help_text: str):
+        """Set the HELP line of a metric"""
+        self._help[name] = help_text
+
+    def histogram(self, name: str, **labels) -> LatencyHistogram:
+        """Return the histogram for a metric and label set"""
+        key = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        family = self._histograms.get(name)
+        if family is not None:
+            histogram = family.get(key)
+            if histogram is not None:
+                return histogram
+
+        with self._lock:
+            family = self._histograms.setdefault(name, {})
+            return family.setdefault(key, LatencyHistogram())
+
+    def observe(self, name: str, seconds: float, **labels):
+        """Record a duration measured elsewhere"""
+        self.histogram(name, **labels).record(seconds)
+
+    def timer(self, name: str, **labels) -> Timer:
+        """Timer for a metric, usable as a context manager or decorator"""
+        return Timer(self.histogram(name, **labels))
+
+    def render_prometheus(
+        self, quantiles: Tuple[float, ...] = DEFAULT_QUANTILES
+    ) -> str:
+        """
+        Export every histogram as a Prometheus summary.
+
+        Returns:
+            Text exposition format, version 0.0.4
+        """
+        lines = []
+        with self._lock:
+            families = {name: dict(family) for name, family in self._histograms.items()}
+
+        for name, family in families.items():
+            metric = f"{self.namespace}_{name}"
+            if name in self._help:
+                lines.append(f"# HELP {metric} {self._help[name]}")
+            lines.append(f"# TYPE {metric} summary")
+            for labels, histogram in sorted(family.items()):
+                values = histogram.quantiles(quantiles)
+                for q, value in zip(quantiles, values):
+                    lines.append(
+                        f"{metric}{_format_labels(labels, ('quantile', str(q)))} "
+                        f"{value:.6g}"
+                    )
+                lines.append(
+                    f"{metric}_sum{_format_labels(labels)} {histogram.sum:.6g}"
+                )
+                lines.append(
+                    f"{metric}_count{_format_labels(labels)} {histogram.count}"
+                )
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def reset(self):
+        """Zero every histogram, keeping those bound to decorators"""
+        with self._lock:
+            histograms = [h for f in self._histograms.values() for h in f.values()]
+        for histogram in histograms:
+            histogram.reset()
+
+
+# Shared registry for the Clerk API process
+metrics = MetricsRegistry()
+for _name, _help in HOT_PATH_METRICS.items():
+    metrics.describe(_name, _help)
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Return the shared metrics registry"""
+    return metrics
@@ -0,0 +1,84 @@
+"""
+Unit tests for the shared background event loop.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.utils.background_loop import BackgroundLoop
+
+
+@pytest.fixture
+def background():
+    loop = BackgroundLoop("test-loop")
+    yield loop
+    loop.stop()
+
+
+class TestBackgroundLoop:
+    """Test running coroutines from sync code"""
+
+    def test_calls_share_one_loop(self, background):
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = background.run(current_loop())
+        second = background.run(current_loop())
+
+        assert first is second is background.loop
+        assert first.is_running()
+
+    def test_loop_bound_objects_survive_between_calls(self, background):
+        lock = background.run(_make_lock())
+
+        async def use(lock):
+            async with lock:
+                return True
+
+        assert background.run(use(lock))
+        assert background.run(use(lock))
+
+    def test_exceptions_and_timeouts_propagate(self, background):
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            background.run(fail())
+        with pytest.raises(TimeoutError):
+            background.run(asyncio.sleep(5), timeout=0.05)
+
+    def test_threads_run_concurrently(self, background):
+        started = threading.Barrier(4)
+        results = []
+
+        async def wait_for_others(i):
+            await asyncio.sleep(0.05)
+            return i
+
+        def worker(i):
+            started.wait()
+            results.append(background.run(wait_for_others(i)))
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(results) == [0, 1, 2, 3]
+
+    def test_run_from_loop_thread_is_rejected(self, background):
+        async def nested():
+            return background.run(asyncio.sleep(0))
+
+        with pytest.raises(RuntimeError, match="own loop"):
+            background.run(nested())
+
+
+async def _make_lock():
+    lock = asyncio.Lock()
+    async with lock:
+        pass
+    return lock
@@ -0,0 +1,204 @@
+"""
+Unit tests for the shared cache backend.
+"""
+
+import os
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.utils.cache import CacheEntry, DiskSpillStore, LRUCache, SharedCache
+from src.ai_agents.motion_cache_manager import MotionDraftingCache
+from src.ai_agents.outline_cache_manager import OutlineCacheManager
+
+
+def make_entry(key: str, size: int, ttl: int = 3600) -> CacheEntry:
+    now = datetime.utcnow()
+    return CacheEntry(
+        key=key,
+        value=key,
+        created_at=now,
+        accessed_at=now,
+        size_bytes=size,
+        ttl_seconds=ttl,
+    )
+
+
+class TestLRUCache:
+    """Test the in-memory LRU tier"""
+
+    def test_evicts_least_recently_used(self):
+        """Test that reading an entry protects it from eviction"""
+        lru = LRUCache(max_size_bytes=30)
+        lru.put(make_entry("a", 10))
+        lru.put(make_entry("b", 10))
+        lru.put(make_entry("c", 10))
+
+        lru.get("a")
+        evicted = lru.put(make_entry("d", 10))
+
+        assert evicted == ["b"]
+        assert "a" in lru and "b" not in lru
+        assert lru.current_size_bytes == 30
+        assert lru.evictions == 1
+
+    def test_replacing_entry_updates_size(self):
+        """Test that size accounting is incremental on replace and remove"""
+        lru = LRUCache(max_size_bytes=100)
+        lru.put(make_entry("a", 40))
+        lru.put(make_entry("a", 15))
+        assert lru.current_size_bytes == 15
+
+        lru.remove("a")
+        assert lru.current_size_bytes == 0
+        assert len(lru) == 0
+
+    def test_entry_limit_and_oversized_entries(self):
+        """Test max_entries and entries larger than the whole cache"""
+        lru = LRUCache(max_size_bytes=100, max_entries=2)
+        lru.put(make_entry("a", 1))
+        lru.put(make_entry("b", 1))
+        lru.put(make_entry("c", 1))
+        assert "a" not in lru and len(lru) == 2
+
+        lru.put(make_entry("huge", 500))
+        assert "huge" not in lru
+
+    def test_expired_entries_are_dropped(self):
+        """Test that expired entries are not returned"""
+        lru = LRUCache(max_size_bytes=100)
+        entry = make_entry("old", 10, ttl=60)
+        entry.created_at -= timedelta(seconds=120)
+        lru.put(entry)
+
+        assert lru.get("old") is None
+        assert lru.current_size_bytes == 0
+
+
+class TestSharedCache:
+    """Test the memory plus spill store cache"""
+
+    @pytest.mark.asyncio
+    async def test_value_visible_across_workers(self, tmp_path):
+        """Test that a second cache sharing the spill store sees writes"""
+        worker_a = SharedCache(1024 * 1024, spill_store=DiskSpillStore(tmp_path, "t"))
+        worker_b = SharedCache(1024 * 1024, spill_store=DiskSpillStore(tmp_path, "t"))
+
+        await worker_a.set("draft", {"sections": ["I", "II"]}, tags=["case-1"])
+
+        assert await worker_b.get("draft") == {"sections": ["I", "II"]}
+        assert worker_b.spill_hits == 1
+        assert "draft" in worker_b.memory
+
+        await worker_b.invalidate_by_tags(["case-1"])
+        worker_a.memory.clear()
+        assert await worker_a.get("draft") is None
+
+    @pytest.mark.asyncio
+    async def test_evicted_entries_reload_from_spill(self, tmp_path):
+        """Test that entries evicted from memory are still served"""
+        cache = SharedCache(600, spill_store=DiskSpillStore(tmp_path, "t"))
+
+        await cache.set("a", "x" * 400)
+        await cache.set("b", "y" * 400)
+
+        assert "a" not in cache.memory
+        assert await cache.get("a") == "x" * 400
+
+    @pytest.mark.asyncio
+    async def test_only_evicted_entries_are_spilled(self, tmp_path):
+        """Test that without write-through only evicted entries are pickled"""
+        store = DiskSpillStore(tmp_path, "t")
+        cache = SharedCache(600, spill_store=store, write_through=False)
+
+        await cache.set("a", "x" * 400)
+        assert await store.get("a") is None
+
+        await cache.set("b", "y" * 400)
+        assert "a" not in cache.memory
+        assert await store.get("a") is not None
+        assert await store.get("b") is None
+        assert await cache.get("a") == "x" * 400
+
+    @pytest.mark.asyncio
+    async def test_memory_only_cache_estimates_size(self):
+        """Test size estimation without a spill store"""
+        cache = SharedCache(1024 * 1024)
+        await cache.set("k", {"text": "a" * 1000})
+
+        assert cache.current_size_bytes >= 1000
+        assert cache.get_stats()["spill_backend"] is None
+
+
+class TestDiskSpillStore:
+    """Test the local directory spill store"""
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_not_served(self, tmp_path):
+        """Test that entries expire with their TTL and are swept"""
+        store = DiskSpillStore(tmp_path, "t")
+        await store.set("old", b"payload", 60, [])
+        await store.set("new", b"payload", 60, [])
+        path = store._path("old")
+        os.utime(path, (time.time() - 1, time.time() - 1))
+
+        assert await store.sweep() == 1
+        assert not path.exists()
+        assert await store.get("old") is None
+        assert await store.get("new") == b"payload"
+
+    @pytest.mark.asyncio
+    async def test_size_cap_drops_entries_closest_to_expiry(self, tmp_path):
+        """Test that the directory is kept under max_size_bytes"""
+        store = DiskSpillStore(tmp_path, "t", max_size_bytes=250)
+        await store.set("short", b"a" * 100, 60, [])
+        await store.set("long", b"b" * 100, 3600, [])
+        await store.set("medium", b"c" * 100, 600, [])
+
+        assert await store.get("short") is None
+        assert await store.get("medium") == b"c" * 100
+        assert await store.get("long") == b"b" * 100
+
+    @pytest.mark.asyncio
+    async def test_tags_invalidate_without_reading_entries(self, tmp_path):
+        """Test tag invalidation through the tag index"""
+        store = DiskSpillStore(tmp_path, "t")
+        await store.set("a", b"not a pickle", 60, ["case-1"])
+        await store.set("b", b"not a pickle", 60, ["case-1", "case-2"])
+        await store.set("c", b"not a pickle", 60, ["case-2"])
+
+        assert await store.invalidate_tags(["case-1"]) == 2
+        assert await store.get("c") == b"not a pickle"
+        assert await store.invalidate_tags(["case-2"]) == 1
+        assert await store.invalidate_tags(["case-1"]) == 0
+
+
+class TestCacheManagers:
+    """Test the motion and outline caches on the shared backend"""
+
+    @pytest.mark.asyncio
+    async def test_motion_cache_stats(self):
+        """Test MotionDraftingCache get/set and statistics"""
+        cache = MotionDraftingCache(max_size_mb=1)
+        await cache.set("research", {"facts": [1, 2]}, case="Smith")
+
+        assert await cache.get("research", case="Smith") == {"facts": [1, 2]}
+        assert await cache.get("research", case="Jones") is None
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1 and stats["misses"] == 1
+        assert stats["entries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_outline_shared_between_workers(self, tmp_path):
+        """Test an outline cached by one worker is readable by another"""
+        outline = {"sections": [{"heading": "ARGUMENT", "type": "argument"}]}
+        writer = OutlineCacheManager(spill_store=DiskSpillStore(tmp_path, "outlines"))
+        reader = OutlineCacheManager(spill_store=DiskSpillStore(tmp_path, "outlines"))
+
+        outline_id = await writer.cache_outline(outline, "smith_v_jones")
+
+        assert await reader.get_outline(outline_id) == outline
+        section = await reader.get_section_by_key(outline_id, "type:argument")
+        assert section == {"heading": "ARGUMENT", "type": "argument"}
@@ -0,0 +1,87 @@
+"""
+Unit tests for the shared service client registry.
+"""
+
+import asyncio
+import gc
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils.client_registry import ClientRegistry, LoopLocalClient
+
+
+class FakeAsyncClient:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def test_clients_are_shared_and_use_pool_limits():
+    registry = ClientRegistry()
+
+    client = registry.qdrant_client("http://qdrant:6333")
+
+    assert registry.qdrant_client("http://qdrant:6333") is client
+    assert registry.qdrant_client("http://qdrant:6333/other") is not client
+    assert registry.openai_client() is registry.openai_client()
+    limits = registry._limits()
+    assert limits.max_connections == registry.config.max_connections
+    assert limits.max_keepalive_connections == registry.config.max_keepalive_connections
+
+
+def test_async_clients_are_created_per_event_loop():
+    proxy = LoopLocalClient("fake", FakeAsyncClient)
+
+    async def current():
+        return proxy._current(), proxy._current()
+
+    first, again = asyncio.run(current())
+    second, _ = asyncio.run(current())
+
+    assert first is again
+    assert first is not second
+    # Clients of discarded loops are not kept alive
+    gc.collect()
+    assert len(proxy._clients) == 0
+
+
+@pytest.mark.asyncio
+async def test_health_check_reports_each_client():
+    registry = ClientRegistry()
+    registry.config = SimpleNamespace(health_check_timeout=0.5)
+
+    async def slow():
+        await asyncio.sleep(5)
+
+    async def ok():
+        return []
+
+    registry._clients = {
+        "async_qdrant:http://qdrant": SimpleNamespace(get_collections=ok),
+        "async_openai": SimpleNamespace(models=SimpleNamespace(list=slow)),
+        "cohere": object(),
+    }
+
+    health = await registry.health_check()
+
+    assert set(health) == {"async_qdrant:http://qdrant", "async_openai"}
+    assert health["async_qdrant:http://qdrant"]["status"] == "healthy"
+    assert health["async_openai"]["status"] == "unhealthy"
+    assert health["async_openai"]["error"] == "TimeoutError"
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_clients_for_the_running_loop():
+    registry = ClientRegistry()
+    proxy = registry._shared(
+        "async_fake", lambda: LoopLocalClient("fake", FakeAsyncClient)
+    )
+    client = proxy._current()
+
+    await registry.aclose()
+
+    assert client.closed
+    assert registry._clients == {}
@@ -0,0 +1,268 @@
+"""
+Unit tests for the date-sorted fact index and incremental timelines.
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.models.fact_models import CaseFact, DateReference
+from src.utils import fact_date_index
+from src.utils.fact_date_index import (
+    FactDateIndex,
+    get_fact_date_index,
+    record_fact_removals,
+    record_fact_upserts,
+)
+from src.utils.timeline_generator import TimelineGenerator
+
+CASE = "Smith_v_Jones"
+
+
+def make_fact(fact_id, *dates, content=None, approximate=False):
+    return CaseFact(
+        id=fact_id,
+        case_name=CASE,
+        content=content or f"Event {fact_id}",
+        category="incident",
+        source_document="report.pdf",
+        page_references=[],
+        extraction_timestamp=datetime(2024, 1, 1),
+        confidence_score=0.9,
+        date_references=[
+            DateReference(date_text="", start_date=d, is_approximate=approximate)
+            for d in dates
+        ],
+    )
+
+
+def payload(fact_id, date, **extra):
+    return {
+        "fact_id": fact_id,
+        "case_name": CASE,
+        "content": f"Event {fact_id}",
+        "category": "incident",
+        "source_document": "report.pdf",
+        "extraction_timestamp": "2024-01-01T00:00:00",
+        "confidence_score": 0.9,
+        "primary_date": date.isoformat(),
+        **extra,
+    }
+
+
+@pytest.fixture(autouse=True)
+def clear_indexes():
+    fact_date_index._date_indexes.clear()
+    yield
+    fact_date_index._date_indexes.clear()
+
+
+class TestFactDateIndex:
+    """Test the sorted index"""
+
+    def test_range_queries_are_ordered_and_inclusive(self):
+        index = FactDateIndex(CASE)
+        index.upsert(make_fact("b", datetime(2023, 3, 3), datetime(2023, 1, 1)))
+        index.upsert(make_fact("a", datetime(2023, 2, 2)))
+        index.upsert(make_fact("undated"))
+
+        assert [(d.month, f.id) for d, f, _ in index.events()] == [
+            (1, "b"),
+            (2, "a"),
+            (3, "b"),
+        ]
+        in_range = index.events(datetime(2023, 2, 2), datetime(2023, 3, 3))
+        assert [f.id for _, f, _ in in_range] == ["a", "b"]
+        assert "undated" not in index
+
+    def test_upsert_replaces_and_remove_drops_entries(self):
+        index = FactDateIndex(CASE)
+        index.upsert(make_fact("a", datetime(2023, 2, 2)))
+        version = index.version
+
+        index.upsert(make_fact("a", datetime(2023, 5, 5)))
+        assert [d.month for d, _, _ in index.events()] == [5]
+        assert index.version > version
+
+        index.remove("a")
+        assert len(index) == 0 and index.fact_count == 0
+
+    @pytest.mark.asyncio
+    async def test_load_scrolls_every_page(self):
+        """Test cases with more facts than one scroll page are complete"""
+        pages = [
+            (
+                [
+                    SimpleNamespace(
+                        payload=payload(f"f{i}", datetime(2023, 1, 1 + i % 28))
+                    )
+                    for i in range(1000)
+                ],
+                "next",
+            ),
+            (
+                [
+                    SimpleNamespace(payload=payload("last", datetime(2024, 1, 1))),
+                    SimpleNamespace(
+                        payload=payload("gone", datetime(2024, 1, 2), is_deleted=True)
+                    ),
+                ],
+                None,
+            ),
+        ]
+        store = Mock()
+        store.client.scroll = Mock(side_effect=pages)
+        index = FactDateIndex(CASE)
+
+        await index.ensure_loaded(store, f"{CASE}_facts")
+        await index.ensure_loaded(store, f"{CASE}_facts")
+
+        assert index.fact_count == 1001
+        assert store.client.scroll.call_count == 2
+        assert store.client.scroll.call_args.kwargs["offset"] == "next"
+
+    @pytest.mark.asyncio
+    async def test_updates_during_load_are_replayed(self):
+        """Test writes made while the scroll runs are not lost"""
+        index = get_fact_date_index(CASE)
+
+        def scroll(**kwargs):
+            record_fact_upserts(CASE, [make_fact("new", datetime(2023, 4, 4))])
+            record_fact_removals(CASE, ["old"])
+            return [SimpleNamespace(payload=payload("old", datetime(2023, 1, 1)))], None
+
+        store = Mock()
+        store.client.scroll = Mock(side_effect=scroll)
+        await index.ensure_loaded(store, f"{CASE}_facts")
+
+        assert "new" in index and "old" not in index
+
+    @pytest.mark.asyncio
+    async def test_expired_index_is_reloaded(self):
+        """Test facts written by other processes are seen after the TTL"""
+        store = Mock()
+        store.client.scroll = Mock(
+            return_value=(
+                [SimpleNamespace(payload=payload("a", datetime(2023, 1, 1)))],
+                None,
+            )
+        )
+        index = FactDateIndex(CASE, ttl_seconds=60)
+        await index.ensure_loaded(store, f"{CASE}_facts")
+        version, generation = index.version, index.generation
+
+        store.client.scroll.return_value = (
+            [SimpleNamespace(payload=payload("b", datetime(2023, 2, 2)))],
+            None,
+        )
+        await index.ensure_loaded(store, f"{CASE}_facts")
+        assert "a" in index and store.client.scroll.call_count == 1
+
+        index.loaded_at -= 60
+        await index.ensure_loaded(store, f"{CASE}_facts")
+        assert "b" in index and "a" not in index
+        assert index.version > version and index.generation > generation
+
+    def test_writers_only_touch_loaded_indexes(self):
+        record_fact_upserts(CASE, [make_fact("a", datetime(2023, 2, 2))])
+        assert CASE not in fact_date_index._date_indexes
+
+        index = get_fact_date_index(CASE)
+        index.loaded = True
+        record_fact_upserts(CASE, [make_fact("a", datetime(2023, 2, 2))])
+        assert "a" in index
+        record_fact_removals(CASE, ["a"])
+        assert "a" not in index
+
+
+@pytest.fixture
+def generator():
+    with patch("src.utils.timeline_generator.QdrantVectorStore"):
+        generator = TimelineGenerator(CASE)
+    generator.vector_store.client.scroll = Mock(return_value=([], None))
+    embedder = Mock()
+    embedder.generate_embeddings_batch_async = AsyncMock(
+        side_effect=lambda texts: ([[0.1] * 4 for _ in texts], 10)
+    )
+    generator._embedding_generator = embedder
+    return generator
+
+
+class TestIncrementalTimeline:
+    """Test timeline generation from the date index"""
+
+    @pytest.mark.asyncio
+    async def test_only_changed_events_are_embedded(self, generator):
+        await generator.generate_timeline()
+        record_fact_upserts(
+            CASE,
+            [
+                make_fact("a", datetime(2023, 3, 3), content="The crash occurred"),
+                make_fact("b", datetime(2023, 1, 1), content="Complaint filed"),
+            ],
+        )
+
+        timeline = await generator.generate_timeline()
+        assert [f.id for _, f in timeline.timeline_events] == ["b", "a"]
+        assert timeline.key_dates["incident_date"] == datetime(2023, 3, 3)
+
+        embed = generator._embedding_generator.generate_embeddings_batch_async
+        assert len(embed.await_args.args[0]) == 2
+
+        # Unchanged index: cached timeline, nothing stored
+        assert await generator.generate_timeline() is timeline
+        assert embed.await_count == 1
+
+        # One edited and one deleted fact: one embedding, one removal
+        record_fact_upserts(
+            CASE, [make_fact("a", datetime(2023, 3, 3), content="The truck crashed")]
+        )
+        record_fact_removals(CASE, ["b"])
+        timeline = await generator.generate_timeline()
+
+        assert embed.await_args.args[0] == ["On March 03, 2023: The truck crashed"]
+        deleted = generator.vector_store.client.delete.call_args.kwargs
+        assert len(deleted["points_selector"].points) == 1
+        assert len(timeline.timeline_events) == 1
+
+    @pytest.mark.asyncio
+    async def test_stored_narratives_are_reread_after_reload(self, generator):
+        await generator.generate_timeline()
+        timeline_scrolls = [
+            c
+            for c in generator.vector_store.client.scroll.call_args_list
+            if c.kwargs["collection_name"] == f"{CASE}_timeline"
+        ]
+        assert len(timeline_scrolls) == 1
+
+        generator.date_index.loaded_at -= generator.date_index.ttl_seconds
+        await generator.generate_timeline()
+
+        timeline_scrolls = [
+            c
+            for c in generator.vector_store.client.scroll.call_args_list
+            if c.kwargs["collection_name"] == f"{CASE}_timeline"
+        ]
+        assert len(timeline_scrolls) == 2
+
+    @pytest.mark.asyncio
+    async def test_near_date_queries_do_not_rescroll(self, generator):
+        await generator.generate_timeline(include_uncertain=False)
+        record_fact_upserts(
+            CASE,
+            [
+                make_fact("a", datetime(2023, 3, 3)),
+                make_fact("b", datetime(2023, 6, 1)),
+                make_fact("c", datetime(2023, 3, 10), approximate=True),
+            ],
+        )
+        scrolls = generator.vector_store.client.scroll.call_count
+
+        events = await generator.find_events_near_date(datetime(2023, 3, 5), 7, 7)
+        timeline = await generator.generate_timeline(include_uncertain=False)
+
+        assert [f.id for _, f in events] == ["a", "c"]
+        assert [f.id for _, f in timeline.timeline_events] == ["a", "b"]
+        assert generator.vector_store.client.scroll.call_count == scrolls
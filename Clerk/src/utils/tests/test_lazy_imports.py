@@ -0,0 +1,49 @@
+"""
+Unit tests for lazy package re-exports.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import src.document_processing as document_processing
+from src.utils.lazy_imports import lazy_exports
+
+ROOT = Path(__file__).resolve().parents[3]
+
+
+def test_exports_resolve_on_first_access():
+    from src.document_processing.qdrant_deduplicator import (
+        QdrantDocumentDeduplicator,
+    )
+
+    assert document_processing.DocumentDeduplicator is QdrantDocumentDeduplicator
+    assert "DocumentDeduplicator" in vars(document_processing)
+    assert "SourceDocumentIndexer" in dir(document_processing)
+
+
+def test_unknown_names_raise_attribute_error():
+    getattr_, _ = lazy_exports("src.document_processing", {})
+
+    with pytest.raises(AttributeError):
+        getattr_("Missing")
+    assert not hasattr(document_processing, "Missing")
+
+
+def test_vector_store_import_skips_nlp_stack():
+    """Test importing the store does not load spaCy or sklearn"""
+    code = (
+        "import sys, src.vector_storage.qdrant_store; "
+        "print(sorted(m for m in ('spacy', 'sklearn', 'pdfplumber') "
+        "if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip().splitlines()[-1] == "[]"
@@ -0,0 +1,106 @@
+"""
+Unit tests for the shared legal entity scanner.
+"""
+
+import re
+
+import pytest
+
+from src.utils.legal_entity_scanner import (
+    LEGAL_ENTITY_PATTERNS,
+    EntityPattern,
+    LegalEntityScanner,
+    legal_entity_scanner,
+)
+
+TEXT = (
+    "See Smith Dep. 45:3-12 and Plaintiff's Exhibit 12. The carrier violated "
+    "49 C.F.R. § 395.8 and FMCSR 395.3(a). Under Fla. Stat. § 768.81 and "
+    "Palsgraf v. Long, 248 N.E. 99 (1928), damages of $184,250.00 accrued "
+    "by March 3, 2023 (see Rule 1.280; Fed. R. Civ. P. 26). "
+    "Produced as SMITH000123 on 03/15/2022.\n45:12 Q: Were you driving?"
+)
+
+
+class CountingPattern:
+    """Wraps a compiled pattern and counts finditer calls"""
+
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.calls = 0
+
+    def finditer(self, text):
+        self.calls += 1
+        return self.pattern.finditer(text)
+
+
+@pytest.fixture
+def scanner():
+    return LegalEntityScanner(LEGAL_ENTITY_PATTERNS)
+
+
+class TestLegalEntityScanner:
+    """Test scanning against the individual patterns"""
+
+    @pytest.mark.parametrize("entity", LEGAL_ENTITY_PATTERNS, ids=lambda e: e.kind)
+    def test_matches_equal_separate_pattern(self, scanner, entity):
+        expected = [
+            (m.span(), m.groups())
+            for m in re.compile(entity.pattern, entity.flags).finditer(TEXT)
+        ]
+        found = [(m.span(), m.groups()) for m in scanner.finditer(TEXT, entity.kind)]
+        assert found == expected
+
+    @pytest.mark.parametrize("entity", LEGAL_ENTITY_PATTERNS, ids=lambda e: e.kind)
+    def test_triggers_cover_every_match(self, entity):
+        """A match must contain one of its pattern's trigger literals"""
+        for match in re.compile(entity.pattern, entity.flags).finditer(TEXT):
+            if entity.triggers:
+                assert any(t in match.group(0).lower() for t in entity.triggers)
+
+    def test_scan_returns_typed_spans_in_order(self, scanner):
+        spans = scanner.scan(TEXT, ["motion", "sparse.monetary"])
+
+        assert [s.start for s in spans] == sorted(s.start for s in spans)
+        kinds = {s.kind for s in spans}
+        assert "sparse.monetary" in kinds and "motion.cfr" in kinds
+        assert not any(k.startswith("fact.") for k in kinds)
+        money = next(s for s in spans if s.kind == "sparse.monetary")
+        assert TEXT[money.start : money.end] == money.text == "$184,250.00"
+
+    def test_each_text_is_scanned_once(self, scanner):
+        counting = CountingPattern(scanner.pattern("fact.deposition"))
+        scanner._patterns["fact.deposition"] = counting
+
+        first = scanner.finditer(TEXT, "fact.deposition")
+        # An equal string from another consumer hits the same cache entry
+        second = scanner.finditer("".join(TEXT), "fact.deposition")
+
+        assert first is second and counting.calls == 1
+
+    def test_triggers_skip_patterns(self):
+        scanner = LegalEntityScanner(
+            [EntityPattern("test.money", r"\$\d+", triggers=("$",))]
+        )
+        counting = CountingPattern(scanner.pattern("test.money"))
+        scanner._patterns["test.money"] = counting
+
+        assert scanner.finditer("no amounts here", "test.money") == []
+        assert scanner.findall("paid $40", "test.money") == ["$40"]
+        assert counting.calls == 1
+
+    def test_cache_is_bounded(self):
+        scanner = LegalEntityScanner(LEGAL_ENTITY_PATTERNS, cache_size=2)
+        for text in ("a $1", "b $2", "c $3"):
+            scanner.findall(text, "sparse.monetary")
+        assert list(scanner._cache) == ["b $2", "c $3"]
+
+    def test_consumer_groups_use_shared_patterns(self):
+        assert set(legal_entity_scanner.patterns_for("exhibit")) == {
+            "standard",
+            "parenthetical",
+            "composite",
+            "bates",
+            "deposition",
+            "trial",
+        }
@@ -0,0 +1,146 @@
+"""
+Unit tests for queued logging, hot-path rate limiting and request summaries.
+"""
+
+import json
+import logging
+import logging.handlers
+import queue
+
+import pytest
+
+from src.utils.logger import (
+    DeferredQueueHandler,
+    LegalAIFormatter,
+    LogSummary,
+    RateLimitFilter,
+    get_hot_path_logger,
+)
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def make_logger(request):
+    """Logger whose records go through a queue to a list handler"""
+    listeners = []
+
+    def factory(name):
+        logger = logging.getLogger(f"test_logger.{request.node.name}.{name}")
+        logger.propagate = False
+        logger.setLevel(logging.DEBUG)
+        log_queue = queue.SimpleQueue()
+        sink = ListHandler()
+        logger.addHandler(DeferredQueueHandler(log_queue))
+        listener = logging.handlers.QueueListener(log_queue, sink)
+        listener.start()
+        listeners.append((logger, listener))
+        return logger, listener, sink
+
+    yield factory
+    for logger, listener in listeners:
+        if listener._thread is not None:
+            listener.stop()
+        logger.handlers.clear()
+
+
+class TestDeferredQueueHandler:
+    """Test formatting is deferred only when it is safe"""
+
+    def test_immutable_args_are_formatted_by_the_writer(self, make_logger):
+        logger, listener, sink = make_logger("lazy")
+        items = ["a"]
+
+        logger.info("search %s returned %d results", "case", 3)
+        logger.info("items: %s", items)
+        items.append("b")
+        listener.stop()
+
+        lazy, eager = sink.records
+        assert lazy.args == ("case", 3)
+        assert lazy.getMessage() == "search case returned 3 results"
+        # Mutable arguments are captured when the call is made
+        assert eager.args is None and eager.getMessage() == "items: ['a']"
+
+    def test_exception_info_reaches_the_json_formatter(self, make_logger):
+        logger, listener, sink = make_logger("exc")
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+        listener.stop()
+
+        record = json.loads(LegalAIFormatter().format(sink.records[0]))
+        assert record["message"] == "failed"
+        assert "ValueError: boom" in record["exception"]
+
+
+class TestRateLimitFilter:
+    """Test per-call-site token buckets"""
+
+    def test_burst_then_suppressed_count(self, monkeypatch):
+        clock = [100.0]
+        monkeypatch.setattr("src.utils.logger.time.monotonic", lambda: clock[0])
+        rate_filter = RateLimitFilter(per_second=1.0, burst=2)
+
+        def record(lineno=10):
+            return logging.LogRecord("hot", logging.INFO, "x.py", lineno, "m", (), None)
+
+        assert [rate_filter.filter(record()) for _ in range(5)] == [
+            True,
+            True,
+            False,
+            False,
+            False,
+        ]
+        # Other call sites have their own bucket
+        assert rate_filter.filter(record(lineno=11))
+
+        clock[0] += 1.0
+        allowed = record()
+        assert rate_filter.filter(allowed)
+        assert allowed.suppressed == 3
+
+    def test_hot_path_logger_is_a_filtered_child(self):
+        logger = get_hot_path_logger("clerk_api")
+        assert logger.name == "clerk_api.hot"
+        assert get_hot_path_logger("clerk_api") is logger
+        assert sum(isinstance(f, RateLimitFilter) for f in logger.filters) == 1
+
+
+class TestLogSummary:
+    """Test one structured record per request"""
+
+    def test_summary_is_one_record(self, make_logger):
+        logger, listener, sink = make_logger("summary")
+
+        with LogSummary(logger, "Searches complete", queries=2) as summary:
+            summary.count("results.case", 3)
+            summary.count("results.case", 2)
+            summary.set(top_score=0.91)
+        listener.stop()
+
+        (record,) = sink.records
+        assert record.getMessage() == (
+            "Searches complete queries=2 results.case=5 top_score=0.91"
+        )
+        assert record.summary == {"queries": 2, "results.case": 5, "top_score": 0.91}
+        formatted = json.loads(LegalAIFormatter().format(record))
+        assert formatted["summary"]["results.case"] == 5
+        assert formatted["execution_time"] >= 0
+
+    def test_disabled_level_logs_nothing(self, make_logger):
+        logger, listener, sink = make_logger("quiet")
+        logger.setLevel(logging.WARNING)
+
+        LogSummary(logger, "Searches complete").emit()
+        listener.stop()
+
+        assert sink.records == []
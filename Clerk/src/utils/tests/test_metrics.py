@@ -0,0 +1,102 @@
+"""
+Unit tests for hot-path latency histograms and Prometheus export.
+"""
+
+import random
+
+import pytest
+
+from src.utils.metrics import LatencyHistogram, MetricsRegistry
+
+
+class TestLatencyHistogram:
+    """Test recording and quantile accuracy"""
+
+    def test_quantiles_within_relative_error(self):
+        rng = random.Random(3)
+        samples = sorted(rng.lognormvariate(-3, 1.2) for _ in range(20000))
+        histogram = LatencyHistogram()
+        for sample in samples:
+            histogram.record(sample)
+
+        for q in (0.5, 0.9, 0.99, 0.999):
+            exact = samples[int(q * len(samples)) - 1]
+            assert histogram.quantile(q) == pytest.approx(exact, rel=0.05)
+
+        assert histogram.count == len(samples)
+        assert histogram.sum == pytest.approx(sum(samples))
+        assert histogram.quantile(1.0) <= max(samples)
+
+    def test_out_of_range_values_are_clamped(self):
+        histogram = LatencyHistogram(lowest=1e-3, highest=1.0)
+        histogram.record(0.0)
+        histogram.record(50.0)
+
+        assert histogram.quantile(0.5) < 2e-3
+        assert histogram.quantile(1.0) == 50.0
+
+    def test_empty_histogram(self):
+        assert LatencyHistogram().quantiles([0.5, 0.99]) == [0.0, 0.0]
+
+
+class TestMetricsRegistry:
+    """Test timers and the exposition format"""
+
+    def test_timer_context_manager_and_decorators(self):
+        registry = MetricsRegistry()
+
+        with registry.timer("stage_seconds", leg="semantic"):
+            pass
+
+        @registry.timer("stage_seconds", leg="keyword")
+        def sync_stage():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            sync_stage()
+
+        assert registry.histogram("stage_seconds", leg="semantic").count == 1
+        # Failed calls are timed too
+        assert registry.histogram("stage_seconds", leg="keyword").count == 1
+
+    @pytest.mark.asyncio
+    async def test_async_decorator(self):
+        registry = MetricsRegistry()
+
+        @registry.timer("llm_call_seconds", model="gpt-test")
+        async def call():
+            return "ok"
+
+        assert await call() == "ok"
+        assert registry.histogram("llm_call_seconds", model="gpt-test").count == 1
+
+    def test_render_prometheus(self):
+        registry = MetricsRegistry(namespace="clerk")
+        registry.describe("rerank_seconds", "Rerank latency")
+        registry.observe("rerank_seconds", 0.25)
+        registry.observe("llm_call_seconds", 1.5, model='gpt "quoted"')
+
+        text = registry.render_prometheus(quantiles=(0.5, 0.99))
+        lines = text.splitlines()
+
+        assert "# HELP clerk_rerank_seconds Rerank latency" in lines
+        assert "# TYPE clerk_rerank_seconds summary" in lines
+        median = next(l for l in lines if 'quantile="0.5"' in l)
+        assert median.startswith('clerk_rerank_seconds{quantile="0.5"} ')
+        assert float(median.split()[-1]) == pytest.approx(0.25, rel=0.05)
+        assert "clerk_rerank_seconds_count 1" in lines
+        assert 'clerk_llm_call_seconds_sum{model="gpt \\"quoted\\""} 1.5' in lines
+        assert text.endswith("\n")
+
+    def test_reset_keeps_decorated_histograms(self):
+        registry = MetricsRegistry()
+
+        @registry.timer("stage_seconds")
+        def stage():
+            pass
+
+        stage()
+        registry.reset()
+        stage()
+
+        assert registry.histogram("stage_seconds").count == 1
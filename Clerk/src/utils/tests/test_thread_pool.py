@@ -0,0 +1,63 @@
+"""
+Unit tests for the bounded blocking-call thread pool.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.utils import thread_pool
+from src.utils.thread_pool import run_blocking, shutdown_blocking_executor
+
+
+@pytest.fixture(autouse=True)
+def fresh_executor(monkeypatch):
+    monkeypatch.setattr(thread_pool, "DEFAULT_MAX_WORKERS", 2)
+    shutdown_blocking_executor()
+    yield
+    shutdown_blocking_executor()
+
+
+@pytest.mark.asyncio
+async def test_run_blocking_returns_result_and_raises():
+    assert await run_blocking(sorted, [3, 1, 2], reverse=True) == [3, 2, 1]
+    with pytest.raises(ZeroDivisionError):
+        await run_blocking(lambda: 1 / 0)
+
+
+@pytest.mark.asyncio
+async def test_calls_beyond_pool_size_queue():
+    """Test concurrent calls never run on more threads than the pool allows"""
+    lock = threading.Lock()
+    running = peak = 0
+
+    def work():
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+
+    await asyncio.gather(*(run_blocking(work) for _ in range(8)))
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_event_loop_stays_responsive():
+    """Test the loop keeps serving other tasks while a blocking call runs"""
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    task = asyncio.create_task(ticker())
+    await run_blocking(time.sleep, 0.1)
+    task.cancel()
+    assert ticks > 5
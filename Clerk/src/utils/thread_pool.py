@@ -0,0 +1,64 @@
+"""
+Bounded thread pool for blocking calls made from async code.
+Keeps sync SDK calls (Cohere, sync Qdrant paths, legacy search) off the
+event loop without letting a burst of requests spawn unbounded threads.
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_WORKERS = int(os.getenv("BLOCKING_POOL_MAX_WORKERS", "16"))
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_blocking_executor() -> ThreadPoolExecutor:
+    """Return the shared executor for blocking calls, creating it on first use"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=DEFAULT_MAX_WORKERS, thread_name_prefix="clerk-blocking"
+            )
+            logger.debug(
+                f"Started blocking thread pool with {DEFAULT_MAX_WORKERS} workers"
+            )
+        return _executor
+
+
+async def run_blocking(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Run a blocking callable in the shared thread pool and await its result.
+
+    Calls beyond the pool size queue instead of starting new threads.
+
+    Args:
+        func: Sync callable to run
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        The callable's result; its exception is re-raised here
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_blocking_executor(), partial(func, *args, **kwargs)
+    )
+
+
+def shutdown_blocking_executor(wait: bool = True):
+    """Shut down the shared executor; the next call starts a new one"""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
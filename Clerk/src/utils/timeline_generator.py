@@ -3,14 +3,21 @@ Timeline Generator for Case Facts
 Creates chronological narratives from extracted facts with case isolation
 """
 
+import asyncio
 import logging
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
+from functools import partial
 import json
 
+from qdrant_client.models import PointIdsList
+
 from src.models.fact_models import CaseFact, FactTimeline, DateReference
 from src.vector_storage.qdrant_store import QdrantVectorStore
+from src.vector_storage.bulk_upsert import upsert_in_chunks
+from src.vector_storage.point_ids import deterministic_point_id
+from src.utils.fact_date_index import get_fact_date_index
 
 logger = logging.getLogger("clerk_api")
 
@@ -39,6 +46,18 @@ class TimelineGenerator:
         self.facts_collection = f"{case_name}_facts"
         self.timeline_collection = f"{case_name}_timeline"
 
+        # Shared date-sorted index of the case's facts
+        self.date_index = get_fact_date_index(case_name)
+        self._embedding_generator = None
+
+        # Timelines built at a given index version, keyed by request parameters
+        self._timelines: Dict[tuple, Tuple[int, FactTimeline]] = {}
+        # Narratives already stored in the timeline collection, by point ID,
+        # read at a given index generation
+        self._stored_narratives: Optional[Dict[str, str]] = None
+        self._stored_generation = 0
+        self.upsert_batch_size = 256
+
         logger.info(f"TimelineGenerator initialized for case: {case_name}")
 
     async def generate_timeline(
@@ -50,105 +69,60 @@ class TimelineGenerator:
         """Generate a timeline from all facts in the case"""
         logger.info(f"Generating timeline for case: {self.case_name}")
 
-        # Retrieve all facts with dates
-        facts_with_dates = await self._get_facts_with_dates(start_date, end_date)
+        await self._ensure_date_index()
+
+        # Nothing changed since the last identical request
+        cache_key = (start_date, end_date, include_uncertain)
+        cached = self._timelines.get(cache_key)
+        if cached and cached[0] == self.date_index.version:
+            return cached[1]
 
         # Create timeline
         timeline = FactTimeline(
             case_name=self.case_name, timeline_events=[], date_ranges=[], key_dates={}
         )
 
-        # Process facts
-        for fact in facts_with_dates:
-            if fact.date_references:
-                for date_ref in fact.date_references:
-                    if date_ref.start_date:
-                        # Skip uncertain dates if not included
-                        if not include_uncertain and date_ref.is_approximate:
-                            continue
-
-                        timeline.timeline_events.append((date_ref.start_date, fact))
-
-                        # Track date ranges
-                        if date_ref.is_range and date_ref.end_date:
-                            timeline.date_ranges.append(
-                                (
-                                    date_ref.start_date,
-                                    date_ref.end_date,
-                                    fact.content[:100],
-                                )
-                            )
-
-        # Sort events chronologically
-        timeline.timeline_events.sort(key=lambda x: x[0])
+        # Index entries are already in chronological order
+        for date, fact, date_ref in self.date_index.events(start_date, end_date):
+            # Skip uncertain dates if not included
+            if not include_uncertain and date_ref.is_approximate:
+                continue
+
+            timeline.timeline_events.append((date, fact))
+
+            # Track date ranges
+            if date_ref.is_range and date_ref.end_date:
+                timeline.date_ranges.append(
+                    (date_ref.start_date, date_ref.end_date, fact.content[:100])
+                )
 
         # Identify key dates
         timeline.key_dates = self._identify_key_dates(timeline)
 
-        # Store timeline
-        await self._store_timeline(timeline)
+        # Store only the events that changed since the last store
+        await self._store_timeline(
+            timeline, prune=start_date is None and end_date is None
+        )
 
+        self._timelines[cache_key] = (self.date_index.version, timeline)
         return timeline
 
+    async def _ensure_date_index(self):
+        """Load the case's dated facts into the shared index on first use"""
+        await self.date_index.ensure_loaded(self.vector_store, self.facts_collection)
+
     async def _get_facts_with_dates(
         self, start_date: Optional[datetime], end_date: Optional[datetime]
     ) -> List[CaseFact]:
         """Retrieve facts that have date references"""
-        # Build filter
-        must_conditions = [
-            {"key": "case_name", "match": {"value": self.case_name}},
-            {"key": "has_dates", "match": {"value": True}},
-        ]
+        await self._ensure_date_index()
 
-        if start_date and end_date:
-            must_conditions.append(
-                {
-                    "key": "primary_date",
-                    "range": {
-                        "gte": start_date.isoformat(),
-                        "lte": end_date.isoformat(),
-                    },
-                }
-            )
-
-        # Search for facts with dates
-        results = self.vector_store.client.scroll(
-            collection_name=self.facts_collection,
-            scroll_filter={"must": must_conditions},
-            limit=1000,  # Get all facts with dates
-            with_payload=True,
-            with_vectors=False,
-        )
-
-        # Convert to fact objects (simplified - in production would deserialize full facts)
         facts = []
-        for point in results[0]:
-            # Here we would normally deserialize the full fact
-            # For now, creating a minimal fact object
-            fact = CaseFact(
-                id=point.payload["fact_id"],
-                case_name=self.case_name,
-                content=point.payload.get("content", ""),
-                category=point.payload["category"],
-                source_document=point.payload["source_document"],
-                page_references=[],
-                extraction_timestamp=datetime.fromisoformat(
-                    point.payload["extraction_timestamp"]
-                ),
-                confidence_score=point.payload["confidence_score"],
-                date_references=[
-                    DateReference(
-                        date_text="",
-                        start_date=datetime.fromisoformat(
-                            point.payload["primary_date"]
-                        ),
-                    )
-                ]
-                if "primary_date" in point.payload
-                else [],
-            )
-            facts.append(fact)
-
+        seen = set()
+        for _, fact, _ in self.date_index.events(start_date, end_date):
+            if fact.id not in seen:
+                seen.add(fact.id)
+                facts.append(fact)
         return facts
 
     def _identify_key_dates(self, timeline: FactTimeline) -> Dict[str, datetime]:
@@ -186,48 +160,135 @@ class TimelineGenerator:
 
         return key_dates
 
-    async def _store_timeline(self, timeline: FactTimeline):
-        """Store timeline in case-specific collection"""
-        # Create timeline entries for vector storage
-        points = []
+    async def _store_timeline(self, timeline: FactTimeline, prune: bool = True):
+        """
+        Store timeline in case-specific collection.
+
+        Only events whose narrative is new or changed are embedded and
+        upserted. With prune, stored events no longer in the timeline are
+        deleted.
+        """
+        stored = await self._get_stored_narratives()
 
-        for i, (date, fact) in enumerate(timeline.timeline_events):
+        # Create timeline entries for vector storage
+        current = {}
+        changed = []
+        for date, fact in timeline.timeline_events:
             # Create a narrative description
             narrative = f"On {date.strftime('%B %d, %Y')}: {fact.content}"
+            point_id = deterministic_point_id(
+                self.case_name, "timeline", fact.id, date.isoformat()
+            )
+            current[point_id] = narrative
+            if stored.get(point_id) != narrative:
+                changed.append((point_id, date, fact, narrative))
+
+        stale = []
+        if prune:
+            stale = [point_id for point_id in stored if point_id not in current]
+
+        loop = asyncio.get_running_loop()
+        if changed:
+            # Generate embeddings for all changed narratives at once
+            embedding_generator = self._get_embedding_generator()
+            embeddings, _ = await embedding_generator.generate_embeddings_batch_async(
+                [narrative for _, _, _, narrative in changed]
+            )
 
-            # Generate embedding for the narrative
-            from src.vector_storage.embeddings import EmbeddingGenerator
-
-            embedding_gen = EmbeddingGenerator()
-            embedding, _ = await embedding_gen.generate_embedding_async(narrative)
-
-            metadata = {
-                "case_name": self.case_name,
-                "event_date": date.isoformat(),
-                "fact_id": fact.id,
-                "event_index": i,
-                "category": fact.category,
-                "source_document": fact.source_document,
-                "narrative": narrative,
-            }
-
-            points.append(
-                {
-                    "id": f"{self.case_name}_timeline_{i}",
-                    "vector": embedding,
-                    "payload": metadata,
+            points = []
+            for (point_id, date, fact, narrative), embedding in zip(
+                changed, embeddings
+            ):
+                metadata = {
+                    "case_name": self.case_name,
+                    "event_date": date.isoformat(),
+                    "fact_id": fact.id,
+                    "category": getattr(fact.category, "value", fact.category),
+                    "source_document": fact.source_document,
+                    "narrative": narrative,
                 }
-            )
+                points.append(
+                    {"id": point_id, "vector": embedding, "payload": metadata}
+                )
 
-        # Store in timeline collection
-        if points:
-            self.vector_store.client.upsert(
-                collection_name=self.timeline_collection, points=points
+            # Store in timeline collection
+            await upsert_in_chunks(
+                self.vector_store.client,
+                self.timeline_collection,
+                points,
+                self.upsert_batch_size,
+                target="timeline",
             )
+            for point_id, _, _, narrative in changed:
+                stored[point_id] = narrative
+
+        if stale:
+            await loop.run_in_executor(
+                None,
+                partial(
+                    self.vector_store.client.delete,
+                    collection_name=self.timeline_collection,
+                    points_selector=PointIdsList(points=stale),
+                ),
+            )
+            for point_id in stale:
+                stored.pop(point_id, None)
+
+        if changed or stale:
             logger.info(
-                f"Stored {len(points)} timeline events in {self.timeline_collection}"
+                f"Updated timeline in {self.timeline_collection}: "
+                f"{len(changed)} events stored, {len(stale)} removed, "
+                f"{len(current) - len(changed)} unchanged"
             )
 
+    async def _get_stored_narratives(self) -> Dict[str, str]:
+        """
+        Load the narratives already stored for this case.
+
+        Re-read whenever the date index reloads, since the facts and the
+        timeline may both have been written by another process.
+        """
+        if (
+            self._stored_narratives is not None
+            and self._stored_generation == self.date_index.generation
+        ):
+            return self._stored_narratives
+
+        stored = {}
+        loop = asyncio.get_running_loop()
+        offset = None
+        try:
+            while True:
+                points, offset = await loop.run_in_executor(
+                    None,
+                    partial(
+                        self.vector_store.client.scroll,
+                        collection_name=self.timeline_collection,
+                        limit=1000,
+                        offset=offset,
+                        with_payload=["narrative"],
+                        with_vectors=False,
+                    ),
+                )
+                for point in points:
+                    stored[str(point.id)] = point.payload.get("narrative", "")
+                if offset is None:
+                    break
+        except Exception as e:
+            # Collection may not exist yet; every event is then new
+            logger.debug(f"No stored timeline for {self.case_name}: {e}")
+
+        self._stored_narratives = stored
+        self._stored_generation = self.date_index.generation
+        return stored
+
+    def _get_embedding_generator(self):
+        if self._embedding_generator is None:
+            from src.vector_storage.embeddings import EmbeddingGenerator
+
+            self._embedding_generator = EmbeddingGenerator()
+        return self._embedding_generator
+
     def generate_narrative_timeline(
         self, timeline: FactTimeline, format: str = "markdown"
     ) -> str:
@@ -323,7 +384,7 @@ class TimelineGenerator:
                     "date": date.isoformat(),
                     "fact_id": fact.id,
                     "content": fact.content,
-                    "category": fact.category,
+                    "category": getattr(fact.category, "value", fact.category),
                     "source": fact.source_document,
                     "confidence": fact.confidence_score,
                 }
@@ -349,21 +410,12 @@ class TimelineGenerator:
         start_date = target_date - timedelta(days=days_before)
         end_date = target_date + timedelta(days=days_after)
 
-        # Get facts within date range
-        facts = await self._get_facts_with_dates(start_date, end_date)
-
-        # Convert to timeline events
-        events = []
-        for fact in facts:
-            if fact.date_references:
-                for date_ref in fact.date_references:
-                    if date_ref.start_date:
-                        events.append((date_ref.start_date, fact))
-
-        # Sort by date
-        events.sort(key=lambda x: x[0])
-
-        return events
+        # Binary search the date index; entries are already sorted
+        await self._ensure_date_index()
+        return [
+            (date, fact)
+            for date, fact, _ in self.date_index.events(start_date, end_date)
+        ]
 
     def calculate_timeline_statistics(self, timeline: FactTimeline) -> Dict[str, Any]:
         """Calculate statistics about the timeline"""
@@ -58,6 +58,7 @@ class TimeoutMonitor:
         self.start_time = time.time()
         self.end_time = None
         self.progress_log: List[Dict[str, Any]] = []
+        self.prompt_budgets: List[Dict[str, Any]] = []
         self.is_running = True
         self.monitor_task = None
 
@@ -113,6 +114,30 @@ class TimeoutMonitor:
         elapsed = time.time() - self.start_time
         logger.info(f"[PROGRESS] {self.operation_name} [{elapsed:.1f}s]: {message}")
 
+    def log_prompt_budget(self, label: str, usage: Dict[str, Any]):
+        """Record how much of a prompt token budget was used"""
+        self.prompt_budgets.append({"label": label, **usage})
+        logger.debug(
+            f"[PROMPT_BUDGET] {self.operation_name} - {label}: "
+            f"{usage.get('prompt_tokens', 0)}/{usage.get('budget', 0)} tokens"
+        )
+
+    def _prompt_budget_summary(self) -> Optional[Dict[str, Any]]:
+        """Aggregate recorded prompt budget utilization"""
+        if not self.prompt_budgets:
+            return None
+
+        utilizations = [b.get("utilization", 0.0) for b in self.prompt_budgets]
+        return {
+            "prompts": len(self.prompt_budgets),
+            "total_prompt_tokens": sum(
+                b.get("prompt_tokens", 0) for b in self.prompt_budgets
+            ),
+            "avg_utilization": round(sum(utilizations) / len(utilizations), 3),
+            "max_utilization": round(max(utilizations), 3),
+            "per_prompt": self.prompt_budgets,
+        }
+
     def finish(self, success: bool = True):
         """Mark operation as finished"""
         self.is_running = False
@@ -128,6 +153,15 @@ class TimeoutMonitor:
             f"[TIMEOUT_MONITOR] {self.operation_name} {status} after {total_time:.1f}s"
         )
 
+        budget_summary = self._prompt_budget_summary()
+        if budget_summary:
+            logger.info(
+                f"[TIMEOUT_MONITOR] {self.operation_name} prompt budgets: "
+                f"{budget_summary['prompts']} prompts, "
+                f"{budget_summary['total_prompt_tokens']} tokens, "
+                f"avg utilization {budget_summary['avg_utilization']:.0%}"
+            )
+
     def get_summary(self) -> Dict[str, Any]:
         """Get summary of operation timing"""
         current_time = self.end_time or time.time()
@@ -145,6 +179,7 @@ class TimeoutMonitor:
             "exceeded_critical": total_elapsed > self.critical_threshold,
             "progress_steps": len(self.progress_log),
             "last_progress": self.progress_log[-1] if self.progress_log else None,
+            "prompt_budgets": self._prompt_budget_summary(),
         }
 
 
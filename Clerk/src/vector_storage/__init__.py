@@ -3,17 +3,11 @@ Vector storage package for Clerk legal AI system.
 Provides Qdrant vector storage with hybrid search capabilities.
 """
 
-from .embeddings import EmbeddingGenerator
-from .qdrant_store import QdrantVectorStore, SearchResult
-from .sparse_encoder import SparseVectorEncoder, LegalQueryAnalyzer
+from src.utils.lazy_imports import lazy_exports
 
-# Legacy imports for backward compatibility (will be removed)
-try:
-    from .vector_store import VectorStore
-    from .fulltext_search import FullTextSearchManager
-except ImportError:
-    VectorStore = None
-    FullTextSearchManager = None
+# Legacy names kept for backward compatibility; their modules were removed
+VectorStore = None
+FullTextSearchManager = None
 
 __all__ = [
     "EmbeddingGenerator",
@@ -21,9 +15,22 @@ __all__ = [
     "SearchResult",
     "SparseVectorEncoder",
     "LegalQueryAnalyzer",
+    "deterministic_point_id",
     # Legacy
     "VectorStore",
     "FullTextSearchManager",
 ]
 
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "EmbeddingGenerator": ".embeddings",
+        "QdrantVectorStore": ".qdrant_store",
+        "SearchResult": ".qdrant_store",
+        "SparseVectorEncoder": ".sparse_encoder",
+        "LegalQueryAnalyzer": ".sparse_encoder",
+        "deterministic_point_id": ".point_ids",
+    },
+)
+
 __version__ = "2.0.0"  # Major version bump for Qdrant migration
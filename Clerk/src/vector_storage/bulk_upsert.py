@@ -0,0 +1,61 @@
+"""
+Chunked Qdrant upserts for bulk writers.
+Splits large point lists into bounded batches, runs each blocking upsert in
+the shared thread pool and reports embed/upsert throughput.
+"""
+
+from typing import Any, Dict, List
+
+from src.utils.metrics import metrics
+from src.utils.thread_pool import run_blocking
+
+
+async def upsert_in_chunks(
+    client,
+    collection_name: str,
+    points: List[Dict[str, Any]],
+    batch_size: int = 256,
+    target: str = "points",
+):
+    """
+    Upsert points in bounded chunks without blocking the event loop.
+
+    Args:
+        client: Sync Qdrant client
+        collection_name: Collection to write to
+        points: Points as dicts with id, vector and payload
+        batch_size: Points per upsert request
+        target: Label of the qdrant_upsert_seconds metric
+    """
+    for i in range(0, len(points), batch_size):
+        with metrics.timer("qdrant_upsert_seconds", target=target):
+            await run_blocking(
+                client.upsert,
+                collection_name=collection_name,
+                points=points[i : i + batch_size],
+            )
+
+
+def upsert_stats(
+    item_name: str, count: int, started: float, embedded: float, finished: float
+) -> Dict[str, Any]:
+    """
+    Throughput of one embed-and-upsert pass.
+
+    Args:
+        item_name: Plural name of the stored items, e.g. "citations"
+        count: Items stored
+        started: perf_counter() when the pass began
+        embedded: perf_counter() when embedding finished
+        finished: perf_counter() when the last upsert finished
+
+    Returns:
+        Item count, embedding and upsert seconds, and items per second
+    """
+    elapsed = finished - started
+    return {
+        item_name: count,
+        "embedding_seconds": round(embedded - started, 3),
+        "upsert_seconds": round(finished - embedded, 3),
+        f"{item_name}_per_second": round(count / elapsed, 1) if elapsed else 0.0,
+    }
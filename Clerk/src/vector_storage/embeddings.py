@@ -4,7 +4,7 @@ Creates vector embeddings using OpenAI's text-embedding-3-small model.
 """
 
 import logging
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 import numpy as np
 import asyncio
 
@@ -18,6 +18,8 @@ from tenacity import (
 from tenacity.asyncio import AsyncRetrying
 
 from config.settings import settings
+from src.utils.client_registry import get_client_registry
+from src.utils.metrics import metrics
 
 logger = logging.getLogger(__name__)
 
@@ -25,10 +27,20 @@ logger = logging.getLogger(__name__)
 class EmbeddingGenerator:
     """Generates vector embeddings for text chunks"""
 
-    def __init__(self):
-        """Initialize embedding generator with OpenAI client"""
-        self.client = openai.OpenAI(api_key=settings.openai.api_key)
-        self.async_client = openai.AsyncOpenAI(api_key=settings.openai.api_key)
+    def __init__(
+        self,
+        client: Optional[openai.OpenAI] = None,
+        async_client: Optional[openai.AsyncOpenAI] = None,
+    ):
+        """Initialize embedding generator with the shared OpenAI clients
+
+        Args:
+            client: Sync OpenAI client, defaults to the registry's pooled client
+            async_client: Async OpenAI client, defaults to the registry's pooled client
+        """
+        registry = get_client_registry()
+        self.client = client or registry.openai_client()
+        self.async_client = async_client or registry.async_openai_client()
         self.model = settings.ai.embedding_model
         self.dimensions = settings.ai.embedding_dimensions
 
@@ -49,9 +61,10 @@ class EmbeddingGenerator:
             Tuple of (embedding vector, token count)
         """
         try:
-            response = self.client.embeddings.create(
-                model=self.model, input=text, encoding_format="float"
-            )
+            with metrics.timer("embedding_seconds", operation="single"):
+                response = self.client.embeddings.create(
+                    model=self.model, input=text, encoding_format="float"
+                )
 
             embedding = response.data[0].embedding
             token_count = response.usage.total_tokens
@@ -92,9 +105,10 @@ class EmbeddingGenerator:
             batch = texts[i : i + self.max_batch_size]
 
             try:
-                response = self.client.embeddings.create(
-                    model=self.model, input=batch, encoding_format="float"
-                )
+                with metrics.timer("embedding_seconds", operation="batch"):
+                    response = self.client.embeddings.create(
+                        model=self.model, input=batch, encoding_format="float"
+                    )
 
                 # Extract embeddings in order
                 batch_embeddings = [item.embedding for item in response.data]
@@ -193,9 +207,10 @@ class EmbeddingGenerator:
         ):
             with attempt:
                 try:
-                    response = await self.async_client.embeddings.create(
-                        model=self.model, input=text, encoding_format="float"
-                    )
+                    with metrics.timer("embedding_seconds", operation="single_async"):
+                        response = await self.async_client.embeddings.create(
+                            model=self.model, input=text, encoding_format="float"
+                        )
 
                     embedding = response.data[0].embedding
                     token_count = response.usage.total_tokens
@@ -244,9 +259,12 @@ class EmbeddingGenerator:
             ):
                 with attempt:
                     try:
-                        response = await self.async_client.embeddings.create(
-                            model=self.model, input=batch, encoding_format="float"
-                        )
+                        with metrics.timer(
+                            "embedding_seconds", operation="batch_async"
+                        ):
+                            response = await self.async_client.embeddings.create(
+                                model=self.model, input=batch, encoding_format="float"
+                            )
 
                         # Extract embeddings in order
                         batch_embeddings = [item.embedding for item in response.data]
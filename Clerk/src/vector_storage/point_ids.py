@@ -0,0 +1,25 @@
+"""
+Deterministic Qdrant point IDs.
+Derives stable UUIDs from identifying fields so re-indexing the same source
+overwrites existing points instead of duplicating them.
+"""
+
+import uuid
+from typing import Any
+
+# Fixed namespace for all Clerk point IDs
+POINT_ID_NAMESPACE = uuid.UUID("6f1c2e0a-4b7d-5c3e-9a8f-2d4b6c8e0f13")
+
+
+def deterministic_point_id(*parts: Any) -> str:
+    """
+    Build a UUID5 point ID from identifying parts.
+
+    Args:
+        *parts: Values that identify the point (case, document, offset, ...)
+
+    Returns:
+        UUID string, identical for identical parts
+    """
+    key = "\x1f".join("" if part is None else str(part) for part in parts)
+    return str(uuid.uuid5(POINT_ID_NAMESPACE, key))
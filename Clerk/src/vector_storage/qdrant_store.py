@@ -4,6 +4,7 @@ Manages storing and retrieving vectors from Qdrant with folder-based isolation a
 """
 
 import asyncio
+import logging
 import uuid
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
@@ -34,7 +35,10 @@ from qdrant_client.models import (
 )
 from config.settings import settings
 from src.utils.logger import get_logger
-from src.vector_storage.sparse_encoder import SparseVectorEncoder
+from src.utils.metrics import metrics
+from src.utils.client_registry import get_client_registry
+from src.utils.thread_pool import run_blocking
+from src.vector_storage.sparse_encoder import SparseVectorEncoder, get_sparse_encoder
 
 logger = get_logger(__name__)
 
@@ -77,50 +81,66 @@ class SearchResult:
 class QdrantVectorStore:
     """Manages vector storage in Qdrant with folder-based isolation and hybrid search"""
 
-    def __init__(self, database_name: Optional[str] = None):
-        """Initialize Qdrant client
+    def __init__(
+        self,
+        database_name: Optional[str] = None,
+        client: Optional[QdrantClient] = None,
+        async_client: Optional[AsyncQdrantClient] = None,
+        cohere_client: Optional[cohere.Client] = None,
+        sparse_encoder: Optional[SparseVectorEncoder] = None,
+    ):
+        """Initialize the store on shared clients
+
+        Clients default to the process-wide registry, so building a store per
+        request opens no new connections.
 
         Args:
             database_name: Optional database name for case-specific collections
+            client: Sync Qdrant client to use instead of the shared one
+            async_client: Async Qdrant client to use instead of the shared one
+            cohere_client: Cohere client to use instead of the shared one
+            sparse_encoder: Sparse encoder to use instead of the shared one
         """
         self.config = settings.qdrant
         self.database_name = database_name
 
-        # Build URL with database name if provided
-        base_url = self.config.url
-        if database_name:
-            if base_url.endswith("/"):
-                base_url = base_url[:-1]
-            base_url = f"{base_url}/{database_name}"
-
-        # Initialize synchronous client
-        self.client = QdrantClient(
-            url=base_url,
-            api_key=self.config.api_key,
-            prefer_grpc=self.config.prefer_grpc,
-            timeout=self.config.timeout,
-            check_compatibility=False,  # Skip version check for Docker/Cloud setups
-        )
+        registry = get_client_registry()
+        base_url = registry.qdrant_url(database_name)
+        self.client = client or registry.qdrant_client(base_url)
+        self.async_client = async_client or registry.async_qdrant_client(base_url)
 
-        # Initialize async client for batch operations
-        self.async_client = AsyncQdrantClient(
-            url=base_url,
-            api_key=self.config.api_key,
-            prefer_grpc=self.config.prefer_grpc,
-            timeout=self.config.timeout,
-            check_compatibility=False,  # Skip version check for Docker/Cloud setups
-        )
+        # Per-collection (named vectors, sparse vectors) layout, read once
+        self._collection_layouts: Dict[str, Tuple[bool, bool]] = {}
 
-        # Initialize sparse encoder for hybrid search
-        self.sparse_encoder = SparseVectorEncoder()
+        # Sparse encoder for hybrid search, resolved on first use
+        self._sparse_encoder = sparse_encoder
 
-        # Initialize Cohere client for reranking
-        self.cohere_client = (
-            cohere.Client(settings.cohere.api_key) if settings.cohere.api_key else None
-        )
+        # Cohere client for reranking
+        self.cohere_client = cohere_client or registry.cohere_client()
         if not self.cohere_client:
             logger.warning("Cohere API key not found. Reranking will be disabled.")
 
+    @property
+    def sparse_encoder(self) -> SparseVectorEncoder:
+        """Sparse encoder, the shared one unless injected; loads spaCy on first use"""
+        if self._sparse_encoder is None:
+            self._sparse_encoder = get_sparse_encoder()
+        return self._sparse_encoder
+
+    def _case_views(self):
+        """Shared materialized view manager holding per-case aggregates"""
+        # Import here to avoid circular dependency
+        from src.database.caching_manager import get_materialized_view_manager
+
+        return get_materialized_view_manager(self)
+
+    def _storage_tiers(self):
+        """Shared tiering manager, which promotes demoted cases on access"""
+        # Import here to avoid circular dependency
+        from src.database.storage_tiering import get_storage_tiering_manager
+
+        return get_storage_tiering_manager(self)
+
     def get_collection_name(self, folder_name: str) -> str:
         """Generate safe collection name from folder name"""
         # Sanitize folder name to valid Qdrant collection name
@@ -481,8 +501,12 @@ class QdrantVectorStore:
             points.append(point)
 
             # Batch upload
-            self.client.upsert(
-                collection_name=collection_name, points=points, wait=True
+            with metrics.timer("qdrant_upsert_seconds", target="chunks"):
+                self.client.upsert(
+                    collection_name=collection_name, points=points, wait=True
+                )
+            self._case_views().record_chunk_upserts(
+                folder_name, [(point.id, point.payload) for point in points]
             )
 
             logger.info(f"Successfully indexed {len(stored_ids)} documents")
@@ -557,11 +581,12 @@ class QdrantVectorStore:
             hybrid_points.append(point)
 
             # Batch upload to hybrid collection
-            self.client.upsert(
-                collection_name=self.get_collection_name(folder_name),
-                points=hybrid_points,
-                wait=True,
-            )
+            with metrics.timer("qdrant_upsert_seconds", target="hybrid_chunks"):
+                self.client.upsert(
+                    collection_name=self.get_collection_name(folder_name),
+                    points=hybrid_points,
+                    wait=True,
+                )
 
         except Exception as e:
             logger.error(f"Error storing hybrid document: {str(e)}")
@@ -597,17 +622,9 @@ class QdrantVectorStore:
             logger.debug(
                 f"Searching collection '{collection_name}' with embedding of length {len(query_embedding)}"
             )
+            self._storage_tiers().record_access(collection_name)
 
-            # Build filter if provided
-            query_filter = None
-            if filters:
-                conditions = []
-                for key, value in filters.items():
-                    conditions.append(
-                        FieldCondition(key=key, match=MatchValue(value=value))
-                    )
-                query_filter = Filter(must=conditions)
-                logger.debug(f"Applied filters: {filters}")
+            query_filter = self._build_filter(filters)
 
             # Check if collection has multiple vector configurations
             try:
@@ -655,20 +672,7 @@ class QdrantVectorStore:
                     with_vectors=False,
                 )
 
-            # Convert to SearchResult objects
-            search_results = []
-            for point in results:
-                search_results.append(
-                    SearchResult(
-                        id=str(point.id),
-                        content=point.payload.get("content", ""),
-                        case_name=point.payload.get("case_name", ""),
-                        document_id=point.payload.get("document_id", ""),
-                        score=point.score,
-                        metadata=point.payload,
-                        search_type="vector",
-                    )
-                )
+            search_results = self._to_search_results(results)
 
             logger.debug(f"Found {len(search_results)} vector results")
             return search_results
@@ -677,6 +681,107 @@ class QdrantVectorStore:
             logger.error(f"Error searching documents: {str(e)}")
             raise
 
+    async def search_documents_async(
+        self,
+        collection_name: str,
+        query_embedding: List[float],
+        limit: int = 10,
+        threshold: float = 0.7,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[SearchResult]:
+        """Search for similar documents without blocking the event loop
+
+        Async counterpart of search_documents using the async Qdrant client.
+
+        Args:
+            collection_name: Name of the collection to search
+            query_embedding: Query vector
+            limit: Maximum number of results
+            threshold: Minimum similarity threshold
+            filters: Additional filters to apply
+
+        Returns:
+            List of search results with similarity scores
+        """
+        if not isinstance(query_embedding, (list, tuple)) or not query_embedding:
+            raise ValueError(
+                f"query_embedding must be a non-empty list, got: {type(query_embedding)}"
+            )
+        self._storage_tiers().record_access(collection_name)
+
+        try:
+            named_vectors, _ = await self._get_collection_layout(collection_name)
+        except Exception as e:
+            logger.warning(
+                f"Could not determine collection vector config, using default: {str(e)}"
+            )
+            named_vectors = False
+
+        try:
+            response = await self.async_client.query_points(
+                collection_name=collection_name,
+                query=query_embedding,
+                using="semantic" if named_vectors else None,
+                query_filter=self._build_filter(filters),
+                limit=limit,
+                score_threshold=threshold,
+                with_payload=True,
+                with_vectors=False,
+            )
+        except Exception as e:
+            logger.error(f"Error searching documents: {str(e)}")
+            raise
+
+        search_results = self._to_search_results(response.points)
+        logger.debug("Found %d vector results", len(search_results))
+        return search_results
+
+    async def _get_collection_layout(self, collection_name: str) -> Tuple[bool, bool]:
+        """Return whether a collection uses named vectors and sparse vectors
+
+        The layout is read once per collection and cached, so searches do not
+        pay an extra get_collection round trip.
+        """
+        layout = self._collection_layouts.get(collection_name)
+        if layout is None:
+            collection_info = await self.async_client.get_collection(collection_name)
+            params = collection_info.config.params
+            layout = (
+                isinstance(params.vectors, dict),
+                bool(getattr(params, "sparse_vectors", None)),
+            )
+            self._collection_layouts[collection_name] = layout
+        return layout
+
+    def _build_filter(self, filters: Optional[Dict[str, Any]]) -> Optional[Filter]:
+        """Build an exact-match filter from field/value pairs"""
+        if not filters:
+            return None
+        logger.debug("Applied filters: %s", filters)
+        return Filter(
+            must=[
+                FieldCondition(key=key, match=MatchValue(value=value))
+                for key, value in filters.items()
+            ]
+        )
+
+    def _to_search_results(
+        self, points, search_type: str = "vector"
+    ) -> List[SearchResult]:
+        """Convert scored Qdrant points to SearchResult objects"""
+        return [
+            SearchResult(
+                id=str(point.id),
+                content=point.payload.get("content", ""),
+                case_name=point.payload.get("case_name", ""),
+                document_id=point.payload.get("document_id", ""),
+                score=point.score,
+                metadata=point.payload,
+                search_type=search_type,
+            )
+            for point in points
+        ]
+
     def reciprocal_rank_fusion_with_tracking(
         self, *result_lists, k: int = 60
     ) -> List[SearchResult]:
@@ -763,12 +868,14 @@ class QdrantVectorStore:
                 documents.append(doc_text)
 
             # Call Cohere Rerank API
-            response = self.cohere_client.rerank(
-                model="rerank-v3.5",
-                query=query,
-                documents=documents,
-                top_n=min(top_n, len(documents)),
-            )
+            with metrics.timer("rerank_seconds"):
+                response = await run_blocking(
+                    self.cohere_client.rerank,
+                    model="rerank-v3.5",
+                    query=query,
+                    documents=documents,
+                    top_n=min(top_n, len(documents)),
+                )
 
             # Map reranked results back to SearchResult objects
             reranked_results = []
@@ -817,13 +924,16 @@ class QdrantVectorStore:
             List of reranked SearchResult objects with ranking history
         """
         try:
+            self._storage_tiers().record_access(collection_name)
+
             # Ensure collection exists - create if it doesn't
-            if not self.client.collection_exists(collection_name):
+            if not await self.async_client.collection_exists(collection_name):
                 logger.warning(
                     f"Collection {collection_name} does not exist. Creating it..."
                 )
+                self._collection_layouts.pop(collection_name, None)
                 try:
-                    self.create_collection(collection_name)
+                    await run_blocking(self.create_collection, collection_name)
                     logger.info(f"Successfully created collection: {collection_name}")
                 except Exception as create_error:
                     logger.error(
@@ -841,12 +951,13 @@ class QdrantVectorStore:
             # 1. Semantic search using dense vectors
             semantic_results = []
             try:
-                semantic_results = self.search_documents(
-                    collection_name=collection_name,
-                    query_embedding=query_embedding,
-                    limit=limit,
-                    threshold=0.0,  # Lower threshold for RRF
-                )
+                with metrics.timer("hybrid_search_leg_seconds", leg="semantic"):
+                    semantic_results = await self.search_documents_async(
+                        collection_name=collection_name,
+                        query_embedding=query_embedding,
+                        limit=limit,
+                        threshold=0.0,  # Lower threshold for RRF
+                    )
 
                 # Add ranking information
                 for rank, result in enumerate(semantic_results, 1):
@@ -854,7 +965,7 @@ class QdrantVectorStore:
                     result.score_history["semantic_score"] = result.score
 
                 logger.debug(
-                    f"Semantic search returned {len(semantic_results)} results"
+                    "Semantic search returned %d results", len(semantic_results)
                 )
             except Exception as e:
                 logger.error(f"Semantic search failed: {str(e)}")
@@ -863,11 +974,13 @@ class QdrantVectorStore:
 
             # Check if collection supports sparse vectors
             try:
-                collection_info = self.client.get_collection(collection_name)
-                params = collection_info.config.params
-                has_sparse_vectors = bool(getattr(params, "sparse_vectors", None))
+                _, has_sparse_vectors = await self._get_collection_layout(
+                    collection_name
+                )
                 logger.debug(
-                    f"Collection {collection_name} sparse vector support: {has_sparse_vectors}"
+                    "Collection %s sparse vector support: %s",
+                    collection_name,
+                    has_sparse_vectors,
                 )
             except Exception as e:
                 logger.warning(f"Could not check collection info: {str(e)}")
@@ -882,20 +995,21 @@ class QdrantVectorStore:
                     values = [float(v) for v in keywords_sparse.values()]
 
                     if indices and values and len(indices) == len(values):
-                        keyword_search_results = self.client.search(
-                            collection_name=collection_name,
-                            query_vector=models.NamedSparseVector(
-                                name="keywords",
-                                vector=models.SparseVector(
-                                    indices=indices, values=values
-                                ),
-                            ),
-                            limit=limit,
-                            with_payload=True,
-                            with_vectors=False,
-                        )
+                        with metrics.timer("hybrid_search_leg_seconds", leg="keyword"):
+                            keyword_search_results = (
+                                await self.async_client.query_points(
+                                    collection_name=collection_name,
+                                    query=models.SparseVector(
+                                        indices=indices, values=values
+                                    ),
+                                    using="keywords",
+                                    limit=limit,
+                                    with_payload=True,
+                                    with_vectors=False,
+                                )
+                            )
 
-                        for rank, point in enumerate(keyword_search_results, 1):
+                        for rank, point in enumerate(keyword_search_results.points, 1):
                             result = SearchResult(
                                 id=str(point.id),
                                 content=point.payload.get("content", ""),
@@ -910,7 +1024,7 @@ class QdrantVectorStore:
                             keyword_results.append(result)
 
                         logger.debug(
-                            f"Keyword search returned {len(keyword_results)} results"
+                            "Keyword search returned %d results", len(keyword_results)
                         )
                     else:
                         logger.warning("Invalid sparse vector data for keyword search")
@@ -930,20 +1044,21 @@ class QdrantVectorStore:
                     values = [float(v) for v in citations_sparse.values()]
 
                     if indices and values and len(indices) == len(values):
-                        citation_search_results = self.client.search(
-                            collection_name=collection_name,
-                            query_vector=models.NamedSparseVector(
-                                name="citations",
-                                vector=models.SparseVector(
-                                    indices=indices, values=values
-                                ),
-                            ),
-                            limit=limit,
-                            with_payload=True,
-                            with_vectors=False,
-                        )
+                        with metrics.timer("hybrid_search_leg_seconds", leg="citation"):
+                            citation_search_results = (
+                                await self.async_client.query_points(
+                                    collection_name=collection_name,
+                                    query=models.SparseVector(
+                                        indices=indices, values=values
+                                    ),
+                                    using="citations",
+                                    limit=limit,
+                                    with_payload=True,
+                                    with_vectors=False,
+                                )
+                            )
 
-                        for rank, point in enumerate(citation_search_results, 1):
+                        for rank, point in enumerate(citation_search_results.points, 1):
                             result = SearchResult(
                                 id=str(point.id),
                                 content=point.payload.get("content", ""),
@@ -958,7 +1073,7 @@ class QdrantVectorStore:
                             citation_results.append(result)
 
                         logger.debug(
-                            f"Citation search returned {len(citation_results)} results"
+                            "Citation search returned %d results", len(citation_results)
                         )
                     else:
                         logger.warning("Invalid sparse vector data for citation search")
@@ -976,7 +1091,8 @@ class QdrantVectorStore:
             if citation_results:
                 search_lists.append(citation_results)
 
-            fused_results = self.reciprocal_rank_fusion_with_tracking(*search_lists)
+            with metrics.timer("rrf_fusion_seconds"):
+                fused_results = self.reciprocal_rank_fusion_with_tracking(*search_lists)
 
             # Add RRF ranking
             for rank, result in enumerate(fused_results, 1):
@@ -1004,25 +1120,33 @@ class QdrantVectorStore:
 
             # Log ranking journey for top results
             logger.info(
-                f"Hybrid search completed: {len(semantic_results)} semantic, {len(keyword_results)} keyword, {len(citation_results)} citation -> {len(final_results)} final"
+                "Hybrid search completed: %d semantic, %d keyword, %d citation -> %d final",
+                len(semantic_results),
+                len(keyword_results),
+                len(citation_results),
+                len(final_results),
             )
 
-            for i, result in enumerate(final_results[:3], 1):  # Log top 3
-                logger.debug(
-                    f"Result {i} ranking journey: "
-                    f"Semantic #{result.ranking_history.get('semantic_rank', 'N/A')}, "
-                    f"Keyword #{result.ranking_history.get('keyword_rank', 'N/A')}, "
-                    f"Citation #{result.ranking_history.get('citation_rank', 'N/A')} -> "
-                    f"RRF #{result.ranking_history.get('rrf_rank', 'N/A')} -> "
-                    f"Final #{result.ranking_history.get('final_rank', 'N/A')}"
-                )
+            if logger.isEnabledFor(logging.DEBUG):
+                for i, result in enumerate(final_results[:3], 1):  # Log top 3
+                    history = result.ranking_history
+                    logger.debug(
+                        "Result %d ranking journey: Semantic #%s, Keyword #%s, "
+                        "Citation #%s -> RRF #%s -> Final #%s",
+                        i,
+                        history.get("semantic_rank", "N/A"),
+                        history.get("keyword_rank", "N/A"),
+                        history.get("citation_rank", "N/A"),
+                        history.get("rrf_rank", "N/A"),
+                        history.get("final_rank", "N/A"),
+                    )
 
             return final_results
 
         except Exception as e:
             logger.error(f"Error in hybrid search: {str(e)}")
             # Fallback to semantic search only
-            return self.search_documents(
+            return await self.search_documents_async(
                 collection_name=collection_name,
                 query_embedding=query_embedding,
                 limit=final_limit,
@@ -1128,6 +1252,8 @@ class QdrantVectorStore:
                 except Exception as e:
                     logger.warning(f"Could not delete from hybrid collection: {str(e)}")
 
+            self._case_views().record_document_removal(folder_name, document_id)
+
             logger.info(f"Deleted {count_before} vectors for document {document_id}")
             return count_before
 
@@ -1273,8 +1399,12 @@ class QdrantVectorStore:
                 points.append(point)
 
             # Batch upload all points
-            self.client.upsert(
-                collection_name=collection_name, points=points, wait=True
+            with metrics.timer("qdrant_upsert_seconds", target="chunks"):
+                self.client.upsert(
+                    collection_name=collection_name, points=points, wait=True
+                )
+            self._case_views().record_chunk_upserts(
+                case_name, [(point.id, point.payload) for point in points]
             )
 
             logger.info(
@@ -1446,11 +1576,16 @@ class QdrantVectorStore:
             logger.error(f"Error getting case name mapping: {str(e)}")
             return {}
 
-    def list_cases(self, include_shared: bool = False) -> List[Dict[str, Any]]:
+    def list_cases(
+        self, include_shared: bool = False, include_details: bool = True
+    ) -> List[Dict[str, Any]]:
         """List all cases (collections) in the system
 
         Args:
             include_shared: Whether to include shared resource collections
+            include_details: Whether to fetch collection info per case. Without
+                it, only materialized case statistics are attached, so the
+                listing costs a single get_collections call
 
         Returns:
             List of case information dictionaries
@@ -1467,6 +1602,18 @@ class QdrantVectorStore:
                 if not include_shared and is_shared_resource(collection.name):
                     continue
 
+                if not include_details:
+                    case_info = {
+                        "collection_name": collection.name,
+                        "original_name": collection.name,
+                        "is_shared": is_shared_resource(collection.name),
+                    }
+                    statistics = self._case_views().get_case_statistics(collection.name)
+                    if statistics is not None:
+                        case_info["statistics"] = statistics
+                    cases.append(case_info)
+                    continue
+
                 try:
                     # Get collection info
                     info = self.client.get_collection(collection.name)
@@ -1504,6 +1651,9 @@ class QdrantVectorStore:
     def get_folder_statistics(self, folder_name: str) -> Dict[str, Any]:
         """Get statistics for a specific folder
 
+        Served from the case's materialized aggregate; the first call for a
+        case scans its collection once, later calls are dictionary reads.
+
         Args:
             folder_name: Folder to get statistics for
 
@@ -1511,40 +1661,11 @@ class QdrantVectorStore:
             Dictionary with folder statistics
         """
         try:
-            folder_filter = Filter(
-                must=[
-                    FieldCondition(
-                        key="folder_name", match=MatchValue(value=folder_name)
-                    )
-                ]
-            )
-
-            # Get counts
-            total_chunks = self.client.count(
-                collection_name=self.get_collection_name(folder_name),
-                count_filter=folder_filter,
-            ).count
-
-            # Get unique documents (this is approximate)
-            # In production, you might want to maintain a separate index
-            search_results = self.client.scroll(
-                collection_name=self.get_collection_name(folder_name),
-                scroll_filter=folder_filter,
-                limit=10000,  # Adjust based on expected folder size
-                with_payload=["document_id"],
-                with_vectors=False,
-            )
+            views = self._case_views()
+            views.materialize_case_statistics(folder_name)
+            stats = views.get_case_statistics(folder_name, include_document_ids=True)
 
-            unique_documents = set()
-            for point in search_results[0]:
-                unique_documents.add(point.payload.get("document_id"))
-
-            return {
-                "folder_name": folder_name,
-                "total_chunks": total_chunks,
-                "unique_documents": len(unique_documents),
-                "document_ids": list(unique_documents),
-            }
+            return {"folder_name": folder_name, **stats}
 
         except Exception as e:
             logger.error(f"Error getting folder statistics: {str(e)}")
@@ -1583,10 +1704,4 @@ class QdrantVectorStore:
             raise
 
     def close(self):
-        """Close client connections"""
-        try:
-            if hasattr(self.async_client, "close"):
-                asyncio.run(self.async_client.close())
-            logger.info("Closed Qdrant connections")
-        except Exception as e:
-            logger.warning(f"Error closing connections: {str(e)}")
+        """Kept for callers; shared clients are closed by the client registry"""
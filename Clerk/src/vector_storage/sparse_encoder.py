@@ -7,12 +7,13 @@ Using hash-based consistent indexing.
 import re
 import logging
 import hashlib
-from typing import Dict, List, Tuple
+import threading
+from typing import Dict, List, Optional, Tuple
 from collections import Counter
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-import spacy
-from spacy.lang.en import English
+
+from src.utils.legal_entity_scanner import get_legal_entity_scanner
+from src.utils.metrics import metrics
 
 
 logger = logging.getLogger(__name__)
@@ -23,6 +24,11 @@ class SparseVectorEncoder:
 
     def __init__(self):
         """Initialize the sparse encoder with legal-specific tokenization"""
+        # spaCy is imported here rather than at module load, so importing the
+        # vector store stays cheap until an encoder is actually built
+        import spacy
+        from spacy.lang.en import English
+
         # Initialize spaCy for better tokenization
         try:
             self.nlp = spacy.load("en_core_web_sm", disable=["parser", "ner"])
@@ -31,29 +37,11 @@ class SparseVectorEncoder:
             self.nlp = English()
             self.nlp.add_pipe("sentencizer")
 
-        # Legal-specific patterns
-        self.citation_pattern = re.compile(
-            r"(?:"
-            r"\d+\s+U\.S\.C\.\s+§\s*\d+|"  # USC citations
-            r"\d+\s+F\.\d+d\s+\d+|"  # Federal Reporter
-            r"\d+\s+S\.\s*Ct\.\s+\d+|"  # Supreme Court Reporter
-            r"§\s*\d+(?:\.\d+)?|"  # Section references
-            r"Rule\s+\d+(?:\.\d+)?|"  # Rule references
-            r"\d+\s+[A-Z][a-z]+(?:\.\s*\d+d)?\s+\d+"  # State reporters
-            r")"
-        )
-
-        self.monetary_pattern = re.compile(
-            r"\$[\d,]+(?:\.\d{2})?(?:\s*(?:million|billion|thousand|k|m|b))?"
-        )
-
-        self.date_pattern = re.compile(
-            r"(?:"
-            r"\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{1,2},?\s+\d{4}|"
-            r"\b\d{1,2}[-/]\d{1,2}[-/]\d{2,4}|"
-            r"\b\d{4}[-/]\d{1,2}[-/]\d{1,2}"
-            r")"
-        )
+        # Legal-specific patterns, shared with the other entity consumers
+        self.entity_scanner = get_legal_entity_scanner()
+        self.citation_pattern = self.entity_scanner.pattern("sparse.citation")
+        self.monetary_pattern = self.entity_scanner.pattern("sparse.monetary")
+        self.date_pattern = self.entity_scanner.pattern("sparse.date")
 
         # Legal stopwords (common words to exclude)
         self.legal_stopwords = set(
@@ -109,8 +97,8 @@ class SparseVectorEncoder:
             ]
         )
 
-        # Initialize TF-IDF for keyword extraction
-        self.tfidf_vectorizer = TfidfVectorizer(
+        # TF-IDF settings for keyword extraction
+        self.tfidf_params = dict(
             max_features=1000,
             ngram_range=(1, 2),
             stop_words="english",
@@ -156,25 +144,13 @@ class SparseVectorEncoder:
             "rules": [],
         }
 
-        # Extract citations
-        citations = self.citation_pattern.findall(text)
-        entities["citations"] = list(set(citations))
-
-        # Extract monetary amounts
-        monetary = self.monetary_pattern.findall(text)
-        entities["monetary"] = list(set(monetary))
-
-        # Extract dates
-        dates = self.date_pattern.findall(text)
-        entities["dates"] = list(set(dates))
-
-        # Extract section references
-        sections = re.findall(r"§\s*\d+(?:\.\d+)?", text)
-        entities["sections"] = list(set(sections))
-
-        # Extract rule references
-        rules = re.findall(r"Rule\s+\d+(?:\.\d+)?", text, re.IGNORECASE)
-        entities["rules"] = list(set(rules))
+        # Each chunk is scanned once; repeated calls reuse the scanner's matches
+        scanner = self.entity_scanner
+        entities["citations"] = list(set(scanner.findall(text, "sparse.citation")))
+        entities["monetary"] = list(set(scanner.findall(text, "sparse.monetary")))
+        entities["dates"] = list(set(scanner.findall(text, "sparse.date")))
+        entities["sections"] = list(set(scanner.findall(text, "sparse.section")))
+        entities["rules"] = list(set(scanner.findall(text, "sparse.rule")))
 
         return entities
 
@@ -302,6 +278,7 @@ class SparseVectorEncoder:
 
         return sparse_vector
 
+    @metrics.timer("sparse_encoding_seconds")
     def encode_for_hybrid_search(
         self, text: str
     ) -> Tuple[Dict[int, float], Dict[int, float]]:
@@ -379,9 +356,14 @@ class SparseVectorEncoder:
             # Join tokens back for TF-IDF
             processed_text = " ".join(tokens)
 
-            # Fit TF-IDF on single document
-            tfidf_matrix = self.tfidf_vectorizer.fit_transform([processed_text])
-            feature_names = self.tfidf_vectorizer.get_feature_names_out()
+            # Import here to keep sklearn off the startup path
+            from sklearn.feature_extraction.text import TfidfVectorizer
+
+            # Fit TF-IDF on single document; a fresh vectorizer keeps the
+            # shared encoder safe to use from several threads
+            vectorizer = TfidfVectorizer(**self.tfidf_params)
+            tfidf_matrix = vectorizer.fit_transform([processed_text])
+            feature_names = vectorizer.get_feature_names_out()
 
             # Get scores
             scores = tfidf_matrix.toarray()[0]
@@ -496,3 +478,16 @@ class LegalQueryAnalyzer:
             }
 
         return analysis
+
+
+_sparse_encoder: Optional[SparseVectorEncoder] = None
+_sparse_encoder_lock = threading.Lock()
+
+
+def get_sparse_encoder() -> SparseVectorEncoder:
+    """Return the shared sparse encoder, loading spaCy on first use"""
+    global _sparse_encoder
+    with _sparse_encoder_lock:
+        if _sparse_encoder is None:
+            _sparse_encoder = SparseVectorEncoder()
+        return _sparse_encoder
@@ -1,5 +1,6 @@
 import pytest
-from unittest.mock import AsyncMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
 from src.vector_storage.qdrant_store import QdrantVectorStore
 
 
@@ -97,3 +98,90 @@ class TestQdrantVectorStore:
         # Verify all collection names are within limit
         for coll_name in results.keys():
             assert len(coll_name) <= 63
+
+
+class TestAsyncSearch:
+    """Test searches run on the async client"""
+
+    @pytest.fixture
+    def vector_store(self):
+        store = QdrantVectorStore()
+        store.client = Mock()
+        store.async_client = AsyncMock()
+        store.async_client.get_collection.return_value = SimpleNamespace(
+            config=SimpleNamespace(
+                params=SimpleNamespace(vectors={"semantic": None}, sparse_vectors={})
+            )
+        )
+        store.async_client.query_points.return_value = SimpleNamespace(
+            points=[
+                SimpleNamespace(
+                    id=1,
+                    score=0.9,
+                    payload={
+                        "content": "text",
+                        "case_name": "case",
+                        "document_id": "d",
+                    },
+                )
+            ]
+        )
+        return store
+
+    @pytest.mark.asyncio
+    async def test_search_documents_async(self, vector_store):
+        """Test named-vector search with a cached collection layout"""
+        results = await vector_store.search_documents_async(
+            "case", [0.1, 0.2], limit=5, filters={"document_id": "d"}
+        )
+        await vector_store.search_documents_async("case", [0.1, 0.2])
+
+        assert [(r.id, r.content, r.score) for r in results] == [("1", "text", 0.9)]
+        query = vector_store.async_client.query_points.call_args_list[0].kwargs
+        assert query["using"] == "semantic"
+        assert query["limit"] == 5
+        assert query["query_filter"].must[0].key == "document_id"
+
+        vector_store.async_client.get_collection.assert_awaited_once_with("case")
+        vector_store.client.search.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_search_documents_async_rejects_empty_embedding(self, vector_store):
+        with pytest.raises(ValueError):
+            await vector_store.search_documents_async("case", [])
+
+
+class TestCaseStatistics:
+    """Test folder statistics come from the materialized case aggregate"""
+
+    @pytest.fixture
+    def vector_store(self, monkeypatch):
+        from src.database import caching_manager
+
+        monkeypatch.setattr(caching_manager, "_view_manager", None)
+        store = QdrantVectorStore()
+        store.client = Mock()
+        store.client.collection_exists.return_value = False
+        store.ensure_collection_exists = Mock(return_value="case")
+        return store
+
+    def test_folder_statistics_follow_stored_chunks(self, vector_store):
+        stats = vector_store.get_folder_statistics("case")
+        assert (stats["total_chunks"], stats["unique_documents"]) == (0, 0)
+
+        chunks = [
+            {
+                "content": "text",
+                "embedding": [0.1],
+                "metadata": {"document_type": "motion"},
+            }
+        ] * 3
+        vector_store.store_document_chunks("case", "doc-1", chunks)
+        stats = vector_store.get_folder_statistics("case")
+
+        assert stats["total_chunks"] == 3
+        assert stats["document_ids"] == ["doc-1"]
+        assert stats["document_types"] == {"motion": 1}
+        # Built once; later reads never scroll the collection
+        vector_store.client.scroll.assert_not_called()
+        vector_store.client.count.assert_not_called()
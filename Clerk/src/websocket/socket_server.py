@@ -4,9 +4,9 @@ WebSocket server implementation using Socket.IO for real-time updates
 
 import logging
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 import socketio
-from datetime import datetime
+from datetime import datetime, timedelta
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -34,6 +34,10 @@ socket_app = socketio.ASGIApp(sio, socketio_path="/ws/socket.io", other_asgi_app
 # Store active connections and their metadata
 active_connections: Dict[str, Dict[str, Any]] = {}
 
+# Streaming motion drafts keyed by motion_id (kept for reconnecting clients)
+motion_streams: Dict[str, "MotionStreamSession"] = {}
+MOTION_STREAM_RETENTION = timedelta(hours=1)
+
 
 @sio.event
 async def connect(sid, environ, auth):
@@ -119,6 +123,41 @@ async def subscribe_case(sid, data):
         await sio.emit("subscribed", {"case_id": case_id}, room=sid)
 
 
+@sio.event
+async def subscribe_motion(sid, data):
+    """Subscribe to a streaming motion draft, replaying anything already generated
+
+    Clients resuming after a disconnect pass the offsets they already hold as
+    ``{"resume": {"<section index>": {"revision": int, "offset": int}}}`` and
+    only receive the missing text.
+    """
+    motion_id = data.get("motion_id")
+    session = motion_streams.get(motion_id)
+    if not session:
+        await sio.emit(
+            "motion:error",
+            {"motion_id": motion_id, "error": "Unknown motion stream"},
+            room=sid,
+        )
+        return
+
+    # Join before replaying so no delta falls between replay and live events;
+    # clients drop duplicates using the delta offsets
+    await sio.enter_room(sid, session.room)
+    logger.info(f"Client {sid} joined room {session.room}")
+    await sio.emit(
+        "motion:resume", session.get_resume_payload(data.get("resume")), room=sid
+    )
+
+
+@sio.event
+async def unsubscribe_motion(sid, data):
+    """Stop receiving updates for a streaming motion draft"""
+    motion_id = data.get("motion_id")
+    await sio.leave_room(sid, f"motion_{motion_id}")
+    logger.info(f"Client {sid} unsubscribed from motion {motion_id}")
+
+
 @sio.event
 async def unsubscribe_case(sid, data):
     """Unsubscribe from case updates"""
@@ -265,6 +304,183 @@ async def emit_motion_completed(motion_id: str, download_url: str):
     await sio.emit("motion:completed", event_data)
 
 
+class MotionStreamSession:
+    """Buffers a streaming motion draft and forwards its events to the motion room
+
+    Each section is tracked as the text generated so far for its current
+    revision. Deltas carry the character offset they start at, so clients can
+    detect gaps and resume from the last offset they received.
+    """
+
+    def __init__(self, motion_id: str, case_id: Optional[str] = None):
+        self.motion_id = motion_id
+        self.case_id = case_id
+        self.room = f"motion_{motion_id}"
+        self.status = "drafting"
+        self.created_at = datetime.utcnow()
+        self.sections: Dict[int, Dict[str, Any]] = {}
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+
+    async def handle_event(self, event: str, payload: Dict[str, Any]):
+        """Stream callback passed to the motion drafter"""
+        if event == "section_started":
+            await self.section_started(
+                payload["index"], payload["heading"], payload.get("revision", 0)
+            )
+        elif event == "section_delta":
+            await self.section_delta(
+                payload["index"], payload["revision"], payload["delta"]
+            )
+        elif event == "section_snapshot":
+            await self.section_snapshot(payload["index"], payload["section"])
+        else:
+            logger.debug(f"Ignoring unknown motion stream event: {event}")
+
+    async def section_started(self, index: int, heading: str, revision: int = 0):
+        """Start (or restart) streaming a section"""
+        self.sections[index] = {
+            "index": index,
+            "heading": heading,
+            "revision": revision,
+            "content": "",
+            "complete": False,
+            "snapshot": None,
+        }
+        await sio.emit(
+            "motion:section_started",
+            {
+                "motion_id": self.motion_id,
+                "index": index,
+                "heading": heading,
+                "revision": revision,
+            },
+            room=self.room,
+        )
+
+    async def section_delta(self, index: int, revision: int, delta: str):
+        """Append generated text to a section and forward it with its offset"""
+        section = self.sections.get(index)
+        if not section or section["revision"] != revision:
+            return
+        offset = len(section["content"])
+        section["content"] += delta
+        await sio.emit(
+            "motion:section_delta",
+            {
+                "motion_id": self.motion_id,
+                "index": index,
+                "revision": revision,
+                "offset": offset,
+                "delta": delta,
+            },
+            room=self.room,
+        )
+
+    async def section_snapshot(self, index: int, snapshot: Dict[str, Any]):
+        """Record the finished DraftedSection for a section"""
+        section = self.sections.setdefault(
+            index,
+            {
+                "index": index,
+                "heading": snapshot.get("title", ""),
+                "revision": 0,
+                "content": "",
+                "complete": False,
+                "snapshot": None,
+            },
+        )
+        section["content"] = snapshot.get("content", section["content"])
+        section["complete"] = True
+        section["snapshot"] = snapshot
+        await sio.emit(
+            "motion:section_snapshot",
+            {
+                "motion_id": self.motion_id,
+                "index": index,
+                "revision": section["revision"],
+                "section": snapshot,
+            },
+            room=self.room,
+        )
+
+    async def completed(self, result: Dict[str, Any]):
+        """Publish the final motion (same content as the non-streaming response)"""
+        self.status = "completed"
+        self.result = result
+        await sio.emit(
+            "motion:completed",
+            {"motion_id": self.motion_id, **result},
+            room=self.room,
+        )
+        logger.info(f"Emitted motion:completed for motion {self.motion_id}")
+
+    async def failed(self, error: str):
+        """Publish a drafting failure"""
+        self.status = "failed"
+        self.error = error
+        await sio.emit(
+            "motion:error",
+            {"motion_id": self.motion_id, "error": error},
+            room=self.room,
+        )
+        logger.error(f"Emitted motion:error for motion {self.motion_id}: {error}")
+
+    def get_resume_payload(
+        self, resume: Optional[Dict[str, Dict[str, int]]] = None
+    ) -> Dict[str, Any]:
+        """Build the text a client is missing given the offsets it already holds"""
+        resume = resume or {}
+        sections: List[Dict[str, Any]] = []
+
+        for index in sorted(self.sections):
+            section = self.sections[index]
+            held = resume.get(str(index)) or resume.get(index) or {}
+            offset = 0
+            if held.get("revision") == section["revision"]:
+                offset = int(held.get("offset", 0))
+                offset = min(max(offset, 0), len(section["content"]))
+
+            sections.append(
+                {
+                    "index": index,
+                    "heading": section["heading"],
+                    "revision": section["revision"],
+                    "offset": offset,
+                    "content": section["content"][offset:],
+                    "complete": section["complete"],
+                    "section": section["snapshot"],
+                }
+            )
+
+        return {
+            "motion_id": self.motion_id,
+            "status": self.status,
+            "sections": sections,
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+def create_motion_stream(
+    motion_id: str, case_id: Optional[str] = None
+) -> MotionStreamSession:
+    """Register a new streaming motion draft, pruning expired ones"""
+    cutoff = datetime.utcnow() - MOTION_STREAM_RETENTION
+    for old_id, old_session in list(motion_streams.items()):
+        if old_session.created_at < cutoff:
+            del motion_streams[old_id]
+
+    session = MotionStreamSession(motion_id, case_id)
+    motion_streams[motion_id] = session
+    return session
+
+
+def get_motion_stream(motion_id: str) -> Optional[MotionStreamSession]:
+    """Get a streaming motion draft by ID"""
+    return motion_streams.get(motion_id)
+
+
 # Case management event emitters
 async def emit_case_event(event_type: str, case_id: str, data: dict):
     """
@@ -317,6 +533,9 @@ __all__ = [
     "emit_motion_started",
     "emit_motion_section_completed",
     "emit_motion_completed",
+    "MotionStreamSession",
+    "create_motion_stream",
+    "get_motion_stream",
     "emit_case_event",
     "get_active_connections",
 ]
@@ -0,0 +1 @@
+"""Tests for websocket module"""
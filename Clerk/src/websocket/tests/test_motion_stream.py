@@ -0,0 +1,147 @@
+"""
+Tests for streaming motion drafts over WebSocket
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from src.websocket.socket_server import (
+    MotionStreamSession,
+    create_motion_stream,
+    get_motion_stream,
+)
+from src.ai_agents.motion_drafter import EnhancedMotionDraftingAgent
+
+
+@pytest.fixture
+def mock_sio():
+    """Patch the Socket.IO server so events are captured instead of sent"""
+    with patch("src.websocket.socket_server.sio") as sio:
+        sio.emit = AsyncMock()
+        yield sio
+
+
+def emitted(mock_sio, event_name):
+    """Payloads emitted for an event name"""
+    return [c.args[1] for c in mock_sio.emit.call_args_list if c.args[0] == event_name]
+
+
+class TestMotionStreamSession:
+    """Test section buffering and resume offsets"""
+
+    @pytest.mark.asyncio
+    async def test_deltas_carry_offsets(self, mock_sio):
+        session = MotionStreamSession("motion-1")
+
+        await session.handle_event(
+            "section_started", {"index": 0, "heading": "INTRODUCTION", "revision": 0}
+        )
+        await session.handle_event(
+            "section_delta", {"index": 0, "revision": 0, "delta": "Plaintiff "}
+        )
+        await session.handle_event(
+            "section_delta", {"index": 0, "revision": 0, "delta": "moves"}
+        )
+
+        deltas = emitted(mock_sio, "motion:section_delta")
+        assert [d["offset"] for d in deltas] == [0, 10]
+        assert session.sections[0]["content"] == "Plaintiff moves"
+        assert all(
+            c.kwargs["room"] == "motion_motion-1" for c in mock_sio.emit.call_args_list
+        )
+
+    @pytest.mark.asyncio
+    async def test_resume_returns_only_missing_text(self, mock_sio):
+        session = MotionStreamSession("motion-1")
+        await session.section_started(0, "INTRODUCTION")
+        await session.section_delta(0, 0, "Plaintiff moves")
+        await session.section_started(1, "ARGUMENT")
+        await session.section_delta(1, 0, "The evidence")
+
+        payload = session.get_resume_payload(
+            {"0": {"revision": 0, "offset": 10}, "1": {"revision": 0, "offset": 4}}
+        )
+
+        assert payload["sections"][0]["offset"] == 10
+        assert payload["sections"][0]["content"] == "moves"
+        assert payload["sections"][1]["content"] == "evidence"
+
+    @pytest.mark.asyncio
+    async def test_resume_after_revision_restarts_section(self, mock_sio):
+        session = MotionStreamSession("motion-1")
+        await session.section_started(0, "ARGUMENT", revision=0)
+        await session.section_delta(0, 0, "Short draft")
+        await session.section_started(0, "ARGUMENT", revision=1)
+        await session.section_delta(0, 1, "Expanded draft")
+        # Late delta from the superseded revision is dropped
+        await session.section_delta(0, 0, " stale")
+
+        payload = session.get_resume_payload({"0": {"revision": 0, "offset": 11}})
+
+        assert payload["sections"][0]["revision"] == 1
+        assert payload["sections"][0]["offset"] == 0
+        assert payload["sections"][0]["content"] == "Expanded draft"
+
+    @pytest.mark.asyncio
+    async def test_snapshot_is_authoritative(self, mock_sio):
+        session = MotionStreamSession("motion-1")
+        await session.section_started(0, "CONCLUSION")
+        await session.section_delta(0, 0, "partial")
+        await session.section_snapshot(0, {"title": "CONCLUSION", "content": "Final."})
+
+        payload = session.get_resume_payload()
+        assert payload["sections"][0]["complete"] is True
+        assert payload["sections"][0]["content"] == "Final."
+
+    def test_registry(self):
+        session = create_motion_stream("motion-registry")
+        assert get_motion_stream("motion-registry") is session
+
+
+class TestDrafterStreaming:
+    """Test that streaming produces the same text as the non-streaming writer"""
+
+    @pytest.fixture
+    def drafter(self):
+        agent = EnhancedMotionDraftingAgent.__new__(EnhancedMotionDraftingAgent)
+        agent.section_writer = Mock()
+        agent.primary_model = Mock(model_name="gpt-test")
+        return agent
+
+    @pytest.mark.asyncio
+    async def test_run_section_writer_without_stream(self, drafter):
+        drafter.section_writer.run = AsyncMock(return_value=Mock(data="Full text"))
+
+        assert await drafter._run_section_writer("prompt") == "Full text"
+
+    @pytest.mark.asyncio
+    async def test_run_section_writer_streams_deltas(self, drafter):
+        async def stream_text(delta=False):
+            for chunk in ["Full ", "text"]:
+                yield chunk
+
+        stream_result = Mock()
+        stream_result.stream_text = stream_text
+        stream_cm = AsyncMock()
+        stream_cm.__aenter__.return_value = stream_result
+        drafter.section_writer.run_stream = Mock(return_value=stream_cm)
+
+        events = []
+
+        async def callback(event, payload):
+            events.append((event, payload))
+
+        on_delta = drafter._make_delta_forwarder(callback, 2, 0)
+        content = await drafter._run_section_writer("prompt", on_delta)
+
+        assert content == "Full text"
+        assert [p["delta"] for _, p in events] == ["Full ", "text"]
+        assert all(p["index"] == 2 and p["revision"] == 0 for _, p in events)
+
+    @pytest.mark.asyncio
+    async def test_stream_errors_do_not_abort_draft(self, drafter):
+        callback = AsyncMock(side_effect=RuntimeError("client gone"))
+
+        await drafter._emit_stream_event(callback, "section_started", {"index": 0})
+
+        assert drafter._make_delta_forwarder(None, 0, 0) is None
@@ -0,0 +1,108 @@
+"""
+Tests for the per-draft context index used by the motion drafter
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.ai_agents.draft_context_index import DraftContextIndex
+from src.ai_agents.motion_drafter import EnhancedMotionDraftingAgent
+
+
+class Fact:
+    """Minimal stand-in for the drafter's search result objects"""
+
+    def __init__(self, content):
+        self.content = content
+        self.metadata = {}
+
+
+VECTORS = {
+    "brake failure": [1.0, 0.0, 0.0],
+    "driver fatigue": [0.0, 1.0, 0.0],
+    "maintenance logs": [0.8, 0.2, 0.0],
+    "hiring policy": [0.0, 0.0, 1.0],
+}
+
+
+@pytest.fixture
+def embedding_generator():
+    """Embedding generator returning fixed vectors per text"""
+    generator = Mock()
+    generator.generate_embeddings_batch_async = AsyncMock(
+        side_effect=lambda texts: ([VECTORS[t] for t in texts], 0)
+    )
+    generator.generate_embedding_async = AsyncMock(
+        side_effect=lambda text: (VECTORS[text], 0)
+    )
+    return generator
+
+
+@pytest.mark.asyncio
+async def test_build_uses_single_batch_call(embedding_generator):
+    index = DraftContextIndex(embedding_generator)
+
+    indexed = await index.build(
+        {
+            "case_facts": [Fact("brake failure"), Fact("driver fatigue"), Fact("")],
+            "firm_knowledge": [{"content": "hiring policy"}],
+        }
+    )
+
+    assert indexed == 3
+    assert embedding_generator.generate_embeddings_batch_async.await_count == 1
+    assert index.size("case_facts") == 2
+    assert index.size("firm_knowledge") == 1
+
+
+@pytest.mark.asyncio
+async def test_top_k_orders_by_cosine_similarity(embedding_generator):
+    facts = [Fact("driver fatigue"), Fact("maintenance logs"), Fact("brake failure")]
+    index = DraftContextIndex(embedding_generator)
+    await index.build({"case_facts": facts})
+
+    query = await index.embed_query("brake failure")
+    selected = index.top_k("case_facts", query, 2)
+
+    assert [f.content for f in selected] == ["brake failure", "maintenance logs"]
+
+
+@pytest.mark.asyncio
+async def test_query_embeddings_are_cached(embedding_generator):
+    index = DraftContextIndex(embedding_generator)
+
+    await index.embed_query("driver fatigue")
+    await index.embed_query("driver fatigue")
+
+    assert embedding_generator.generate_embedding_async.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_top_k_handles_missing_collections(embedding_generator):
+    index = DraftContextIndex(embedding_generator)
+    await index.build({"case_facts": []})
+
+    query = await index.embed_query("hiring policy")
+
+    assert index.top_k("case_facts", query, 5) == []
+    assert index.top_k("firm_knowledge", query, 5) == []
+    assert index.top_k("case_facts", None, 5) == []
+
+
+@pytest.mark.asyncio
+async def test_drafter_selects_from_the_index_it_is_passed(embedding_generator):
+    """The index is per draft, so the shared drafter must not hold it"""
+    drafter = EnhancedMotionDraftingAgent.__new__(EnhancedMotionDraftingAgent)
+    facts = [Fact("driver fatigue"), Fact("brake failure")]
+    index = DraftContextIndex(embedding_generator)
+    await index.build({"case_facts": facts})
+    section = Mock(title="brake failure", content_points=[])
+
+    vector = await drafter._embed_section_query(section, index)
+    selected = drafter._extract_relevant_facts(
+        section, facts, limit=1, section_vector=vector, index=index
+    )
+
+    assert [f.content for f in selected] == ["brake failure"]
+    assert drafter._extract_relevant_facts(section, facts, limit=1) == facts[:1]
+    assert not hasattr(drafter, "document_context")
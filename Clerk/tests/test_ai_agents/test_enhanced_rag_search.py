@@ -0,0 +1,135 @@
+"""
+Tests for concurrent case database search in the enhanced RAG agent
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.ai_agents.enhanced_rag_agent import (
+    EnhancedRAGResearchAgent,
+    EnhancedResearchRequest,
+)
+
+SEARCH_DELAY = 0.1
+
+
+def make_component(method_name, hit):
+    async def search(query, limit=20, query_embedding=None):
+        await asyncio.sleep(SEARCH_DELAY)
+        return [hit]
+
+    component = Mock()
+    setattr(component, method_name, AsyncMock(side_effect=search))
+    return component
+
+
+@pytest.fixture
+def components():
+    fact = SimpleNamespace(
+        id="f1",
+        content="Brakes failed",
+        confidence_score=0.9,
+        category="incident",
+        source_document="report.pdf",
+        extraction_timestamp=datetime(2024, 1, 1),
+    )
+    depo = SimpleNamespace(
+        id="d1",
+        testimony_excerpt="I saw the truck",
+        deponent_name="Smith",
+        page_start=4,
+        line_start=2,
+        citation_format="Smith Dep. 4:2",
+    )
+    exhibit = SimpleNamespace(
+        id="e1",
+        description="Photo of scene",
+        relevance_score=0.7,
+        exhibit_number="Ex. 1",
+        document_type="photo",
+        page_references=[1],
+    )
+    return {
+        "fact": make_component("search_facts", fact),
+        "deposition": make_component("search_testimony", depo),
+        "exhibit": make_component("search_exhibits", exhibit),
+    }
+
+
+@pytest.fixture
+def agent(components):
+    with patch("src.ai_agents.enhanced_rag_agent.QdrantVectorStore"), patch(
+        "src.ai_agents.enhanced_rag_agent.EmbeddingGenerator"
+    ), patch("src.ai_agents.enhanced_rag_agent.OpenAIModel"), patch(
+        "src.ai_agents.enhanced_rag_agent.Agent"
+    ), patch(
+        "src.ai_agents.enhanced_rag_agent.FactExtractor",
+        return_value=components["fact"],
+    ) as fact_cls, patch(
+        "src.ai_agents.enhanced_rag_agent.DepositionParser",
+        return_value=components["deposition"],
+    ), patch(
+        "src.ai_agents.enhanced_rag_agent.ExhibitIndexer",
+        return_value=components["exhibit"],
+    ):
+        agent = EnhancedRAGResearchAgent()
+        agent.embedding_generator.generate_embeddings_batch_async = AsyncMock(
+            side_effect=lambda texts: ([[float(i)] for i in range(len(texts))], 10)
+        )
+        agent.fact_extractor_cls = fact_cls
+        yield agent
+
+
+def make_request(**overrides):
+    fields = {
+        "case_name": "Smith_v_Jones",
+        "questions": ["q"],
+        "research_context": "summary judgment",
+    }
+    fields.update(overrides)
+    return EnhancedResearchRequest(**fields)
+
+
+async def test_searches_run_concurrently(agent, components):
+    queries = ["brakes", "speed", "weather"]
+
+    started = time.perf_counter()
+    results = await agent._search_case_databases(
+        "Smith_v_Jones", queries, make_request()
+    )
+    elapsed = time.perf_counter() - started
+
+    assert len(results) == 9
+    assert elapsed < SEARCH_DELAY * 3
+    assert [r.source_type for r in results[:3]] == ["fact", "deposition", "exhibit"]
+
+    # One batched embedding call, shared by every source type
+    agent.embedding_generator.generate_embeddings_batch_async.assert_awaited_once_with(
+        queries
+    )
+    call = components["exhibit"].search_exhibits.await_args_list[2]
+    assert call.kwargs["query_embedding"] == [2.0]
+
+
+async def test_components_are_pooled_per_case(agent):
+    request = make_request(include_exhibits=False)
+
+    await agent._search_case_databases("Smith_v_Jones", ["brakes"], request)
+    await agent._search_case_databases("Smith_v_Jones", ["speed"], request)
+
+    agent.fact_extractor_cls.assert_called_once_with("Smith_v_Jones")
+
+
+async def test_failed_search_does_not_drop_other_results(agent, components):
+    components["deposition"].search_testimony.side_effect = RuntimeError("down")
+
+    results = await agent._search_case_databases(
+        "Smith_v_Jones", ["brakes"], make_request()
+    )
+
+    assert {r.source_type for r in results} == {"fact", "exhibit"}
@@ -0,0 +1,132 @@
+"""
+Tests for the concurrent, batched fact extraction pipeline
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.ai_agents.fact_extractor import FactExtractor
+
+LLM_DELAY = 0.05
+
+
+def chat_response(text):
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=text))]
+    )
+
+
+@pytest.fixture
+def extractor():
+    with patch("src.ai_agents.fact_extractor.QdrantVectorStore"), patch(
+        "src.ai_agents.fact_extractor.EmbeddingGenerator"
+    ), patch("src.ai_agents.fact_extractor.spacy.load"), patch(
+        "src.ai_agents.fact_extractor.OpenAIModel"
+    ), patch(
+        "src.ai_agents.fact_extractor.Agent"
+    ):
+        extractor = FactExtractor(
+            "Smith_v_Jones",
+            max_concurrent_llm_calls=3,
+            openai_client=Mock(),
+            async_openai_client=Mock(),
+        )
+
+    state = {"in_flight": 0, "peak": 0, "calls": 0}
+
+    async def create(**kwargs):
+        state["in_flight"] += 1
+        state["calls"] += 1
+        call = state["calls"]
+        state["peak"] = max(state["peak"], state["in_flight"])
+        await asyncio.sleep(LLM_DELAY)
+        state["in_flight"] -= 1
+        chunk = kwargs["messages"][1]["content"]
+        marker = "brakes" if "brakes" in chunk else "speed"
+        return chat_response(
+            f"The {marker} fact one from call {call}\n"
+            f"The {marker} fact two from call {call}"
+        )
+
+    extractor.async_openai_client.chat.completions.create = AsyncMock(
+        side_effect=create
+    )
+    extractor.fact_categorizer.run = AsyncMock(
+        return_value=SimpleNamespace(data="substantive")
+    )
+    extractor.nlp = Mock()
+    extractor.nlp.pipe = Mock(
+        side_effect=lambda texts, batch_size: [SimpleNamespace(ents=[]) for _ in texts]
+    )
+    extractor.embedding_generator.generate_embeddings_batch_async = AsyncMock(
+        side_effect=lambda texts: ([[0.1] * 4 for _ in texts], 10)
+    )
+    extractor.vector_store._get_collection_layout = AsyncMock(
+        return_value=(False, False)
+    )
+    extractor.vector_store.async_client.query_batch_points = AsyncMock(
+        side_effect=lambda collection_name, requests: [
+            SimpleNamespace(points=[]) for _ in requests
+        ]
+    )
+    extractor.llm_state = state
+    return extractor
+
+
+def make_document(paragraphs):
+    return "\n\n".join(
+        ("The brakes failed. " if i % 2 else "He was speeding. ") * 40
+        for i in range(paragraphs)
+    )
+
+
+async def test_chunks_are_extracted_concurrently_under_limit(extractor):
+    document = make_document(6)
+    chunk_count = len(extractor._split_into_chunks(document))
+
+    started = asyncio.get_running_loop().time()
+    collection = await extractor.extract_facts_from_document("doc1", document)
+    elapsed = asyncio.get_running_loop().time() - started
+
+    assert len(collection.facts) == chunk_count * 2
+    assert extractor.llm_state["peak"] == 3
+    assert elapsed < LLM_DELAY * chunk_count * 2
+
+
+async def test_entities_are_parsed_in_one_batch(extractor):
+    await extractor.extract_facts_from_document("doc1", make_document(4))
+
+    extractor.nlp.pipe.assert_called_once()
+    fact_texts = extractor.nlp.pipe.call_args.args[0]
+    assert len(fact_texts) == 8
+    extractor.nlp.assert_not_called()
+
+
+async def test_facts_are_embedded_and_upserted_once(extractor):
+    collection = await extractor.extract_facts_from_document("doc1", make_document(4))
+
+    embed = extractor.embedding_generator.generate_embeddings_batch_async
+    embed.assert_awaited_once_with([fact.content for fact in collection.facts])
+
+    extractor.vector_store.client.upsert.assert_called_once()
+    points = extractor.vector_store.client.upsert.call_args.kwargs["points"]
+    assert [p["id"] for p in points] == [fact.id for fact in collection.facts]
+
+
+async def test_repeated_facts_are_stored_once(extractor):
+    extractor.async_openai_client.chat.completions.create = AsyncMock(
+        return_value=chat_response("The brakes failed on the trailer")
+    )
+    extractor.embedding_generator.generate_embeddings_batch_async = AsyncMock(
+        side_effect=lambda texts: ([[1.0, 0.0, 0.0, 0.0] for _ in texts], 10)
+    )
+
+    collection = await extractor.extract_facts_from_document("doc1", make_document(4))
+
+    assert len(collection.facts) == 1
+    assert sum(collection.fact_count_by_category.values()) == 1
+    points = extractor.vector_store.client.upsert.call_args.kwargs["points"]
+    assert [p["id"] for p in points] == [collection.facts[0].id]
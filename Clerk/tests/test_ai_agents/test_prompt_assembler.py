@@ -0,0 +1,117 @@
+"""
+Tests for token-budget-aware prompt assembly
+"""
+
+import pytest
+
+from src.ai_agents.prompt_assembler import (
+    PromptAssembler,
+    PromptBlock,
+    get_tokenizer,
+)
+from src.ai_agents.motion_drafter import EnhancedMotionDraftingAgent
+from src.utils.timeout_monitor import TimeoutMonitor
+
+
+def build(parts):
+    return f"Draft this section.\n\nKey Points:\n{parts['points']}\n\nFacts:\n{parts['facts']}"
+
+
+def assemble(budget, blocks):
+    assembler = PromptAssembler(budget)
+    reserved = assembler.count_tokens(build({b.name: "" for b in blocks}))
+    parts, usage = assembler.fit(blocks, reserved_tokens=reserved)
+    return assembler, build(parts), usage
+
+
+def test_tokenizer_is_cached():
+    assert get_tokenizer("gpt-4") is get_tokenizer("gpt-4")
+
+
+def test_prompt_stays_within_budget():
+    blocks = [
+        PromptBlock("points", ["negligent maintenance " * 40] * 5, priority=0),
+        PromptBlock("facts", ["brake failure reported " * 40] * 5, priority=1),
+    ]
+
+    assembler, prompt, usage = assemble(200, blocks)
+
+    assert assembler.count_tokens(prompt) <= 200
+    assert usage.blocks["points"]["dropped"] > 0
+
+
+def test_higher_priority_blocks_are_filled_first():
+    blocks = [
+        PromptBlock("facts", ["fact " * 100], priority=1),
+        PromptBlock("points", ["point one", "point two"], priority=0),
+    ]
+
+    _, prompt, usage = assemble(60, blocks)
+
+    assert "- point one\n- point two" in prompt
+    assert usage.blocks["points"]["dropped"] == 0
+    assert usage.blocks["facts"]["tokens"] <= 60 - usage.blocks["points"]["tokens"]
+
+
+def test_item_and_block_caps():
+    blocks = [
+        PromptBlock("points", ["word " * 200], priority=0, item_max_tokens=20),
+        PromptBlock("facts", ["a", "b", "c", "d"], priority=1, max_tokens=5),
+    ]
+
+    _, prompt, usage = assemble(1000, blocks)
+
+    assert usage.blocks["points"]["tokens"] <= 22
+    assert prompt.count("...") == 1
+    assert usage.blocks["facts"]["tokens"] <= 5
+
+
+def test_empty_blocks_use_placeholder_text():
+    blocks = [
+        PromptBlock("points", [], priority=0, empty_text="- None"),
+        PromptBlock("facts", ["x"], priority=1),
+    ]
+
+    _, prompt, _ = assemble(100, blocks)
+
+    assert "Key Points:\n- None" in prompt
+
+
+@pytest.mark.asyncio
+async def test_timeout_monitor_summarizes_prompt_budgets():
+    monitor = TimeoutMonitor("Motion Drafting (test)")
+    monitor.log_prompt_budget(
+        "I. ARGUMENT", {"prompt_tokens": 1500, "budget": 3000, "utilization": 0.5}
+    )
+    monitor.log_prompt_budget(
+        "II. ARGUMENT", {"prompt_tokens": 2700, "budget": 3000, "utilization": 0.9}
+    )
+    monitor.finish()
+
+    budgets = monitor.get_summary()["prompt_budgets"]
+
+    assert budgets["prompts"] == 2
+    assert budgets["total_prompt_tokens"] == 4200
+    assert budgets["avg_utilization"] == 0.7
+    assert budgets["max_utilization"] == 0.9
+
+
+@pytest.mark.asyncio
+async def test_prompt_budgets_go_to_the_monitor_of_their_draft():
+    """Concurrent drafts share the drafter, so each passes its own monitor"""
+    drafter = EnhancedMotionDraftingAgent.__new__(EnhancedMotionDraftingAgent)
+    first = TimeoutMonitor("Motion Drafting (first)")
+    second = TimeoutMonitor("Motion Drafting (second)")
+    blocks = [
+        PromptBlock("points", ["Duty"], priority=0),
+        PromptBlock("facts", ["Speeding"], priority=1),
+    ]
+
+    drafter._assemble_prompt(PromptAssembler(3000), "I. ARGUMENT", build, blocks, first)
+    drafter._assemble_prompt(
+        PromptAssembler(3000), "II. ARGUMENT", build, blocks, second
+    )
+    drafter._assemble_prompt(PromptAssembler(3000), "III. ARGUMENT", build, blocks)
+
+    assert [b["label"] for b in first.prompt_budgets] == ["I. ARGUMENT"]
+    assert [b["label"] for b in second.prompt_budgets] == ["II. ARGUMENT"]
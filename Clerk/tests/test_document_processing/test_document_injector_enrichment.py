@@ -0,0 +1,110 @@
+"""
+Tests for DocumentInjector enrichment on the shared background loop
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.document_injector import DocumentInjector
+from src.utils.background_loop import BackgroundLoop
+
+
+class SlowComponent:
+    """Stands in for FactExtractor, DepositionParser and SourceDocumentIndexer"""
+
+    instances = []
+    running = 0
+    peak = 0
+
+    def __init__(self, case_name):
+        self.case_name = case_name
+        SlowComponent.instances.append(self)
+
+    async def _work(self, result):
+        SlowComponent.running += 1
+        SlowComponent.peak = max(SlowComponent.peak, SlowComponent.running)
+        await asyncio.sleep(0.02)
+        SlowComponent.running -= 1
+        return result
+
+    async def extract_facts_from_document(self, doc_id, content, metadata):
+        return await self._work(SimpleNamespace(facts=[1, 2, 3]))
+
+    async def parse_deposition(self, doc_path, content, metadata):
+        return await self._work(["citation"])
+
+    async def index_source_document(self, doc_path, content, metadata):
+        return await self._work(
+            SimpleNamespace(
+                id="src-1",
+                title="Smith deposition",
+                document_type=SimpleNamespace(value="deposition"),
+                summary="",
+            )
+        )
+
+
+@pytest.fixture
+def injector():
+    SlowComponent.instances = []
+    SlowComponent.peak = 0
+    background = BackgroundLoop("test-injector-loop")
+
+    injector = DocumentInjector.__new__(DocumentInjector)
+    injector.background_loop = background
+    injector._case_components = {}
+    with patch("src.document_injector.FactExtractor", SlowComponent), patch(
+        "src.document_injector.DepositionParser", SlowComponent
+    ), patch("src.document_injector.SourceDocumentIndexer", SlowComponent):
+        yield injector
+    background.stop()
+
+
+class TestDocumentEnrichment:
+    """Test concurrent enrichment with cached per-case components"""
+
+    def test_steps_run_concurrently_and_components_are_reused(self, injector):
+        for i in range(3):
+            facts, depositions, source = injector.background_loop.run(
+                injector._enrich_document(
+                    "Smith_v_Jones",
+                    f"hash-{i}",
+                    f"depos/smith-{i}.pdf",
+                    "transcript",
+                    f"smith-{i}.pdf",
+                    "deposition",
+                )
+            )
+
+        assert facts["facts"] == 3
+        assert depositions["depositions"] == 1
+        assert source["id"] == "src-1"
+        assert SlowComponent.peak == 3
+        # One instance per component for the case, not per document
+        assert len(SlowComponent.instances) == 3
+
+    def test_depositions_only_parsed_for_transcripts(self, injector):
+        facts, depositions, source = injector.background_loop.run(
+            injector._enrich_document(
+                "Smith_v_Jones", "hash", "letters/a.pdf", "text", "a.pdf", "letter"
+            )
+        )
+
+        assert facts and source and depositions is None
+        assert len(SlowComponent.instances) == 2
+
+    def test_failed_step_does_not_fail_the_others(self, injector):
+        async def broken(*args):
+            raise RuntimeError("qdrant down")
+
+        with patch.object(SlowComponent, "index_source_document", broken):
+            facts, _, source = injector.background_loop.run(
+                injector._enrich_document(
+                    "Smith_v_Jones", "hash", "a.pdf", "text", "a.pdf", "letter"
+                )
+            )
+
+        assert facts["facts"] == 3 and source is None